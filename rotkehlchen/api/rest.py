@@ -1000,7 +1000,6 @@ class RestAPI():
         try:
             identifier = db.add_ledger_action(action)
         except sqlcipher.IntegrityError:  # pylint: disable=no-member
-            db.db.conn.rollback()
             error_msg = 'Failed to add Ledger action due to entry already existing in the DB'
             return api_response(wrap_in_fail_result(error_msg), status_code=HTTPStatus.CONFLICT)
 
@@ -1317,6 +1316,23 @@ class RestAPI():
             log_result=False,
         )
 
+    @staticmethod
+    def search_assets(value: str, limit: int, offset: int) -> Response:
+        entries, entries_found = GlobalDBHandler().search_assets(
+            text=value,
+            limit=limit,
+            offset=offset,
+        )
+        result = {
+            'entries': entries,
+            'entries_found': entries_found,
+        }
+        return api_response(
+            _wrap_in_ok_result(result),
+            status_code=HTTPStatus.OK,
+            log_result=False,
+        )
+
     @staticmethod
     def supported_modules() -> Response:
         """Returns all supported modules"""
@@ -1327,6 +1343,16 @@ class RestAPI():
             log_result=False,
         )
 
+    @require_loggedin_user()
+    def get_ethereum_nodes(self) -> Response:
+        ethereum = self.rotkehlchen.chain_manager.ethereum
+        result = {
+            'nodes': ethereum.get_nodes_health(),
+            'contract_call_cache_hits': ethereum.contract_call_cache_hits,
+            'contract_call_cache_misses': ethereum.contract_call_cache_misses,
+        }
+        return api_response(_wrap_in_ok_result(result), status_code=HTTPStatus.OK)
+
     @require_loggedin_user()
     def query_owned_assets(self) -> Response:
         result = process_result_list(self.rotkehlchen.data.db.query_owned_assets())
@@ -1383,8 +1409,6 @@ class RestAPI():
         except InputError as e:
             return api_response(wrap_in_fail_result(str(e)), status_code=HTTPStatus.CONFLICT)
 
-        # Also clear the in-memory cache of the asset resolver to requery DB
-        AssetResolver().assets_cache.pop(data['identifier'], None)
         return api_response(OK_RESULT, status_code=HTTPStatus.OK)
 
     @require_loggedin_user()
@@ -1397,8 +1421,6 @@ class RestAPI():
         except InputError as e:
             return api_response(wrap_in_fail_result(str(e)), status_code=HTTPStatus.CONFLICT)
 
-        # Also clear the in-memory cache of the asset resolver
-        AssetResolver().assets_cache.pop(identifier, None)
         return api_response(OK_RESULT, status_code=HTTPStatus.OK)
 
     @require_loggedin_user()
@@ -1409,7 +1431,7 @@ class RestAPI():
             return api_response(wrap_in_fail_result(str(e)), status_code=HTTPStatus.CONFLICT)
 
         # Also clear the in-memory cache of the asset resolver
-        AssetResolver().assets_cache.pop(source_identifier, None)
+        AssetResolver().clean_memory_cache(source_identifier)
         return api_response(OK_RESULT, status_code=HTTPStatus.OK)
 
     @staticmethod
@@ -1461,9 +1483,6 @@ class RestAPI():
         except InputError as e:
             return api_response(wrap_in_fail_result(str(e)), status_code=HTTPStatus.CONFLICT)
 
-        # Also clear the in-memory cache of the asset resolver to requery DB
-        AssetResolver().assets_cache.pop(identifier, None)
-
         return api_response(
             result=_wrap_in_ok_result({'identifier': identifier}),
             status_code=HTTPStatus.OK,
@@ -1480,9 +1499,6 @@ class RestAPI():
         except InputError as e:
             return api_response(wrap_in_fail_result(str(e)), status_code=HTTPStatus.CONFLICT)
 
-        # Also clear the in-memory cache of the asset resolver
-        AssetResolver().assets_cache.pop(identifier, None)
-
         return api_response(
             result=_wrap_in_ok_result({'identifier': identifier}),
             status_code=HTTPStatus.OK,
@@ -1507,7 +1523,7 @@ class RestAPI():
             return api_response(_wrap_in_ok_result(OK_RESULT), status_code=HTTPStatus.OK)
         return api_response(wrap_in_fail_result(msg), status_code=HTTPStatus.CONFLICT)
 
-    def query_netvalue_data(self, include_nfts: bool) -> Response:
+    def query_netvalue_data(self, include_nfts: bool, max_points: Optional[int]) -> Response:
         from_ts = Timestamp(0)
         premium = self.rotkehlchen.premium
 
@@ -1516,7 +1532,7 @@ class RestAPI():
             start_of_day_today = datetime.datetime(today.year, today.month, today.day)
             from_ts = Timestamp(int((start_of_day_today - datetime.timedelta(days=14)).timestamp()))  # noqa: E501
 
-        data = self.rotkehlchen.data.db.get_netvalue_data(from_ts, include_nfts)
+        data = self.rotkehlchen.data.db.get_netvalue_data(from_ts, include_nfts, max_points)
         result = process_result({'times': data[0], 'data': data[1]})
         return api_response(_wrap_in_ok_result(result), status_code=HTTPStatus.OK)
 
@@ -1526,6 +1542,7 @@ class RestAPI():
             asset: Asset,
             from_timestamp: Timestamp,
             to_timestamp: Timestamp,
+            max_points: Optional[int],
     ) -> Response:
         # TODO: Think about this, but for now this is only balances, not liabilities
         data = self.rotkehlchen.data.db.query_timed_balances(
@@ -1533,6 +1550,7 @@ class RestAPI():
             to_ts=to_timestamp,
             asset=asset,
             balance_type=BalanceType.ASSET,
+            max_points=max_points,
         )
 
         result = process_result_list(data)
@@ -3816,6 +3834,23 @@ class RestAPI():
 
         return api_response(_wrap_in_ok_result(result_dict), status_code=HTTPStatus.OK)
 
+    @require_loggedin_user()
+    def get_database_health(self) -> Response:
+        result = self.rotkehlchen.data.db.get_health_stats()
+        return api_response(_wrap_in_ok_result(result), status_code=HTTPStatus.OK)
+
+    @require_loggedin_user()
+    def vacuum_database(self) -> Response:
+        db = self.rotkehlchen.data.db
+        if db.conn.in_transaction:
+            return api_response(
+                wrap_in_fail_result('Can not vacuum the DB while it is being written to'),
+                status_code=HTTPStatus.CONFLICT,
+            )
+
+        db.incremental_vacuum()
+        return api_response(_wrap_in_ok_result(db.get_health_stats()), status_code=HTTPStatus.OK)
+
     @require_loggedin_user()
     def create_database_backup(self) -> Response:
         try:
@@ -28,6 +28,7 @@ from rotkehlchen.api.v1.resources import (
     AssetIconsResource,
     AssetMovementsResource,
     AssetsReplaceResource,
+    AssetsSearchResource,
     AssetsTypesResource,
     AssetUpdatesResource,
     AssociatedLocations,
@@ -45,6 +46,7 @@ from rotkehlchen.api.v1.resources import (
     CompoundHistoryResource,
     CurrentAssetsPriceResource,
     DatabaseBackupsResource,
+    DatabaseHealthResource,
     DatabaseInfoResource,
     DataImportResource,
     DefiBalancesResource,
@@ -58,6 +60,7 @@ from rotkehlchen.api.v1.resources import (
     EthereumAssetsResource,
     EthereumModuleDataResource,
     EthereumModuleResource,
+    EthereumNodesResource,
     EthereumTransactionsResource,
     ExchangeBalancesResource,
     ExchangeRatesResource,
@@ -206,6 +209,7 @@ URLS_V1: URLS = [
     ('/blockchains/ETH2/stake/dailystats', Eth2DailyStatsResource),
     ('/blockchains/ETH/defi', DefiBalancesResource),
     ('/blockchains/ETH/airdrops', EthereumAirdropsResource),
+    ('/blockchains/ETH/nodes', EthereumNodesResource),
     ('/blockchains/ETH/erc20details/', ERC20TokenInfo),
     ('/blockchains/ETH/modules/<string:module_name>/data', NamedEthereumModuleDataResource),
     ('/blockchains/ETH/modules/data', EthereumModuleDataResource),
@@ -251,6 +255,7 @@ URLS_V1: URLS = [
     ('/assets', OwnedAssetsResource),
     ('/assets/types', AssetsTypesResource),
     ('/assets/replace', AssetsReplaceResource),
+    ('/assets/search', AssetsSearchResource),
     ('/assets/all', AllAssetsResource),
     ('/assets/ethereum', EthereumAssetsResource),
     ('/assets/prices/current', CurrentAssetsPriceResource),
@@ -268,6 +273,7 @@ URLS_V1: URLS = [
     ('/limits/reset/<string:location>', LimitsCounterResetResource),
     ('/database/info', DatabaseInfoResource),
     ('/database/backups', DatabaseBackupsResource),
+    ('/database/health', DatabaseHealthResource),
     ('/locations/associated', AssociatedLocations),
     ('/staking/kraken', StakingResource),
 ]
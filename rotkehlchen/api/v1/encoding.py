@@ -39,6 +39,7 @@ from rotkehlchen.chain.bitcoin.utils import (
     scriptpubkey_to_btc_address,
 )
 from rotkehlchen.chain.ethereum.manager import EthereumManager
+from rotkehlchen.chain.ethereum.typing import EthereumCallType, NodeName
 from rotkehlchen.chain.substrate.typing import (
     KusamaAddress,
     PolkadotAddress,
@@ -912,6 +913,40 @@ class CurrentPriceOracleField(fields.Field):
         return current_price_oracle
 
 
+class EthereumNodeNameField(fields.Field):
+
+    def _deserialize(
+            self,
+            value: str,
+            attr: Optional[str],  # pylint: disable=unused-argument
+            data: Optional[Mapping[str, Any]],  # pylint: disable=unused-argument
+            **_kwargs: Any,
+    ) -> NodeName:
+        try:
+            node_name = NodeName.deserialize(value)
+        except DeserializationError as e:
+            raise ValidationError(f'Invalid ethereum node: {value}') from e
+
+        return node_name
+
+
+class EthereumCallTypeField(fields.Field):
+
+    def _deserialize(
+            self,
+            value: str,
+            attr: Optional[str],  # pylint: disable=unused-argument
+            data: Optional[Mapping[str, Any]],  # pylint: disable=unused-argument
+            **_kwargs: Any,
+    ) -> EthereumCallType:
+        try:
+            call_type = EthereumCallType.deserialize(value)
+        except DeserializationError as e:
+            raise ValidationError(f'Invalid ethereum call type: {value}') from e
+
+        return call_type
+
+
 class HistoricalPriceOracleField(fields.Field):
 
     def _deserialize(
@@ -1439,6 +1474,15 @@ def _validate_historical_price_oracles(
         )
 
 
+def _validate_ethereum_nodes(nodes: List[NodeName]) -> None:
+    """Prevents repeated nodes"""
+    if len(nodes) != len(set(nodes)):
+        raise ValidationError(
+            f'Invalid ethereum nodes in: {", ".join(str(x) for x in nodes)}. '
+            f'Check there are no repeated ones.',
+        )
+
+
 class ModifiableSettingsSchema(Schema):
     """This is the Schema for the settings that can be modified via the API"""
     premium_should_sync = fields.Bool(load_default=None)
@@ -1505,6 +1549,17 @@ class ModifiableSettingsSchema(Schema):
         ),
         load_default=None,
     )
+    pinned_ethereum_nodes = fields.List(
+        EthereumNodeNameField,
+        validate=_validate_ethereum_nodes,
+        load_default=None,
+    )
+    excluded_ethereum_nodes = fields.List(
+        EthereumNodeNameField,
+        validate=_validate_ethereum_nodes,
+        load_default=None,
+    )
+    hedged_ethereum_calls = fields.List(EthereumCallTypeField, load_default=None)
 
     @validates_schema
     def validate_settings_schema(  # pylint: disable=no-self-use
@@ -1520,6 +1575,19 @@ class ModifiableSettingsSchema(Schema):
                         field_name='active_modules',
                     )
 
+        pinned_nodes = data['pinned_ethereum_nodes']
+        excluded_nodes = data['excluded_ethereum_nodes']
+        if pinned_nodes is not None and excluded_nodes is not None:
+            both = [x for x in pinned_nodes if x in excluded_nodes]
+            if len(both) != 0:
+                raise ValidationError(
+                    message=(
+                        f'Ethereum nodes {", ".join(str(x) for x in both)} can not '
+                        f'be both pinned and excluded'
+                    ),
+                    field_name='excluded_ethereum_nodes',
+                )
+
     @post_load
     def transform_data(  # pylint: disable=no-self-use
             self,
@@ -1551,6 +1619,9 @@ class ModifiableSettingsSchema(Schema):
             pnl_csv_with_formulas=data['pnl_csv_with_formulas'],
             pnl_csv_have_summary=data['pnl_csv_have_summary'],
             ssf_0graph_multiplier=data['ssf_0graph_multiplier'],
+            pinned_ethereum_nodes=data['pinned_ethereum_nodes'],
+            excluded_ethereum_nodes=data['excluded_ethereum_nodes'],
+            hedged_ethereum_calls=data['hedged_ethereum_calls'],
         )
 
 
@@ -1691,6 +1762,14 @@ class StatisticsAssetBalanceSchema(Schema):
     asset = AssetField(required=True)
     from_timestamp = TimestampField(load_default=Timestamp(0))
     to_timestamp = TimestampField(load_default=ts_now)
+    max_points = fields.Integer(
+        strict=True,
+        validate=webargs.validate.Range(
+            min=3,
+            error='The maximum number of points must be at least 3',
+        ),
+        load_default=None,
+    )
 
 
 class StatisticsValueDistributionSchema(Schema):
@@ -2352,6 +2431,25 @@ class ModifyEthereumTokenSchema(Schema):
         )
 
 
+class AssetsSearchSchema(Schema):
+    value = fields.String(required=True, validate=webargs.validate.Length(min=1))
+    limit = fields.Integer(
+        load_default=25,
+        validate=webargs.validate.Range(
+            min=1,
+            max=100,
+            error='The asset search limit should be between 1 and 100',
+        ),
+    )
+    offset = fields.Integer(
+        load_default=0,
+        validate=webargs.validate.Range(
+            min=0,
+            error='The asset search offset should be a non-negative integer',
+        ),
+    )
+
+
 class AssetsReplaceSchema(Schema):
     source_identifier = fields.String(required=True)
     target_asset = AssetField(required=True, form_with_incomplete_data=True)
@@ -2690,6 +2788,14 @@ class Eth2DailyStatsSchema(
 
 class StatisticsNetValueSchema(Schema):
     include_nfts = fields.Boolean(load_default=True)
+    max_points = fields.Integer(
+        strict=True,
+        validate=webargs.validate.Range(
+            min=3,
+            error='The maximum number of points must be at least 3',
+        ),
+        load_default=None,
+    )
 
 
 class BinanceMarketsSchema(Schema):
@@ -25,6 +25,7 @@ from rotkehlchen.api.v1.encoding import (
     AssetSchema,
     AssetSchemaWithIdentifier,
     AssetsReplaceSchema,
+    AssetsSearchSchema,
     AssetUpdatesRequestSchema,
     AsyncHistoricalQuerySchema,
     AsyncIgnoreCacheQueryArgumentSchema,
@@ -439,6 +440,15 @@ class DatabaseInfoResource(BaseResource):
         return self.rest_api.get_database_info()
 
 
+class DatabaseHealthResource(BaseResource):
+
+    def get(self) -> Response:
+        return self.rest_api.get_database_health()
+
+    def put(self) -> Response:
+        return self.rest_api.vacuum_database()
+
+
 class DatabaseBackupsResource(BaseResource):
 
     delete_schema = FileListSchema()
@@ -494,6 +504,15 @@ class AssetsTypesResource(BaseResource):
         return self.rest_api.get_asset_types()
 
 
+class AssetsSearchResource(BaseResource):
+
+    get_schema = AssetsSearchSchema()
+
+    @use_kwargs(get_schema, location='json_and_query')
+    def get(self, value: str, limit: int, offset: int) -> Response:
+        return self.rest_api.search_assets(value=value, limit=limit, offset=offset)
+
+
 class AssetsReplaceResource(BaseResource):
 
     put_schema = AssetsReplaceSchema()
@@ -897,8 +916,8 @@ class StatisticsNetvalueResource(BaseResource):
     get_schema = StatisticsNetValueSchema()
 
     @use_kwargs(get_schema, location='json_and_query')
-    def get(self, include_nfts: bool) -> Response:
-        return self.rest_api.query_netvalue_data(include_nfts)
+    def get(self, include_nfts: bool, max_points: Optional[int]) -> Response:
+        return self.rest_api.query_netvalue_data(include_nfts, max_points)
 
 
 class StatisticsAssetBalanceResource(BaseResource):
@@ -911,11 +930,13 @@ class StatisticsAssetBalanceResource(BaseResource):
             asset: Asset,
             from_timestamp: Timestamp,
             to_timestamp: Timestamp,
+            max_points: Optional[int],
     ) -> Response:
         return self.rest_api.query_timed_balances_data(
             asset=asset,
             from_timestamp=from_timestamp,
             to_timestamp=to_timestamp,
+            max_points=max_points,
         )
 
 
@@ -1344,6 +1365,12 @@ class EthereumModuleDataResource(BaseResource):
         return self.rest_api.purge_module_data(module_name=None)
 
 
+class EthereumNodesResource(BaseResource):
+
+    def get(self) -> Response:
+        return self.rest_api.get_ethereum_nodes()
+
+
 class EthereumModuleResource(BaseResource):
 
     def get(self) -> Response:
@@ -11,6 +11,7 @@ from enum import Enum
 class WSMessageType(Enum):
     LEGACY = 0
     BALANCE_SNAPSHOT_ERROR = 1
+    DB_UPGRADE_STATUS = 2
 
     def __str__(self) -> str:
         return self.name.lower()  # pylint: disable=no-member
@@ -1,7 +1,7 @@
 import logging
 from dataclasses import InitVar, dataclass, field
 from functools import total_ordering
-from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar, Union
 
 from rotkehlchen.constants.misc import NFT_DIRECTIVE
 from rotkehlchen.constants.resolver import (
@@ -557,10 +557,72 @@ WORLD_TO_CRYPTOCOM = {
 # Create a generic variable that can be 'Asset', or any subclass.
 Z = TypeVar('Z', bound='Asset')
 
+# A related asset (forked/swapped_for) is kept as its identifier until first accessed
+LazyAsset = Union[str, 'Asset', None]
+
+
+# Maximum number of asset instances kept in the identity map
+ASSETS_REGISTRY_MAX_SIZE = 10000
+
+
+class InternedAssetMeta(type):
+    """Metaclass that makes constructing an asset return a shared instance
+
+    Assets are immutable, so for each class and (lowercased) identifier only
+    one object needs to exist. Constructed assets are kept in a bounded identity
+    map. When it is full the oldest entries are evicted.
+
+    Direct field initialization always creates a new object since the caller is
+    going to populate the fields itself.
+    """
+    registry: Dict[Tuple[type, str], Any] = {}
+
+    def __call__(  # type: ignore  # different signature than type.__call__
+            cls,
+            identifier: str,
+            form_with_incomplete_data: bool = False,
+            direct_field_initialization: bool = False,
+    ) -> Any:
+        if direct_field_initialization is True or not isinstance(identifier, str):
+            return super().__call__(
+                identifier,
+                form_with_incomplete_data=form_with_incomplete_data,
+                direct_field_initialization=direct_field_initialization,
+            )
+
+        key = (cls, identifier.lower())
+        asset = InternedAssetMeta.registry.get(key)
+        if asset is None:
+            asset = super().__call__(
+                identifier,
+                form_with_incomplete_data=form_with_incomplete_data,
+            )
+            if len(InternedAssetMeta.registry) >= ASSETS_REGISTRY_MAX_SIZE:
+                # dicts keep insertion order so this evicts the oldest entry
+                InternedAssetMeta.registry.pop(next(iter(InternedAssetMeta.registry)))
+            InternedAssetMeta.registry[key] = asset
+
+        return asset
+
+    @staticmethod
+    def clear_registry(identifier: Optional[str] = None) -> None:
+        """Drop either all or all instances of a single asset from the identity map"""
+        if identifier is None:
+            InternedAssetMeta.registry.clear()
+            return
+
+        lowered_identifier = identifier.lower()
+        # tokens are constructed with the address and not the full identifier
+        lowered_address = None
+        if lowered_identifier.startswith(ETHEREUM_DIRECTIVE):
+            lowered_address = lowered_identifier[ETHEREUM_DIRECTIVE_LENGTH:]
+        for key in [x for x in InternedAssetMeta.registry if x[1] in (lowered_identifier, lowered_address)]:  # noqa: E501
+            InternedAssetMeta.registry.pop(key, None)
+
 
 @total_ordering
 @dataclass(init=True, repr=True, eq=False, order=False, unsafe_hash=False, frozen=True)
-class Asset():
+class Asset(metaclass=InternedAssetMeta):
     identifier: str
     form_with_incomplete_data: InitVar[bool] = field(default=False)
     direct_field_initialization: InitVar[bool] = field(default=False)
@@ -568,8 +630,9 @@ class Asset():
     symbol: str = field(init=False)
     asset_type: AssetType = field(init=False)
     started: Optional[Timestamp] = field(init=False)
-    forked: Optional['Asset'] = field(init=False)
-    swapped_for: Optional['Asset'] = field(init=False)
+    # Resolved lazily by the forked and swapped_for properties
+    _forked: LazyAsset = field(init=False, repr=False)
+    _swapped_for: LazyAsset = field(init=False, repr=False)
     # None means no special mapping. '' means not supported
     cryptocompare: Optional[str] = field(init=False)
     coingecko: Optional[str] = field(init=False)
@@ -605,8 +668,8 @@ class Asset():
             object.__setattr__(self, 'symbol', self.identifier[len(NFT_DIRECTIVE):])
             object.__setattr__(self, 'asset_type', AssetType.NFT)
             object.__setattr__(self, 'started', 0)
-            object.__setattr__(self, 'forked', None)
-            object.__setattr__(self, 'swapped_for', None)
+            object.__setattr__(self, '_forked', None)
+            object.__setattr__(self, '_swapped_for', None)
             object.__setattr__(self, 'cryptocompare', '')
             object.__setattr__(self, 'coingecko', None)
             return
@@ -625,23 +688,37 @@ class Asset():
         object.__setattr__(self, 'symbol', data.symbol)
         object.__setattr__(self, 'asset_type', data.asset_type)
         object.__setattr__(self, 'started', data.started)
-        forked = None
-        if data.forked is not None:
-            try:
-                forked = Asset(data.forked)
-            except UnknownAsset:  # should not happen due to foreign keys
-                log.error(f'Forked asset {data.forked} for {self.identifier} could not be found')
-        object.__setattr__(self, 'forked', forked)
-        swapped_for = None
-        if data.swapped_for is not None:
-            try:
-                swapped_for = Asset(data.swapped_for)
-            except UnknownAsset:  # should not happen due to foreign keys
-                log.error(f'Swapped for asset {data.swapped_for} for {self.identifier} could not be found')  # noqa: E501
-        object.__setattr__(self, 'swapped_for', swapped_for)
+        # forked and swapped_for are rarely read so only resolve them when accessed
+        object.__setattr__(self, '_forked', data.forked)
+        object.__setattr__(self, '_swapped_for', data.swapped_for)
         object.__setattr__(self, 'cryptocompare', data.cryptocompare)
         object.__setattr__(self, 'coingecko', data.coingecko)
 
+    def _resolve_related_asset(self, attribute: str, description: str) -> Optional['Asset']:
+        """Turns the identifier stored in a related asset attribute to an Asset
+
+        The result is stored back so that resolution happens only once
+        """
+        value = getattr(self, attribute)
+        if not isinstance(value, str):
+            return value
+
+        related: Optional[Asset] = None
+        try:
+            related = Asset(value)
+        except UnknownAsset:  # should not happen due to foreign keys
+            log.error(f'{description} asset {value} for {self.identifier} could not be found')
+        object.__setattr__(self, attribute, related)
+        return related
+
+    @property
+    def forked(self) -> Optional['Asset']:
+        return self._resolve_related_asset('_forked', 'Forked')
+
+    @property
+    def swapped_for(self) -> Optional['Asset']:
+        return self._resolve_related_asset('_swapped_for', 'Swapped for')
+
     def serialize(self) -> str:
         return self.identifier
 
@@ -738,21 +815,25 @@ class Asset():
             name: Optional[str] = None,
             symbol: Optional[str] = None,
             started: Optional[Timestamp] = None,
-            forked: Optional['Asset'] = None,
-            swapped_for: Optional['Asset'] = None,
+            forked: LazyAsset = None,
+            swapped_for: LazyAsset = None,
             coingecko: Optional[str] = None,
             # add the asset with inactive cryptocompare so querying is not attempted by symbol
             cryptocompare: Optional[str] = '',
     ) -> Z:
-        """Initialize an asset from fields"""
+        """Initialize an asset from fields
+
+        forked and swapped_for can also be given as identifiers in which case
+        they are resolved when first accessed.
+        """
         asset = cls('whatever', direct_field_initialization=True)
         object.__setattr__(asset, 'identifier', identifier)
         object.__setattr__(asset, 'name', name)
         object.__setattr__(asset, 'symbol', symbol)
         object.__setattr__(asset, 'asset_type', asset_type)
         object.__setattr__(asset, 'started', started)
-        object.__setattr__(asset, 'forked', forked)
-        object.__setattr__(asset, 'swapped_for', swapped_for)
+        object.__setattr__(asset, '_forked', forked)
+        object.__setattr__(asset, '_swapped_for', swapped_for)
         object.__setattr__(asset, 'cryptocompare', cryptocompare)
         object.__setattr__(asset, 'coingecko', coingecko)
         return asset
@@ -836,7 +917,7 @@ class HasEthereumToken(Asset):
             name: Optional[str] = None,
             symbol: Optional[str] = None,
             started: Optional[Timestamp] = None,
-            swapped_for: Optional[Asset] = None,
+            swapped_for: LazyAsset = None,
             coingecko: Optional[str] = None,
             # add the token with inactive cryptocompare so querying is not attempted by symbol
             cryptocompare: Optional[str] = '',
@@ -850,8 +931,8 @@ class HasEthereumToken(Asset):
         object.__setattr__(token, 'symbol', symbol)
         object.__setattr__(token, 'asset_type', AssetType.ETHEREUM_TOKEN)
         object.__setattr__(token, 'started', started)
-        object.__setattr__(token, 'forked', None)
-        object.__setattr__(token, 'swapped_for', swapped_for)
+        object.__setattr__(token, '_forked', None)
+        object.__setattr__(token, '_swapped_for', swapped_for)
         object.__setattr__(token, 'cryptocompare', cryptocompare)
         object.__setattr__(token, 'coingecko', coingecko)
         object.__setattr__(token, 'ethereum_address', address)
@@ -866,18 +947,19 @@ class HasEthereumToken(Asset):
             entry: EthereumTokenDBTuple,
             underlying_tokens: Optional[List[UnderlyingToken]] = None,
     ) -> Y:
-        """May raise UnknownAsset if the swapped for asset can't be recognized
+        """Create a token out of a DB entry
 
-        That error would be bad because it would mean somehow an unknown id made it into the DB
+        The swapped for asset is resolved lazily. If it can't be recognized at that
+        point an error is logged. That would be bad because it would mean somehow an
+        unknown id made it into the DB.
         """
-        swapped_for = Asset(entry[6]) if entry[6] is not None else None
         return cls.initialize(
             address=entry[1],  # type: ignore
             decimals=entry[2],
             name=entry[3],
             symbol=entry[4],
             started=Timestamp(entry[5]),  # type: ignore
-            swapped_for=swapped_for,
+            swapped_for=entry[6],
             coingecko=entry[7],
             cryptocompare=entry[8],
             protocol=entry[9],
@@ -24,7 +24,8 @@ from rotkehlchen.constants.assets import A_DAI, A_SAI
 from rotkehlchen.constants.resolver import strethaddress_to_identifier
 from rotkehlchen.db.upgrades.v7_v8 import COINBASE_DAI_UPGRADE_END_TS
 from rotkehlchen.errors import DeserializationError, UnsupportedAsset
-from rotkehlchen.typing import Timestamp
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.typing import Location, Timestamp
 from rotkehlchen.utils.misc import ts_now
 
 UNSUPPORTED_POLONIEX_ASSETS = (
@@ -753,6 +754,42 @@ NEXO_TO_WORLD = {v: k for k, v in WORLD_TO_NEXO.items()}
 BITPANDA_TO_WORLD = {v: k for k, v in WORLD_TO_BITPANDA.items()}
 CRYPTOCOM_TO_WORLD = {v: k for k, v in WORLD_TO_CRYPTOCOM.items()}
 
+# Some names are not in the map since kraken can have multiple representations
+# depending on the pair for the same asset. For example XXBT and XBT, XETH and ETH,
+# ZUSD and USD
+KRAKEN_SPECIAL_NAMES = {
+    'SETH': 'ETH2',
+    'XBT': 'BTC',
+    'XDG': 'DOGE',
+    **{x: x for x in ('ETH', 'EUR', 'USD', 'GBP', 'CAD', 'JPY', 'KRW', 'CHF', 'AUD')},
+}
+
+# The mappings used to build the symbol translation table of each exchange
+EXCHANGE_TO_WORLD: Dict[Location, Dict[str, str]] = {
+    Location.KRAKEN: {**KRAKEN_TO_WORLD, **KRAKEN_SPECIAL_NAMES},
+    Location.POLONIEX: POLONIEX_TO_WORLD,
+    Location.BITTREX: BITTREX_TO_WORLD,
+    Location.BINANCE: BINANCE_TO_WORLD,
+    # bitfinex symbols are already mapped with the exchange's currency map
+    Location.BITFINEX: {},
+    Location.FTX: FTX_TO_WORLD,
+    Location.KUCOIN: KUCOIN_TO_WORLD,
+    Location.ICONOMI: ICONOMI_TO_WORLD,
+    Location.COINBASEPRO: COINBASE_PRO_TO_WORLD,
+    Location.COINBASE: COINBASE_TO_WORLD,
+    Location.UPHOLD: UPHOLD_TO_WORLD,
+    Location.BITSTAMP: BITSTAMP_TO_WORLD,
+    Location.GEMINI: GEMINI_TO_WORLD,
+    Location.NEXO: NEXO_TO_WORLD,
+    Location.BITPANDA: BITPANDA_TO_WORLD,
+    Location.CRYPTOCOM: CRYPTOCOM_TO_WORLD,
+}
+# Exchanges that use the symbols table of another exchange
+SHARED_EXCHANGE_SYMBOLS = {
+    Location.BINANCEUS: Location.BINANCE,
+    Location.FTXUS: Location.FTX,
+}
+
 RENAMED_BINANCE_ASSETS = {
     # The old BCC in binance forked into BCHABC and BCHSV
     # but for old trades the canonical chain is ABC (BCH in rotkehlchen)
@@ -766,6 +803,31 @@ RENAMED_BINANCE_ASSETS = {
 }
 
 
+def load_exchange_symbols(location: Location) -> None:
+    """Makes sure the symbol translation table of an exchange is loaded in memory so
+    that deserializing its data does not need to query the DB for each symbol"""
+    location = SHARED_EXCHANGE_SYMBOLS.get(location, location)
+    to_world = EXCHANGE_TO_WORLD.get(location)
+    if to_world is not None:
+        GlobalDBHandler().get_exchange_symbols(location, to_world)
+
+
+def _exchange_symbol_to_asset(location: Location, symbol: str) -> Asset:
+    """Turns an exchange symbol to an asset via the exchange's symbol translation table
+
+    Symbols not in the table are looked up in the DB after mapping them to world symbols.
+
+    May raise:
+    - UnknownAsset
+    """
+    to_world = EXCHANGE_TO_WORLD[location]
+    identifier = GlobalDBHandler().get_exchange_symbols(location, to_world).get(symbol)
+    if identifier is not None:
+        return Asset(identifier)
+
+    return symbol_to_asset_or_token(to_world.get(symbol, symbol))
+
+
 def asset_from_kraken(kraken_name: str) -> Asset:
     """May raise:
     - DeserializationError
@@ -783,20 +845,7 @@ def asset_from_kraken(kraken_name: str) -> Asset:
     if kraken_name.endswith('.HOLD'):
         kraken_name = kraken_name[:-5]
 
-    # Some names are not in the map since kraken can have multiple representations
-    # depending on the pair for the same asset. For example XXBT and XBT, XETH and ETH,
-    # ZUSD and USD
-    if kraken_name == 'SETH':
-        name = 'ETH2'
-    elif kraken_name == 'XBT':
-        name = 'BTC'
-    elif kraken_name == 'XDG':
-        name = 'DOGE'
-    elif kraken_name in ('ETH', 'EUR', 'USD', 'GBP', 'CAD', 'JPY', 'KRW', 'CHF', 'AUD'):
-        name = kraken_name
-    else:
-        name = KRAKEN_TO_WORLD.get(kraken_name, kraken_name)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.KRAKEN, kraken_name)
 
 
 def asset_from_poloniex(poloniex_name: str) -> Asset:
@@ -811,8 +860,7 @@ def asset_from_poloniex(poloniex_name: str) -> Asset:
     if poloniex_name in UNSUPPORTED_POLONIEX_ASSETS:
         raise UnsupportedAsset(poloniex_name)
 
-    our_name = POLONIEX_TO_WORLD.get(poloniex_name, poloniex_name)
-    return symbol_to_asset_or_token(our_name)
+    return _exchange_symbol_to_asset(Location.POLONIEX, poloniex_name)
 
 
 def asset_from_bitfinex(
@@ -838,7 +886,7 @@ def asset_from_bitfinex(
         currency_map.update(BITFINEX_TO_WORLD)
 
     symbol = currency_map.get(bitfinex_name, bitfinex_name)
-    return symbol_to_asset_or_token(symbol)
+    return _exchange_symbol_to_asset(Location.BITFINEX, symbol)
 
 
 def asset_from_bitstamp(bitstamp_name: str) -> Asset:
@@ -850,8 +898,7 @@ def asset_from_bitstamp(bitstamp_name: str) -> Asset:
     if not isinstance(bitstamp_name, str):
         raise DeserializationError(f'Got non-string type {type(bitstamp_name)} for bitstamp asset')
 
-    name = BITSTAMP_TO_WORLD.get(bitstamp_name, bitstamp_name)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.BITSTAMP, bitstamp_name)
 
 
 def asset_from_bittrex(bittrex_name: str) -> Asset:
@@ -866,8 +913,7 @@ def asset_from_bittrex(bittrex_name: str) -> Asset:
     if bittrex_name in UNSUPPORTED_BITTREX_ASSETS:
         raise UnsupportedAsset(bittrex_name)
 
-    name = BITTREX_TO_WORLD.get(bittrex_name, bittrex_name)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.BITTREX, bittrex_name)
 
 
 def asset_from_coinbasepro(coinbase_pro_name: str) -> Asset:
@@ -881,8 +927,7 @@ def asset_from_coinbasepro(coinbase_pro_name: str) -> Asset:
             f'Got non-string type {type(coinbase_pro_name)} for '
             f'coinbasepro asset',
         )
-    name = COINBASE_PRO_TO_WORLD.get(coinbase_pro_name, coinbase_pro_name)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.COINBASEPRO, coinbase_pro_name)
 
 
 def asset_from_binance(binance_name: str) -> Asset:
@@ -900,8 +945,7 @@ def asset_from_binance(binance_name: str) -> Asset:
     if binance_name in RENAMED_BINANCE_ASSETS:
         return Asset(RENAMED_BINANCE_ASSETS[binance_name])
 
-    name = BINANCE_TO_WORLD.get(binance_name, binance_name)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.BINANCE, binance_name)
 
 
 def asset_from_coinbase(cb_name: str, time: Optional[Timestamp] = None) -> Asset:
@@ -926,8 +970,7 @@ def asset_from_coinbase(cb_name: str, time: Optional[Timestamp] = None) -> Asset
     if not isinstance(cb_name, str):
         raise DeserializationError(f'Got non-string type {type(cb_name)} for coinbase asset')
 
-    name = COINBASE_TO_WORLD.get(cb_name, cb_name)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.COINBASE, cb_name)
 
 
 def asset_from_ftx(ftx_name: str) -> Asset:
@@ -943,10 +986,9 @@ def asset_from_ftx(ftx_name: str) -> Asset:
         raise UnsupportedAsset(ftx_name)
 
     if ftx_name == 'SRM_LOCKED':
-        name = strethaddress_to_identifier('0x476c5E26a75bd202a9683ffD34359C0CC15be0fF')  # SRM
-    else:
-        name = FTX_TO_WORLD.get(ftx_name, ftx_name)
-    return symbol_to_asset_or_token(name)
+        return Asset(strethaddress_to_identifier('0x476c5E26a75bd202a9683ffD34359C0CC15be0fF'))  # SRM  # noqa: E501
+
+    return _exchange_symbol_to_asset(Location.FTX, ftx_name)
 
 
 def asset_from_kucoin(kucoin_name: str) -> Asset:
@@ -961,8 +1003,7 @@ def asset_from_kucoin(kucoin_name: str) -> Asset:
     if kucoin_name in UNSUPPORTED_KUCOIN_ASSETS:
         raise UnsupportedAsset(kucoin_name)
 
-    name = KUCOIN_TO_WORLD.get(kucoin_name, kucoin_name)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.KUCOIN, kucoin_name)
 
 
 def asset_from_gemini(symbol: str) -> Asset:
@@ -977,8 +1018,7 @@ def asset_from_gemini(symbol: str) -> Asset:
     if symbol in UNSUPPORTED_GEMINI_ASSETS:
         raise UnsupportedAsset(symbol)
 
-    name = GEMINI_TO_WORLD.get(symbol, symbol)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.GEMINI, symbol)
 
 
 def asset_from_iconomi(symbol: str) -> Asset:
@@ -992,8 +1032,7 @@ def asset_from_iconomi(symbol: str) -> Asset:
     symbol = symbol.upper()
     if symbol in UNSUPPORTED_ICONOMI_ASSETS:
         raise UnsupportedAsset(symbol)
-    name = ICONOMI_TO_WORLD.get(symbol, symbol)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.ICONOMI, symbol)
 
 
 def asset_from_uphold(symbol: str) -> Asset:
@@ -1005,8 +1044,7 @@ def asset_from_uphold(symbol: str) -> Asset:
     if not isinstance(symbol, str):
         raise DeserializationError(f'Got non-string type {type(symbol)} for uphold asset')
 
-    name = UPHOLD_TO_WORLD.get(symbol, symbol)
-    return symbol_to_asset_or_token(name)
+    return _exchange_symbol_to_asset(Location.UPHOLD, symbol)
 
 
 def asset_from_nexo(nexo_name: str) -> Asset:
@@ -1018,8 +1056,7 @@ def asset_from_nexo(nexo_name: str) -> Asset:
     if not isinstance(nexo_name, str):
         raise DeserializationError(f'Got non-string type {type(nexo_name)} for nexo asset')
 
-    our_name = NEXO_TO_WORLD.get(nexo_name, nexo_name)
-    return symbol_to_asset_or_token(our_name)
+    return _exchange_symbol_to_asset(Location.NEXO, nexo_name)
 
 
 def asset_from_bitpanda(bitpanda_name: str) -> Asset:
@@ -1031,8 +1068,7 @@ def asset_from_bitpanda(bitpanda_name: str) -> Asset:
     if not isinstance(bitpanda_name, str):
         raise DeserializationError(f'Got non-string type {type(bitpanda_name)} for bitpanda asset')
 
-    our_name = BITPANDA_TO_WORLD.get(bitpanda_name, bitpanda_name)
-    return symbol_to_asset_or_token(our_name)
+    return _exchange_symbol_to_asset(Location.BITPANDA, bitpanda_name)
 
 
 def asset_from_cryptocom(cryptocom_name: str) -> Asset:
@@ -1046,5 +1082,4 @@ def asset_from_cryptocom(cryptocom_name: str) -> Asset:
             f'Got non-string type {type(cryptocom_name)} for cryptocom asset',
         )
 
-    symbol = CRYPTOCOM_TO_WORLD.get(cryptocom_name, cryptocom_name)
-    return symbol_to_asset_or_token(symbol)
+    return _exchange_symbol_to_asset(Location.CRYPTOCOM, cryptocom_name)
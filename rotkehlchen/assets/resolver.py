@@ -1,15 +1,24 @@
-from typing import Dict, Optional
+import logging
+import sys
+from typing import Dict, Optional, Set
 
 from rotkehlchen.errors import UnknownAsset
 from rotkehlchen.globaldb import GlobalDBHandler
+from rotkehlchen.logging import RotkehlchenLogsAdapter
 
+from .asset import InternedAssetMeta
 from .typing import AssetData
 
+logger = logging.getLogger(__name__)
+log = RotkehlchenLogsAdapter(logger)
+
 
 class AssetResolver():
     __instance: Optional['AssetResolver'] = None
     # A cache so that the DB is not hit every time
     assets_cache: Dict[str, AssetData] = {}
+    # True if the memory cache was populated with all assets of the DB at once
+    warmed_up: bool = False
 
     def __new__(cls) -> 'AssetResolver':
         """Lazily initializes AssetResolver
@@ -24,13 +33,73 @@ class AssetResolver():
 
     @staticmethod
     def clean_memory_cache(identifier: Optional[str] = None) -> None:
-        """Clean the memory cache of either a single or all assets"""
+        """Clean the memory cache of either a single or all assets
+
+        Also drops the interned asset instances so that they get recreated from the DB
+        """
         assert AssetResolver.__instance is not None, 'when cleaning the cache instance should be set'  # noqa: E501
 
         if identifier is None:  # clean all
             AssetResolver.__instance.assets_cache.clear()
+            AssetResolver.warmed_up = False
         else:
             AssetResolver.__instance.assets_cache.pop(identifier.lower(), None)
+        InternedAssetMeta.clear_registry(identifier)
+
+    @staticmethod
+    def warm_up() -> None:
+        """Populate the memory cache with the data of all assets using a single DB query
+
+        Assets that can't be fully resolved, such as tokens missing basic data,
+        are left out and still looked up in the DB one by one when requested.
+        """
+        instance = AssetResolver()
+        for asset_data in GlobalDBHandler().get_resolvable_assets_data():
+            instance.assets_cache[asset_data.identifier.lower()] = asset_data
+        AssetResolver.warmed_up = True
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f'Warmed up the asset resolver with {len(instance.assets_cache)} assets '
+                f'taking {AssetResolver.get_memory_footprint()} bytes',
+            )
+
+    @staticmethod
+    def refresh_cache(identifier: Optional[str] = None) -> None:
+        """Update the memory cache after either a single or all assets changed in the DB
+
+        If the cache was warmed up the changed entries are reloaded from the DB,
+        otherwise they are just dropped and will be queried again when needed.
+        """
+        instance = AssetResolver()
+        was_warmed_up = AssetResolver.warmed_up
+        AssetResolver.clean_memory_cache(identifier)
+        if was_warmed_up is False:
+            return
+
+        if identifier is None:
+            AssetResolver.warm_up()
+            return
+
+        for asset_data in GlobalDBHandler().get_resolvable_assets_data(specific_ids=[identifier]):
+            instance.assets_cache[asset_data.identifier.lower()] = asset_data
+
+    @staticmethod
+    def get_memory_footprint() -> int:
+        """Returns an estimate of the bytes taken by the asset data memory cache
+
+        Objects shared among entries, such as the asset types, are only counted once.
+        """
+        cache = AssetResolver().assets_cache
+        seen: Set[int] = set()
+        size = sys.getsizeof(cache)
+        for key, asset_data in cache.items():
+            for entry in (key, asset_data, *asset_data):
+                if id(entry) in seen:
+                    continue
+                seen.add(id(entry))
+                size += sys.getsizeof(entry)
+
+        return size
 
     @staticmethod
     def get_asset_data(
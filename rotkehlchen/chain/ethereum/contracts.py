@@ -5,9 +5,12 @@ from typing_extensions import Literal
 from web3 import Web3
 from web3._utils.abi import get_abi_output_types
 
+from rotkehlchen.chain.ethereum.typing import EthereumCallType
 from rotkehlchen.typing import ChecksumEthAddress
 
 if TYPE_CHECKING:
+    from gevent.lock import BoundedSemaphore
+
     from rotkehlchen.chain.ethereum.manager import EthereumManager, NodeName
 
 WEB3 = Web3()
@@ -24,6 +27,9 @@ class EthereumContract(NamedTuple):
             method_name: str,
             arguments: Optional[List[Any]] = None,
             call_order: Optional[Sequence['NodeName']] = None,
+            call_type: EthereumCallType = EthereumCallType.CONTRACT_CALL,
+            block_identifier: Union[int, Literal['latest']] = 'latest',
+            node_semaphores: Optional[Dict['NodeName', 'BoundedSemaphore']] = None,
     ) -> Any:
         return ethereum.call_contract(
             contract_address=self.address,
@@ -31,6 +37,9 @@ class EthereumContract(NamedTuple):
             method_name=method_name,
             arguments=arguments,
             call_order=call_order,
+            call_type=call_type,
+            block_identifier=block_identifier,
+            node_semaphores=node_semaphores,
         )
 
     def get_logs(
@@ -1,22 +1,29 @@
 import json
 import logging
 import random
+import time
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, overload
 from urllib.parse import urlparse
 
+import gevent
 import requests
 from ens import ENS
 from ens.abis import ENS as ENS_ABI, RESOLVER as ENS_RESOLVER_ABI
 from ens.exceptions import InvalidName
 from ens.main import ENS_MAINNET_ADDR
 from ens.utils import is_none_or_zero_address, normal_name_to_hash, normalize_name
+from eth_abi.exceptions import DecodingError
 from eth_typing import BlockNumber, HexStr
+from gevent.lock import BoundedSemaphore
+from gevent.pool import Pool
 from typing_extensions import Literal
 from web3 import HTTPProvider, Web3
-from web3._utils.abi import get_abi_output_types
+from web3._utils.abi import get_abi_output_types, map_abi_data
 from web3._utils.contracts import find_matching_event_abi
 from web3._utils.filters import construct_event_filter_params
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import Contract
 from web3.datastructures import MutableAttributeDict
 from web3.exceptions import BadFunctionCallOutput, BadResponseFormat, TransactionNotFound
 from web3.middleware.exception_retry_request import http_retry_request_middleware
@@ -26,6 +33,7 @@ from rotkehlchen.chain.constants import DEFAULT_EVM_RPC_TIMEOUT
 from rotkehlchen.chain.ethereum.contracts import EthereumContract
 from rotkehlchen.chain.ethereum.graph import Graph
 from rotkehlchen.chain.ethereum.modules.eth2 import ETH2_DEPOSIT
+from rotkehlchen.chain.ethereum.node_health import CircuitState, NodeHealth
 from rotkehlchen.chain.ethereum.typing import string_to_ethereum_address
 from rotkehlchen.chain.ethereum.utils import multicall_2
 from rotkehlchen.constants.ethereum import ERC20TOKEN_ABI, ETH_SCAN
@@ -38,6 +46,7 @@ from rotkehlchen.errors import (
 )
 from rotkehlchen.externalapis.etherscan import Etherscan
 from rotkehlchen.fval import FVal
+from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.greenlets import GreenletManager
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.serialization.deserialize import (
@@ -53,10 +62,11 @@ from rotkehlchen.typing import (
     Timestamp,
 )
 from rotkehlchen.user_messages import MessagesAggregator
-from rotkehlchen.utils.misc import from_wei, hex_or_bytes_to_str
+from rotkehlchen.utils.misc import from_wei, get_chunks, hex_or_bytes_to_str
 from rotkehlchen.utils.network import request_get_dict
+from rotkehlchen.utils.serialization import jsonloads_list
 
-from .typing import NodeName
+from .typing import EthereumCallType, NodeName
 from .utils import ENS_RESOLVER_ABI_MULTICHAIN_ADDRESS
 
 logger = logging.getLogger(__name__)
@@ -164,6 +174,38 @@ def _query_web3_get_logs(
     return events
 
 
+def _deserialize_raw_tx_receipt(tx_receipt: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """Turns the hex numbers of a receipt as returned by the JSON-RPC API to ints,
+    as web3 does for the receipts it returns
+
+    May raise:
+    - DeserializationError if the receipt can't be deserialized
+    """
+    try:
+        block_number = int(tx_receipt['blockNumber'], 16)
+        tx_receipt['blockNumber'] = block_number
+        tx_receipt['cumulativeGasUsed'] = int(tx_receipt['cumulativeGasUsed'], 16)
+        tx_receipt['gasUsed'] = int(tx_receipt['gasUsed'], 16)
+        # Receipts of transactions before byzantium have no status. Assume success.
+        status = tx_receipt.get('status')
+        tx_receipt['status'] = 1 if status is None else int(status, 16)
+        tx_index = int(tx_receipt['transactionIndex'], 16)
+        tx_receipt['transactionIndex'] = tx_index
+        for receipt_log in tx_receipt['logs']:
+            receipt_log['blockNumber'] = block_number
+            receipt_log['logIndex'] = deserialize_int_from_hex(
+                symbol=receipt_log['logIndex'],
+                location=f'{source} tx receipt',
+            )
+            receipt_log['transactionIndex'] = tx_index
+    except (DeserializationError, ValueError, KeyError, TypeError) as e:
+        raise DeserializationError(
+            f'Couldnt deserialize transaction receipt data from {source} {tx_receipt}',
+        ) from e
+
+    return tx_receipt
+
+
 # TODO: Ideally all these should become configurable
 # Taking LINKPOOL out since it's just really too slow and seems to not
 # respond to the batched calls almost at all. Combined with web3.py retries
@@ -189,6 +231,9 @@ ETHEREUM_NODES_TO_CONNECT_AT_START = (
     # NodeName.LINKPOOL,
     NodeName.CLOUDFLARE_ETH,
 )
+# How many receipts to ask a node for in one JSON-RPC batch request
+MAX_RECEIPTS_PER_BATCH_REQUEST = 100
+ETHERSCAN_MAX_CONCURRENT_RECEIPT_QUERIES = 2
 OPEN_NODES_WEIGHT_MAP = {  # Probability with which to select each node
     NodeName.ETHERSCAN: 0.3,
     NodeName.MYCRYPTO: 0.15,
@@ -201,6 +246,34 @@ OPEN_NODES_WEIGHT_MAP = {  # Probability with which to select each node
 }
 
 
+def _decode_contract_call_result(
+        web3: Web3,
+        contract: Contract,
+        method_name: str,
+        arguments: Optional[List[Any]],
+        result: bytes,
+) -> Any:
+    """Decodes the raw result of a contract call the way web3's contract functions do
+
+    May raise:
+    - BlockchainQueryError if the result can't be decoded with the method's output types
+    """
+    fn_abi = contract._find_matching_fn_abi(fn_identifier=method_name, args=arguments)
+    output_types = get_abi_output_types(fn_abi)
+    try:
+        output_data = web3.codec.decode_abi(output_types, result)
+    except DecodingError as e:
+        raise BlockchainQueryError(
+            f'Error decoding the result 0x{result.hex()} of calling {method_name} '
+            f'on contract {contract.address}: {str(e)}',
+        ) from e
+
+    normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+    return normalized_data
+
+
 class EthereumManager():
     def __init__(
             self,
@@ -237,6 +310,13 @@ class EthereumManager():
         # stateless object and thus wouldn't persist.
         # Not really happy with this approach but well ...
         self.tx_per_address: Dict[ChecksumEthAddress, int] = defaultdict(int)
+        self.nodes_health: Dict[NodeName, NodeHealth] = {x: NodeHealth() for x in NodeName}
+        self.pinned_nodes: List[NodeName] = []
+        self.excluded_nodes: List[NodeName] = []
+        self.hedged_calls: List[EthereumCallType] = []
+        # How many calls at a block number found their result in the global DB
+        self.contract_call_cache_hits = 0
+        self.contract_call_cache_misses = 0
 
     def connected_to_any_web3(self) -> bool:
         return (
@@ -246,11 +326,27 @@ class EthereumManager():
             NodeName.AVADO_POOL in self.web3_mapping
         )
 
+    def set_node_preferences(
+            self,
+            pinned_nodes: List[NodeName],
+            excluded_nodes: List[NodeName],
+    ) -> None:
+        """Sets the nodes the user wants queried first, in order, and the ones never queried
+
+        A node that is both pinned and excluded is excluded.
+        """
+        self.excluded_nodes = excluded_nodes
+        self.pinned_nodes = [x for x in pinned_nodes if x not in excluded_nodes]
+
     def default_call_order(self, skip_etherscan: bool = False) -> List[NodeName]:
         """Default call order for ethereum nodes
 
-        Own node always has preference. Then all other node types are randomly queried
-        in sequence depending on a weighted probability.
+        The nodes pinned by the user always have preference, then our own node. Then
+        all other node types are randomly queried in sequence depending on a weighted
+        probability. The weight of each node is its static weight scaled by the
+        health of the node, so that nodes that answered faster and failed less in
+        the recent queries are picked more often. Nodes excluded by the user are
+        never in the call order.
 
 
         Some benchmarks on weighted probability based random selection when compared
@@ -264,25 +360,46 @@ class EthereumManager():
         ===> Runs: 66, 82, 72, 58, 72 seconds
         ---> Average: 70 seconds
         """
-        result = []
-        if NodeName.OWN in self.web3_mapping:
+        result = [
+            x for x in self.pinned_nodes
+            if x in self.web3_mapping or (x == NodeName.ETHERSCAN and not skip_etherscan)
+        ]
+        if (
+            NodeName.OWN in self.web3_mapping and
+            NodeName.OWN not in result and
+            NodeName.OWN not in self.excluded_nodes
+        ):
             result.append(NodeName.OWN)
 
-        selection = list(OPEN_NODES)
-        if skip_etherscan:
+        selection = [
+            x for x in OPEN_NODES
+            if x not in result and x not in self.excluded_nodes
+        ]
+        if skip_etherscan and NodeName.ETHERSCAN in selection:
             selection.remove(NodeName.ETHERSCAN)
 
         ordered_list = []
         while len(selection) != 0:
             weights = []
             for entry in selection:
-                weights.append(OPEN_NODES_WEIGHT_MAP[entry])
+                weights.append(self.nodes_health[entry].weight(OPEN_NODES_WEIGHT_MAP[entry]))
             node = random.choices(selection, weights, k=1)
             ordered_list.append(node[0])
             selection.remove(node[0])
 
         return result + ordered_list
 
+    def get_nodes_health(self) -> List[Dict[str, Any]]:
+        """Returns the health of all the nodes and whether they are used"""
+        now = time.monotonic()
+        return [{
+            'name': str(node),
+            'connected': node == NodeName.ETHERSCAN or node in self.web3_mapping,
+            'pinned': node in self.pinned_nodes,
+            'excluded': node in self.excluded_nodes,
+            **health.serialize(now),
+        } for node, health in self.nodes_health.items()]
+
     def attempt_connect(
             self,
             name: NodeName,
@@ -394,31 +511,163 @@ class EthereumManager():
             self.own_rpc_endpoint = endpoint
         return result, message
 
-    def query(self, method: Callable, call_order: Sequence[NodeName], **kwargs: Any) -> Any:
+    def _query_node(
+            self,
+            node: NodeName,
+            method: Callable,
+            node_semaphores: Optional[Dict[NodeName, BoundedSemaphore]] = None,
+            **kwargs: Any,
+    ) -> Tuple[bool, Any]:
+        """Performs the provided method with the given node and records the node's health
+
+        If node_semaphores are given the query first waits for the semaphore of the node,
+        so that only a limited number of queries run against it at the same time.
+
+        Returns whether the query succeeded and its result
+        """
+        if node_semaphores is not None and node in node_semaphores:
+            with node_semaphores[node]:
+                return self._query_node(node, method, **kwargs)
+
+        start = time.monotonic()
+        try:
+            result = method(self.web3_mapping.get(node, None), **kwargs)
+        except (BlockchainQueryError, TransactionNotFound, DeserializationError) as e:
+            # The node answered, but not with what we want. Could be a contract
+            # call that reverts, a not yet mined transaction or a malformed response.
+            self.nodes_health[node].record_success(time.monotonic() - start)
+            log.warning(f'Failed to query {node} for {str(method)} due to {str(e)}')
+            return False, None
+        except (
+                RemoteError,
+                requests.exceptions.RequestException,
+                KeyError,  # saw this happen inside web3.py if resulting json contains unexpected key. Probably fixed as written below, but no risking it. # noqa: E501
+                BadResponseFormat,  # should replace the above KeyError after https://github.com/ethereum/web3.py/pull/2188  # noqa: E501
+        ) as e:
+            end = time.monotonic()
+            self.nodes_health[node].record_failure(duration=end - start, now=end)
+            log.warning(f'Failed to query {node} for {str(method)} due to {str(e)}')
+            # Catch all possible errors here and just try next node call
+            return False, None
+
+        self.nodes_health[node].record_success(time.monotonic() - start)
+        return True, result
+
+    def _query_hedged(
+            self,
+            method: Callable,
+            nodes: List[NodeName],
+            node_semaphores: Optional[Dict[NodeName, BoundedSemaphore]] = None,
+            **kwargs: Any,
+    ) -> Tuple[bool, Any]:
+        """Performs the provided method with the nodes in order, but without waiting for
+        a slow node to fail
+
+        If the last queried node has not answered after the time its queries usually
+        take, or if it failed, the same query is also sent to the next node. The first
+        successful answer is returned and the queries still running are cancelled.
+        """
+        if len(nodes) == 0:
+            return False, None
+
+        pending = list(nodes)
+        running: Dict[gevent.Greenlet, NodeName] = {}
+        hedged = set()
+        last_node = nodes[0]
+        query_next = True
+        while len(pending) != 0 or len(running) != 0:
+            if query_next and len(pending) != 0:
+                last_node = pending.pop(0)
+                greenlet = gevent.spawn(
+                    self._query_node,
+                    last_node,
+                    method,
+                    node_semaphores=node_semaphores,
+                    **kwargs,
+                )
+                if len(running) != 0:  # a slower node is still queried
+                    self.nodes_health[last_node].hedges += 1
+                    hedged.add(greenlet)
+                running[greenlet] = last_node
+                query_next = False
+
+            timeout = None
+            if len(pending) != 0:
+                timeout = self.nodes_health[last_node].hedge_delay()
+            done = gevent.wait(list(running), timeout=timeout, count=1)
+            if len(done) == 0:  # the last node is slow. Also ask the next one
+                query_next = True
+                continue
+
+            for greenlet in done:
+                node = running.pop(greenlet)
+                if greenlet.successful() and greenlet.value[0] is False:
+                    query_next = True  # this node failed, don't wait for the others
+                    continue
+
+                for other_node in running.values():
+                    self.nodes_health[other_node].cancelled += 1
+                gevent.killall(list(running), block=False)
+                if greenlet.successful() is False:
+                    raise greenlet.exception
+
+                if greenlet in hedged:
+                    self.nodes_health[node].hedges_won += 1
+                return greenlet.value
+
+        return False, None
+
+    def query(
+            self,
+            method: Callable,
+            call_order: Sequence[NodeName],
+            hedge: bool = False,
+            node_semaphores: Optional[Dict[NodeName, BoundedSemaphore]] = None,
+            **kwargs: Any,
+    ) -> Any:
         """Queries ethereum related data by performing the provided method to all given nodes
 
         The first node in the call order that gets a succcesful response returns.
+        Nodes that failed many times in a row are only tried after all the others
+        and nodes excluded by the user are not tried at all. The time each node
+        takes and whether it fails is recorded in its health.
+        If hedge is True, slow nodes are not waited for before trying the next ones.
+        If node_semaphores are given each node is only queried while holding its semaphore.
         If none get a result then a remote error is raised
         """
+        now = time.monotonic()
+        healthy_nodes, broken_nodes = [], []
         for node in call_order:
-            web3 = self.web3_mapping.get(node, None)
-            if web3 is None and node != NodeName.ETHERSCAN:
+            if node in self.excluded_nodes:
                 continue
-
-            try:
-                result = method(web3, **kwargs)
-            except (
-                    RemoteError,
-                    requests.exceptions.RequestException,
-                    BlockchainQueryError,
-                    TransactionNotFound,
-                    KeyError,  # saw this happen inside web3.py if resulting json contains unexpected key. Probably fixed as written below, but no risking it. # noqa: E501
-                    BadResponseFormat,  # should replace the above KeyError after https://github.com/ethereum/web3.py/pull/2188  # noqa: E501
-            ) as e:
-                log.warning(f'Failed to query {node} for {str(method)} due to {str(e)}')
-                # Catch all possible errors here and just try next node call
+            if node not in self.web3_mapping and node != NodeName.ETHERSCAN:
                 continue
+            if self.nodes_health[node].state(now) == CircuitState.OPEN:
+                broken_nodes.append(node)
+            else:
+                healthy_nodes.append(node)
+
+        if hedge:
+            success, result = self._query_hedged(
+                method,
+                healthy_nodes + broken_nodes,
+                node_semaphores=node_semaphores,
+                **kwargs,
+            )
+        else:
+            for node in healthy_nodes + broken_nodes:
+                success, result = self._query_node(
+                    node,
+                    method,
+                    node_semaphores=node_semaphores,
+                    **kwargs,
+                )
+                if success:
+                    break
+            else:
+                success = False
 
+        if success:
             return result
 
         # no node in the call order list was succesfully queried
@@ -542,6 +791,7 @@ class EthereumManager():
             method_name='etherBalances',
             arguments=[accounts],
             call_order=call_order if call_order is not None else self.default_call_order(),
+            call_type=EthereumCallType.ETH_BALANCES,
         )
         balances = {}
         for idx, account in enumerate(accounts):
@@ -726,40 +976,27 @@ class EthereumManager():
     def _call_contract_etherscan(
             self,
             contract_address: ChecksumEthAddress,
-            abi: List,
-            method_name: str,
-            arguments: Optional[List[Any]] = None,
-    ) -> Any:
+            input_data: str,
+            block_identifier: Union[int, Literal['latest']],
+    ) -> bytes:
         """Performs an eth_call to an ethereum contract via etherscan
 
         May raise:
         - RemoteError if there is a problem with
         reaching etherscan or with the returned result
         """
-        web3 = Web3()
-        contract = web3.eth.contract(address=contract_address, abi=abi)
-        input_data = contract.encodeABI(method_name, args=arguments if arguments else [])
         result = self.etherscan.eth_call(
             to_address=contract_address,
             input_data=input_data,
+            block_identifier=block_identifier,
         )
         if result == '0x':
             raise BlockchainQueryError(
-                f'Error doing call on contract {contract_address} for {method_name} '
-                f'with arguments: {str(arguments)} via etherscan. Returned 0x result',
+                f'Error doing call on contract {contract_address} with input data '
+                f'{input_data} via etherscan. Returned 0x result',
             )
 
-        fn_abi = contract._find_matching_fn_abi(
-            fn_identifier=method_name,
-            args=arguments,
-        )
-        output_types = get_abi_output_types(fn_abi)
-        output_data = web3.codec.decode_abi(output_types, bytes.fromhex(result[2:]))
-
-        if len(output_data) == 1:
-            # due to https://github.com/PyCQA/pylint/issues/4114
-            return output_data[0]  # pylint: disable=unsubscriptable-object
-        return output_data
+        return bytes.fromhex(result[2:])
 
     def _get_transaction_receipt(
             self,
@@ -768,27 +1005,7 @@ class EthereumManager():
     ) -> Dict[str, Any]:
         if web3 is None:
             tx_receipt = self.etherscan.get_transaction_receipt(tx_hash)
-            try:
-                # Turn hex numbers to int
-                block_number = int(tx_receipt['blockNumber'], 16)
-                tx_receipt['blockNumber'] = block_number
-                tx_receipt['cumulativeGasUsed'] = int(tx_receipt['cumulativeGasUsed'], 16)
-                tx_receipt['gasUsed'] = int(tx_receipt['gasUsed'], 16)
-                tx_receipt['status'] = int(tx_receipt['status'], 16)
-                tx_index = int(tx_receipt['transactionIndex'], 16)
-                tx_receipt['transactionIndex'] = tx_index
-                for receipt_log in tx_receipt['logs']:
-                    receipt_log['blockNumber'] = block_number
-                    receipt_log['logIndex'] = deserialize_int_from_hex(
-                        symbol=receipt_log['logIndex'],
-                        location='etherscan tx receipt',
-                    )
-                    receipt_log['transactionIndex'] = tx_index
-            except (DeserializationError, ValueError) as e:
-                raise RemoteError(
-                    f'Couldnt deserialize transaction receipt data from etherscan {tx_receipt}',
-                ) from e
-            return tx_receipt
+            return _deserialize_raw_tx_receipt(tx_receipt, source='etherscan')
 
         # Can raise TransactionNotFound if the user's node is pruned and transaction is old
         tx_receipt = web3.eth.get_transaction_receipt(tx_hash)  # type: ignore
@@ -805,6 +1022,88 @@ class EthereumManager():
             tx_hash=tx_hash,
         )
 
+    def _get_transaction_receipts(
+            self,
+            web3: Optional[Web3],
+            tx_hashes: List[str],
+    ) -> List[Dict[str, Any]]:
+        """Gets the receipts of many transactions
+
+        A web3 node is sent JSON-RPC batch requests. Etherscan has no batch requests
+        so it gets a few concurrent requests, within its rate limit.
+
+        May raise:
+        - RemoteError if a request fails
+        - DeserializationError if a response can't be deserialized
+        - TransactionNotFound if the node does not have a receipt. Could be a pruned node.
+        """
+        if web3 is None:
+            pool = Pool(size=ETHERSCAN_MAX_CONCURRENT_RECEIPT_QUERIES)
+            greenlets = [
+                pool.spawn(self._get_transaction_receipt, web3=None, tx_hash=tx_hash)
+                for tx_hash in tx_hashes
+            ]
+            gevent.joinall(greenlets)
+            return [greenlet.get() for greenlet in greenlets]
+
+        tx_receipts = []
+        endpoint = web3.provider.endpoint_uri  # type: ignore  # we only use HTTPProvider
+        for chunk in get_chunks(tx_hashes, n=MAX_RECEIPTS_PER_BATCH_REQUEST):
+            payload = [{
+                'jsonrpc': '2.0',
+                'id': idx,
+                'method': 'eth_getTransactionReceipt',
+                'params': [tx_hash],
+            } for idx, tx_hash in enumerate(chunk)]
+            try:
+                response = requests.post(endpoint, json=payload, timeout=self.eth_rpc_timeout)
+            except requests.exceptions.RequestException as e:
+                raise RemoteError(f'Batch request to {endpoint} failed due to {str(e)}') from e
+
+            if response.status_code != 200:
+                raise RemoteError(
+                    f'Batch request to {endpoint} failed with HTTP status code '
+                    f'{response.status_code} and text {response.text}',
+                )
+            try:
+                results = {x['id']: x for x in jsonloads_list(response.text)}
+            except (json.JSONDecodeError, TypeError, KeyError) as e:
+                raise RemoteError(
+                    f'Batch request to {endpoint} returned an unexpected response {response.text}',
+                ) from e
+
+            for idx, tx_hash in enumerate(chunk):
+                result = results.get(idx)
+                if result is None or 'error' in result:
+                    raise RemoteError(
+                        f'Batch request to {endpoint} returned no receipt for {tx_hash}. '
+                        f'Got {result}',
+                    )
+                if result.get('result') is None:
+                    raise TransactionNotFound(f'Transaction with hash {tx_hash} not found')
+                tx_receipts.append(_deserialize_raw_tx_receipt(result['result'], source=endpoint))
+
+        return tx_receipts
+
+    def get_transaction_receipts(
+            self,
+            tx_hashes: List[str],
+            call_order: Optional[Sequence[NodeName]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Gets the receipts of the given transactions in the same order
+
+        Each node is asked for all of them. If a node fails to return any of them
+        the next node is asked for all of them again.
+
+        May raise:
+        - RemoteError if no node returned all of the receipts
+        """
+        return self.query(
+            method=self._get_transaction_receipts,
+            call_order=call_order if call_order is not None else self.default_call_order(),
+            tx_hashes=tx_hashes,
+        )
+
     def _get_transaction_by_hash(
             self,
             web3: Optional[Web3],
@@ -842,15 +1141,69 @@ class EthereumManager():
             method_name: str,
             arguments: Optional[List[Any]] = None,
             call_order: Optional[Sequence[NodeName]] = None,
+            call_type: EthereumCallType = EthereumCallType.CONTRACT_CALL,
+            block_identifier: Union[int, Literal['latest']] = 'latest',
+            node_semaphores: Optional[Dict[NodeName, BoundedSemaphore]] = None,
     ) -> Any:
-        return self.query(
-            method=self._call_contract,
+        """Calls the method of the contract at the state of the given block. If the call
+        type is in the hedged calls then the call is sent to more nodes when the first
+        ones are slow. If node_semaphores are given each node is queried while holding
+        its semaphore.
+
+        The results of calls at a block number can't change so they are kept in the
+        global DB and only queried from the nodes the first time.
+
+        May raise:
+        - RemoteError if no node could be queried
+        - BlockchainQueryError if the call failed or its result can't be decoded
+        """
+        web3 = Web3()
+        contract = web3.eth.contract(address=contract_address, abi=abi)
+        input_data = contract.encodeABI(method_name, args=arguments if arguments else [])
+        input_hash = bytes(Web3.keccak(hexstr=input_data))
+        if isinstance(block_identifier, int):
+            cached_result = GlobalDBHandler().get_contract_call_result(
+                chain=SupportedBlockchain.ETHEREUM.value,
+                contract_address=contract_address,
+                input_hash=input_hash,
+                block_number=block_identifier,
+            )
+            if cached_result is not None:
+                self.contract_call_cache_hits += 1
+                return _decode_contract_call_result(
+                    web3=web3,
+                    contract=contract,
+                    method_name=method_name,
+                    arguments=arguments,
+                    result=cached_result,
+                )
+            self.contract_call_cache_misses += 1
+
+        result = self.query(
+            method=self._eth_call,
             call_order=call_order if call_order is not None else self.default_call_order(),
+            hedge=call_type in self.hedged_calls,
+            node_semaphores=node_semaphores,
             contract_address=contract_address,
-            abi=abi,
+            input_data=input_data,
+            block_identifier=block_identifier,
+        )
+        output = _decode_contract_call_result(
+            web3=web3,
+            contract=contract,
             method_name=method_name,
             arguments=arguments,
+            result=result,
         )
+        if isinstance(block_identifier, int):  # only results that decoded are kept
+            GlobalDBHandler().add_contract_call_result(
+                chain=SupportedBlockchain.ETHEREUM.value,
+                contract_address=contract_address,
+                input_hash=input_hash,
+                block_number=block_identifier,
+                result=result,
+            )
+        return output
 
     def _call_contract(
             self,
@@ -860,7 +1213,38 @@ class EthereumManager():
             method_name: str,
             arguments: Optional[List[Any]] = None,
     ) -> Any:
-        """Performs an eth_call to an ethereum contract
+        """Calls the method of the contract in the given node
+
+        May raise:
+        - RemoteError if etherscan is used and there is a problem with
+        reaching it or with the returned result
+        - BlockchainQueryError if there is a VM execution error or the result
+        can't be decoded
+        """
+        offline_web3 = Web3()
+        contract = offline_web3.eth.contract(address=contract_address, abi=abi)
+        result = self._eth_call(
+            web3=web3,
+            contract_address=contract_address,
+            input_data=contract.encodeABI(method_name, args=arguments if arguments else []),
+            block_identifier='latest',
+        )
+        return _decode_contract_call_result(
+            web3=offline_web3,
+            contract=contract,
+            method_name=method_name,
+            arguments=arguments,
+            result=result,
+        )
+
+    def _eth_call(
+            self,
+            web3: Optional[Web3],
+            contract_address: ChecksumEthAddress,
+            input_data: str,
+            block_identifier: Union[int, Literal['latest']],
+    ) -> bytes:
+        """Performs an eth_call to an ethereum contract and returns the raw result
 
         May raise:
         - RemoteError if etherscan is used and there is a problem with
@@ -870,20 +1254,20 @@ class EthereumManager():
         if web3 is None:
             return self._call_contract_etherscan(
                 contract_address=contract_address,
-                abi=abi,
-                method_name=method_name,
-                arguments=arguments,
+                input_data=input_data,
+                block_identifier=block_identifier,
             )
 
-        contract = web3.eth.contract(address=contract_address, abi=abi)
         try:
-            method = getattr(contract.caller, method_name)
-            result = method(*arguments if arguments else [])
+            result = web3.eth.call(
+                {'to': contract_address, 'data': HexStr(input_data)},
+                block_identifier=block_identifier,
+            )
         except (ValueError, BadFunctionCallOutput) as e:
             raise BlockchainQueryError(
                 f'Error doing call on contract {contract_address}: {str(e)}',
             ) from e
-        return result
+        return bytes(result)
 
     def get_logs(
             self,
@@ -10,7 +10,7 @@ from rotkehlchen.chain.ethereum.defi.defisaver_proxy import HasDSProxy
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_DAI
 from rotkehlchen.constants.ethereum import MAKERDAO_DAI_JOIN, MAKERDAO_POT
-from rotkehlchen.errors import DeserializationError, RemoteError
+from rotkehlchen.errors import BlockchainQueryError, DeserializationError, RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.price import query_usd_price_or_use_default
 from rotkehlchen.inquirer import Inquirer
@@ -204,6 +204,32 @@ class MakerdaoDsr(HasDSProxy):
                     value = None
         return value * RAY  # turn it from DAI to RAD
 
+    def _get_chi_at_movement(self, movement: DSRMovement) -> FVal:
+        """Returns the chi of the pot at the block of the movement. Joins and exits of the
+        pot need chi to be updated in the same block so this is the chi they used.
+
+        The chi is derived from the amounts of the movement, which is exact. Only if the
+        movement moved no DAI, so there is nothing to derive it from, the pot is queried
+        at the block of the movement, which needs an archive node.
+        """
+        if movement.amount != 0:
+            return FVal(movement.amount) / FVal(movement.normalized_balance)
+
+        try:
+            chi = MAKERDAO_POT.call(
+                self.ethereum,
+                'chi',
+                block_identifier=movement.block_number,
+            )
+        except (RemoteError, BlockchainQueryError) as e:
+            log.warning(
+                f'Could not query the DSR chi at block {movement.block_number} due to '
+                f'{str(e)}. Considering it zero',
+            )
+            return ZERO
+
+        return FVal(chi)
+
     def _historical_dsr_for_account(
             self,
             account: ChecksumEthAddress,
@@ -346,7 +372,7 @@ class MakerdaoDsr(HasDSProxy):
             if normalized_balance == m.normalized_balance:
                 m.gain_so_far = m.amount - amount_in_dsr
             else:
-                current_chi = FVal(m.amount) / FVal(m.normalized_balance)
+                current_chi = self._get_chi_at_movement(m)
                 gain_so_far = normalized_balance * current_chi - amount_in_dsr
                 m.gain_so_far = gain_so_far.to_int(exact=False)
 
@@ -74,14 +74,14 @@ from rotkehlchen.constants.ethereum import (
     MAKERDAO_ZRX_A_JOIN,
 )
 from rotkehlchen.constants.timing import YEAR_IN_SECONDS
-from rotkehlchen.errors import DeserializationError, RemoteError
+from rotkehlchen.errors import BlockchainQueryError, DeserializationError, RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.price import query_usd_price_or_use_default
 from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.premium.premium import Premium
 from rotkehlchen.serialization.deserialize import deserialize_ethereum_address
-from rotkehlchen.typing import ChecksumEthAddress, Timestamp
+from rotkehlchen.typing import ChecksumEthAddress, Price, Timestamp
 from rotkehlchen.user_messages import MessagesAggregator
 from rotkehlchen.utils.misc import address_to_bytes32, hexstr_to_int, ts_now
 
@@ -364,6 +364,56 @@ class MakerdaoVaults(HasDSProxy):
             stability_fee=self.get_stability_fee(ilk),
         )
 
+    def _get_collateral_price_at_block(self, ilk: bytes, block_number: int) -> Optional[Price]:
+        """Returns the USD price of the collateral of the ilk that the makerdao contracts
+        had at the given block or None if they can't be queried at that block"""
+        try:
+            spot = MAKERDAO_VAT.call(
+                self.ethereum,
+                'ilks',
+                arguments=[ilk],
+                block_identifier=block_number,
+            )[2]  # Price with Safety Margin
+            mat = MAKERDAO_SPOT.call(
+                self.ethereum,
+                'ilks',
+                arguments=[ilk],
+                block_identifier=block_number,
+            )[1]
+        except (RemoteError, BlockchainQueryError) as e:
+            log.warning(
+                f'Could not query the makerdao price of {ilk!r} at block {block_number} '
+                f'due to {str(e)}',
+            )
+            return None
+
+        return Price((FVal(spot) / RAY) * (FVal(mat) / RAY))
+
+    def _query_collateral_usd_price(
+            self,
+            vault: MakerdaoVault,
+            event: Dict[str, Any],
+            timestamp: Timestamp,
+            location: str,
+    ) -> Price:
+        """Returns the USD price of the vault's collateral at the time of the event. If
+        the historical price can't be found the price of the makerdao contracts at the
+        block of the event is used instead"""
+        usd_price = query_usd_price_or_use_default(
+            asset=vault.collateral_asset,
+            time=timestamp,
+            default_value=ZERO,
+            location=location,
+        )
+        if usd_price != ZERO:
+            return usd_price
+
+        block_price = self._get_collateral_price_at_block(
+            ilk=vault.ilk,
+            block_number=event['blockNumber'],
+        )
+        return usd_price if block_price is None else block_price
+
     def _query_vault_details(
             self,
             vault: MakerdaoVault,
@@ -472,10 +522,10 @@ class MakerdaoVaults(HasDSProxy):
                 asset=vault.collateral_asset,
             )
             timestamp = self.ethereum.get_event_timestamp(event)
-            usd_price = query_usd_price_or_use_default(
-                asset=vault.collateral_asset,
-                time=timestamp,
-                default_value=ZERO,
+            usd_price = self._query_collateral_usd_price(
+                vault=vault,
+                event=event,
+                timestamp=timestamp,
                 location='vault collateral deposit',
             )
             vault_events.append(VaultEvent(
@@ -507,10 +557,10 @@ class MakerdaoVaults(HasDSProxy):
                 asset=vault.collateral_asset,
             )
             timestamp = self.ethereum.get_event_timestamp(event)
-            usd_price = query_usd_price_or_use_default(
-                asset=vault.collateral_asset,
-                time=timestamp,
-                default_value=ZERO,
+            usd_price = self._query_collateral_usd_price(
+                vault=vault,
+                event=event,
+                timestamp=timestamp,
                 location='vault collateral withdrawal',
             )
             vault_events.append(VaultEvent(
@@ -620,10 +670,10 @@ class MakerdaoVaults(HasDSProxy):
             )
             timestamp = self.ethereum.get_event_timestamp(event)
             sum_liquidation_amount += amount
-            usd_price = query_usd_price_or_use_default(
-                asset=vault.collateral_asset,
-                time=timestamp,
-                default_value=ZERO,
+            usd_price = self._query_collateral_usd_price(
+                vault=vault,
+                event=event,
+                timestamp=timestamp,
                 location='vault collateral liquidation',
             )
             amount_usd_value = amount * usd_price
@@ -0,0 +1,132 @@
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from rotkehlchen.utils.mixins.serializableenum import SerializableEnumMixin
+
+# How much each new query moves the moving averages of a node's latency and error rate
+LATENCY_EWMA_ALPHA = 0.2
+ERROR_RATE_EWMA_ALPHA = 0.1
+# The latency a node is assumed to have before it is queried, in seconds
+DEFAULT_NODE_LATENCY = 1.0
+MIN_NODE_LATENCY = 0.01
+# After this many failures in a row a node is not queried until its cooldown passes
+CIRCUIT_BREAKER_FAILURES = 3
+CIRCUIT_BREAKER_COOLDOWN = 30.0
+CIRCUIT_BREAKER_MAX_COOLDOWN = 600.0
+# A hedged query is also sent to the next node if the first one has not answered
+# after the given quantile of the recent query times of the first node
+HEDGE_LATENCY_QUANTILE = 0.9
+HEDGE_LATENCY_SAMPLES = 50
+HEDGE_MIN_LATENCY_SAMPLES = 10
+DEFAULT_HEDGE_DELAY = 2.0
+MIN_HEDGE_DELAY = 0.05
+
+
+class CircuitState(SerializableEnumMixin):
+    """State of the circuit breaker of a node
+
+    CLOSED: The node is queried normally
+    OPEN: The node failed too often and is only queried if all others fail
+    HALF_OPEN: The cooldown passed and the next query decides if the node
+    is healthy again or the circuit opens for a longer cooldown
+    """
+    CLOSED = 1
+    OPEN = 2
+    HALF_OPEN = 3
+
+
+class NodeHealth():
+    """The health of an ethereum node as seen by the queries made to it
+
+    All times are in seconds of time.monotonic(), given by the caller.
+    """
+
+    def __init__(self) -> None:
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.queries = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.cooldown = CIRCUIT_BREAKER_COOLDOWN
+        self.open_until: Optional[float] = None
+        self.durations: Deque[float] = deque(maxlen=HEDGE_LATENCY_SAMPLES)
+        # Accounting of the extra queries hedging costs
+        self.hedges = 0
+        self.hedges_won = 0
+        self.cancelled = 0
+
+    def _record(self, duration: float) -> None:
+        self.queries += 1
+        if self.latency is None:
+            self.latency = duration
+        else:
+            self.latency += LATENCY_EWMA_ALPHA * (duration - self.latency)
+
+    def record_success(self, duration: float) -> None:
+        """Records a successful query that took duration seconds. Closes the circuit"""
+        self._record(duration)
+        self.durations.append(duration)
+        self.error_rate -= ERROR_RATE_EWMA_ALPHA * self.error_rate
+        self.consecutive_failures = 0
+        self.cooldown = CIRCUIT_BREAKER_COOLDOWN
+        self.open_until = None
+
+    def record_failure(self, duration: float, now: float) -> None:
+        """Records a failed query that took duration seconds
+
+        The time of failed queries counts in the latency since a timing out node
+        costs the whole timeout before the next node is queried.
+        """
+        state = self.state(now)
+        self._record(duration)
+        self.failures += 1
+        self.error_rate += ERROR_RATE_EWMA_ALPHA * (1 - self.error_rate)
+        self.consecutive_failures += 1
+        if state == CircuitState.HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, CIRCUIT_BREAKER_MAX_COOLDOWN)
+            self.open_until = now + self.cooldown
+        elif state == CircuitState.CLOSED and self.consecutive_failures >= CIRCUIT_BREAKER_FAILURES:  # noqa: E501
+            self.open_until = now + self.cooldown
+
+    def state(self, now: float) -> CircuitState:
+        if self.open_until is None:
+            return CircuitState.CLOSED
+        if now < self.open_until:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def hedge_delay(self) -> float:
+        """How long to wait for the node before also sending a hedged query to the next one"""
+        if len(self.durations) < HEDGE_MIN_LATENCY_SAMPLES:
+            return DEFAULT_HEDGE_DELAY
+
+        durations = sorted(self.durations)
+        return max(
+            MIN_HEDGE_DELAY,
+            durations[min(len(durations) - 1, int(len(durations) * HEDGE_LATENCY_QUANTILE))],
+        )
+
+    def weight(self, base_weight: float) -> float:
+        """The weight with which the node is picked given its static base weight
+
+        Nodes are picked in inverse proportion to their latency and less often the
+        more of their recent queries failed. Nodes not queried yet keep the base weight.
+        """
+        latency = DEFAULT_NODE_LATENCY if self.latency is None else self.latency
+        return (
+            base_weight *
+            DEFAULT_NODE_LATENCY / max(latency, MIN_NODE_LATENCY) *
+            (1 - self.error_rate)
+        )
+
+    def serialize(self, now: float) -> Dict[str, Any]:
+        return {
+            'state': self.state(now).serialize(),
+            'latency': self.latency,
+            'error_rate': self.error_rate,
+            'queries': self.queries,
+            'failures': self.failures,
+            'hedges': self.hedges,
+            'hedges_won': self.hedges_won,
+            'cancelled': self.cancelled,
+        }
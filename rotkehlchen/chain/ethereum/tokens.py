@@ -1,22 +1,26 @@
 import logging
 import random
 from collections import defaultdict
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+import gevent
+from gevent.lock import BoundedSemaphore
+from gevent.pool import Pool
 
 from rotkehlchen.assets.asset import EthereumToken
 from rotkehlchen.chain.ethereum.manager import EthereumManager, NodeName
-from rotkehlchen.chain.ethereum.typing import string_to_ethereum_address
+from rotkehlchen.chain.ethereum.typing import EthereumCallType, string_to_ethereum_address
 from rotkehlchen.chain.ethereum.utils import token_normalized_value
 from rotkehlchen.constants.ethereum import ETH_SCAN
 from rotkehlchen.constants.misc import ZERO
 from rotkehlchen.db.dbhandler import DBHandler
-from rotkehlchen.errors import RemoteError
+from rotkehlchen.errors import BlockchainQueryError, RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.inquirer import Inquirer
 from rotkehlchen.logging import RotkehlchenLogsAdapter
-from rotkehlchen.typing import ChecksumEthAddress, Price
-from rotkehlchen.utils.misc import get_chunks, ts_now
+from rotkehlchen.typing import ChecksumEthAddress, Price, Timestamp
+from rotkehlchen.utils.misc import ts_now
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -55,6 +59,32 @@ TokensReturn = Tuple[
 
 ETHERSCAN_MAX_TOKEN_CHUNK_LENGTH = 120
 OTHER_MAX_TOKEN_CHUNK_LENGTH = 590
+# The balances of many accounts are queried with one tokensBalances call. Each balance
+# costs a token contract call so their number is limited by the gas a node lets an
+# eth_call use. This is lowered if a call fails, down to the balances of the
+# etherscan chunk length for one account. A lowered limit goes back up after a while
+# since the failure may have been due to a node that is only temporarily unreliable.
+MAX_BALANCES_PER_CALL = 1200
+MIN_BALANCES_PER_CALL = ETHERSCAN_MAX_TOKEN_CHUNK_LENGTH
+BALANCES_PER_CALL_RESET_SECS = 3600
+# The saved tokens of addresses that are queried together are queried for all of them.
+# Addresses are only grouped while that queries at most this many times the balances
+# of their own saved tokens.
+SAVED_TOKENS_MAX_OVERHEAD = 2
+
+# How many token balance queries of all the addresses run at the same time
+MAX_CONCURRENT_TOKEN_QUERIES = 12
+# How many of them may go to the same node. Etherscan and the open nodes rate limit
+# their users so only a few queries run against each of them.
+NODE_MAX_CONCURRENT_TOKEN_QUERIES = {
+    NodeName.OWN: MAX_CONCURRENT_TOKEN_QUERIES,
+    NodeName.ETHERSCAN: 2,
+}
+OPEN_NODE_MAX_CONCURRENT_TOKEN_QUERIES = 3
+DETECTION_OPEN_NODES = (NodeName.MYCRYPTO, NodeName.BLOCKSCOUT, NodeName.AVADO_POOL)
+
+TokensQuery = Tuple[List[ChecksumEthAddress], List[EthereumToken], List[NodeName]]
+AccountsTokenBalances = Dict[ChecksumEthAddress, Dict[str, FVal]]
 
 
 class EthTokens():
@@ -62,44 +92,92 @@ class EthTokens():
     def __init__(self, database: DBHandler, ethereum: EthereumManager):
         self.db = database
         self.ethereum = ethereum
+        self.node_semaphores = {
+            node: BoundedSemaphore(NODE_MAX_CONCURRENT_TOKEN_QUERIES.get(
+                node,
+                OPEN_NODE_MAX_CONCURRENT_TOKEN_QUERIES,
+            )) for node in NodeName
+        }
+        self.max_balances_per_call = MAX_BALANCES_PER_CALL
+        self.max_balances_per_call_ts = Timestamp(0)
 
-    def detect_tokens_for_address(
+    def _balance_batches(
             self,
-            address: ChecksumEthAddress,
-            token_usd_price: Dict[EthereumToken, Price],
-            etherscan_chunks: List[List[EthereumToken]],
-            other_chunks: List[List[EthereumToken]],
-    ) -> Dict[EthereumToken, FVal]:
-        balances: Dict[EthereumToken, FVal] = defaultdict(FVal)
-        if self.ethereum.connected_to_any_web3():
-            call_order = []
-            if NodeName.OWN in self.ethereum.web3_mapping:
-                call_order = [NodeName.OWN]
-            for chunk in other_chunks:
-                self._get_tokens_balance_and_price(
-                    address=address,
-                    tokens=chunk,
-                    balances=balances,
-                    token_usd_price=token_usd_price,
-                    call_order=call_order + random.sample(
-                        (NodeName.MYCRYPTO, NodeName.BLOCKSCOUT, NodeName.AVADO_POOL),
-                        3,
-                    ),
-                )
+            accounts: List[ChecksumEthAddress],
+            tokens: List[EthereumToken],
+            max_addresses: int,
+    ) -> List[Tuple[List[ChecksumEthAddress], List[EthereumToken]]]:
+        """Splits the balances of all the accounts for all the tokens in batches of one call
+
+        A call can't have more than max_addresses accounts and tokens together, since
+        the URI length of the etherscan queries is limited, nor more balances than the
+        current limit. Within these the batches are kept as square as possible since
+        that fits the most balances in a call.
+        """
+        if len(accounts) + len(tokens) <= max_addresses:
+            accounts_num, tokens_num = len(accounts), len(tokens)
         else:
-            for chunk in etherscan_chunks:
-                self._get_tokens_balance_and_price(
-                    address=address,
-                    tokens=chunk,
-                    balances=balances,
-                    token_usd_price=token_usd_price,
-                    call_order=(NodeName.ETHERSCAN,),
-                )
-
-        # now that detection happened we also have to save it in the DB for the address
-        self.db.save_tokens_for_address(address, list(balances.keys()))
+            accounts_num = min(
+                len(accounts),
+                max(max_addresses // 2, max_addresses - len(tokens)),
+            )
+            tokens_num = min(len(tokens), max_addresses - accounts_num)
+        while accounts_num * tokens_num > self.max_balances_per_call:
+            if accounts_num > tokens_num:
+                accounts_num = (accounts_num + 1) // 2
+            else:
+                tokens_num = (tokens_num + 1) // 2
 
-        return balances
+        return [
+            (accounts[a_idx:a_idx + accounts_num], tokens[t_idx:t_idx + tokens_num])
+            for a_idx in range(0, len(accounts), accounts_num)
+            for t_idx in range(0, len(tokens), tokens_num)
+        ]
+
+    @staticmethod
+    def _group_saved_tokens(
+            saved_lists: Dict[ChecksumEthAddress, List[EthereumToken]],
+    ) -> List[Tuple[List[ChecksumEthAddress], List[EthereumToken]]]:
+        """Groups the addresses whose saved tokens are queried together
+
+        All of the saved tokens of a group are queried for each of its addresses.
+        Addresses with the same saved tokens are always in the same group. Other groups
+        are merged only if that queries at most SAVED_TOKENS_MAX_OVERHEAD times the
+        balances of their own saved tokens.
+        """
+        same_tokens: Dict[FrozenSet[EthereumToken], List[ChecksumEthAddress]] = defaultdict(list)  # noqa: E501
+        for address, saved_list in saved_lists.items():
+            same_tokens[frozenset(saved_list)].append(address)
+
+        # each group is its addresses, the union of their tokens and their own balances
+        groups: List[Tuple[List[ChecksumEthAddress], Dict[EthereumToken, None], int]] = []
+        for accounts in same_tokens.values():
+            tokens = dict.fromkeys(saved_lists[accounts[0]])
+            balances_num = len(accounts) * len(tokens)
+            for idx, (group_accounts, group_tokens, group_balances_num) in enumerate(groups):
+                merged_tokens = {**group_tokens, **tokens}
+                merged_balances_num = group_balances_num + balances_num
+                queried_num = (len(group_accounts) + len(accounts)) * len(merged_tokens)
+                if queried_num <= SAVED_TOKENS_MAX_OVERHEAD * merged_balances_num:
+                    groups[idx] = (group_accounts + accounts, merged_tokens, merged_balances_num)  # noqa: E501
+                    break
+            else:
+                groups.append((accounts, tokens, balances_num))
+
+        return [(accounts, list(tokens)) for accounts, tokens, _ in groups]
+
+    def _detection_call_order(self, query_idx: int) -> List[NodeName]:
+        """Returns the nodes to query for the detection query with the given index"""
+        if not self.ethereum.connected_to_any_web3():
+            return [NodeName.ETHERSCAN]
+
+        if NodeName.OWN in self.ethereum.web3_mapping:
+            return [NodeName.OWN] + random.sample(DETECTION_OPEN_NODES, 3)
+
+        # Spread the queries over the open nodes so that they run on all of them at once
+        first = DETECTION_OPEN_NODES[query_idx % len(DETECTION_OPEN_NODES)]
+        rest = [x for x in DETECTION_OPEN_NODES if x != first]
+        return [first] + random.sample(rest, len(rest))
 
     def query_tokens_for_addresses(
             self,
@@ -111,7 +189,16 @@ class EthTokens():
         If an address's tokens were recently autodetected they are not detected again but the
         balances are simply queried. Unless force_detection is True.
 
+        The queries of all addresses and token chunks run concurrently, limited per node.
+        The detected tokens of all addresses are saved in the DB at the end.
+
         Returns the token balances of each address and the usd prices of the tokens
+
+        May raise:
+        - RemoteError if an external service such as Etherscan is queried and
+          there is a problem with its query.
+        - BadFunctionCallOutput if a local node is used and the contract for the
+          token has no code. That means the chain is not synced
         """
         log.debug(
             'Querying/detecting token balances for all addresses',
@@ -144,107 +231,186 @@ class EthTokens():
             exceptions=exceptions,
             except_protocols=['balancer'],
         )
-        # With etherscan with chunks > 120, we get request uri too large
-        # so the limitation is not in the gas, but in the request uri length
-        etherscan_chunks = list(get_chunks(all_tokens, n=ETHERSCAN_MAX_TOKEN_CHUNK_LENGTH))
-        other_chunks = list(get_chunks(all_tokens, n=OTHER_MAX_TOKEN_CHUNK_LENGTH))
         now = ts_now()
-        token_usd_price: Dict[EthereumToken, Price] = {}
-        result = {}
-
+        if now - self.max_balances_per_call_ts >= BALANCES_PER_CALL_RESET_SECS:
+            self.max_balances_per_call = MAX_BALANCES_PER_CALL
+        detected_addresses = []
+        saved_lists = {}
+        result: Dict[ChecksumEthAddress, Dict[EthereumToken, FVal]] = {}
         for address in addresses:
             saved_list = self.db.get_tokens_for_address_if_time(address=address, current_time=now)
             if force_detection or saved_list is None:
-                balances = self.detect_tokens_for_address(
-                    address=address,
-                    token_usd_price=token_usd_price,
-                    etherscan_chunks=etherscan_chunks,
-                    other_chunks=other_chunks,
-                )
+                detected_addresses.append(address)
+            elif len(saved_list) != 0:  # Do not query if we know the address has no tokens
+                saved_lists[address] = saved_list
+            else:
+                continue
+
+            result[address] = defaultdict(FVal)
+
+        queries: List[TokensQuery] = []
+        if len(detected_addresses) != 0:
+            if self.ethereum.connected_to_any_web3():
+                max_addresses = OTHER_MAX_TOKEN_CHUNK_LENGTH + 1
             else:
-                if len(saved_list) == 0:
-                    continue  # Do not query if we know the address has no tokens
+                # With etherscan with chunks > 120, we get request uri too large
+                # so the limitation is not in the gas, but in the request uri length
+                max_addresses = ETHERSCAN_MAX_TOKEN_CHUNK_LENGTH + 1
+            for accounts, tokens in self._balance_batches(
+                    accounts=detected_addresses,
+                    tokens=all_tokens,
+                    max_addresses=max_addresses,
+            ):
+                queries.append((accounts, tokens, self._detection_call_order(len(queries))))
+        # Query the saved tokens of the addresses with mostly the same ones together. The
+        # balances of tokens not in the saved list of an address are not kept for it.
+        for group_accounts, group_tokens in self._group_saved_tokens(saved_lists):
+            for accounts, tokens in self._balance_batches(
+                    accounts=group_accounts,
+                    tokens=group_tokens,
+                    max_addresses=ETHERSCAN_MAX_TOKEN_CHUNK_LENGTH + 1,
+            ):
+                queries.append((accounts, tokens, self.ethereum.default_call_order()))
 
-                balances = defaultdict(FVal)
-                self._get_tokens_balance_and_price(
-                    address=address,
-                    tokens=saved_list,
-                    balances=balances,
-                    token_usd_price=token_usd_price,
-                    call_order=None,  # use defaults
-                )
+        pool = Pool(size=MAX_CONCURRENT_TOKEN_QUERIES)
+        greenlets = [
+            pool.spawn(
+                self._query_token_balances,
+                accounts=accounts,
+                tokens=tokens,
+                call_order=call_order,
+            ) for accounts, tokens, call_order in queries
+        ]
+        gevent.joinall(greenlets)
+        # Merge in the order of the queries so that the result does not depend on
+        # which query finished first. get() raises the error of a failed query.
+        for greenlet in greenlets:
+            for address, balances in greenlet.get().items():
+                saved_identifiers = None
+                if address in saved_lists:
+                    saved_identifiers = {x.identifier for x in saved_lists[address]}
+                for token_identifier, value in balances.items():
+                    if saved_identifiers is not None and token_identifier not in saved_identifiers:  # noqa: E501
+                        continue
+                    token = EthereumToken.from_identifier(token_identifier)
+                    if token is None:  # should not happen
+                        log.warning(
+                            f'Could not initialize token with identifier {token_identifier}. '
+                            f'Should not happen. Skipping its token balance query',
+                        )
+                        continue
+                    result[address][token] += value
 
-            result[address] = balances
+        # now that detection happened we also have to save it in the DB for the addresses
+        self.db.save_tokens_for_addresses({
+            address: list(result[address].keys()) for address in detected_addresses
+        })
+        token_usd_price: Dict[EthereumToken, Price] = {}
+        for balances in result.values():
+            for balance_token in balances:
+                if balance_token in token_usd_price:
+                    continue
+                try:
+                    usd_price = Inquirer().find_usd_price(balance_token)
+                except RemoteError:
+                    usd_price = Price(ZERO)
+                token_usd_price[balance_token] = usd_price
 
         return result, token_usd_price
 
-    def _get_tokens_balance_and_price(
+    def _query_token_balances(
             self,
-            address: ChecksumEthAddress,
+            accounts: List[ChecksumEthAddress],
             tokens: List[EthereumToken],
-            balances: Dict[EthereumToken, FVal],
-            token_usd_price: Dict[EthereumToken, Price],
-            call_order: Optional[Sequence[NodeName]],
-    ) -> None:
-        ret = self._get_multitoken_account_balance(
-            tokens=tokens,
-            account=address,
-            call_order=call_order,
-        )
-        for token_identifier, value in ret.items():
-            token = EthereumToken.from_identifier(token_identifier)
-            if token is None:  # should not happen
-                log.warning(
-                    f'Could not initialize token with identifier {token_identifier}. '
-                    f'Should not happen. Skipping its token balance query',
-                )
-                continue
-            balances[token] += value
-            if token in token_usd_price:
-                continue
-            # else get the price
-            try:
-                usd_price = Inquirer().find_usd_price(token)
-            except RemoteError:
-                usd_price = Price(ZERO)
-            token_usd_price[token] = usd_price
-
-    def _get_multitoken_account_balance(
+            call_order: Sequence[NodeName],
+    ) -> AccountsTokenBalances:
+        """Queries the balances of the accounts for the tokens in as few calls as possible
+
+        If the call fails, for example since it needs more gas than the node allows,
+        the limit of the balances per call is lowered for BALANCES_PER_CALL_RESET_SECS
+        and the balances are queried in smaller batches. Unless the call was already
+        small enough.
+
+        May raise:
+        - RemoteError if an external service such as Etherscan is queried and
+          there is a problem with its query.
+        - BlockchainQueryError if an ethereum node is used and the contract call fails
+        """
+        try:
+            return self._get_multiaccount_token_balances(
+                accounts=accounts,
+                tokens=tokens,
+                call_order=call_order,
+            )
+        except (RemoteError, BlockchainQueryError) as e:
+            balances_num = len(accounts) * len(tokens)
+            if balances_num <= MIN_BALANCES_PER_CALL:
+                raise
+
+            self.max_balances_per_call = max(
+                MIN_BALANCES_PER_CALL,
+                min(self.max_balances_per_call, balances_num // 2),
+            )
+            self.max_balances_per_call_ts = ts_now()
+            log.debug(
+                f'Querying {balances_num} token balances in one call failed due to {str(e)}. '
+                f'Retrying with at most {self.max_balances_per_call} balances per call',
+            )
+
+        result: AccountsTokenBalances = defaultdict(dict)
+        for batch_accounts, batch_tokens in self._balance_batches(
+                accounts=accounts,
+                tokens=tokens,
+                max_addresses=len(accounts) + len(tokens),
+        ):
+            batch_result = self._query_token_balances(
+                accounts=batch_accounts,
+                tokens=batch_tokens,
+                call_order=call_order,
+            )
+            for account, balances in batch_result.items():
+                result[account].update(balances)
+
+        return result
+
+    def _get_multiaccount_token_balances(
             self,
+            accounts: List[ChecksumEthAddress],
             tokens: List[EthereumToken],
-            account: ChecksumEthAddress,
-            call_order: Optional[Sequence[NodeName]],
-    ) -> Dict[str, FVal]:
-        """Queries balances of multiple tokens for an account
+            call_order: Sequence[NodeName],
+    ) -> AccountsTokenBalances:
+        """Queries balances of multiple tokens for multiple accounts in one call
 
-        Return a dictionary with keys being tokens and value a dictionary of
-        account to balances
+        Return a dictionary with keys being the accounts and values a dictionary of
+        the token identifiers to the non zero balances
 
         May raise:
         - RemoteError if an external service such as Etherscan is queried and
           there is a problem with its query.
-        - BadFunctionCallOutput if a local node is used and the contract for the
-          token has no code. That means the chain is not synced
+        - BlockchainQueryError if an ethereum node is used and the contract call fails
         """
         log.debug(
-            'Querying ethereum chain for multi token account balances',
-            eth_address=account,
+            'Querying ethereum chain for multi account token balances',
+            accounts_num=len(accounts),
             tokens_num=len(tokens),
         )
-        balances: Dict[str, FVal] = {}
         result = ETH_SCAN.call(
             ethereum=self.ethereum,
-            method_name='tokensBalance',
-            arguments=[account, [x.ethereum_address for x in tokens]],
+            method_name='tokensBalances',
+            arguments=[accounts, [x.ethereum_address for x in tokens]],
             call_order=call_order,
+            call_type=EthereumCallType.TOKEN_BALANCES,
+            node_semaphores=self.node_semaphores,
         )
-        for tk_idx, token in enumerate(tokens):
-            token_amount = result[tk_idx]
-            if token_amount != 0:
-                normalized_amount = token_normalized_value(token_amount, token)
-                log.debug(
-                    f'Found {token.symbol}({token.ethereum_address}) token balance for '
-                    f'{account} and amount {normalized_amount}',
-                )
-                balances[token.identifier] = normalized_amount
+        balances: AccountsTokenBalances = {}
+        for account, account_result in zip(accounts, result):
+            account_balances = balances[account] = {}
+            for token, token_amount in zip(tokens, account_result):
+                if token_amount != 0:
+                    normalized_amount = token_normalized_value(token_amount, token)
+                    log.debug(
+                        f'Found {token.symbol}({token.ethereum_address}) token balance for '
+                        f'{account} and amount {normalized_amount}',
+                    )
+                    account_balances[token.identifier] = normalized_amount
         return balances
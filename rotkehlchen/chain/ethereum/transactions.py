@@ -97,17 +97,18 @@ class EthTransactions(LockableQueryMixIn):
                     f'to_ts: {query_end_ts} ',
                 )
 
-        # add new transactions to the DB
-        if new_transactions != []:
-            dbethtx.add_ethereum_transactions(new_transactions)
-
-        # and also set the last queried timestamps for the address
-        ranges.update_used_query_range(
-            location_string=f'ethtxs_{address}',
-            start_ts=start_ts,
-            end_ts=end_ts,
-            ranges_to_query=ranges_to_query,
-        )
+        with self.database.user_write():
+            # add new transactions to the DB
+            if new_transactions != []:
+                dbethtx.add_ethereum_transactions(new_transactions)
+
+            # and also set the last queried timestamps for the address
+            ranges.update_used_query_range(
+                location_string=f'ethtxs_{address}',
+                start_ts=start_ts,
+                end_ts=end_ts,
+                ranges_to_query=ranges_to_query,
+            )
 
     @protect_with_lock()
     def query(
@@ -6,9 +6,11 @@ from eth_typing import HexAddress, HexStr
 
 from rotkehlchen.accounting.structures import Balance
 from rotkehlchen.constants.misc import ZERO
+from rotkehlchen.errors import DeserializationError
 from rotkehlchen.fval import FVal
 from rotkehlchen.typing import ChecksumEthAddress, Eth2PubKey, Timestamp
 from rotkehlchen.utils.misc import from_gwei
+from rotkehlchen.utils.mixins.serializableenum import SerializableEnumMixin
 
 
 def string_to_ethereum_address(value: str) -> ChecksumEthAddress:
@@ -19,6 +21,13 @@ def string_to_ethereum_address(value: str) -> ChecksumEthAddress:
     return ChecksumEthAddress(HexAddress(HexStr(value)))
 
 
+class EthereumCallType(SerializableEnumMixin):
+    """Types of latency critical ethereum calls for which queries can be hedged"""
+    CONTRACT_CALL = 1
+    ETH_BALANCES = 2
+    TOKEN_BALANCES = 3
+
+
 class NodeName(Enum):
     """Various node types
 
@@ -57,6 +66,18 @@ class NodeName(Enum):
         # else
         raise RuntimeError(f'Corrupt value {self} for NodeName -- Should never happen')
 
+    def serialize(self) -> str:
+        return str(self)
+
+    @classmethod
+    def deserialize(cls, value: str) -> 'NodeName':
+        """May raise DeserializationError if the given value is not a node name"""
+        for node in cls:
+            if str(node) == value:
+                return node
+
+        raise DeserializationError(f'Failed to deserialize NodeName value {value}')
+
     def endpoint(self, own_rpc_endpoint: str) -> str:
         if self == NodeName.OWN:
             return own_rpc_endpoint
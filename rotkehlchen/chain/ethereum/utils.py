@@ -1,6 +1,7 @@
-from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union
 
 from eth_utils import to_checksum_address
+from typing_extensions import Literal
 from web3 import Web3
 
 from rotkehlchen.assets.asset import Asset, EthereumToken
@@ -77,12 +78,14 @@ def multicall(
         ethereum: 'EthereumManager',
         calls: List[Tuple[ChecksumEthAddress, str]],
         call_order: Optional[Sequence['NodeName']] = None,
+        block_identifier: Union[int, Literal['latest']] = 'latest',
 ) -> Any:
     multicall_result = ETH_MULTICALL.call(
         ethereum=ethereum,
         method_name='aggregate',
         arguments=[calls],
         call_order=call_order,
+        block_identifier=block_identifier,
     )
     _, output = multicall_result
     return output
@@ -93,6 +96,7 @@ def multicall_2(
         calls: List[Tuple[ChecksumEthAddress, str]],
         require_success: bool,
         call_order: Optional[Sequence['NodeName']] = None,
+        block_identifier: Union[int, Literal['latest']] = 'latest',
 ) -> List[Tuple[bool, bytes]]:
     """
     Use a MULTICALL_2 contract for an aggregated query. If require_success
@@ -103,6 +107,7 @@ def multicall_2(
         method_name='tryAggregate',
         arguments=[require_success, calls],
         call_order=call_order,
+        block_identifier=block_identifier,
     )
 
 
@@ -112,12 +117,13 @@ def multicall_specific(
         method_name: str,
         arguments: List[Any],
         call_order: Optional[Sequence['NodeName']] = None,
+        block_identifier: Union[int, Literal['latest']] = 'latest',
 ) -> Any:
     calls = [(
         contract.address,
         contract.encode(method_name=method_name, arguments=i),
     ) for i in arguments]
-    output = multicall(ethereum, calls, call_order)
+    output = multicall(ethereum, calls, call_order, block_identifier)
     return [contract.decode(x, method_name, arguments[0]) for x in output]
 
 
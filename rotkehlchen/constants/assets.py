@@ -1,2259 +1,468 @@
 # This python file was generated automatically by
-# tools/scripts/generate_constant_assets.py at 15/12/2021 12:36:55.
+# tools/scripts/generate_constant_assets.py at 19/10/2026 10:32:17.
 # Do not edit manually!
 
-from typing import List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from rotkehlchen.assets.asset import Asset, EthereumToken
 from rotkehlchen.assets.typing import AssetType
 from rotkehlchen.chain.ethereum.typing import string_to_ethereum_address
 from rotkehlchen.typing import Timestamp
 
+# The constant assets are created lazily the first time they are accessed. This list
+# holds the ones that have been created so far.
 CONSTANT_ASSETS: List[Asset] = []
+# Set by the GlobalDB when it is initialized so that constant assets created after
+# that point also get their details from the DB
+CONSTANT_ASSETS_RELOADER: Optional[Callable[[List[Asset]], None]] = None
 
-A_USD = Asset.initialize(
-    identifier='USD',
-    asset_type=AssetType.FIAT,
-    name="United States Dollar",
-    symbol='USD',
-    started=None,
-    forked=None,
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_USD)
-A_EUR = Asset.initialize(
-    identifier='EUR',
-    asset_type=AssetType.FIAT,
-    name="Euro",
-    symbol='EUR',
-    started=Timestamp(915148800),
-    forked=None,
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_EUR)
-A_BTC = Asset.initialize(
-    identifier='BTC',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Bitcoin",
-    symbol='BTC',
-    started=Timestamp(1231006505),
-    forked=None,
-    swapped_for=None,
-    coingecko='bitcoin',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_BTC)
-A_BCH = Asset.initialize(
-    identifier='BCH',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Bitcoin Cash",
-    symbol='BCH',
-    started=Timestamp(1501593374),
-    forked=A_BTC,
-    swapped_for=None,
-    coingecko='bitcoin-cash',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_BCH)
-A_BSV = Asset.initialize(
-    identifier='BSV',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Bitcoin Satoshi's Vision",
-    symbol='BSV',
-    started=Timestamp(1542300000),
-    forked=A_BCH,
-    swapped_for=None,
-    coingecko='bitcoin-cash-sv',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_BSV)
-A_ETH = Asset.initialize(
-    identifier='ETH',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Ethereum",
-    symbol='ETH',
-    started=Timestamp(1438214400),
-    forked=None,
-    swapped_for=None,
-    coingecko='ethereum',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_ETH)
-A_ETH2 = Asset.initialize(
-    identifier='ETH2',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Staked ETH in Phase 0",
-    symbol='ETH',
-    started=Timestamp(1602667372),
-    forked=None,
-    swapped_for=None,
-    coingecko='ethereum',
-    cryptocompare='ETH',
-)
-CONSTANT_ASSETS.append(A_ETH2)
-A_ETC = Asset.initialize(
-    identifier='ETC',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Ethereum classic",
-    symbol='ETC',
-    started=Timestamp(1469020840),
-    forked=A_ETH,
-    swapped_for=None,
-    coingecko='ethereum-classic',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_ETC)
-A_KSM = Asset.initialize(
-    identifier='KSM',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Kusama",
-    symbol='KSM',
-    started=Timestamp(1576142353),
-    forked=None,
-    swapped_for=None,
-    coingecko='kusama',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_KSM)
-A_AVAX = Asset.initialize(
-    identifier='AVAX',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Avalanche",
-    symbol='AVAX',
-    started=Timestamp(1600646400),
-    forked=None,
-    swapped_for=None,
-    coingecko='avalanche-2',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_AVAX)
-A_DOGE = Asset.initialize(
-    identifier='DOGE',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Dogecoin",
-    symbol='DOGE',
-    started=Timestamp(1386325540),
-    forked=None,
-    swapped_for=None,
-    coingecko='dogecoin',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_DOGE)
-A_BSQ = Asset.initialize(
-    identifier='BSQ',
-    asset_type=AssetType.OTHER,
-    name="Bisq DAO Token",
-    symbol='BSQ',
-    started=Timestamp(1555286400),
-    forked=None,
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_BSQ)
-A_KFEE = Asset.initialize(
-    identifier='KFEE',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Kraken fees",
-    symbol='KFEE',
-    started=Timestamp(1377993600),
-    forked=None,
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_KFEE)
+if TYPE_CHECKING:
+    A_USD: Asset
+    A_EUR: Asset
+    A_BTC: Asset
+    A_BCH: Asset
+    A_BSV: Asset
+    A_ETH: Asset
+    A_ETH2: Asset
+    A_ETC: Asset
+    A_KSM: Asset
+    A_AVAX: Asset
+    A_DOGE: Asset
+    A_BSQ: Asset
+    A_KFEE: Asset
 
+    A_BAL: EthereumToken
+    A_BAT: EthereumToken
+    A_UNI: EthereumToken
+    A_1INCH: EthereumToken
+    A_DAI: EthereumToken
+    A_SAI: EthereumToken
+    A_YFI: EthereumToken
+    A_USDT: EthereumToken
+    A_USDC: EthereumToken
+    A_TUSD: EthereumToken
+    A_MATIC: EthereumToken
+    A_LQTY: EthereumToken
+    A_PICKLE: EthereumToken
+    A_BEST: EthereumToken
 
-A_BAL = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xba100000625a3754423978a60c9317c58a424e3D'),
-    decimals=18,
-    name="Balancer",
-    symbol='BAL',
-    started=Timestamp(1592616779),
-    swapped_for=None,
-    coingecko='balancer',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BAL)
-A_BAT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x0D8775F648430679A709E98d2b0Cb6250d2887EF'),
-    decimals=18,
-    name="Basic Attention Token",
-    symbol='BAT',
-    started=Timestamp(1496294094),
-    swapped_for=None,
-    coingecko='basic-attention-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BAT)
-A_UNI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984'),
-    decimals=18,
-    name="Uniswap",
-    symbol='UNI',
-    started=Timestamp(1600107086),
-    swapped_for=None,
-    coingecko='uniswap',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_UNI)
-A_1INCH = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x111111111117dC0aa78b770fA6A738034120C302'),
-    decimals=18,
-    name="1INCH Token",
-    symbol='1INCH',
-    started=Timestamp(1608747211),
-    swapped_for=None,
-    coingecko='1inch',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_1INCH)
-A_DAI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x6B175474E89094C44Da98b954EedeAC495271d0F'),
-    decimals=18,
-    name="Multi Collateral Dai",
-    symbol='DAI',
-    started=Timestamp(1573672677),
-    swapped_for=None,
-    coingecko='dai',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_DAI)
-A_SAI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x89d24A6b4CcB1B6fAA2625fE562bDD9a23260359'),
-    decimals=18,
-    name="Single Collateral Dai",
-    symbol='SAI',
-    started=Timestamp(1513586475),
-    swapped_for=None,
-    coingecko='sai',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_SAI)
-A_YFI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x0bc529c00C6401aEF6D220BE8C6Ea1667F6Ad93e'),
-    decimals=18,
-    name="yearn.finance",
-    symbol='YFI',
-    started=Timestamp(1594972885),
-    swapped_for=None,
-    coingecko='yearn-finance',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_YFI)
-A_USDT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xdAC17F958D2ee523a2206206994597C13D831ec7'),
-    decimals=6,
-    name="Tether",
-    symbol='USDT',
-    started=Timestamp(1402358400),
-    swapped_for=None,
-    coingecko='tether',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_USDT)
-A_USDC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48'),
-    decimals=6,
-    name="USD Coin",
-    symbol='USDC',
-    started=Timestamp(1533324504),
-    swapped_for=None,
-    coingecko='usd-coin',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_USDC)
-A_TUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x0000000000085d4780B73119b644AE5ecd22b376'),
-    decimals=18,
-    name="TrueUSD",
-    symbol='TUSD',
-    started=Timestamp(1520310861),
-    swapped_for=None,
-    coingecko='true-usd',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_TUSD)
-A_MATIC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x7D1AfA7B718fb893dB30A3aBc0Cfc608AaCfeBB0'),
-    decimals=18,
-    name="Matic Network",
-    symbol='MATIC',
-    started=Timestamp(1555718400),
-    swapped_for=None,
-    coingecko='matic-network',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_MATIC)
-A_LQTY = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x6DEA81C8171D0bA574754EF6F8b412F2Ed88c54D'),
-    decimals=18,
-    name="LQTY",
-    symbol='LQTY',
-    started=Timestamp(1617611590),
-    swapped_for=None,
-    coingecko='liquity',
-    cryptocompare='LQTY',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_LQTY)
-A_PICKLE = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x429881672B9AE42b8EbA0E26cD9C73711b891Ca5'),
-    decimals=18,
-    name="PickleToken",
-    symbol='PICKLE',
-    started=Timestamp(1599694316),
-    swapped_for=None,
-    coingecko='pickle-finance',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_PICKLE)
-A_BEST = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x1B073382E63411E3BcfFE90aC1B9A43feFa1Ec6F'),
-    decimals=8,
-    name="Bitpanda Ecosystem Token",
-    symbol='BEST',
-    started=Timestamp(1564487711),
-    swapped_for=None,
-    coingecko='bitpanda-ecosystem-token',
-    cryptocompare='BEST',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BEST)
+    A_AAVE: EthereumToken
+    A_GUSD: EthereumToken
+    A_CRV: EthereumToken
+    A_KNC: EthereumToken
+    A_WBTC: EthereumToken
+    A_WETH: EthereumToken
+    A_ZRX: EthereumToken
+    A_MANA: EthereumToken
+    A_PAX: EthereumToken
+    A_COMP: EthereumToken
+    A_LRC: EthereumToken
+    A_LINK: EthereumToken
+    A_ADX: EthereumToken
+    A_TORN: EthereumToken
+    A_CORN: EthereumToken
+    A_GRAIN: EthereumToken
+    A_COMBO: EthereumToken
+    A_LDO: EthereumToken
+    A_RENBTC: EthereumToken
+    A_BNB: EthereumToken
+    A_REP: EthereumToken  # v2
+    A_BZRX: EthereumToken
+    A_STAKE: EthereumToken
+    A_DPI: EthereumToken
+    A_YFII: EthereumToken
+    A_MCB: EthereumToken
+    A_LUSD: EthereumToken
 
-A_AAVE = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9'),
-    decimals=18,
-    name="Aave Token",
-    symbol='AAVE',
-    started=Timestamp(1600970788),
-    swapped_for=None,
-    coingecko='aave',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_AAVE)
-A_GUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x056Fd409E1d7A124BD7017459dFEa2F387b6d5Cd'),
-    decimals=2,
-    name="Gemini Dollar",
-    symbol='GUSD',
-    started=Timestamp(1536521774),
-    swapped_for=None,
-    coingecko='gemini-dollar',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_GUSD)
-A_CRV = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xD533a949740bb3306d119CC777fa900bA034cd52'),
-    decimals=18,
-    name="Curve DAO Token",
-    symbol='CRV',
-    started=Timestamp(1597270648),
-    swapped_for=None,
-    coingecko='curve-dao-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CRV)
-A_KNC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xdd974D5C2e2928deA5F71b9825b8b646686BD200'),
-    decimals=18,
-    name="Kyber Network",
-    symbol='KNC',
-    started=Timestamp(1501545600),
-    swapped_for=None,
-    coingecko='kyber-network',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_KNC)
-A_WBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599'),
-    decimals=8,
-    name="Wrapped Bitcoin",
-    symbol='WBTC',
-    started=Timestamp(1543095952),
-    swapped_for=None,
-    coingecko='wrapped-bitcoin',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_WBTC)
-A_WETH = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2'),
-    decimals=18,
-    name="WETH",
-    symbol='WETH',
-    started=Timestamp(1513077455),
-    swapped_for=None,
-    coingecko='weth',
-    cryptocompare='ETH',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_WETH)
-A_ZRX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xE41d2489571d322189246DaFA5ebDe1F4699F498'),
-    decimals=18,
-    name="0x",
-    symbol='ZRX',
-    started=Timestamp(1502476756),
-    swapped_for=None,
-    coingecko='0x',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_ZRX)
-A_MANA = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x0F5D2fB29fb7d3CFeE444a200298f468908cC942'),
-    decimals=18,
-    name="Decentraland",
-    symbol='MANA',
-    started=Timestamp(1502824689),
-    swapped_for=None,
-    coingecko='decentraland',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_MANA)
-A_PAX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x8E870D67F660D95d5be530380D0eC0bd388289E1'),
-    decimals=18,
-    name="Paxos Standard Token",
-    symbol='PAX',
-    started=Timestamp(1536537600),
-    swapped_for=None,
-    coingecko='paxos-standard',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_PAX)
-A_COMP = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xc00e94Cb662C3520282E6f5717214004A7f26888'),
-    decimals=18,
-    name="Compound",
-    symbol='COMP',
-    started=Timestamp(1583323735),
-    swapped_for=None,
-    coingecko='compound-governance-token',
-    cryptocompare=None,
-    protocol='compound',
-)
-CONSTANT_ASSETS.append(A_COMP)
-A_LRC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xBBbbCA6A901c926F240b89EacB641d8Aec7AEafD'),
-    decimals=18,
-    name="LoopringCoin V2",
-    symbol='LRC',
-    started=Timestamp(1500422400),
-    swapped_for=None,
-    coingecko='loopring',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_LRC)
-A_LINK = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x514910771AF9Ca656af840dff83E8264EcF986CA'),
-    decimals=18,
-    name="Chainlink",
-    symbol='LINK',
-    started=Timestamp(1505520000),
-    swapped_for=None,
-    coingecko='chainlink',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_LINK)
-A_ADX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xADE00C28244d5CE17D72E40330B1c318cD12B7c3'),
-    decimals=18,
-    name="AdEx Network",
-    symbol='ADX',
-    started=Timestamp(1496102400),
-    swapped_for=None,
-    coingecko='adex',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_ADX)
-A_TORN = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x77777FeDdddFfC19Ff86DB637967013e6C6A116C'),
-    decimals=18,
-    name="TornadoCash",
-    symbol='TORN',
-    started=Timestamp(1608260437),
-    swapped_for=None,
-    coingecko='tornado-cash',
-    cryptocompare='TORN',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_TORN)
-A_CORN = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xa456b515303B2Ce344E9d2601f91270f8c2Fea5E'),
-    decimals=18,
-    name="Cornichon",
-    symbol='CORN',
-    started=Timestamp(1606603741),
-    swapped_for=None,
-    coingecko='cornichon',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CORN)
-A_GRAIN = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x6589fe1271A0F29346796C6bAf0cdF619e25e58e'),
-    decimals=18,
-    name="GRAIN Token",
-    symbol='GRAIN',
-    started=Timestamp(1606500872),
-    swapped_for=None,
-    coingecko='grain-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_GRAIN)
-A_COMBO = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xfFffFffF2ba8F66D4e51811C5190992176930278'),
-    decimals=18,
-    name="Furucombo",
-    symbol='COMBO',
-    started=Timestamp(1609231627),
-    swapped_for=None,
-    coingecko='furucombo',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_COMBO)
-A_LDO = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x5A98FcBEA516Cf06857215779Fd812CA3beF1B32'),
-    decimals=18,
-    name="Lido DAO Token",
-    symbol='LDO',
-    started=Timestamp(1608242396),
-    swapped_for=None,
-    coingecko='lido-dao',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_LDO)
-A_RENBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xEB4C2781e4ebA804CE9a9803C67d0893436bB27D'),
-    decimals=8,
-    name="renBTC",
-    symbol='renBTC',
-    started=Timestamp(1585090944),
-    swapped_for=None,
-    coingecko='renbtc',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_RENBTC)
-A_BNB = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xB8c77482e45F1F44dE1745F52C74426C631bDD52'),
-    decimals=18,
-    name="Binance Coin",
-    symbol='BNB',
-    started=Timestamp(1498521600),
-    swapped_for=None,
-    coingecko='binancecoin',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BNB)
-A_REP = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x221657776846890989a759BA2973e427DfF5C9bB'),
-    decimals=18,
-    name="Augur",
-    symbol='REPv2',
-    started=Timestamp(1595886655),
-    swapped_for=None,
-    coingecko='augur',
-    cryptocompare='REP',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_REP)
-A_BZRX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x56d811088235F11C8920698a204A5010a788f4b3'),
-    decimals=18,
-    name="bZx Protocol",
-    symbol='BZRX',
-    started=Timestamp(1594509320),
-    swapped_for=None,
-    coingecko='bzx-protocol',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BZRX)
-A_STAKE = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x0Ae055097C6d159879521C384F1D2123D1f195e6'),
-    decimals=18,
-    name="xDAI STAKE",
-    symbol='STAKE',
-    started=Timestamp(1586959457),
-    swapped_for=None,
-    coingecko='xdai-stake',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_STAKE)
-A_DPI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x1494CA1F11D487c2bBe4543E90080AeBa4BA3C2b'),
-    decimals=18,
-    name="DefiPulse Index",
-    symbol='DPI',
-    started=Timestamp(1599694252),
-    swapped_for=None,
-    coingecko='defipulse-index',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_DPI)
-A_YFII = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xa1d0E215a23d7030842FC67cE582a6aFa3CCaB83'),
-    decimals=18,
-    name="YFII.finance",
-    symbol='YFII',
-    started=Timestamp(1595768700),
-    swapped_for=None,
-    coingecko='yfii-finance',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_YFII)
-A_MCB = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x4e352cF164E64ADCBad318C3a1e222E9EBa4Ce42'),
-    decimals=18,
-    name="MCDEX Token",
-    symbol='MCB',
-    started=Timestamp(1593849744),
-    swapped_for=None,
-    coingecko='mcdex',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_MCB)
-A_LUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x5f98805A4E8be255a32880FDeC7F6728C6568bA0'),
-    decimals=18,
-    name="LUSD Stablecoin",
-    symbol='LUSD',
-    started=Timestamp(1617611299),
-    swapped_for=None,
-    coingecko='liquity-usd',
-    cryptocompare='LUSD',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_LUSD)
+    # used as underlying assets of aave v1 tokens
+    A_ENJ: EthereumToken
+    A_SUSD: EthereumToken
+    A_BUSD: EthereumToken
+    A_LEND: EthereumToken
+    A_MKR: EthereumToken
+    A_REN: EthereumToken
+    A_SNX: EthereumToken
 
-# used as underlying assets of aave v1 tokens
-A_ENJ = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xF629cBd94d3791C9250152BD8dfBDF380E2a3B9c'),
-    decimals=18,
-    name="Enjin Coin",
-    symbol='ENJ',
-    started=Timestamp(1500854400),
-    swapped_for=None,
-    coingecko='enjincoin',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_ENJ)
-A_SUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x57Ab1ec28D129707052df4dF418D58a2D46d5f51'),
-    decimals=18,
-    name="Synth sUSD",
-    symbol='sUSD',
-    started=Timestamp(1569466541),
-    swapped_for=None,
-    coingecko='nusd',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_SUSD)
-A_BUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x4Fabb145d64652a948d72533023f6E7A623C7C53'),
-    decimals=18,
-    name="Binance USD",
-    symbol='BUSD',
-    started=Timestamp(1567641600),
-    swapped_for=None,
-    coingecko='binance-usd',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BUSD)
-A_LEND = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x80fB784B7eD66730e8b1DBd9820aFD29931aab03'),
-    decimals=18,
-    name="ETHLend",
-    symbol='LEND',
-    started=Timestamp(1502755200),
-    swapped_for=A_AAVE,
-    coingecko='ethlend',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_LEND)
-A_MKR = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x9f8F72aA9304c8B593d555F12eF6589cC3A579A2'),
-    decimals=18,
-    name="Maker",
-    symbol='MKR',
-    started=Timestamp(1439596800),
-    swapped_for=None,
-    coingecko='maker',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_MKR)
-A_REN = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x408e41876cCCDC0F92210600ef50372656052a38'),
-    decimals=18,
-    name="Republic",
-    symbol='REN',
-    started=Timestamp(1514678400),
-    swapped_for=None,
-    coingecko='republic-protocol',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_REN)
-A_SNX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xC011a73ee8576Fb46F5E1c5751cA3B9Fe0af2a6F'),
-    decimals=18,
-    name="Synthetix Network Token",
-    symbol='SNX',
-    started=Timestamp(1515283200),
-    swapped_for=None,
-    coingecko='havven',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_SNX)
+    # atokens TODO: These can be handled programatically if enough info is in the assets DB
+    # protocol and underlying asset
 
-# atokens TODO: These can be handled programatically if enough info is in the assets DB
-# protocol and underlying asset
+    A_ALINK_V1: EthereumToken
+    A_AETH_V1: EthereumToken
+    A_AUSDC_V1: EthereumToken
+    A_AREP_V1: EthereumToken
 
-A_ALINK_V1 = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xA64BD6C70Cb9051F6A9ba1F163Fdc07E0DfB5F84'),
-    decimals=18,
-    name="Aave Interest bearing LINK",
-    symbol='aLINK',
-    started=Timestamp(1578501727),
-    swapped_for=None,
-    coingecko='aave-link',
-    cryptocompare='LINK',
-    protocol='aave',
-)
-CONSTANT_ASSETS.append(A_ALINK_V1)
-A_AETH_V1 = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x3a3A65aAb0dd2A17E3F1947bA16138cd37d08c04'),
-    decimals=18,
-    name="Aave Interest bearing ETH",
-    symbol='aETH',
-    started=Timestamp(1578501678),
-    swapped_for=None,
-    coingecko='aave-eth-v1',
-    cryptocompare='ETH',
-    protocol='aave',
-)
-CONSTANT_ASSETS.append(A_AETH_V1)
-A_AUSDC_V1 = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x9bA00D6856a4eDF4665BcA2C2309936572473B7E'),
-    decimals=6,
-    name="Aave Interest bearing USDC",
-    symbol='aUSDC',
-    started=Timestamp(1578501407),
-    swapped_for=None,
-    coingecko='aave-usdc',
-    cryptocompare='USDC',
-    protocol='aave',
-)
-CONSTANT_ASSETS.append(A_AUSDC_V1)
-A_AREP_V1 = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x71010A9D003445aC60C4e6A7017c1E89A477B438'),
-    decimals=18,
-    name="Aave Interest bearing REP",
-    symbol='aREP',
-    started=Timestamp(1578501835),
-    swapped_for=None,
-    coingecko='aave-rep',
-    cryptocompare='REP',
-    protocol='aave',
-)
-CONSTANT_ASSETS.append(A_AREP_V1)
+    # compound tokens -- TODO: Can also be handled programmatically
+    A_CDAI: EthereumToken
+    A_CUSDC: EthereumToken
+    A_CUSDT: EthereumToken
+    A_CBAT: EthereumToken
+    A_CETH: EthereumToken
+    A_CREP: EthereumToken
+    A_CWBTC: EthereumToken
+    A_CZRX: EthereumToken
 
-# compound tokens -- TODO: Can also be handled programmatically
-A_CDAI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x5d3a536E4D6DbD6114cc1Ead35777bAB948E3643'),
-    decimals=8,
-    name="Compound DAI",
-    symbol='cDAI',
-    started=Timestamp(1574471013),
-    swapped_for=None,
-    coingecko='cdai',
-    cryptocompare=None,
-    protocol='compound',
-)
-CONSTANT_ASSETS.append(A_CDAI)
-A_CUSDC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x39AA39c021dfbaE8faC545936693aC917d5E7563'),
-    decimals=8,
-    name="Compound USD Coin",
-    symbol='cUSDC',
-    started=Timestamp(1557192331),
-    swapped_for=None,
-    coingecko='compound-usd-coin',
-    cryptocompare=None,
-    protocol='compound',
-)
-CONSTANT_ASSETS.append(A_CUSDC)
-A_CUSDT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xf650C3d88D12dB855b8bf7D11Be6C55A4e07dCC9'),
-    decimals=8,
-    name="Compound USDT",
-    symbol='cUSDT',
-    started=Timestamp(1586985186),
-    swapped_for=None,
-    coingecko='compound-usdt',
-    cryptocompare=None,
-    protocol='compound',
-)
-CONSTANT_ASSETS.append(A_CUSDT)
-A_CBAT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x6C8c6b02E7b2BE14d4fA6022Dfd6d75921D90E4E'),
-    decimals=8,
-    name="Compound BAT",
-    symbol='cBAT',
-    started=Timestamp(1557192085),
-    swapped_for=None,
-    coingecko='compound-basic-attention-token',
-    cryptocompare=None,
-    protocol='compound',
-)
-CONSTANT_ASSETS.append(A_CBAT)
-A_CETH = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x4Ddc2D193948926D02f9B1fE9e1daa0718270ED5'),
-    decimals=8,
-    name="Compound ETH",
-    symbol='cETH',
-    started=Timestamp(1557192318),
-    swapped_for=None,
-    coingecko='compound-ether',
-    cryptocompare=None,
-    protocol='compound',
-)
-CONSTANT_ASSETS.append(A_CETH)
-A_CREP = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x158079Ee67Fce2f58472A96584A73C7Ab9AC95c1'),
-    decimals=8,
-    name="Compound Augur",
-    symbol='cREP',
-    started=Timestamp(1557192288),
-    swapped_for=None,
-    coingecko='compound-augur',
-    cryptocompare=None,
-    protocol='compound',
-)
-CONSTANT_ASSETS.append(A_CREP)
-A_CWBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xC11b1268C1A384e55C48c2391d8d480264A3A7F4'),
-    decimals=8,
-    name="Compound Wrapped BTC",
-    symbol='cWBTC',
-    started=Timestamp(1563263257),
-    swapped_for=None,
-    coingecko='compound-wrapped-btc',
-    cryptocompare=None,
-    protocol='compound',
-)
-CONSTANT_ASSETS.append(A_CWBTC)
-A_CZRX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xB3319f5D18Bc0D84dD1b4825Dcde5d5f7266d407'),
-    decimals=8,
-    name="Compound 0x",
-    symbol='cZRX',
-    started=Timestamp(1557192054),
-    swapped_for=None,
-    coingecko='compound-0x',
-    cryptocompare=None,
-    protocol='compound',
-)
-CONSTANT_ASSETS.append(A_CZRX)
+    # Special tokens for defi price inquiry -- these should end up in programmatic rules
+    # after being upgraded to include, protocol (to identify the program to run on them)
+    # and underlying assets
+    A_3CRV: EthereumToken
+    A_YV1_DAIUSDCTBUSD: EthereumToken
+    A_CRVP_DAIUSDCTBUSD: EthereumToken
+    A_YV1_DAIUSDCTTUSD: EthereumToken
+    A_CRVP_DAIUSDCTTUSD: EthereumToken
+    A_CRVP_RENWSBTC: EthereumToken
+    A_YV1_RENWSBTC: EthereumToken
+    A_CRV_RENWBTC: EthereumToken
+    A_CRV_YPAX: EthereumToken
+    A_CRV_GUSD: EthereumToken
+    A_CRV_3CRV: EthereumToken
+    A_YV1_3CRV: EthereumToken
+    A_CRV_3CRVSUSD: EthereumToken
+    A_YV1_ALINK: EthereumToken
+    A_YV1_DAI: EthereumToken
+    A_YV1_WETH: EthereumToken
+    A_YV1_YFI: EthereumToken
+    A_YV1_USDT: EthereumToken
+    A_YV1_USDC: EthereumToken
+    A_YV1_TUSD: EthereumToken
+    A_YV1_GUSD: EthereumToken
+    A_FARM_USDC: EthereumToken
+    A_FARM_USDT: EthereumToken
+    A_FARM_DAI: EthereumToken
+    A_FARM_TUSD: EthereumToken
+    A_FARM_WETH: EthereumToken
+    A_FARM_WBTC: EthereumToken
+    A_FARM_RENBTC: EthereumToken
+    A_FARM_CRVRENWBTC: EthereumToken
 
+    # Needed by independentreserve
+    A_XRP: Asset
+    A_ADA: Asset
+    A_DOT: Asset
+    A_LTC: Asset
+    A_EOS: Asset
+    A_XLM: Asset
+    A_GRT: EthereumToken
+    A_PMGT: EthereumToken
+    A_OMG: EthereumToken
 
-# Special tokens for defi price inquiry -- these should end up in programmatic rules
-# after being upgraded to include, protocol (to identify the program to run on them)
-# and underlying assets
-A_3CRV = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xFd2a8fA60Abd58Efe3EeE34dd494cD491dC14900'),
-    decimals=18,
-    name="Curve.fi aDAI/aUSDC/aUSDT",
-    symbol='a3CRV',
-    started=Timestamp(1608558126),
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_3CRV)
-A_YV1_DAIUSDCTBUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x2994529C0652D127b7842094103715ec5299bBed'),
-    decimals=18,
-    name="yearn Curve.fi yDAI/yUSDC/yUSDT/yBUSD",
-    symbol='yyDAI+yUSDC+yUSDT+yBUSD',
-    started=Timestamp(1598095312),
-    swapped_for=None,
-    coingecko='lp-bcurve',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_DAIUSDCTBUSD)
-A_CRVP_DAIUSDCTBUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x3B3Ac5386837Dc563660FB6a0937DFAa5924333B'),
-    decimals=18,
-    name="Curve.fi yDAI/yUSDC/yUSDT/yBUSD",
-    symbol='yDAI+yUSDC+yUSDT+yBUSD',
-    started=Timestamp(1582828578),
-    swapped_for=None,
-    coingecko='lp-bcurve',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CRVP_DAIUSDCTBUSD)
-A_YV1_DAIUSDCTTUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x5dbcF33D8c2E976c6b560249878e6F1491Bca25c'),
-    decimals=18,
-    name="yearn Curve.fi yDAI/yUSDC/yUSDT/yTUSD",
-    symbol='yyDAI+yUSDC+yUSDT+yTUSD',
-    started=Timestamp(1596091760),
-    swapped_for=None,
-    coingecko='yvault-lp-ycurve',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_DAIUSDCTTUSD)
-A_CRVP_DAIUSDCTTUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xdF5e0e81Dff6FAF3A7e52BA697820c5e32D806A8'),
-    decimals=18,
-    name="Curve.fi yDAI/yUSDC/yUSDT/yTUSD",
-    symbol='yDAI+yUSDC+yUSDT+yTUSD',
-    started=Timestamp(1581620573),
-    swapped_for=None,
-    coingecko='curve-fi-ydai-yusdc-yusdt-ytusd',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CRVP_DAIUSDCTTUSD)
-A_CRVP_RENWSBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x075b1bb99792c9E1041bA13afEf80C91a1e70fB3'),
-    decimals=18,
-    name="Curve.fi renBTC/wBTC/sBTC",
-    symbol='crvRenWSBTC',
-    started=Timestamp(1592306956),
-    swapped_for=None,
-    coingecko='lp-renbtc-curve',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CRVP_RENWSBTC)
-A_YV1_RENWSBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x7Ff566E1d69DEfF32a7b244aE7276b9f90e9D0f6'),
-    decimals=18,
-    name="yearn Curve.fi renBTC/wBTC/sBTC",
-    symbol='ycrvRenWSBTC',
-    started=Timestamp(1598421792),
-    swapped_for=None,
-    coingecko='lp-renbtc-curve',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_RENWSBTC)
-A_CRV_RENWBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x49849C98ae39Fff122806C06791Fa73784FB3675'),
-    decimals=18,
-    name="Curve.fi renBTC/wBTC",
-    symbol='crvRenWBTC',
-    started=Timestamp(1590630368),
-    swapped_for=None,
-    coingecko='lp-renbtc-curve',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CRV_RENWBTC)
-A_CRV_YPAX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xD905e2eaeBe188fc92179b6350807D8bd91Db0D8'),
-    decimals=18,
-    name="Curve.fi DAI/USDC/USDT/PAX",
-    symbol='ypaxCrv',
-    started=Timestamp(1589148107),
-    swapped_for=None,
-    coingecko='lp-paxcurve',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CRV_YPAX)
-A_CRV_GUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xD2967f45c4f384DEEa880F807Be904762a3DeA07'),
-    decimals=18,
-    name="Curve.fi GUSD/3Crv",
-    symbol='gusd3CRV',
-    started=Timestamp(1602032874),
-    swapped_for=None,
-    coingecko='curve-dao-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CRV_GUSD)
-A_CRV_3CRV = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490'),
-    decimals=18,
-    name="Curve.fi DAI/USDC/USDT",
-    symbol='3Crv',
-    started=Timestamp(1599414946),
-    swapped_for=None,
-    coingecko='curve-dao-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CRV_3CRV)
-A_YV1_3CRV = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x9cA85572E6A3EbF24dEDd195623F188735A5179f'),
-    decimals=18,
-    name="yearn Curve.fi DAI/USDC/USDT",
-    symbol='y3Crv',
-    started=Timestamp(1602322413),
-    swapped_for=None,
-    coingecko='curve-dao-token',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_3CRV)
-A_CRV_3CRVSUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xC25a3A3b969415c80451098fa907EC722572917F'),
-    decimals=18,
-    name="Curve.fi DAI/USDC/USDT/sUSD",
-    symbol='crvPlain3andSUSD',
-    started=Timestamp(1587348347),
-    swapped_for=None,
-    coingecko='lp-scurve',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CRV_3CRVSUSD)
-A_YV1_ALINK = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x29E240CFD7946BA20895a7a02eDb25C210f9f324'),
-    decimals=18,
-    name="yearn Aave Interest bearing LINK",
-    symbol='yaLINK',
-    started=Timestamp(1596628700),
-    swapped_for=None,
-    coingecko='aave-link',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_ALINK)
-A_YV1_DAI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xACd43E627e64355f1861cEC6d3a6688B31a6F952'),
-    decimals=18,
-    name="yearn Dai Stablecoin",
-    symbol='yDAI',
-    started=Timestamp(1597301808),
-    swapped_for=None,
-    coingecko='dai',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_DAI)
-A_YV1_WETH = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xe1237aA7f535b0CC33Fd973D66cBf830354D16c7'),
-    decimals=18,
-    name="yearn Wrapped Ether",
-    symbol='yWETH',
-    started=Timestamp(1598952738),
-    swapped_for=None,
-    coingecko='weth',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_WETH)
-A_YV1_YFI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xBA2E7Fed597fd0E3e70f5130BcDbbFE06bB94fe1'),
-    decimals=18,
-    name="yearn yearn.finance",
-    symbol='yYFI',
-    started=Timestamp(1597845648),
-    swapped_for=None,
-    coingecko='yearn-finance',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_YFI)
-A_YV1_USDT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x2f08119C6f07c006695E079AAFc638b8789FAf18'),
-    decimals=6,
-    name="yearn Tether USD",
-    symbol='yUSDT',
-    started=Timestamp(1597318993),
-    swapped_for=None,
-    coingecko='tether',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_USDT)
-A_YV1_USDC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x597aD1e0c13Bfe8025993D9e79C69E1c0233522e'),
-    decimals=6,
-    name="yearn USD//C",
-    symbol='yUSDC',
-    started=Timestamp(1595721600),
-    swapped_for=None,
-    coingecko='usd-coin',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_USDC)
-A_YV1_TUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x37d19d1c4E1fa9DC47bD1eA12f742a0887eDa74a'),
-    decimals=18,
-    name="yearn TrueUSD",
-    symbol='yTUSD',
-    started=Timestamp(1596678980),
-    swapped_for=None,
-    coingecko='true-usd',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_TUSD)
-A_YV1_GUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xec0d8D3ED5477106c6D4ea27D90a60e594693C90'),
-    decimals=2,
-    name="yearn Gemini dollar",
-    symbol='yGUSD',
-    started=Timestamp(1602827638),
-    swapped_for=None,
-    coingecko='gemini-dollar',
-    cryptocompare=None,
-    protocol='yearn-v1',
-)
-CONSTANT_ASSETS.append(A_YV1_GUSD)
-A_FARM_USDC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xf0358e8c3CD5Fa238a29301d0bEa3D63A17bEdBE'),
-    decimals=6,
-    name="FARM_USDC",
-    symbol='fUSDC',
-    started=Timestamp(1603116154),
-    swapped_for=None,
-    coingecko='usd-coin',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FARM_USDC)
-A_FARM_USDT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x053c80eA73Dc6941F518a68E2FC52Ac45BDE7c9C'),
-    decimals=6,
-    name="FARM_USDT",
-    symbol='fUSDT',
-    started=Timestamp(1603116272),
-    swapped_for=None,
-    coingecko='tether',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FARM_USDT)
-A_FARM_DAI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xab7FA2B2985BCcfC13c6D86b1D5A17486ab1e04C'),
-    decimals=18,
-    name="FARM_DAI",
-    symbol='fDAI',
-    started=Timestamp(1603116059),
-    swapped_for=None,
-    coingecko='dai',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FARM_DAI)
-A_FARM_TUSD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x7674622c63Bee7F46E86a4A5A18976693D54441b'),
-    decimals=18,
-    name="FARM_TUSD",
-    symbol='fTUSD',
-    started=Timestamp(1601927319),
-    swapped_for=None,
-    coingecko='true-usd',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FARM_TUSD)
-A_FARM_WETH = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xFE09e53A81Fe2808bc493ea64319109B5bAa573e'),
-    decimals=18,
-    name="FARM_WETH",
-    symbol='fWETH',
-    started=Timestamp(1603115998),
-    swapped_for=None,
-    coingecko='weth',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FARM_WETH)
-A_FARM_WBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x5d9d25c7C457dD82fc8668FFC6B9746b674d4EcB'),
-    decimals=8,
-    name="FARM_WBTC",
-    symbol='fWBTC',
-    started=Timestamp(1602866633),
-    swapped_for=None,
-    coingecko='wrapped-bitcoin',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FARM_WBTC)
-A_FARM_RENBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xC391d1b08c1403313B0c28D47202DFDA015633C4'),
-    decimals=8,
-    name="FARM_renBTC",
-    symbol='frenBTC',
-    started=Timestamp(1603116341),
-    swapped_for=None,
-    coingecko='renbtc',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FARM_RENBTC)
-A_FARM_CRVRENWBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x9aA8F427A17d6B0d91B6262989EdC7D45d6aEdf8'),
-    decimals=18,
-    name="FARM_crvRenWBTC",
-    symbol='fcrvRenWBTC',
-    started=Timestamp(1603116454),
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FARM_CRVRENWBTC)
+    A_AUD: Asset
+    A_NZD: Asset
+    A_SGD: Asset
 
+    # Needed by cryptocompare.py
+    A_KRW: Asset
 
-# Needed by independentreserve
-A_XRP = Asset.initialize(
-    identifier='XRP',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Ripple",
-    symbol='XRP',
-    started=Timestamp(1364774400),
-    forked=None,
-    swapped_for=None,
-    coingecko='ripple',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_XRP)
-A_ADA = Asset.initialize(
-    identifier='ADA',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Cardano",
-    symbol='ADA',
-    started=Timestamp(1506643200),
-    forked=None,
-    swapped_for=None,
-    coingecko='cardano',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_ADA)
-A_DOT = Asset.initialize(
-    identifier='DOT',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Polkadot",
-    symbol='DOT',
-    started=Timestamp(1590451200),
-    forked=None,
-    swapped_for=None,
-    coingecko='polkadot',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_DOT)
-A_LTC = Asset.initialize(
-    identifier='LTC',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Litecoin",
-    symbol='LTC',
-    started=Timestamp(1317972665),
-    forked=None,
-    swapped_for=None,
-    coingecko='litecoin',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_LTC)
-A_EOS = Asset.initialize(
-    identifier='EOS',
-    asset_type=AssetType.OWN_CHAIN,
-    name="EOS.io",
-    symbol='EOS',
-    started=Timestamp(1494028800),
-    forked=None,
-    swapped_for=None,
-    coingecko='eos',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_EOS)
-A_XLM = Asset.initialize(
-    identifier='XLM',
-    asset_type=AssetType.OWN_CHAIN,
-    name="Stellar Lumens",
-    symbol='XLM',
-    started=Timestamp(1374192000),
-    forked=None,
-    swapped_for=None,
-    coingecko='stellar',
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_XLM)
-A_GRT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xc944E90C64B2c07662A292be6244BDf05Cda44a7'),
-    decimals=18,
-    name="Graph Token",
-    symbol='GRT',
-    started=Timestamp(1607890633),
-    swapped_for=None,
-    coingecko='the-graph',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_GRT)
-A_PMGT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xAFFCDd96531bCd66faED95FC61e443D08F79eFEf'),
-    decimals=5,
-    name="Perth Mint Gold Token",
-    symbol='PMGT',
-    started=Timestamp(1570681682),
-    swapped_for=None,
-    coingecko='perth-mint-gold-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_PMGT)
-A_OMG = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xd26114cd6EE289AccF82350c8d8487fedB8A0C07'),
-    decimals=18,
-    name="OmiseGO",
-    symbol='OMG',
-    started=Timestamp(1498176000),
-    swapped_for=None,
-    coingecko='omisego',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_OMG)
+    # Needed by airdrops.py
+    A_CVX: EthereumToken
 
-A_AUD = Asset.initialize(
-    identifier='AUD',
-    asset_type=AssetType.FIAT,
-    name="Australian Dollar",
-    symbol='AUD',
-    started=None,
-    forked=None,
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_AUD)
-A_NZD = Asset.initialize(
-    identifier='NZD',
-    asset_type=AssetType.FIAT,
-    name="New Zealand Dollar",
-    symbol='NZD',
-    started=None,
-    forked=None,
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_NZD)
-A_SGD = Asset.initialize(
-    identifier='SGD',
-    asset_type=AssetType.FIAT,
-    name="Singapore Dollar",
-    symbol='SGD',
-    started=None,
-    forked=None,
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_SGD)
+    # Needed by loopring.py
+    A_HT: EthereumToken
+    A_OKB: EthereumToken
+    A_KEEP: EthereumToken
+    A_DXD: EthereumToken
+    A_TRB: EthereumToken
+    A_AUC: EthereumToken
+    A_RPL: EthereumToken
+    A_GNO: EthereumToken
+    A_BNT: EthereumToken
+    A_PBTC: EthereumToken
+    A_PNT: EthereumToken
+    A_GRID: EthereumToken
+    A_PNK: EthereumToken
+    A_NEST: EthereumToken
+    A_BTU: EthereumToken
+    A_VBZRX: EthereumToken
+    A_NMR: EthereumToken
+    A_SNT: EthereumToken
+    A_MTA: EthereumToken
+    A_ONG: EthereumToken
+    A_GRG: EthereumToken
+    A_QCAD: EthereumToken
+    A_TON: EthereumToken
+    A_BAND: EthereumToken
+    A_UMA: EthereumToken
+    A_WNXM: EthereumToken
+    A_ENTRP: EthereumToken
+    A_NIOX: EthereumToken
+    A_OGN: EthereumToken
+    A_HEX: EthereumToken
+    A_HBTC: EthereumToken
+    A_PLTC: EthereumToken
+    A_FIN: EthereumToken
+    A_DOUGH: EthereumToken
+    A_DEFI_L: EthereumToken
+    A_DEFI_S: EthereumToken
+    A_TRYB: EthereumToken
+    A_CEL: EthereumToken
+    A_AMP: EthereumToken
+    A_KP3R: EthereumToken
+    A_AC: EthereumToken
+    A_CVT: EthereumToken
+    A_WOO: EthereumToken
+    A_BEL: EthereumToken
+    A_OBTC: EthereumToken
+    A_INDEX: EthereumToken
+    A_TTV: EthereumToken
+    A_FARM: EthereumToken
+    A_BOR: EthereumToken
+    A_RFOX: EthereumToken
+    A_NEC: EthereumToken
+    A_RGT: EthereumToken
+    A_VSP: EthereumToken
+    A_SMARTCREDIT: EthereumToken
+    A_RAI: EthereumToken
+    A_TEL: EthereumToken
+    A_BCP: EthereumToken
+    A_BADGER: EthereumToken
+    A_SUSHI: EthereumToken
+    A_MASK: EthereumToken
+    A_YPIE: EthereumToken
+    A_FUSE: EthereumToken
+    A_SX: EthereumToken
+    A_RSPT: EthereumToken
+    A_FOX: EthereumToken
+    A_ENS: EthereumToken
+    A_PSP: EthereumToken
+    A_SDL: EthereumToken
 
-# Needed by cryptocompare.py
-A_KRW = Asset.initialize(
-    identifier='KRW',
-    asset_type=AssetType.FIAT,
-    name="Korean won",
-    symbol='KRW',
-    started=None,
-    forked=None,
-    swapped_for=None,
-    coingecko=None,
-    cryptocompare=None,
-)
-CONSTANT_ASSETS.append(A_KRW)
+# variable name -> (identifier, type, name, symbol, started, forked,
+# swapped_for, coingecko, cryptocompare)
+_ASSETS_DATA: Dict[str, Tuple[Any, ...]] = {
+    'A_USD': ('USD', AssetType.FIAT, 'United States Dollar', 'USD', None, None, None, None, None),
+    'A_EUR': ('EUR', AssetType.FIAT, 'Euro', 'EUR', 915148800, None, None, None, None),
+    'A_BTC': ('BTC', AssetType.OWN_CHAIN, 'Bitcoin', 'BTC', 1231006505, None, None, 'bitcoin', None),  # noqa: E501
+    'A_BCH': ('BCH', AssetType.OWN_CHAIN, 'Bitcoin Cash', 'BCH', 1501593374, 'BTC', None, 'bitcoin-cash', None),  # noqa: E501
+    'A_BSV': ('BSV', AssetType.OWN_CHAIN, "Bitcoin Satoshi's Vision", 'BSV', 1542300000, 'BCH', None, 'bitcoin-cash-sv', None),  # noqa: E501
+    'A_ETH': ('ETH', AssetType.OWN_CHAIN, 'Ethereum', 'ETH', 1438214400, None, None, 'ethereum', None),  # noqa: E501
+    'A_ETH2': ('ETH2', AssetType.OWN_CHAIN, 'Staked ETH in Phase 0', 'ETH', 1602667372, None, None, 'ethereum', 'ETH'),  # noqa: E501
+    'A_ETC': ('ETC', AssetType.OWN_CHAIN, 'Ethereum classic', 'ETC', 1469020840, 'ETH', None, 'ethereum-classic', None),  # noqa: E501
+    'A_KSM': ('KSM', AssetType.OWN_CHAIN, 'Kusama', 'KSM', 1576142353, None, None, 'kusama', None),
+    'A_AVAX': ('AVAX', AssetType.OWN_CHAIN, 'Avalanche', 'AVAX', 1600646400, None, None, 'avalanche-2', None),  # noqa: E501
+    'A_DOGE': ('DOGE', AssetType.OWN_CHAIN, 'Dogecoin', 'DOGE', 1386325540, None, None, 'dogecoin', None),  # noqa: E501
+    'A_BSQ': ('BSQ', AssetType.OTHER, 'Bisq DAO Token', 'BSQ', 1555286400, None, None, None, None),
+    'A_KFEE': ('KFEE', AssetType.OWN_CHAIN, 'Kraken fees', 'KFEE', 1377993600, None, None, None, None),  # noqa: E501
+    'A_XRP': ('XRP', AssetType.OWN_CHAIN, 'Ripple', 'XRP', 1364774400, None, None, 'ripple', None),
+    'A_ADA': ('ADA', AssetType.OWN_CHAIN, 'Cardano', 'ADA', 1506643200, None, None, 'cardano', None),  # noqa: E501
+    'A_DOT': ('DOT', AssetType.OWN_CHAIN, 'Polkadot', 'DOT', 1590451200, None, None, 'polkadot', None),  # noqa: E501
+    'A_LTC': ('LTC', AssetType.OWN_CHAIN, 'Litecoin', 'LTC', 1317972665, None, None, 'litecoin', None),  # noqa: E501
+    'A_EOS': ('EOS', AssetType.OWN_CHAIN, 'EOS.io', 'EOS', 1494028800, None, None, 'eos', None),
+    'A_XLM': ('XLM', AssetType.OWN_CHAIN, 'Stellar Lumens', 'XLM', 1374192000, None, None, 'stellar', None),  # noqa: E501
+    'A_AUD': ('AUD', AssetType.FIAT, 'Australian Dollar', 'AUD', None, None, None, None, None),
+    'A_NZD': ('NZD', AssetType.FIAT, 'New Zealand Dollar', 'NZD', None, None, None, None, None),
+    'A_SGD': ('SGD', AssetType.FIAT, 'Singapore Dollar', 'SGD', None, None, None, None, None),
+    'A_KRW': ('KRW', AssetType.FIAT, 'Korean won', 'KRW', None, None, None, None, None),
+}
+# variable name -> (address, decimals, name, symbol, started, swapped_for,
+# coingecko, cryptocompare, protocol)
+_ETHEREUM_TOKENS_DATA: Dict[str, Tuple[Any, ...]] = {
+    'A_BAL': ('0xba100000625a3754423978a60c9317c58a424e3D', 18, 'Balancer', 'BAL', 1592616779, None, 'balancer', None, None),  # noqa: E501
+    'A_BAT': ('0x0D8775F648430679A709E98d2b0Cb6250d2887EF', 18, 'Basic Attention Token', 'BAT', 1496294094, None, 'basic-attention-token', None, None),  # noqa: E501
+    'A_UNI': ('0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984', 18, 'Uniswap', 'UNI', 1600107086, None, 'uniswap', None, None),  # noqa: E501
+    'A_1INCH': ('0x111111111117dC0aa78b770fA6A738034120C302', 18, '1INCH Token', '1INCH', 1608747211, None, '1inch', None, None),  # noqa: E501
+    'A_DAI': ('0x6B175474E89094C44Da98b954EedeAC495271d0F', 18, 'Multi Collateral Dai', 'DAI', 1573672677, None, 'dai', None, None),  # noqa: E501
+    'A_SAI': ('0x89d24A6b4CcB1B6fAA2625fE562bDD9a23260359', 18, 'Single Collateral Dai', 'SAI', 1513586475, None, 'sai', None, None),  # noqa: E501
+    'A_YFI': ('0x0bc529c00C6401aEF6D220BE8C6Ea1667F6Ad93e', 18, 'yearn.finance', 'YFI', 1594972885, None, 'yearn-finance', None, None),  # noqa: E501
+    'A_USDT': ('0xdAC17F958D2ee523a2206206994597C13D831ec7', 6, 'Tether', 'USDT', 1402358400, None, 'tether', None, None),  # noqa: E501
+    'A_USDC': ('0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48', 6, 'USD Coin', 'USDC', 1533324504, None, 'usd-coin', None, None),  # noqa: E501
+    'A_TUSD': ('0x0000000000085d4780B73119b644AE5ecd22b376', 18, 'TrueUSD', 'TUSD', 1520310861, None, 'true-usd', None, None),  # noqa: E501
+    'A_MATIC': ('0x7D1AfA7B718fb893dB30A3aBc0Cfc608AaCfeBB0', 18, 'Matic Network', 'MATIC', 1555718400, None, 'matic-network', None, None),  # noqa: E501
+    'A_LQTY': ('0x6DEA81C8171D0bA574754EF6F8b412F2Ed88c54D', 18, 'LQTY', 'LQTY', 1617611590, None, 'liquity', 'LQTY', None),  # noqa: E501
+    'A_PICKLE': ('0x429881672B9AE42b8EbA0E26cD9C73711b891Ca5', 18, 'PickleToken', 'PICKLE', 1599694316, None, 'pickle-finance', None, None),  # noqa: E501
+    'A_BEST': ('0x1B073382E63411E3BcfFE90aC1B9A43feFa1Ec6F', 8, 'Bitpanda Ecosystem Token', 'BEST', 1564487711, None, 'bitpanda-ecosystem-token', 'BEST', None),  # noqa: E501
+    'A_AAVE': ('0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9', 18, 'Aave Token', 'AAVE', 1600970788, None, 'aave', None, None),  # noqa: E501
+    'A_GUSD': ('0x056Fd409E1d7A124BD7017459dFEa2F387b6d5Cd', 2, 'Gemini Dollar', 'GUSD', 1536521774, None, 'gemini-dollar', None, None),  # noqa: E501
+    'A_CRV': ('0xD533a949740bb3306d119CC777fa900bA034cd52', 18, 'Curve DAO Token', 'CRV', 1597270648, None, 'curve-dao-token', None, None),  # noqa: E501
+    'A_KNC': ('0xdd974D5C2e2928deA5F71b9825b8b646686BD200', 18, 'Kyber Network', 'KNC', 1501545600, None, 'kyber-network', None, None),  # noqa: E501
+    'A_WBTC': ('0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599', 8, 'Wrapped Bitcoin', 'WBTC', 1543095952, None, 'wrapped-bitcoin', None, None),  # noqa: E501
+    'A_WETH': ('0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2', 18, 'WETH', 'WETH', 1513077455, None, 'weth', 'ETH', None),  # noqa: E501
+    'A_ZRX': ('0xE41d2489571d322189246DaFA5ebDe1F4699F498', 18, '0x', 'ZRX', 1502476756, None, '0x', None, None),  # noqa: E501
+    'A_MANA': ('0x0F5D2fB29fb7d3CFeE444a200298f468908cC942', 18, 'Decentraland', 'MANA', 1502824689, None, 'decentraland', None, None),  # noqa: E501
+    'A_PAX': ('0x8E870D67F660D95d5be530380D0eC0bd388289E1', 18, 'Paxos Standard Token', 'PAX', 1536537600, None, 'paxos-standard', None, None),  # noqa: E501
+    'A_COMP': ('0xc00e94Cb662C3520282E6f5717214004A7f26888', 18, 'Compound', 'COMP', 1583323735, None, 'compound-governance-token', None, 'compound'),  # noqa: E501
+    'A_LRC': ('0xBBbbCA6A901c926F240b89EacB641d8Aec7AEafD', 18, 'LoopringCoin V2', 'LRC', 1500422400, None, 'loopring', None, None),  # noqa: E501
+    'A_LINK': ('0x514910771AF9Ca656af840dff83E8264EcF986CA', 18, 'Chainlink', 'LINK', 1505520000, None, 'chainlink', None, None),  # noqa: E501
+    'A_ADX': ('0xADE00C28244d5CE17D72E40330B1c318cD12B7c3', 18, 'AdEx Network', 'ADX', 1496102400, None, 'adex', None, None),  # noqa: E501
+    'A_TORN': ('0x77777FeDdddFfC19Ff86DB637967013e6C6A116C', 18, 'TornadoCash', 'TORN', 1608260437, None, 'tornado-cash', 'TORN', None),  # noqa: E501
+    'A_CORN': ('0xa456b515303B2Ce344E9d2601f91270f8c2Fea5E', 18, 'Cornichon', 'CORN', 1606603741, None, 'cornichon', None, None),  # noqa: E501
+    'A_GRAIN': ('0x6589fe1271A0F29346796C6bAf0cdF619e25e58e', 18, 'GRAIN Token', 'GRAIN', 1606500872, None, 'grain-token', None, None),  # noqa: E501
+    'A_COMBO': ('0xfFffFffF2ba8F66D4e51811C5190992176930278', 18, 'Furucombo', 'COMBO', 1609231627, None, 'furucombo', None, None),  # noqa: E501
+    'A_LDO': ('0x5A98FcBEA516Cf06857215779Fd812CA3beF1B32', 18, 'Lido DAO Token', 'LDO', 1608242396, None, 'lido-dao', None, None),  # noqa: E501
+    'A_RENBTC': ('0xEB4C2781e4ebA804CE9a9803C67d0893436bB27D', 8, 'renBTC', 'renBTC', 1585090944, None, 'renbtc', None, None),  # noqa: E501
+    'A_BNB': ('0xB8c77482e45F1F44dE1745F52C74426C631bDD52', 18, 'Binance Coin', 'BNB', 1498521600, None, 'binancecoin', None, None),  # noqa: E501
+    'A_REP': ('0x221657776846890989a759BA2973e427DfF5C9bB', 18, 'Augur', 'REPv2', 1595886655, None, 'augur', 'REP', None),  # noqa: E501
+    'A_BZRX': ('0x56d811088235F11C8920698a204A5010a788f4b3', 18, 'bZx Protocol', 'BZRX', 1594509320, None, 'bzx-protocol', None, None),  # noqa: E501
+    'A_STAKE': ('0x0Ae055097C6d159879521C384F1D2123D1f195e6', 18, 'xDAI STAKE', 'STAKE', 1586959457, None, 'xdai-stake', None, None),  # noqa: E501
+    'A_DPI': ('0x1494CA1F11D487c2bBe4543E90080AeBa4BA3C2b', 18, 'DefiPulse Index', 'DPI', 1599694252, None, 'defipulse-index', None, None),  # noqa: E501
+    'A_YFII': ('0xa1d0E215a23d7030842FC67cE582a6aFa3CCaB83', 18, 'YFII.finance', 'YFII', 1595768700, None, 'yfii-finance', None, None),  # noqa: E501
+    'A_MCB': ('0x4e352cF164E64ADCBad318C3a1e222E9EBa4Ce42', 18, 'MCDEX Token', 'MCB', 1593849744, None, 'mcdex', None, None),  # noqa: E501
+    'A_LUSD': ('0x5f98805A4E8be255a32880FDeC7F6728C6568bA0', 18, 'LUSD Stablecoin', 'LUSD', 1617611299, None, 'liquity-usd', 'LUSD', None),  # noqa: E501
+    'A_ENJ': ('0xF629cBd94d3791C9250152BD8dfBDF380E2a3B9c', 18, 'Enjin Coin', 'ENJ', 1500854400, None, 'enjincoin', None, None),  # noqa: E501
+    'A_SUSD': ('0x57Ab1ec28D129707052df4dF418D58a2D46d5f51', 18, 'Synth sUSD', 'sUSD', 1569466541, None, 'nusd', None, None),  # noqa: E501
+    'A_BUSD': ('0x4Fabb145d64652a948d72533023f6E7A623C7C53', 18, 'Binance USD', 'BUSD', 1567641600, None, 'binance-usd', None, None),  # noqa: E501
+    'A_LEND': ('0x80fB784B7eD66730e8b1DBd9820aFD29931aab03', 18, 'ETHLend', 'LEND', 1502755200, '_ceth_0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9', 'ethlend', None, None),  # noqa: E501
+    'A_MKR': ('0x9f8F72aA9304c8B593d555F12eF6589cC3A579A2', 18, 'Maker', 'MKR', 1439596800, None, 'maker', None, None),  # noqa: E501
+    'A_REN': ('0x408e41876cCCDC0F92210600ef50372656052a38', 18, 'Republic', 'REN', 1514678400, None, 'republic-protocol', None, None),  # noqa: E501
+    'A_SNX': ('0xC011a73ee8576Fb46F5E1c5751cA3B9Fe0af2a6F', 18, 'Synthetix Network Token', 'SNX', 1515283200, None, 'havven', None, None),  # noqa: E501
+    'A_ALINK_V1': ('0xA64BD6C70Cb9051F6A9ba1F163Fdc07E0DfB5F84', 18, 'Aave Interest bearing LINK', 'aLINK', 1578501727, None, 'aave-link', 'LINK', 'aave'),  # noqa: E501
+    'A_AETH_V1': ('0x3a3A65aAb0dd2A17E3F1947bA16138cd37d08c04', 18, 'Aave Interest bearing ETH', 'aETH', 1578501678, None, 'aave-eth-v1', 'ETH', 'aave'),  # noqa: E501
+    'A_AUSDC_V1': ('0x9bA00D6856a4eDF4665BcA2C2309936572473B7E', 6, 'Aave Interest bearing USDC', 'aUSDC', 1578501407, None, 'aave-usdc', 'USDC', 'aave'),  # noqa: E501
+    'A_AREP_V1': ('0x71010A9D003445aC60C4e6A7017c1E89A477B438', 18, 'Aave Interest bearing REP', 'aREP', 1578501835, None, 'aave-rep', 'REP', 'aave'),  # noqa: E501
+    'A_CDAI': ('0x5d3a536E4D6DbD6114cc1Ead35777bAB948E3643', 8, 'Compound DAI', 'cDAI', 1574471013, None, 'cdai', None, 'compound'),  # noqa: E501
+    'A_CUSDC': ('0x39AA39c021dfbaE8faC545936693aC917d5E7563', 8, 'Compound USD Coin', 'cUSDC', 1557192331, None, 'compound-usd-coin', None, 'compound'),  # noqa: E501
+    'A_CUSDT': ('0xf650C3d88D12dB855b8bf7D11Be6C55A4e07dCC9', 8, 'Compound USDT', 'cUSDT', 1586985186, None, 'compound-usdt', None, 'compound'),  # noqa: E501
+    'A_CBAT': ('0x6C8c6b02E7b2BE14d4fA6022Dfd6d75921D90E4E', 8, 'Compound BAT', 'cBAT', 1557192085, None, 'compound-basic-attention-token', None, 'compound'),  # noqa: E501
+    'A_CETH': ('0x4Ddc2D193948926D02f9B1fE9e1daa0718270ED5', 8, 'Compound ETH', 'cETH', 1557192318, None, 'compound-ether', None, 'compound'),  # noqa: E501
+    'A_CREP': ('0x158079Ee67Fce2f58472A96584A73C7Ab9AC95c1', 8, 'Compound Augur', 'cREP', 1557192288, None, 'compound-augur', None, 'compound'),  # noqa: E501
+    'A_CWBTC': ('0xC11b1268C1A384e55C48c2391d8d480264A3A7F4', 8, 'Compound Wrapped BTC', 'cWBTC', 1563263257, None, 'compound-wrapped-btc', None, 'compound'),  # noqa: E501
+    'A_CZRX': ('0xB3319f5D18Bc0D84dD1b4825Dcde5d5f7266d407', 8, 'Compound 0x', 'cZRX', 1557192054, None, 'compound-0x', None, 'compound'),  # noqa: E501
+    'A_3CRV': ('0xFd2a8fA60Abd58Efe3EeE34dd494cD491dC14900', 18, 'Curve.fi aDAI/aUSDC/aUSDT', 'a3CRV', 1608558126, None, None, None, None),  # noqa: E501
+    'A_YV1_DAIUSDCTBUSD': ('0x2994529C0652D127b7842094103715ec5299bBed', 18, 'yearn Curve.fi yDAI/yUSDC/yUSDT/yBUSD', 'yyDAI+yUSDC+yUSDT+yBUSD', 1598095312, None, 'lp-bcurve', None, 'yearn-v1'),  # noqa: E501
+    'A_CRVP_DAIUSDCTBUSD': ('0x3B3Ac5386837Dc563660FB6a0937DFAa5924333B', 18, 'Curve.fi yDAI/yUSDC/yUSDT/yBUSD', 'yDAI+yUSDC+yUSDT+yBUSD', 1582828578, None, 'lp-bcurve', None, None),  # noqa: E501
+    'A_YV1_DAIUSDCTTUSD': ('0x5dbcF33D8c2E976c6b560249878e6F1491Bca25c', 18, 'yearn Curve.fi yDAI/yUSDC/yUSDT/yTUSD', 'yyDAI+yUSDC+yUSDT+yTUSD', 1596091760, None, 'yvault-lp-ycurve', None, 'yearn-v1'),  # noqa: E501
+    'A_CRVP_DAIUSDCTTUSD': ('0xdF5e0e81Dff6FAF3A7e52BA697820c5e32D806A8', 18, 'Curve.fi yDAI/yUSDC/yUSDT/yTUSD', 'yDAI+yUSDC+yUSDT+yTUSD', 1581620573, None, 'curve-fi-ydai-yusdc-yusdt-ytusd', None, None),  # noqa: E501
+    'A_CRVP_RENWSBTC': ('0x075b1bb99792c9E1041bA13afEf80C91a1e70fB3', 18, 'Curve.fi renBTC/wBTC/sBTC', 'crvRenWSBTC', 1592306956, None, 'lp-renbtc-curve', None, None),  # noqa: E501
+    'A_YV1_RENWSBTC': ('0x7Ff566E1d69DEfF32a7b244aE7276b9f90e9D0f6', 18, 'yearn Curve.fi renBTC/wBTC/sBTC', 'ycrvRenWSBTC', 1598421792, None, 'lp-renbtc-curve', None, 'yearn-v1'),  # noqa: E501
+    'A_CRV_RENWBTC': ('0x49849C98ae39Fff122806C06791Fa73784FB3675', 18, 'Curve.fi renBTC/wBTC', 'crvRenWBTC', 1590630368, None, 'lp-renbtc-curve', None, None),  # noqa: E501
+    'A_CRV_YPAX': ('0xD905e2eaeBe188fc92179b6350807D8bd91Db0D8', 18, 'Curve.fi DAI/USDC/USDT/PAX', 'ypaxCrv', 1589148107, None, 'lp-paxcurve', None, None),  # noqa: E501
+    'A_CRV_GUSD': ('0xD2967f45c4f384DEEa880F807Be904762a3DeA07', 18, 'Curve.fi GUSD/3Crv', 'gusd3CRV', 1602032874, None, 'curve-dao-token', None, None),  # noqa: E501
+    'A_CRV_3CRV': ('0x6c3F90f043a72FA612cbac8115EE7e52BDe6E490', 18, 'Curve.fi DAI/USDC/USDT', '3Crv', 1599414946, None, 'curve-dao-token', None, None),  # noqa: E501
+    'A_YV1_3CRV': ('0x9cA85572E6A3EbF24dEDd195623F188735A5179f', 18, 'yearn Curve.fi DAI/USDC/USDT', 'y3Crv', 1602322413, None, 'curve-dao-token', None, 'yearn-v1'),  # noqa: E501
+    'A_CRV_3CRVSUSD': ('0xC25a3A3b969415c80451098fa907EC722572917F', 18, 'Curve.fi DAI/USDC/USDT/sUSD', 'crvPlain3andSUSD', 1587348347, None, 'lp-scurve', None, None),  # noqa: E501
+    'A_YV1_ALINK': ('0x29E240CFD7946BA20895a7a02eDb25C210f9f324', 18, 'yearn Aave Interest bearing LINK', 'yaLINK', 1596628700, None, 'aave-link', None, 'yearn-v1'),  # noqa: E501
+    'A_YV1_DAI': ('0xACd43E627e64355f1861cEC6d3a6688B31a6F952', 18, 'yearn Dai Stablecoin', 'yDAI', 1597301808, None, 'dai', None, 'yearn-v1'),  # noqa: E501
+    'A_YV1_WETH': ('0xe1237aA7f535b0CC33Fd973D66cBf830354D16c7', 18, 'yearn Wrapped Ether', 'yWETH', 1598952738, None, 'weth', None, 'yearn-v1'),  # noqa: E501
+    'A_YV1_YFI': ('0xBA2E7Fed597fd0E3e70f5130BcDbbFE06bB94fe1', 18, 'yearn yearn.finance', 'yYFI', 1597845648, None, 'yearn-finance', None, 'yearn-v1'),  # noqa: E501
+    'A_YV1_USDT': ('0x2f08119C6f07c006695E079AAFc638b8789FAf18', 6, 'yearn Tether USD', 'yUSDT', 1597318993, None, 'tether', None, 'yearn-v1'),  # noqa: E501
+    'A_YV1_USDC': ('0x597aD1e0c13Bfe8025993D9e79C69E1c0233522e', 6, 'yearn USD//C', 'yUSDC', 1595721600, None, 'usd-coin', None, 'yearn-v1'),  # noqa: E501
+    'A_YV1_TUSD': ('0x37d19d1c4E1fa9DC47bD1eA12f742a0887eDa74a', 18, 'yearn TrueUSD', 'yTUSD', 1596678980, None, 'true-usd', None, 'yearn-v1'),  # noqa: E501
+    'A_YV1_GUSD': ('0xec0d8D3ED5477106c6D4ea27D90a60e594693C90', 2, 'yearn Gemini dollar', 'yGUSD', 1602827638, None, 'gemini-dollar', None, 'yearn-v1'),  # noqa: E501
+    'A_FARM_USDC': ('0xf0358e8c3CD5Fa238a29301d0bEa3D63A17bEdBE', 6, 'FARM_USDC', 'fUSDC', 1603116154, None, 'usd-coin', None, None),  # noqa: E501
+    'A_FARM_USDT': ('0x053c80eA73Dc6941F518a68E2FC52Ac45BDE7c9C', 6, 'FARM_USDT', 'fUSDT', 1603116272, None, 'tether', None, None),  # noqa: E501
+    'A_FARM_DAI': ('0xab7FA2B2985BCcfC13c6D86b1D5A17486ab1e04C', 18, 'FARM_DAI', 'fDAI', 1603116059, None, 'dai', None, None),  # noqa: E501
+    'A_FARM_TUSD': ('0x7674622c63Bee7F46E86a4A5A18976693D54441b', 18, 'FARM_TUSD', 'fTUSD', 1601927319, None, 'true-usd', None, None),  # noqa: E501
+    'A_FARM_WETH': ('0xFE09e53A81Fe2808bc493ea64319109B5bAa573e', 18, 'FARM_WETH', 'fWETH', 1603115998, None, 'weth', None, None),  # noqa: E501
+    'A_FARM_WBTC': ('0x5d9d25c7C457dD82fc8668FFC6B9746b674d4EcB', 8, 'FARM_WBTC', 'fWBTC', 1602866633, None, 'wrapped-bitcoin', None, None),  # noqa: E501
+    'A_FARM_RENBTC': ('0xC391d1b08c1403313B0c28D47202DFDA015633C4', 8, 'FARM_renBTC', 'frenBTC', 1603116341, None, 'renbtc', None, None),  # noqa: E501
+    'A_FARM_CRVRENWBTC': ('0x9aA8F427A17d6B0d91B6262989EdC7D45d6aEdf8', 18, 'FARM_crvRenWBTC', 'fcrvRenWBTC', 1603116454, None, None, None, None),  # noqa: E501
+    'A_GRT': ('0xc944E90C64B2c07662A292be6244BDf05Cda44a7', 18, 'Graph Token', 'GRT', 1607890633, None, 'the-graph', None, None),  # noqa: E501
+    'A_PMGT': ('0xAFFCDd96531bCd66faED95FC61e443D08F79eFEf', 5, 'Perth Mint Gold Token', 'PMGT', 1570681682, None, 'perth-mint-gold-token', None, None),  # noqa: E501
+    'A_OMG': ('0xd26114cd6EE289AccF82350c8d8487fedB8A0C07', 18, 'OmiseGO', 'OMG', 1498176000, None, 'omisego', None, None),  # noqa: E501
+    'A_CVX': ('0x4e3FBD56CD56c3e72c1403e103b45Db9da5B9D2B', 18, 'Convex Token', 'CVX', 1621242525, None, 'convex-finance', 'CVX', None),  # noqa: E501
+    'A_HT': ('0x6f259637dcD74C767781E37Bc6133cd6A68aa161', 18, 'Huobi Token', 'HT', 1516579200, None, 'huobi-token', None, None),  # noqa: E501
+    'A_OKB': ('0x75231F58b43240C9718Dd58B4967c5114342a86c', 18, 'OKB', 'OKB', 1556264879, None, 'okb', None, None),  # noqa: E501
+    'A_KEEP': ('0x85Eee30c52B0b379b046Fb0F85F4f3Dc3009aFEC', 18, 'KEEP Token ', 'KEEP', 1588042366, None, 'keep-network', None, None),  # noqa: E501
+    'A_DXD': ('0xa1d65E8fB6e87b60FECCBc582F7f97804B725521', 18, 'DXdao', 'DXD', 1588752887, None, 'dxdao', None, None),  # noqa: E501
+    'A_TRB': ('0x0Ba45A8b5d5575935B8158a88C631E9F9C95a2e5', 18, 'Tellor Tributes', 'TRB', 1564671864, '_ceth_0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0', 'tellor', None, None),  # noqa: E501
+    'A_AUC': ('0xc12d099be31567add4e4e4d0D45691C3F58f5663', 18, 'Auctus', 'AUC', 1522090240, None, 'auctus', None, None),  # noqa: E501
+    'A_RPL': ('0xB4EFd85c19999D84251304bDA99E90B92300Bd93', 18, 'Rocket Pool', 'RPL', 1504750041, None, 'rocket-pool', None, None),  # noqa: E501
+    'A_GNO': ('0x6810e776880C02933D47DB1b9fc05908e5386b96', 18, 'Gnosis token', 'GNO', 1492992000, None, 'gnosis', None, None),  # noqa: E501
+    'A_BNT': ('0x1F573D6Fb3F13d689FF844B4cE37794d79a7FF1C', 18, 'Bancor', 'BNT', 1497657600, None, 'bancor', None, None),  # noqa: E501
+    'A_PBTC': ('0x5228a22e72ccC52d415EcFd199F99D0665E7733b', 18, 'pTokens BTC', 'pBTC', 1583307208, None, 'ptokens-btc', None, None),  # noqa: E501
+    'A_PNT': ('0x89Ab32156e46F46D02ade3FEcbe5Fc4243B9AAeD', 18, 'pNetwork Token', 'PNT', 1592411070, None, 'pnetwork', None, None),  # noqa: E501
+    'A_GRID': ('0x12B19D3e2ccc14Da04FAe33e63652ce469b3F2FD', 12, 'Grid+', 'GRID', 1499817600, None, 'grid', None, None),  # noqa: E501
+    'A_PNK': ('0x93ED3FBe21207Ec2E8f2d3c3de6e058Cb73Bc04d', 18, 'Kleros', 'PNK', 1521078220, None, 'kleros', 'PNK', None),  # noqa: E501
+    'A_NEST': ('0x04abEdA201850aC0124161F037Efd70c74ddC74C', 18, 'NEST', 'NEST', 1545191462, None, 'nest', None, None),  # noqa: E501
+    'A_BTU': ('0xb683D83a532e2Cb7DFa5275eED3698436371cc9f', 18, 'BTU Protocol', 'BTU', 1525910400, None, 'btu-protocol', None, None),  # noqa: E501
+    'A_VBZRX': ('0xB72B31907C1C95F3650b64b2469e08EdACeE5e8F', 18, 'bZx Vesting Token', 'vBZRX', 1594495494, None, 'vbzrx', None, None),  # noqa: E501
+    'A_NMR': ('0x1776e1F26f98b1A5dF9cD347953a26dd3Cb46671', 18, 'Numeraire', 'NMR', 1496952637, None, 'numeraire', None, None),  # noqa: E501
+    'A_SNT': ('0x744d70FDBE2Ba4CF95131626614a1763DF805B9E', 18, 'Status Network Token', 'SNT', 1497889273, None, 'status', None, None),  # noqa: E501
+    'A_MTA': ('0xa3BeD4E1c75D00fa6f4E5E6922DB7261B5E9AcD2', 18, 'Meta', 'MTA', 1594635836, None, 'meta', None, None),  # noqa: E501
+    'A_ONG': ('0xd341d1680Eeee3255b8C4c75bCCE7EB57f144dAe', 18, 'SoMee.Social', 'ONG', 1497657600, None, 'ong-social', 'ONG', None),  # noqa: E501
+    'A_GRG': ('0x4FbB350052Bca5417566f188eB2EBCE5b19BC964', 18, 'Rigo Token', 'GRG', 1541876282, None, 'rigoblock', None, None),  # noqa: E501
+    'A_QCAD': ('0x4A16BAf414b8e637Ed12019faD5Dd705735DB2e0', 2, 'QCAD', 'QCAD', 1578449585, None, 'qcad', None, None),  # noqa: E501
+    'A_TON': ('0x6a6c2adA3Ce053561C2FbC3eE211F23d9b8C520a', 18, 'TONToken', 'TON', 1597639121, None, 'tontoken', None, None),  # noqa: E501
+    'A_BAND': ('0xBA11D00c5f74255f56a5E366F4F77f5A186d7f55', 18, 'Band Protocol', 'BAND', 1567987200, None, 'band-protocol', None, None),  # noqa: E501
+    'A_UMA': ('0x04Fa0d235C4abf4BcF4787aF4CF447DE572eF828', 18, 'UMA Voting Token v1', 'UMA', 1578581061, None, 'uma', None, None),  # noqa: E501
+    'A_WNXM': ('0x0d438F3b5175Bebc262bF23753C1E53d03432bDE', 18, 'Wrapped Nexus Mutual', 'wNXM', 1593733266, None, 'wrapped-nxm', None, None),  # noqa: E501
+    'A_ENTRP': ('0x5BC7e5f0Ab8b2E10D2D0a3F21739FCe62459aeF3', 18, 'Hut34 Entropy Token', 'ENTRP', 1504742400, None, 'hut34-entropy', None, None),  # noqa: E501
+    'A_NIOX': ('0xc813EA5e3b48BEbeedb796ab42A30C5599b01740', 4, 'Autonio', 'NIOX', 1593134600, None, 'autonio', 'AUTON', None),  # noqa: E501
+    'A_OGN': ('0x8207c1FfC5B6804F6024322CcF34F29c3541Ae26', 18, 'Origin Protocol', 'OGN', 1538352000, None, 'origin-protocol', None, None),  # noqa: E501
+    'A_HEX': ('0x2b591e99afE9f32eAA6214f7B7629768c40Eeb39', 8, 'HEX', 'HEX', 1575331200, None, 'hex', None, None),  # noqa: E501
+    'A_HBTC': ('0x0316EB71485b0Ab14103307bf65a021042c6d380', 18, 'Huobi BTC ', 'HBTC', 1575863326, None, 'huobi-btc', None, None),  # noqa: E501
+    'A_PLTC': ('0x5979F50f1D4c08f9A53863C2f39A7B0492C38d0f', 18, 'pTokens LTC', 'pLTC', 1595926001, None, 'ptokens-ltc', None, None),  # noqa: E501
+    'A_FIN': ('0x054f76beED60AB6dBEb23502178C52d6C5dEbE40', 18, 'DeFiner', 'FIN', 1599618925, None, 'definer', None, None),  # noqa: E501
+    'A_DOUGH': ('0xad32A8e6220741182940c5aBF610bDE99E737b2D', 18, 'PieDAO DOUGH v2', 'DOUGH', 1599823243, None, 'piedao-dough-v2', None, None),  # noqa: E501
+    'A_DEFI_L': ('0x78F225869c08d478c34e5f645d07A87d3fe8eb78', 18, 'PieDAO DEFI Large Cap', 'DEFI+L', 1602115200, None, 'piedao-defi-large-cap', None, None),  # noqa: E501
+    'A_DEFI_S': ('0xaD6A626aE2B43DCb1B39430Ce496d2FA0365BA9C', 18, 'PieDAO DEFI Small Cap', 'DEFI+S', 1602115200, None, 'piedao-defi-small-cap', None, None),  # noqa: E501
+    'A_TRYB': ('0x2C537E5624e4af88A7ae4060C022609376C8D0EB', 6, 'BiLira', 'TRYB', 1563539445, None, 'bilira', None, None),  # noqa: E501
+    'A_CEL': ('0xaaAEBE6Fe48E54f431b0C390CfaF0b017d09D42d', 4, 'Celsius', 'CEL', 1554810016, None, 'celsius-degree-token', None, None),  # noqa: E501
+    'A_AMP': ('0xfF20817765cB7f73d4bde2e66e067E58D11095C2', 18, 'Amp', 'AMP', 1597148839, None, 'amp-token', None, None),  # noqa: E501
+    'A_KP3R': ('0x1cEB5cB57C4D4E2b2433641b95Dd330A33185A44', 18, 'Keep3rV1', 'KP3R', 1603871844, None, 'keep3rv1', None, None),  # noqa: E501
+    'A_AC': ('0x9A0aBA393aac4dFbFf4333B06c407458002C6183', 18, 'ACoconut ', 'AC', 1601507639, None, 'acoconut', None, None),  # noqa: E501
+    'A_CVT': ('0xBe428c3867F05deA2A89Fc76a102b544eaC7f772', 18, 'CyberVein', 'CVT', 1516888006, None, 'cybervein', None, None),  # noqa: E501
+    'A_WOO': ('0x4691937a7508860F876c9c0a2a617E7d9E945D4B', 18, 'Wootrade Network', 'WOO', 1602855151, None, 'woo-network', None, None),  # noqa: E501
+    'A_BEL': ('0xA91ac63D040dEB1b7A5E4d4134aD23eb0ba07e14', 18, 'Bella', 'BEL', 1597392058, None, 'bella-protocol', None, None),  # noqa: E501
+    'A_OBTC': ('0x8064d9Ae6cDf087b1bcd5BDf3531bD5d8C537a68', 18, 'BoringDAO BTC', 'oBTC', 1605169554, None, 'boringdao-btc', None, None),  # noqa: E501
+    'A_INDEX': ('0x0954906da0Bf32d5479e25f46056d22f08464cab', 18, 'Index', 'INDEX', 1601964283, None, 'index-cooperative', None, None),  # noqa: E501
+    'A_TTV': ('0xa838be6E4b760E6061D4732D6B9F11Bf578f9A76', 18, 'TV-TWO', 'TTV', 1526568632, None, 'tv-two', None, None),  # noqa: E501
+    'A_FARM': ('0xa0246c9032bC3A600820415aE600c6388619A14D', 18, 'Harvest Finance', 'FARM', 1598895285, None, 'harvest-finance', None, None),  # noqa: E501
+    'A_BOR': ('0x3c9d6c1C73b31c837832c72E04D3152f051fc1A9', 18, 'BoringDAO', 'BOR', 1603390844, None, 'boringdao', None, None),  # noqa: E501
+    'A_RFOX': ('0xa1d6Df714F91DeBF4e0802A542E13067f31b8262', 18, 'RFOX', 'RFOX', 1603301829, None, 'redfox-labs-2', None, None),  # noqa: E501
+    'A_NEC': ('0xCc80C051057B774cD75067Dc48f8987C4Eb97A5e', 18, 'Ethfinex Nectar Token', 'NEC', 1512086400, None, 'nectar-token', None, None),  # noqa: E501
+    'A_RGT': ('0xD291E7a03283640FDc51b121aC401383A46cC623', 18, 'Rari Governance Token', 'RGT', 1603212673, None, 'rari-governance-token', None, None),  # noqa: E501
+    'A_VSP': ('0x1b40183EFB4Dd766f11bDa7A7c3AD8982e998421', 18, 'VesperToken', 'VSP', 1613051449, None, 'vesper-finance', None, None),  # noqa: E501
+    'A_SMARTCREDIT': ('0x72e9D9038cE484EE986FEa183f8d8Df93f9aDA13', 18, 'SMARTCREDIT Token', 'SMARTCREDIT', 1602058612, None, 'smartcredit-token', None, None),  # noqa: E501
+    'A_RAI': ('0x03ab458634910AaD20eF5f1C8ee96F1D6ac54919', 18, 'Rai Reflex Index', 'RAI', 1613221351, None, 'rai', 'RAI', None),  # noqa: E501
+    'A_TEL': ('0x467Bccd9d29f223BcE8043b84E8C8B282827790F', 2, 'Telcoin', 'TEL', 1510358400, None, 'telcoin', None, None),  # noqa: E501
+    'A_BCP': ('0xE4f726Adc8e89C6a6017F01eadA77865dB22dA14', 18, 'PieDAO Balanced Crypto Pie', 'BCP', 1606733040, None, 'piedao-balanced-crypto-pie', None, None),  # noqa: E501
+    'A_BADGER': ('0x3472A5A71965499acd81997a54BBA8D852C6E53d', 18, 'Badger', 'BADGER', 1606584722, None, 'badger-dao', None, None),  # noqa: E501
+    'A_SUSHI': ('0x6B3595068778DD592e39A122f4f5a5cF09C90fE2', 18, 'SushiToken', 'SUSHI', 1598444887, None, 'sushi', None, None),  # noqa: E501
+    'A_MASK': ('0x69af81e73A73B40adF4f3d4223Cd9b1ECE623074', 18, 'Mask Network', 'MASK', 1613723201, None, 'mask-network', None, None),  # noqa: E501
+    'A_YPIE': ('0x17525E4f4Af59fbc29551bC4eCe6AB60Ed49CE31', 18, 'PieDAO Yearn Ecosystem Pie', 'YPIE', 1608299408, None, 'piedao-yearn-ecosystem-pie', None, None),  # noqa: E501
+    'A_FUSE': ('0x970B9bB2C0444F5E81e9d0eFb84C8ccdcdcAf84d', 18, 'Fuse Token', 'FUSE', 1567507220, None, 'fuse-network-token', None, None),  # noqa: E501
+    'A_SX': ('0x99fE3B1391503A1bC1788051347A1324bff41452', 18, 'SportX', 'SX', 1610747210, None, 'sx-network', None, None),  # noqa: E501
+    'A_RSPT': ('0x016bf078ABcaCB987f0589a6d3BEAdD4316922B0', 18, 'Rari Stable Pool Token', 'RSPT', 1600740632, None, 'rari-stable-pool-token', None, None),  # noqa: E501
+    'A_FOX': ('0xc770EEfAd204B5180dF6a14Ee197D99d808ee52d', 18, 'FOX Token', 'FOX', 1553639047, None, 'shapeshift-fox-token', None, None),  # noqa: E501
+    'A_ENS': ('0xC18360217D8F7Ab5e7c516566761Ea12Ce7F9D72', 18, 'Ethereum Name Service', 'ENS', 1635800117, None, 'ethereum-name-service', 'ENS', None),  # noqa: E501
+    'A_PSP': ('0xcAfE001067cDEF266AfB7Eb5A286dCFD277f3dE5', 18, 'ParaSwap', 'PSP', 1636966698, None, 'paraswap', 'PSP', None),  # noqa: E501
+    'A_SDL': ('0xf1Dc500FdE233A4055e25e5BbF516372BC4F6871', 18, 'Saddle DAO', 'SDL', 1637043563, None, 'saddle-finance', None, None),  # noqa: E501
+}
 
-# Needed by airdrops.py
-A_CVX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x4e3FBD56CD56c3e72c1403e103b45Db9da5B9D2B'),
-    decimals=18,
-    name="Convex Token",
-    symbol='CVX',
-    started=Timestamp(1621242525),
-    swapped_for=None,
-    coingecko='convex-finance',
-    cryptocompare='CVX',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CVX)
 
-# Needed by loopring.py
-A_HT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x6f259637dcD74C767781E37Bc6133cd6A68aa161'),
-    decimals=18,
-    name="Huobi Token",
-    symbol='HT',
-    started=Timestamp(1516579200),
-    swapped_for=None,
-    coingecko='huobi-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_HT)
-A_OKB = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x75231F58b43240C9718Dd58B4967c5114342a86c'),
-    decimals=18,
-    name="OKB",
-    symbol='OKB',
-    started=Timestamp(1556264879),
-    swapped_for=None,
-    coingecko='okb',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_OKB)
-A_KEEP = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x85Eee30c52B0b379b046Fb0F85F4f3Dc3009aFEC'),
-    decimals=18,
-    name="KEEP Token ",
-    symbol='KEEP',
-    started=Timestamp(1588042366),
-    swapped_for=None,
-    coingecko='keep-network',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_KEEP)
-A_DXD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xa1d65E8fB6e87b60FECCBc582F7f97804B725521'),
-    decimals=18,
-    name="DXdao",
-    symbol='DXD',
-    started=Timestamp(1588752887),
-    swapped_for=None,
-    coingecko='dxdao',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_DXD)
-_CETH_0X0BA45A8B5D5575935B8158A88C631E9F9C95A2E5_swappedfor = Asset.initialize(
-    identifier='_ceth_0x88dF592F8eb5D7Bd38bFeF7dEb0fBc02cf3778a0',
-    asset_type=AssetType.ETHEREUM_TOKEN,
-    name="Tellor",
-    symbol='TRB',
-    started=Timestamp(1613850551),
-    forked=None,
-    swapped_for=None,
-    coingecko='tellor',
-    cryptocompare='TRB',
-)
-CONSTANT_ASSETS.append(_CETH_0X0BA45A8B5D5575935B8158A88C631E9F9C95A2E5_swappedfor)
-A_TRB = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x0Ba45A8b5d5575935B8158a88C631E9F9C95a2e5'),
-    decimals=18,
-    name="Tellor Tributes",
-    symbol='TRB',
-    started=Timestamp(1564671864),
-    swapped_for=_CETH_0X0BA45A8B5D5575935B8158A88C631E9F9C95A2E5_swappedfor,
-    coingecko='tellor',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_TRB)
-A_AUC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xc12d099be31567add4e4e4d0D45691C3F58f5663'),
-    decimals=18,
-    name="Auctus",
-    symbol='AUC',
-    started=Timestamp(1522090240),
-    swapped_for=None,
-    coingecko='auctus',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_AUC)
-A_RPL = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xB4EFd85c19999D84251304bDA99E90B92300Bd93'),
-    decimals=18,
-    name="Rocket Pool",
-    symbol='RPL',
-    started=Timestamp(1504750041),
-    swapped_for=None,
-    coingecko='rocket-pool',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_RPL)
-A_GNO = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x6810e776880C02933D47DB1b9fc05908e5386b96'),
-    decimals=18,
-    name="Gnosis token",
-    symbol='GNO',
-    started=Timestamp(1492992000),
-    swapped_for=None,
-    coingecko='gnosis',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_GNO)
-A_BNT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x1F573D6Fb3F13d689FF844B4cE37794d79a7FF1C'),
-    decimals=18,
-    name="Bancor",
-    symbol='BNT',
-    started=Timestamp(1497657600),
-    swapped_for=None,
-    coingecko='bancor',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BNT)
-A_PBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x5228a22e72ccC52d415EcFd199F99D0665E7733b'),
-    decimals=18,
-    name="pTokens BTC",
-    symbol='pBTC',
-    started=Timestamp(1583307208),
-    swapped_for=None,
-    coingecko='ptokens-btc',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_PBTC)
-A_PNT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x89Ab32156e46F46D02ade3FEcbe5Fc4243B9AAeD'),
-    decimals=18,
-    name="pNetwork Token",
-    symbol='PNT',
-    started=Timestamp(1592411070),
-    swapped_for=None,
-    coingecko='pnetwork',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_PNT)
-A_GRID = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x12B19D3e2ccc14Da04FAe33e63652ce469b3F2FD'),
-    decimals=12,
-    name="Grid+",
-    symbol='GRID',
-    started=Timestamp(1499817600),
-    swapped_for=None,
-    coingecko='grid',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_GRID)
-A_PNK = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x93ED3FBe21207Ec2E8f2d3c3de6e058Cb73Bc04d'),
-    decimals=18,
-    name="Kleros",
-    symbol='PNK',
-    started=Timestamp(1521078220),
-    swapped_for=None,
-    coingecko='kleros',
-    cryptocompare='PNK',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_PNK)
-A_NEST = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x04abEdA201850aC0124161F037Efd70c74ddC74C'),
-    decimals=18,
-    name="NEST",
-    symbol='NEST',
-    started=Timestamp(1545191462),
-    swapped_for=None,
-    coingecko='nest',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_NEST)
-A_BTU = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xb683D83a532e2Cb7DFa5275eED3698436371cc9f'),
-    decimals=18,
-    name="BTU Protocol",
-    symbol='BTU',
-    started=Timestamp(1525910400),
-    swapped_for=None,
-    coingecko='btu-protocol',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BTU)
-A_VBZRX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xB72B31907C1C95F3650b64b2469e08EdACeE5e8F'),
-    decimals=18,
-    name="bZx Vesting Token",
-    symbol='vBZRX',
-    started=Timestamp(1594495494),
-    swapped_for=None,
-    coingecko='vbzrx',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_VBZRX)
-A_NMR = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x1776e1F26f98b1A5dF9cD347953a26dd3Cb46671'),
-    decimals=18,
-    name="Numeraire",
-    symbol='NMR',
-    started=Timestamp(1496952637),
-    swapped_for=None,
-    coingecko='numeraire',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_NMR)
-A_SNT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x744d70FDBE2Ba4CF95131626614a1763DF805B9E'),
-    decimals=18,
-    name="Status Network Token",
-    symbol='SNT',
-    started=Timestamp(1497889273),
-    swapped_for=None,
-    coingecko='status',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_SNT)
-A_MTA = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xa3BeD4E1c75D00fa6f4E5E6922DB7261B5E9AcD2'),
-    decimals=18,
-    name="Meta",
-    symbol='MTA',
-    started=Timestamp(1594635836),
-    swapped_for=None,
-    coingecko='meta',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_MTA)
-A_ONG = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xd341d1680Eeee3255b8C4c75bCCE7EB57f144dAe'),
-    decimals=18,
-    name="SoMee.Social",
-    symbol='ONG',
-    started=Timestamp(1497657600),
-    swapped_for=None,
-    coingecko='ong-social',
-    cryptocompare='ONG',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_ONG)
-A_GRG = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x4FbB350052Bca5417566f188eB2EBCE5b19BC964'),
-    decimals=18,
-    name="Rigo Token",
-    symbol='GRG',
-    started=Timestamp(1541876282),
-    swapped_for=None,
-    coingecko='rigoblock',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_GRG)
-A_QCAD = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x4A16BAf414b8e637Ed12019faD5Dd705735DB2e0'),
-    decimals=2,
-    name="QCAD",
-    symbol='QCAD',
-    started=Timestamp(1578449585),
-    swapped_for=None,
-    coingecko='qcad',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_QCAD)
-A_TON = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x6a6c2adA3Ce053561C2FbC3eE211F23d9b8C520a'),
-    decimals=18,
-    name="TONToken",
-    symbol='TON',
-    started=Timestamp(1597639121),
-    swapped_for=None,
-    coingecko='tontoken',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_TON)
-A_BAND = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xBA11D00c5f74255f56a5E366F4F77f5A186d7f55'),
-    decimals=18,
-    name="Band Protocol",
-    symbol='BAND',
-    started=Timestamp(1567987200),
-    swapped_for=None,
-    coingecko='band-protocol',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BAND)
-A_UMA = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x04Fa0d235C4abf4BcF4787aF4CF447DE572eF828'),
-    decimals=18,
-    name="UMA Voting Token v1",
-    symbol='UMA',
-    started=Timestamp(1578581061),
-    swapped_for=None,
-    coingecko='uma',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_UMA)
-A_WNXM = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x0d438F3b5175Bebc262bF23753C1E53d03432bDE'),
-    decimals=18,
-    name="Wrapped Nexus Mutual",
-    symbol='wNXM',
-    started=Timestamp(1593733266),
-    swapped_for=None,
-    coingecko='wrapped-nxm',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_WNXM)
-A_ENTRP = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x5BC7e5f0Ab8b2E10D2D0a3F21739FCe62459aeF3'),
-    decimals=18,
-    name="Hut34 Entropy Token",
-    symbol='ENTRP',
-    started=Timestamp(1504742400),
-    swapped_for=None,
-    coingecko='hut34-entropy',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_ENTRP)
-A_NIOX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xc813EA5e3b48BEbeedb796ab42A30C5599b01740'),
-    decimals=4,
-    name="Autonio",
-    symbol='NIOX',
-    started=Timestamp(1593134600),
-    swapped_for=None,
-    coingecko='autonio',
-    cryptocompare='AUTON',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_NIOX)
-A_OGN = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x8207c1FfC5B6804F6024322CcF34F29c3541Ae26'),
-    decimals=18,
-    name="Origin Protocol",
-    symbol='OGN',
-    started=Timestamp(1538352000),
-    swapped_for=None,
-    coingecko='origin-protocol',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_OGN)
-A_HEX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x2b591e99afE9f32eAA6214f7B7629768c40Eeb39'),
-    decimals=8,
-    name="HEX",
-    symbol='HEX',
-    started=Timestamp(1575331200),
-    swapped_for=None,
-    coingecko='hex',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_HEX)
-A_HBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x0316EB71485b0Ab14103307bf65a021042c6d380'),
-    decimals=18,
-    name="Huobi BTC ",
-    symbol='HBTC',
-    started=Timestamp(1575863326),
-    swapped_for=None,
-    coingecko='huobi-btc',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_HBTC)
-A_PLTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x5979F50f1D4c08f9A53863C2f39A7B0492C38d0f'),
-    decimals=18,
-    name="pTokens LTC",
-    symbol='pLTC',
-    started=Timestamp(1595926001),
-    swapped_for=None,
-    coingecko='ptokens-ltc',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_PLTC)
-A_FIN = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x054f76beED60AB6dBEb23502178C52d6C5dEbE40'),
-    decimals=18,
-    name="DeFiner",
-    symbol='FIN',
-    started=Timestamp(1599618925),
-    swapped_for=None,
-    coingecko='definer',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FIN)
-A_DOUGH = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xad32A8e6220741182940c5aBF610bDE99E737b2D'),
-    decimals=18,
-    name="PieDAO DOUGH v2",
-    symbol='DOUGH',
-    started=Timestamp(1599823243),
-    swapped_for=None,
-    coingecko='piedao-dough-v2',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_DOUGH)
-A_DEFI_L = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x78F225869c08d478c34e5f645d07A87d3fe8eb78'),
-    decimals=18,
-    name="PieDAO DEFI Large Cap",
-    symbol='DEFI+L',
-    started=Timestamp(1602115200),
-    swapped_for=None,
-    coingecko='piedao-defi-large-cap',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_DEFI_L)
-A_DEFI_S = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xaD6A626aE2B43DCb1B39430Ce496d2FA0365BA9C'),
-    decimals=18,
-    name="PieDAO DEFI Small Cap",
-    symbol='DEFI+S',
-    started=Timestamp(1602115200),
-    swapped_for=None,
-    coingecko='piedao-defi-small-cap',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_DEFI_S)
-A_TRYB = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x2C537E5624e4af88A7ae4060C022609376C8D0EB'),
-    decimals=6,
-    name="BiLira",
-    symbol='TRYB',
-    started=Timestamp(1563539445),
-    swapped_for=None,
-    coingecko='bilira',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_TRYB)
-A_CEL = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xaaAEBE6Fe48E54f431b0C390CfaF0b017d09D42d'),
-    decimals=4,
-    name="Celsius",
-    symbol='CEL',
-    started=Timestamp(1554810016),
-    swapped_for=None,
-    coingecko='celsius-degree-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CEL)
-A_AMP = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xfF20817765cB7f73d4bde2e66e067E58D11095C2'),
-    decimals=18,
-    name="Amp",
-    symbol='AMP',
-    started=Timestamp(1597148839),
-    swapped_for=None,
-    coingecko='amp-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_AMP)
-A_KP3R = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x1cEB5cB57C4D4E2b2433641b95Dd330A33185A44'),
-    decimals=18,
-    name="Keep3rV1",
-    symbol='KP3R',
-    started=Timestamp(1603871844),
-    swapped_for=None,
-    coingecko='keep3rv1',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_KP3R)
-A_AC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x9A0aBA393aac4dFbFf4333B06c407458002C6183'),
-    decimals=18,
-    name="ACoconut ",
-    symbol='AC',
-    started=Timestamp(1601507639),
-    swapped_for=None,
-    coingecko='acoconut',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_AC)
-A_CVT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xBe428c3867F05deA2A89Fc76a102b544eaC7f772'),
-    decimals=18,
-    name="CyberVein",
-    symbol='CVT',
-    started=Timestamp(1516888006),
-    swapped_for=None,
-    coingecko='cybervein',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_CVT)
-A_WOO = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x4691937a7508860F876c9c0a2a617E7d9E945D4B'),
-    decimals=18,
-    name="Wootrade Network",
-    symbol='WOO',
-    started=Timestamp(1602855151),
-    swapped_for=None,
-    coingecko='woo-network',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_WOO)
-A_BEL = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xA91ac63D040dEB1b7A5E4d4134aD23eb0ba07e14'),
-    decimals=18,
-    name="Bella",
-    symbol='BEL',
-    started=Timestamp(1597392058),
-    swapped_for=None,
-    coingecko='bella-protocol',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BEL)
-A_OBTC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x8064d9Ae6cDf087b1bcd5BDf3531bD5d8C537a68'),
-    decimals=18,
-    name="BoringDAO BTC",
-    symbol='oBTC',
-    started=Timestamp(1605169554),
-    swapped_for=None,
-    coingecko='boringdao-btc',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_OBTC)
-A_INDEX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x0954906da0Bf32d5479e25f46056d22f08464cab'),
-    decimals=18,
-    name="Index",
-    symbol='INDEX',
-    started=Timestamp(1601964283),
-    swapped_for=None,
-    coingecko='index-cooperative',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_INDEX)
-A_TTV = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xa838be6E4b760E6061D4732D6B9F11Bf578f9A76'),
-    decimals=18,
-    name="TV-TWO",
-    symbol='TTV',
-    started=Timestamp(1526568632),
-    swapped_for=None,
-    coingecko='tv-two',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_TTV)
-A_FARM = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xa0246c9032bC3A600820415aE600c6388619A14D'),
-    decimals=18,
-    name="Harvest Finance",
-    symbol='FARM',
-    started=Timestamp(1598895285),
-    swapped_for=None,
-    coingecko='harvest-finance',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FARM)
-A_BOR = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x3c9d6c1C73b31c837832c72E04D3152f051fc1A9'),
-    decimals=18,
-    name="BoringDAO",
-    symbol='BOR',
-    started=Timestamp(1603390844),
-    swapped_for=None,
-    coingecko='boringdao',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BOR)
-A_RFOX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xa1d6Df714F91DeBF4e0802A542E13067f31b8262'),
-    decimals=18,
-    name="RFOX",
-    symbol='RFOX',
-    started=Timestamp(1603301829),
-    swapped_for=None,
-    coingecko='redfox-labs-2',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_RFOX)
-A_NEC = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xCc80C051057B774cD75067Dc48f8987C4Eb97A5e'),
-    decimals=18,
-    name="Ethfinex Nectar Token",
-    symbol='NEC',
-    started=Timestamp(1512086400),
-    swapped_for=None,
-    coingecko='nectar-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_NEC)
-A_RGT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xD291E7a03283640FDc51b121aC401383A46cC623'),
-    decimals=18,
-    name="Rari Governance Token",
-    symbol='RGT',
-    started=Timestamp(1603212673),
-    swapped_for=None,
-    coingecko='rari-governance-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_RGT)
-A_VSP = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x1b40183EFB4Dd766f11bDa7A7c3AD8982e998421'),
-    decimals=18,
-    name="VesperToken",
-    symbol='VSP',
-    started=Timestamp(1613051449),
-    swapped_for=None,
-    coingecko='vesper-finance',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_VSP)
-A_SMARTCREDIT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x72e9D9038cE484EE986FEa183f8d8Df93f9aDA13'),
-    decimals=18,
-    name="SMARTCREDIT Token",
-    symbol='SMARTCREDIT',
-    started=Timestamp(1602058612),
-    swapped_for=None,
-    coingecko='smartcredit-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_SMARTCREDIT)
-A_RAI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x03ab458634910AaD20eF5f1C8ee96F1D6ac54919'),
-    decimals=18,
-    name="Rai Reflex Index",
-    symbol='RAI',
-    started=Timestamp(1613221351),
-    swapped_for=None,
-    coingecko='rai',
-    cryptocompare='RAI',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_RAI)
-A_TEL = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x467Bccd9d29f223BcE8043b84E8C8B282827790F'),
-    decimals=2,
-    name="Telcoin",
-    symbol='TEL',
-    started=Timestamp(1510358400),
-    swapped_for=None,
-    coingecko='telcoin',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_TEL)
-A_BCP = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xE4f726Adc8e89C6a6017F01eadA77865dB22dA14'),
-    decimals=18,
-    name="PieDAO Balanced Crypto Pie",
-    symbol='BCP',
-    started=Timestamp(1606733040),
-    swapped_for=None,
-    coingecko='piedao-balanced-crypto-pie',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BCP)
-A_BADGER = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x3472A5A71965499acd81997a54BBA8D852C6E53d'),
-    decimals=18,
-    name="Badger",
-    symbol='BADGER',
-    started=Timestamp(1606584722),
-    swapped_for=None,
-    coingecko='badger-dao',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_BADGER)
-A_SUSHI = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x6B3595068778DD592e39A122f4f5a5cF09C90fE2'),
-    decimals=18,
-    name="SushiToken",
-    symbol='SUSHI',
-    started=Timestamp(1598444887),
-    swapped_for=None,
-    coingecko='sushi',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_SUSHI)
-A_MASK = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x69af81e73A73B40adF4f3d4223Cd9b1ECE623074'),
-    decimals=18,
-    name="Mask Network",
-    symbol='MASK',
-    started=Timestamp(1613723201),
-    swapped_for=None,
-    coingecko='mask-network',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_MASK)
-A_YPIE = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x17525E4f4Af59fbc29551bC4eCe6AB60Ed49CE31'),
-    decimals=18,
-    name="PieDAO Yearn Ecosystem Pie",
-    symbol='YPIE',
-    started=Timestamp(1608299408),
-    swapped_for=None,
-    coingecko='piedao-yearn-ecosystem-pie',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_YPIE)
-A_FUSE = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x970B9bB2C0444F5E81e9d0eFb84C8ccdcdcAf84d'),
-    decimals=18,
-    name="Fuse Token",
-    symbol='FUSE',
-    started=Timestamp(1567507220),
-    swapped_for=None,
-    coingecko='fuse-network-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FUSE)
-A_SX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x99fE3B1391503A1bC1788051347A1324bff41452'),
-    decimals=18,
-    name="SportX",
-    symbol='SX',
-    started=Timestamp(1610747210),
-    swapped_for=None,
-    coingecko='sx-network',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_SX)
-A_RSPT = EthereumToken.initialize(
-    address=string_to_ethereum_address('0x016bf078ABcaCB987f0589a6d3BEAdD4316922B0'),
-    decimals=18,
-    name="Rari Stable Pool Token",
-    symbol='RSPT',
-    started=Timestamp(1600740632),
-    swapped_for=None,
-    coingecko='rari-stable-pool-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_RSPT)
-A_FOX = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xc770EEfAd204B5180dF6a14Ee197D99d808ee52d'),
-    decimals=18,
-    name="FOX Token",
-    symbol='FOX',
-    started=Timestamp(1553639047),
-    swapped_for=None,
-    coingecko='shapeshift-fox-token',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_FOX)
-A_ENS = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xC18360217D8F7Ab5e7c516566761Ea12Ce7F9D72'),
-    decimals=18,
-    name="Ethereum Name Service",
-    symbol='ENS',
-    started=Timestamp(1635800117),
-    swapped_for=None,
-    coingecko='ethereum-name-service',
-    cryptocompare='ENS',
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_ENS)
-A_PSP = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xcAfE001067cDEF266AfB7Eb5A286dCFD277f3dE5'),
-    decimals=18,
-    name="ParaSwap",
-    symbol='PSP',
-    started=Timestamp(1636966698),
-    swapped_for=None,
-    coingecko='paraswap',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_PSP)
-A_SDL = EthereumToken.initialize(
-    address=string_to_ethereum_address('0xf1Dc500FdE233A4055e25e5BbF516372BC4F6871'),
-    decimals=18,
-    name="Saddle DAO",
-    symbol='SDL',
-    started=Timestamp(1637043563),
-    swapped_for=None,
-    coingecko='saddle-finance',
-    cryptocompare=None,
-    protocol=None,
-)
-CONSTANT_ASSETS.append(A_SDL)
+def _create_constant_asset(var_name: str) -> Asset:
+    """May raise KeyError if there is no constant asset with the given variable name"""
+    token_data = _ETHEREUM_TOKENS_DATA.get(var_name)
+    if token_data is not None:
+        address, decimals, name, symbol, started, swapped_for, coingecko, cryptocompare, protocol = token_data  # noqa: E501
+        return EthereumToken.initialize(
+            address=string_to_ethereum_address(address),
+            decimals=decimals,
+            name=name,
+            symbol=symbol,
+            started=Timestamp(started) if started is not None else None,
+            swapped_for=swapped_for,
+            coingecko=coingecko,
+            cryptocompare=cryptocompare,
+            protocol=protocol,
+        )
+
+    identifier, asset_type, name, symbol, started, forked, swapped_for, coingecko, cryptocompare = _ASSETS_DATA[var_name]  # noqa: E501
+    return Asset.initialize(
+        identifier=identifier,
+        asset_type=asset_type,
+        name=name,
+        symbol=symbol,
+        started=Timestamp(started) if started is not None else None,
+        forked=forked,
+        swapped_for=swapped_for,
+        coingecko=coingecko,
+        cryptocompare=cryptocompare,
+    )
+
+
+def __getattr__(name: str) -> Asset:
+    """Creates a constant asset the first time it is accessed and caches it in the module"""
+    try:
+        asset = _create_constant_asset(name)
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    globals()[name] = asset
+    CONSTANT_ASSETS.append(asset)
+    if CONSTANT_ASSETS_RELOADER is not None:
+        CONSTANT_ASSETS_RELOADER([asset])
+    return asset
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _ASSETS_DATA.keys() | _ETHEREUM_TOKENS_DATA.keys())
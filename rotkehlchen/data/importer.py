@@ -182,12 +182,13 @@ class DataImporter():
         filepath: Path,
         **kwargs: Any,
     ) -> Tuple[bool, str]:
-        with open(filepath, 'r', encoding='utf-8-sig') as csvfile:
+        with self.db.user_write(), open(filepath, 'r', encoding='utf-8-sig') as csvfile:
             data = csv.reader(csvfile, delimiter=',', quotechar='"')
             header = remap_header(next(data))
             for row in data:
                 try:
-                    self._consume_cointracking_entry(dict(zip(header, row)), **kwargs)
+                    with self.db.user_write():  # a failing row rolls back only its own writes
+                        self._consume_cointracking_entry(dict(zip(header, row)), **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During cointracking CSV import found action with unknown '
@@ -667,42 +668,43 @@ class DataImporter():
                         self.db_ledger.add_ledger_action(action)
 
     def import_cryptocom_csv(self, filepath: Path, **kwargs: Any) -> Tuple[bool, str]:
-        with open(filepath, 'r', encoding='utf-8-sig') as csvfile:
+        with self.db.user_write(), open(filepath, 'r', encoding='utf-8-sig') as csvfile:
             data = csv.DictReader(csvfile)
             try:
-                #  Notice: Crypto.com csv export gathers all swapping entries (`lockup_swap_*`,
-                # `crypto_wallet_swap_*`, ...) into one entry named `dynamic_coin_swap_*`.
-                self._import_cryptocom_associated_entries(
-                    data=data,
-                    tx_kind='dynamic_coin_swap',
-                    **kwargs,
-                )
-                # reset the iterator
-                csvfile.seek(0)
-                # pass the header since seek(0) make the first row to be the header
-                next(data)
-
-                self._import_cryptocom_associated_entries(
-                    data=data,
-                    tx_kind='dust_conversion',
-                    **kwargs,
-                )
-                csvfile.seek(0)
-                next(data)
+                # the associated entries are only kept if all of them could be added
+                with self.db.user_write():
+                    #  Notice: Crypto.com csv export gathers all swapping entries (`lockup_swap_*`,
+                    # `crypto_wallet_swap_*`, ...) into one entry named `dynamic_coin_swap_*`.
+                    self._import_cryptocom_associated_entries(
+                        data=data,
+                        tx_kind='dynamic_coin_swap',
+                        **kwargs,
+                    )
+                    # reset the iterator
+                    csvfile.seek(0)
+                    # pass the header since seek(0) make the first row to be the header
+                    next(data)
+
+                    self._import_cryptocom_associated_entries(
+                        data=data,
+                        tx_kind='dust_conversion',
+                        **kwargs,
+                    )
+                    csvfile.seek(0)
+                    next(data)
 
-                self._import_cryptocom_associated_entries(data, 'interest_swap', **kwargs)
-                csvfile.seek(0)
-                next(data)
+                    self._import_cryptocom_associated_entries(data, 'interest_swap', **kwargs)
+                    csvfile.seek(0)
+                    next(data)
 
-                self._import_cryptocom_associated_entries(data, 'invest', **kwargs)
-                csvfile.seek(0)
-                next(data)
+                    self._import_cryptocom_associated_entries(data, 'invest', **kwargs)
+                    csvfile.seek(0)
+                    next(data)
             except KeyError as e:
                 return False, f'Crypto.com csv missing entry for {str(e)}'
             except UnknownAsset as e:
                 return False, f'Encountered unknown asset {str(e)} at crypto.com csv import'
             except sqlcipher.IntegrityError:  # pylint: disable=no-member
-                self.db.conn.rollback()
                 self.db.msg_aggregator.add_warning(
                     'Error during cryptocom CSV import consumption. '
                     ' Entry already existed in DB. Ignoring.',
@@ -711,7 +713,8 @@ class DataImporter():
 
             for row in data:
                 try:
-                    self._consume_cryptocom_entry(row, **kwargs)
+                    with self.db.user_write():
+                        self._consume_cryptocom_entry(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During cryptocom CSV import found action with unknown '
@@ -725,7 +728,6 @@ class DataImporter():
                     )
                     continue
                 except sqlcipher.IntegrityError:  # pylint: disable=no-member
-                    self.db.conn.rollback()
                     self.db.msg_aggregator.add_warning(
                         'Error during cryptocom CSV import consumption. '
                         ' Entry already existed in DB. Ignoring.',
@@ -833,11 +835,12 @@ class DataImporter():
         Information for the values that the columns can have has been obtained from
         https://github.com/BittyTax/BittyTax/blob/06794f51223398759852d6853bc7112ffb96129a/bittytax/conv/parsers/blockfi.py#L67
         """
-        with open(filepath, 'r', encoding='utf-8-sig') as csvfile:
+        with self.db.user_write(), open(filepath, 'r', encoding='utf-8-sig') as csvfile:
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_blockfi_entry(row, **kwargs)
+                    with self.db.user_write():
+                        self._consume_blockfi_entry(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During BlockFi CSV import found action with unknown '
@@ -851,7 +854,6 @@ class DataImporter():
                     )
                     continue
                 except sqlcipher.IntegrityError:  # pylint: disable=no-member
-                    self.db.conn.rollback()
                     self.db.msg_aggregator.add_warning(
                         'Error during blockfi CSV import consumption. '
                         ' Entry already existed in DB. Ignoring.',
@@ -907,11 +909,12 @@ class DataImporter():
         Information for the values that the columns can have has been obtained from
         the issue in github #1674
         """
-        with open(filepath, 'r', encoding='utf-8-sig') as csvfile:
+        with self.db.user_write(), open(filepath, 'r', encoding='utf-8-sig') as csvfile:
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_blockfi_trade(row, **kwargs)
+                    with self.db.user_write():
+                        self._consume_blockfi_trade(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During BlockFi CSV import found action with unknown '
@@ -1042,11 +1045,12 @@ class DataImporter():
         Information for the values that the columns can have has been obtained from
         https://github.com/BittyTax/BittyTax/blob/06794f51223398759852d6853bc7112ffb96129a/bittytax/conv/parsers/nexo.py
         """
-        with open(filepath, 'r', encoding='utf-8-sig') as csvfile:
+        with self.db.user_write(), open(filepath, 'r', encoding='utf-8-sig') as csvfile:
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_nexo(row, **kwargs)
+                    with self.db.user_write():
+                        self._consume_nexo(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During Nexo CSV import found action with unknown '
@@ -1060,7 +1064,6 @@ class DataImporter():
                     )
                     continue
                 except sqlcipher.IntegrityError:  # pylint: disable=no-member
-                    self.db.conn.rollback()
                     self.db.msg_aggregator.add_warning(
                         'Error during nexro CSV import consumption. '
                         ' Entry already existed in DB. Ignoring.',
@@ -1138,11 +1141,12 @@ Trade from ShapeShift with ShapeShift Deposit Address:
         """
         Information for the values that the columns can have has been obtained from sample CSVs
         """
-        with open(filepath, 'r', encoding='utf-8-sig') as csvfile:
+        with self.db.user_write(), open(filepath, 'r', encoding='utf-8-sig') as csvfile:
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_shapeshift_trade(row, **kwargs)
+                    with self.db.user_write():
+                        self._consume_shapeshift_trade(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During ShapeShift CSV import found action with unknown '
@@ -1308,11 +1312,12 @@ Activity from uphold with uphold transaction id:
         """
         Information for the values that the columns can have has been obtained from sample CSVs
         """
-        with open(filepath, 'r', encoding='utf-8-sig') as csvfile:
+        with self.db.user_write(), open(filepath, 'r', encoding='utf-8-sig') as csvfile:
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_uphold_transaction(row, **kwargs)
+                    with self.db.user_write():
+                        self._consume_uphold_transaction(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During uphold CSV import found action with unknown '
@@ -1402,11 +1407,12 @@ Activity from uphold with uphold transaction id:
         Import trades from bisq. The information and comments about this importer were addressed
         at the issue https://github.com/rotki/rotki/issues/824
         """
-        with open(filepath, 'r', encoding='utf-8-sig') as csvfile:
+        with self.db.user_write(), open(filepath, 'r', encoding='utf-8-sig') as csvfile:
             data = csv.DictReader(csvfile)
             for row in data:
                 try:
-                    self._consume_bisq_trade(row, **kwargs)
+                    with self.db.user_write():
+                        self._consume_bisq_trade(row, **kwargs)
                 except UnknownAsset as e:
                     self.db.msg_aggregator.add_warning(
                         f'During Bisq CSV import found action with unknown '
@@ -218,10 +218,7 @@ class DataHandler():
 
         # First make a backup of the DB we are about to replace
         date = timestamp_to_date(ts=ts_now(), formatstr='%Y_%m_%d_%H_%M_%S', treat_as_local=True)
-        shutil.copyfile(
-            self.data_directory / self.username / 'rotkehlchen.db',
-            self.data_directory / self.username / f'rotkehlchen_db_{date}.backup',
-        )
+        self.db.backup_to(self.data_directory / self.username / f'rotkehlchen_db_{date}.backup')
 
         decrypted_data = decrypt(password.encode(), encrypted_data)
         decompressed_data = zlib.decompress(decrypted_data)
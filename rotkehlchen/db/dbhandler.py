@@ -5,9 +5,13 @@ import re
 import shutil
 import tempfile
 from collections import defaultdict
+from contextlib import contextmanager
+from copy import copy
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Type, Union, cast
 
+import gevent
+from gevent.lock import Semaphore
 from pysqlcipher3 import dbapi2 as sqlcipher
 from typing_extensions import Literal
 
@@ -60,9 +64,18 @@ from rotkehlchen.db.constants import (
     USER_CREDENTIAL_MAPPING_KEYS,
 )
 from rotkehlchen.db.eth2 import ETH2_DEPOSITS_PREFIX
-from rotkehlchen.db.filtering import AssetMovementsFilterQuery, TradesFilterQuery
+from rotkehlchen.db.filtering import (
+    AssetMovementsFilterQuery,
+    DBFilterCache,
+    DBFilterQuery,
+    TradesFilterQuery,
+)
 from rotkehlchen.db.loopring import DBLoopring
-from rotkehlchen.db.schema import DB_SCRIPT_CREATE_TABLES
+from rotkehlchen.db.schema import (
+    DB_SCRIPT_CREATE_INDEXES,
+    DB_SCRIPT_CREATE_OWNED_ASSETS_TRIGGERS,
+    DB_SCRIPT_CREATE_TABLES,
+)
 from rotkehlchen.db.schema_transient import DB_SCRIPT_CREATE_TRANSIENT_TABLES
 from rotkehlchen.db.settings import (
     DEFAULT_PREMIUM_SHOULD_SYNC,
@@ -73,8 +86,10 @@ from rotkehlchen.db.settings import (
 )
 from rotkehlchen.db.upgrade_manager import DBUpgradeManager
 from rotkehlchen.db.utils import (
+    BalanceSnapshotSummary,
     BlockchainAccounts,
     DBAssetBalance,
+    DecimalSum,
     LocationData,
     SingleDBAssetBalance,
     Tag,
@@ -122,6 +137,7 @@ from rotkehlchen.typing import (
     TradeType,
 )
 from rotkehlchen.user_messages import MessagesAggregator
+from rotkehlchen.utils.downsampling import lttb_indices
 from rotkehlchen.utils.hashing import file_md5
 from rotkehlchen.utils.misc import ts_now
 from rotkehlchen.utils.serialization import rlk_jsondumps
@@ -133,6 +149,9 @@ KDF_ITER = 64000
 DBINFO_FILENAME = 'dbinfo.json'
 MAIN_DB_NAME = 'rotkehlchen.db'
 TRANSIENT_DB_NAME = 'rotkehlchen_transient.db'
+# How many idle read only connections are kept open to serve reads
+READ_CONNECTIONS_POOL_SIZE = 3
+AUTO_VACUUM_MODES = {0: 'none', 1: 'full', 2: 'incremental'}
 
 DBTupleType = Literal[
     'trade',
@@ -144,24 +163,6 @@ DBTupleType = Literal[
     'history_event',
 ]
 
-# Tuples that contain first the name of a table and then the columns that
-# reference assets ids. This is used to query all assets that a user owns.
-TABLES_WITH_ASSETS = (
-    ('aave_events', 'asset1', 'asset2'),
-    ('yearn_vaults_events', 'from_asset', 'to_asset'),
-    ('manually_tracked_balances', 'asset'),
-    ('trades', 'base_asset', 'quote_asset', 'fee_currency'),
-    ('margin_positions', 'pl_currency', 'fee_currency'),
-    ('asset_movements', 'asset', 'fee_asset'),
-    ('ledger_actions', 'asset', 'rate_asset'),
-    ('amm_swaps', 'token0_identifier', 'token1_identifier'),
-    ('amm_events', 'token0_identifier', 'token1_identifier'),
-    ('adex_events', 'token'),
-    ('balancer_events', 'pool_address_token'),
-    ('timed_balances', 'currency'),
-)
-
-
 DB_BACKUP_RE = re.compile(r'(\d+)_rotkehlchen_db_v(\d+).backup')
 
 
@@ -253,6 +254,16 @@ class DBHandler:
         self.user_data_dir = user_data_dir
         self.sqlcipher_version = detect_sqlcipher_version()
         self.last_write_ts: Optional[Timestamp] = None
+        self.last_wal_checkpoint_ts = Timestamp(0)
+        self.last_vacuum_ts = Timestamp(0)
+        self.password = password
+        self.read_connections: List[sqlcipher.Connection] = []  # pylint: disable=no-member
+        # The user_write() depth of each greenlet in one and the lock the greenlet holds
+        self.write_depths: Dict[gevent.Greenlet, int] = {}
+        self.user_write_lock = Semaphore()
+        self.filter_cache = DBFilterCache()
+        # bumped at every update_last_write(), so for every write of the user's data
+        self.write_generation = 0
         self.conn: sqlcipher.Connection = None  # pylint: disable=no-member
         self.conn_transient: sqlcipher.Connection = None  # pylint: disable=no-member
         self._connect(password)
@@ -291,14 +302,24 @@ class DBHandler:
         """
         # Run upgrades if needed
         fresh_db = DBUpgradeManager(self).run_upgrades()
+        if fresh_db:
+            # Lets the free pages left by deletions be given back to the filesystem.
+            # Only has an effect if set before the first table is created
+            self.conn.execute('PRAGMA auto_vacuum=INCREMENTAL;')
         # create tables if needed (first run - or some new tables)
         self.conn.executescript(DB_SCRIPT_CREATE_TABLES)
         if fresh_db:  # add DB version. https://github.com/rotki/rotki/issues/3744
+            self.conn.executescript(DB_SCRIPT_CREATE_INDEXES)
+            self.conn.executescript(DB_SCRIPT_CREATE_OWNED_ASSETS_TRIGGERS)
             cursor = self.conn.cursor()
             cursor.execute(
                 'INSERT OR REPLACE INTO settings(name, value) VALUES(?, ?)',
                 ('version', str(ROTKEHLCHEN_DB_VERSION)),
             )
+        self.conn.commit()
+        # With a write-ahead log the read connections can query the DB while it is
+        # being written to. The mode is persistent and existing DBs are converted here
+        self.conn.execute('PRAGMA journal_mode=WAL;')
         # set up transient connection
         self._connect(password, conn_attribute='conn_transient')
         # creating tables if necessary
@@ -337,22 +358,14 @@ class DBHandler:
         )
         self.conn.commit()
 
-    def _connect(
-            self,
-            password: str,
-            conn_attribute: Literal['conn', 'conn_transient'] = 'conn',
-    ) -> None:
-        """Connect to the DB using password
+    def _open_connection(self, fullpath: Path, password: str) -> sqlcipher.Connection:  # pylint: disable=no-member  # noqa: E501
+        """Open a connection to the DB file at fullpath and unlock it with password
 
         May raise:
         - SystemPermissionError if we are unable to open the DB file,
         probably due to permission errors
         - AuthenticationError if the given password is not the right one for the DB
         """
-        if conn_attribute == 'conn':
-            fullpath = self.user_data_dir / MAIN_DB_NAME
-        else:
-            fullpath = self.user_data_dir / TRANSIENT_DB_NAME
         try:
             conn: sqlcipher.Connection = sqlcipher.connect(str(fullpath))  # pylint: disable=no-member  # noqa: E501
         except sqlcipher.OperationalError as e:  # pylint: disable=no-member
@@ -368,18 +381,391 @@ class DBHandler:
         try:
             conn.executescript(script)
             conn.execute('PRAGMA foreign_keys=ON')
+            # Makes the owned assets triggers also run for the rows that an
+            # INSERT OR REPLACE deletes
+            conn.execute('PRAGMA recursive_triggers=ON')
+            conn.create_aggregate('DECIMAL_SUM', 1, DecimalSum)
             # Optimizations for the combined trades view
             # the following will fail with DatabaseError in case of wrong password.
             # If this goes away at any point it needs to be replaced by something
             # that checks the password is correct at this same point in the code
             conn.execute('PRAGMA cache_size = -32768')
         except sqlcipher.DatabaseError as e:  # pylint: disable=no-member
-            del self.conn
             raise AuthenticationError(
                 'Wrong password or invalid/corrupt database for user',
             ) from e
 
+        return conn
+
+    def _connect(
+            self,
+            password: str,
+            conn_attribute: Literal['conn', 'conn_transient'] = 'conn',
+    ) -> None:
+        """Connect to the DB using password
+
+        May raise:
+        - SystemPermissionError if we are unable to open the DB file,
+        probably due to permission errors
+        - AuthenticationError if the given password is not the right one for the DB
+        """
+        if conn_attribute == 'conn':
+            fullpath = self.user_data_dir / MAIN_DB_NAME
+        else:
+            fullpath = self.user_data_dir / TRANSIENT_DB_NAME
+        try:
+            conn = self._open_connection(fullpath=fullpath, password=password)
+        except AuthenticationError:
+            del self.conn
+            raise
+
         setattr(self, conn_attribute, conn)
+        # the generations of the cached values only count the writes of the old connection
+        self.filter_cache.clear()
+
+    @contextmanager
+    def read_cursor(self) -> Iterator[sqlcipher.Cursor]:  # pylint: disable=no-member
+        """Gives a cursor for a read only query of the main DB
+
+        The queries run in one of a pool of read only connections, so they see the last
+        committed state of the DB and are not stuck behind the writes of background tasks.
+        If the writer connection has uncommitted changes then the cursor is from the
+        writer connection instead, so that those changes are visible to the caller.
+        """
+        if self.conn.in_transaction:
+            yield self.conn.cursor()
+            return
+
+        if len(self.read_connections) != 0:
+            conn = self.read_connections.pop()
+        else:  # the first query of each read connection derives the key so open them lazily
+            conn = self._open_connection(
+                fullpath=self.user_data_dir / MAIN_DB_NAME,
+                password=self.password,
+            )
+            conn.execute('PRAGMA query_only=ON;')
+
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            if len(self.read_connections) < READ_CONNECTIONS_POOL_SIZE:
+                self.read_connections.append(conn)
+            else:
+                conn.close()
+
+    @contextmanager
+    def user_write(self) -> Iterator[sqlcipher.Cursor]:  # pylint: disable=no-member
+        """Groups all the writes made in the context into a single DB transaction
+
+        The outermost context commits once at its end and updates the last write
+        timestamp once, so any commits and last write updates of the DBHandler methods
+        called inside it are deferred until then. A nested context joins the transaction
+        of the outer one via a savepoint. If an exception is raised in a context all of
+        its writes are rolled back and the exception propagates.
+
+        The outermost context holds a lock until its end, so the user_write() of another
+        greenlet waits for it instead of joining its transaction. Writes that don't go
+        through user_write() are not locked out, so keep the context around DB calls
+        only and don't switch greenlets in it, for example with a remote query.
+        """
+        greenlet = gevent.getcurrent()
+        depth = self.write_depths.get(greenlet, 0)
+        outermost = depth == 0
+        if outermost:
+            self.user_write_lock.acquire()
+        cursor = self.conn.cursor()
+        savepoint = f'user_write_{depth}'
+        try:
+            if not outermost:
+                cursor.execute(f'SAVEPOINT {savepoint};')
+            self.write_depths[greenlet] = depth + 1
+            try:
+                yield cursor
+            except BaseException:
+                if outermost:
+                    self.conn.rollback()
+                else:
+                    cursor.execute(f'ROLLBACK TO {savepoint};')
+                    cursor.execute(f'RELEASE {savepoint};')
+                raise
+            else:
+                self._set_write_depth(greenlet, depth)
+                if outermost:
+                    self.update_last_write()  # also commits the transaction
+                else:
+                    cursor.execute(f'RELEASE {savepoint};')
+        finally:
+            self._set_write_depth(greenlet, depth)
+            cursor.close()
+            if outermost:
+                self.user_write_lock.release()
+
+    def _set_write_depth(self, greenlet: gevent.Greenlet, depth: int) -> None:
+        if depth == 0:
+            self.write_depths.pop(greenlet, None)
+        else:
+            self.write_depths[greenlet] = depth
+
+    def _in_user_write(self) -> bool:
+        """Whether the current greenlet is in the transaction of a user_write()"""
+        return gevent.getcurrent() in self.write_depths
+
+    def commit(self) -> None:
+        """Commits the writer connection unless in the transaction of a user_write()"""
+        if not self._in_user_write():
+            self.conn.commit()
+
+    def _filter_cache_generation(self) -> Optional[Tuple[int, ...]]:
+        """Returns the current generation of the DB for the filter cache
+
+        That is made of the write generation, which is bumped by update_last_write(),
+        the number of rows changed by the writer connections and their data versions,
+        which change when another connection commits a write to the DB files. Returns
+        None if nothing should be cached since there are uncommitted writes which the
+        read connections don't see yet.
+        """
+        if self.conn.in_transaction or self.conn_transient.in_transaction:
+            return None
+        return (
+            self.write_generation,
+            self.conn.total_changes + self.conn_transient.total_changes,
+            self.conn.execute('PRAGMA data_version;').fetchone()[0],
+            self.conn_transient.execute('PRAGMA data_version;').fetchone()[0],
+        )
+
+    def query_filtered_page(
+            self,
+            cursor: sqlcipher.Cursor,  # pylint: disable=no-member
+            select: str,
+            filter_query: DBFilterQuery,
+            select_bindings: Sequence[Any] = (),
+    ) -> List[Any]:
+        """Runs the select followed by the filter query and returns all result rows
+
+        If the filter query is paginated and ordered by timestamp then the order
+        attributes of the last entry of each queried page are cached. When the next page
+        is queried before any write to the DB it is found by seeking past that entry
+        instead of skipping over all of the entries before it with the offset.
+        """
+        pagination = filter_query.pagination
+        seek_attributes = filter_query.seek_attributes()
+        generation = self._filter_cache_generation()
+        if pagination is None or seek_attributes is None or generation is None:
+            query, bindings = filter_query.prepare()
+            return cursor.execute(select + query, [*select_bindings, *bindings]).fetchall()
+
+        query, bindings = filter_query.prepare(with_pagination=False)
+        key = (select + query, repr([*select_bindings, *bindings]))
+        page_ends = self.filter_cache.get(key, generation)
+        if page_ends is None:
+            page_ends = {}
+        seek = page_ends.get(pagination.offset) if pagination.offset != 0 else None
+        if seek is not None:
+            filter_query = copy(filter_query)
+            filter_query.pagination = pagination._replace(seek=seek)
+
+        query, bindings = filter_query.prepare()
+        cursor.execute(select + query, [*select_bindings, *bindings])
+        column_names = [x[0] for x in cursor.description]
+        results = cursor.fetchall()
+        if len(results) == 0 or any(x not in column_names for x in seek_attributes):
+            return results
+
+        last_entry = results[-1]
+        page_ends[pagination.offset + len(results)] = tuple(
+            last_entry[column_names.index(x)] for x in seek_attributes
+        )
+        self.filter_cache.set(key, generation, page_ends)
+        return results
+
+    def count_filtered(
+            self,
+            cursor: sqlcipher.Cursor,  # pylint: disable=no-member
+            table: str,
+            filter_query: DBFilterQuery,
+    ) -> int:
+        """Returns how many entries of the table match the filter query, ignoring its
+        pagination. The count is cached until the next write to the DB."""
+        query, bindings = filter_query.prepare(with_pagination=False)
+        query = f'SELECT COUNT(*) FROM {table} ' + query
+        generation = self._filter_cache_generation()
+        key = (query, repr(bindings))
+        count = None if generation is None else self.filter_cache.get(key, generation)
+        if count is None:
+            count = cursor.execute(query, bindings).fetchone()[0]
+            if generation is not None:
+                self.filter_cache.set(key, generation, count)
+
+        return count
+
+    def close_read_connections(self) -> None:
+        while len(self.read_connections) != 0:
+            self.read_connections.pop().close()
+
+    def checkpoint_wal(self) -> bool:
+        """Copies all of the write-ahead log into the main DB file and truncates the log
+
+        Returns False if the checkpoint could not be completed, due to a pending write
+        transaction or reads that are still using the log. So the DB file itself may
+        miss committed data at any time and copies of the DB go through backup_to().
+        """
+        self.last_wal_checkpoint_ts = ts_now()
+        if self.conn.in_transaction:
+            log.debug('Skipping the DB WAL checkpoint due to a pending write transaction')
+            return False
+
+        busy, log_frames, checkpointed_frames = self.conn.execute(
+            'PRAGMA wal_checkpoint(TRUNCATE);',
+        ).fetchone()
+        if busy != 0:
+            log.debug(
+                f'DB WAL checkpoint could only copy {checkpointed_frames} out of '
+                f'{log_frames} frames since the log is in use',
+            )
+            return False
+
+        return True
+
+    def _export_script(self, path: Path, name: str) -> str:
+        """Returns the script that attaches the DB file at path as name, encrypted with
+        the same password, and exports the main DB of the connection into it"""
+        password_for_sqlcipher = _protect_password_sqlcipher(self.password)
+        script = f'ATTACH DATABASE "{path}" AS {name} KEY "{password_for_sqlcipher}";'
+        if self.sqlcipher_version == 3:
+            script += f'PRAGMA {name}.kdf_iter={KDF_ITER};'
+        script += f'SELECT sqlcipher_export("{name}");DETACH DATABASE {name};'
+        return script
+
+    def backup_to(self, path: Path) -> None:
+        """Copies the last committed state of the DB to a new DB file at path, encrypted
+        with the same password
+
+        The DB is exported with sqlcipher_export() over a connection of its own, so
+        committed data that is still only in the write-ahead log is copied too, and
+        writes that are not committed yet are not.
+
+        May raise:
+        - OSError if the DB could not be copied
+        """
+        try:
+            source = self._open_connection(
+                fullpath=self.user_data_dir / MAIN_DB_NAME,
+                password=self.password,
+            )
+            try:
+                source.executescript(self._export_script(path=path, name='backup'))
+            finally:
+                source.close()
+        except (sqlcipher.Error, SystemPermissionError, AuthenticationError) as e:  # pylint: disable=no-member  # noqa: E501
+            raise OSError(f'Could not copy the DB to {path}: {str(e)}') from e
+
+    def restore_from(self, path: Path) -> None:
+        """Replaces all of the DB with the DB file at path, encrypted with the same password
+
+        Everything in the DB is dropped by the writer connection and the DB at path is
+        then exported into it with sqlcipher_export() over a connection of its own.
+        Both go through the write-ahead log, so all of the open connections see the
+        restored DB. The writer connection must not be in a transaction.
+
+        May raise:
+        - OSError if the DB could not be restored
+        """
+        try:
+            # foreign_keys can only be switched outside of a transaction and dropping a
+            # table would otherwise delete the rows that refer to it first
+            self.conn.execute('PRAGMA foreign_keys=OFF;')
+            try:
+                cursor = self.conn.cursor()
+                entries = cursor.execute(
+                    'SELECT type, name FROM sqlite_master WHERE type IN ("table", "view") '
+                    'AND name NOT LIKE "sqlite_%";',
+                ).fetchall()
+                cursor.execute('BEGIN;')
+                for entry_type, name in entries:
+                    cursor.execute(f'DROP {entry_type.upper()} "{name}";')
+                self.conn.commit()
+            finally:
+                if self.conn.in_transaction:  # failed midway so leave the DB as it was
+                    self.conn.rollback()
+                self.conn.execute('PRAGMA foreign_keys=ON;')
+
+            source = self._open_connection(fullpath=path, password=self.password)
+            try:
+                source.executescript(self._export_script(
+                    path=self.user_data_dir / MAIN_DB_NAME,
+                    name='restored',
+                ))
+            finally:
+                source.close()
+        except (sqlcipher.Error, SystemPermissionError, AuthenticationError) as e:  # pylint: disable=no-member  # noqa: E501
+            raise OSError(f'Could not restore the DB from {path}: {str(e)}') from e
+
+        # the restore does not count as a write of the connection
+        self.filter_cache.clear()
+
+    def incremental_vacuum(self, max_pages: Optional[int] = None) -> int:
+        """Gives back up to max_pages of the free pages of the DB file to the filesystem
+
+        All of the free pages are given back if max_pages is None. Only has an effect
+        for DBs with incremental auto vacuum. Returns the number of pages freed, which
+        is 0 if it had to be skipped due to a pending write transaction.
+        """
+        self.last_vacuum_ts = ts_now()
+        if self.conn.in_transaction:
+            log.debug('Skipping the DB incremental vacuum due to a pending write transaction')
+            return 0
+
+        free_pages_before = self.conn.execute('PRAGMA freelist_count;').fetchone()[0]
+        pages_arg = '' if max_pages is None else f'({max_pages})'
+        # each step of the pragma frees a page so it has to be run to completion
+        self.conn.execute(f'PRAGMA incremental_vacuum{pages_arg};').fetchall()
+        return free_pages_before - self.conn.execute('PRAGMA freelist_count;').fetchone()[0]
+
+    def get_health_stats(self) -> Dict[str, Any]:
+        """Returns the size statistics of the DB file and of each of its tables and indexes
+
+        The number of pages each table and index takes up comes from the dbstat virtual
+        table. If the SQLCipher build has no dbstat they are None.
+        """
+        with self.read_cursor() as cursor:
+            # with SQLCipher the page size comes back as a string
+            page_size = int(cursor.execute('PRAGMA page_size;').fetchone()[0])
+            page_count = cursor.execute('PRAGMA page_count;').fetchone()[0]
+            freelist_count = cursor.execute('PRAGMA freelist_count;').fetchone()[0]
+            auto_vacuum = cursor.execute('PRAGMA auto_vacuum;').fetchone()[0]
+            pages: Dict[str, Optional[int]] = defaultdict(lambda: None)
+            try:
+                cursor.execute('SELECT name, COUNT(*) FROM dbstat GROUP BY name;')
+            except sqlcipher.OperationalError as e:  # pylint: disable=no-member
+                log.debug(f'Could not query the DB page counts from dbstat due to {str(e)}')
+            else:
+                pages.update(cursor)
+
+            # the indexes sqlite makes for the unique constraints are also listed
+            cursor.execute(
+                'SELECT type, name, tbl_name FROM sqlite_master WHERE type="index" OR '
+                '(type="table" AND name NOT LIKE "sqlite_%") ORDER BY name;',
+            )
+            entries = cursor.fetchall()
+            tables, indexes = [], []
+            for entry_type, name, table_name in entries:
+                if entry_type == 'index':
+                    indexes.append({'name': name, 'table': table_name, 'pages': pages[name]})
+                    continue
+
+                rows = cursor.execute(f'SELECT COUNT(*) FROM "{name}";').fetchone()[0]
+                tables.append({'name': name, 'rows': rows, 'pages': pages[name]})
+
+        return {
+            'page_size': page_size,
+            'page_count': page_count,
+            'freelist_count': freelist_count,
+            'auto_vacuum': AUTO_VACUUM_MODES[auto_vacuum],
+            'tables': tables,
+            'indexes': indexes,
+        }
 
     def _change_password(
             self,
@@ -410,13 +796,19 @@ class DBHandler:
 
     def change_password(self, new_password: str) -> bool:
         """Changes the password for the currently logged in user"""
+        # read connections keyed with the old password can't read the re-keyed DB
+        self.close_read_connections()
         result = (
             self._change_password(new_password, 'conn') and
             self._change_password(new_password, 'conn_transient')
         )
+        if result is True:
+            self.password = new_password
         return result
 
     def disconnect(self, conn_attribute: Literal['conn', 'conn_transient'] = 'conn') -> None:
+        if conn_attribute == 'conn':  # close them first so the writer's close removes the WAL
+            self.close_read_connections()
         conn = getattr(self, conn_attribute, None)
         if conn:
             conn.close()
@@ -462,6 +854,7 @@ class DBHandler:
             self.conn.executescript(script)
             self.disconnect()
 
+        self.password = password
         try:
             self._connect(password)
         except SystemPermissionError as e:
@@ -473,6 +866,9 @@ class DBHandler:
         (self.user_data_dir / 'rotkehlchen_temp_backup.db').unlink()
 
     def update_last_write(self) -> None:
+        if self._in_user_write():  # happens once at the end of the user_write() transaction
+            return
+        self.write_generation += 1
         # Also keep it in memory for faster querying
         self.last_write_ts = ts_now()
         cursor = self.conn.cursor()
@@ -1396,6 +1792,52 @@ class DBHandler:
                 continue
         self.update_last_write()
 
+    def add_balance_snapshot_summary(self, summary: BalanceSnapshotSummary) -> None:
+        """Add the totals of a balance snapshot in the DB"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                'INSERT INTO balance_snapshot_summaries(time, usd_value, usd_value_without_nfts) '
+                'VALUES(?, ?, ?)',
+                summary,
+            )
+        except sqlcipher.IntegrityError:  # pylint: disable=no-member
+            self.msg_aggregator.add_warning(
+                f'Tried to add a balance snapshot summary at already existing '
+                f'timestamp {summary.time}. Skipping.',
+            )
+        self.update_last_write()
+
+    def add_balance_snapshot(
+            self,
+            balances: List[DBAssetBalance],
+            location_data: List[LocationData],
+    ) -> None:
+        """Add the balances and location data of balance snapshots in the DB
+
+        For every total location entry the summary of its snapshot is also added,
+        with the value of the NFTs at that time subtracted for the total without NFTs.
+        """
+        nfts_usd_value: Dict[Timestamp, FVal] = defaultdict(FVal)
+        for balance in balances:
+            is_nft = balance.asset.identifier.startswith(NFT_DIRECTIVE)
+            if balance.category == BalanceType.ASSET and is_nft:
+                nfts_usd_value[balance.time] += FVal(balance.usd_value)
+
+        total_location = Location.TOTAL.serialize_for_db()  # pylint: disable=no-member
+        with self.user_write():
+            self.add_multiple_balances(balances)
+            self.add_multiple_location_data(location_data)
+            for entry in location_data:
+                if entry.location != total_location:
+                    continue
+                without_nfts = FVal(entry.usd_value) - nfts_usd_value[entry.time]
+                self.add_balance_snapshot_summary(BalanceSnapshotSummary(
+                    time=entry.time,
+                    usd_value=entry.usd_value,
+                    usd_value_without_nfts=str(without_nfts),
+                ))
+
     def add_blockchain_accounts(
             self,
             blockchain: SupportedBlockchain,
@@ -1407,20 +1849,22 @@ class DBHandler:
             entry.address,
             entry.label,
         ) for entry in account_data]
-        cursor = self.conn.cursor()
-        try:
-            cursor.executemany(
-                'INSERT INTO blockchain_accounts(blockchain, account, label) VALUES (?, ?, ?)',
-                tuples,
-            )
-        except sqlcipher.IntegrityError as e:  # pylint: disable=no-member
-            raise InputError(
-                f'Blockchain account/s {[x.address for x in account_data]} already exist',
-            ) from e
-
-        insert_tag_mappings(cursor=cursor, data=account_data, object_reference_keys=['address'])
+        with self.user_write() as cursor:
+            try:
+                cursor.executemany(
+                    'INSERT INTO blockchain_accounts(blockchain, account, label) VALUES (?, ?, ?)',
+                    tuples,
+                )
+            except sqlcipher.IntegrityError as e:  # pylint: disable=no-member
+                raise InputError(
+                    f'Blockchain account/s {[x.address for x in account_data]} already exist',
+                ) from e
 
-        self.update_last_write()
+            insert_tag_mappings(
+                cursor=cursor,
+                data=account_data,
+                object_reference_keys=['address'],
+            )
 
     def edit_blockchain_accounts(
             self,
@@ -1433,32 +1877,34 @@ class DBHandler:
         - All tags exist in the DB
         - All accounts exist in the DB
         """
-        cursor = self.conn.cursor()
-        # Delete the current tag mappings for all affected accounts
-        cursor.executemany(
-            'DELETE FROM tag_mappings WHERE '
-            'object_reference = ?;', [(x.address,) for x in account_data],
-        )
-
-        # Update the blockchain account labels in the DB
-        tuples = [(
-            entry.label,
-            entry.address,
-            blockchain.value,
-        ) for entry in account_data]
-        cursor.executemany(
-            'UPDATE blockchain_accounts SET label=? WHERE account=? AND blockchain=?;', tuples,
-        )
-        if cursor.rowcount != len(account_data):
-            msg = (
-                f'When updating blockchain accounts {len(account_data)} entries should '
-                f'have been edited but only {cursor.rowcount} were. Should not happen.'
+        with self.user_write() as cursor:
+            # Delete the current tag mappings for all affected accounts
+            cursor.executemany(
+                'DELETE FROM tag_mappings WHERE '
+                'object_reference = ?;', [(x.address,) for x in account_data],
             )
-            log.error(msg)
-            raise AssertionError(msg)
-        insert_tag_mappings(cursor=cursor, data=account_data, object_reference_keys=['address'])
 
-        self.update_last_write()
+            # Update the blockchain account labels in the DB
+            tuples = [(
+                entry.label,
+                entry.address,
+                blockchain.value,
+            ) for entry in account_data]
+            cursor.executemany(
+                'UPDATE blockchain_accounts SET label=? WHERE account=? AND blockchain=?;', tuples,
+            )
+            if cursor.rowcount != len(account_data):
+                msg = (
+                    f'When updating blockchain accounts {len(account_data)} entries should '
+                    f'have been edited but only {cursor.rowcount} were. Should not happen.'
+                )
+                log.error(msg)
+                raise AssertionError(msg)
+            insert_tag_mappings(
+                cursor=cursor,
+                data=account_data,
+                object_reference_keys=['address'],
+            )
 
     def remove_blockchain_accounts(
             self,
@@ -1473,29 +1919,26 @@ class DBHandler:
         tuples = [(blockchain.value, x) for x in accounts]
         account_tuples = [(x,) for x in accounts]
 
-        cursor = self.conn.cursor()
-        cursor.executemany(
-            'DELETE FROM tag_mappings WHERE '
-            'object_reference = ?;', account_tuples,
-        )
-        cursor.executemany(
-            'DELETE FROM blockchain_accounts WHERE '
-            'blockchain = ? and account = ?;', tuples,
-        )
-        affected_rows = cursor.rowcount
-        if affected_rows != len(accounts):
-            self.conn.rollback()
-            raise InputError(
-                f'Tried to remove {len(accounts) - affected_rows} '
-                f'{blockchain.value} accounts that do not exist',
+        with self.user_write() as cursor:
+            cursor.executemany(
+                'DELETE FROM tag_mappings WHERE '
+                'object_reference = ?;', account_tuples,
             )
+            cursor.executemany(
+                'DELETE FROM blockchain_accounts WHERE '
+                'blockchain = ? and account = ?;', tuples,
+            )
+            affected_rows = cursor.rowcount
+            if affected_rows != len(accounts):
+                raise InputError(
+                    f'Tried to remove {len(accounts) - affected_rows} '
+                    f'{blockchain.value} accounts that do not exist',
+                )
 
-        # Also remove all ethereum address details saved in the DB
-        if blockchain == SupportedBlockchain.ETHEREUM:
-            for address in accounts:
-                self.delete_data_for_ethereum_address(address)  # type: ignore
-
-        self.update_last_write()
+            # Also remove all ethereum address details saved in the DB
+            if blockchain == SupportedBlockchain.ETHEREUM:
+                for address in accounts:
+                    self.delete_data_for_ethereum_address(address)  # type: ignore
 
     def _get_address_details_if_time(
             self,
@@ -1592,23 +2035,29 @@ class DBHandler:
 
         return json_ret
 
-    def save_tokens_for_address(
+    def save_tokens_for_addresses(
             self,
-            address: ChecksumEthAddress,
-            tokens: List[EthereumToken],
+            tokens: Dict[ChecksumEthAddress, List[EthereumToken]],
     ) -> None:
-        """Saves detected tokens for an address"""
-        old_details = self._get_address_details_json(address)
-        new_details = {}
-        if old_details and 'univ2_lp_tokens' in old_details:
-            new_details['univ2_lp_tokens'] = old_details['univ2_lp_tokens']
-        new_details['tokens'] = [x.identifier for x in tokens]
+        """Saves the detected tokens of each address in one write"""
+        if len(tokens) == 0:
+            return
+
         now = ts_now()
+        entries = []
+        for address, address_tokens in tokens.items():
+            old_details = self._get_address_details_json(address)
+            new_details = {}
+            if old_details and 'univ2_lp_tokens' in old_details:
+                new_details['univ2_lp_tokens'] = old_details['univ2_lp_tokens']
+            new_details['tokens'] = [x.identifier for x in address_tokens]
+            entries.append((address, json.dumps(new_details), now))
+
         cursor = self.conn.cursor()
-        cursor.execute(
+        cursor.executemany(
             'INSERT OR REPLACE INTO ethereum_accounts_details '
             '(account, tokens_list, time) VALUES (?, ?, ?)',
-            (address, json.dumps(new_details), now),
+            entries,
         )
         self.update_last_write()
 
@@ -1733,22 +2182,21 @@ class DBHandler:
             entry.location.serialize_for_db(),
             entry.balance_type.serialize_for_db(),
         ) for entry in data]
-        cursor = self.conn.cursor()
-        try:
-            cursor.executemany(
-                'INSERT INTO manually_tracked_balances(asset, label, amount, location, category) '
-                'VALUES (?, ?, ?, ?, ?)', tuples,
-            )
-        except sqlcipher.IntegrityError as e:  # pylint: disable=no-member
-            raise InputError(
-                f'One of the manually tracked balance entries already exists in the DB. {str(e)}',
-            ) from e
-        insert_tag_mappings(cursor=cursor, data=data, object_reference_keys=['label'])
-
-        # make sure assets are included in the global db user owned assets
-        GlobalDBHandler().add_user_owned_assets([x.asset for x in data])
+        with self.user_write() as cursor:
+            try:
+                cursor.executemany(
+                    'INSERT INTO manually_tracked_balances(asset, label, amount, location, '
+                    'category) VALUES (?, ?, ?, ?, ?)', tuples,
+                )
+            except sqlcipher.IntegrityError as e:  # pylint: disable=no-member
+                raise InputError(
+                    f'One of the manually tracked balance entries already exists in the '
+                    f'DB. {str(e)}',
+                ) from e
+            insert_tag_mappings(cursor=cursor, data=data, object_reference_keys=['label'])
 
-        self.update_last_write()
+            # make sure assets are included in the global db user owned assets
+            GlobalDBHandler().add_user_owned_assets([x.asset for x in data])
 
     def edit_manually_tracked_balances(self, data: List[ManuallyTrackedBalance]) -> None:
         """Edits manually tracked balances
@@ -1762,32 +2210,30 @@ class DBHandler:
         - InputError if any of the manually tracked balance labels to edit do not
         exist in the DB
         """
-        cursor = self.conn.cursor()
-        # Delete the current tag mappings for all affected balance entries
-        cursor.executemany(
-            'DELETE FROM tag_mappings WHERE '
-            'object_reference = ?;', [(x.label,) for x in data],
-        )
-
-        # Update the manually tracked balance entries in the DB
-        tuples = [(
-            entry.asset.identifier,
-            str(entry.amount),
-            entry.location.serialize_for_db(),
-            BalanceType.serialize_for_db(entry.balance_type),
-            entry.label,
-        ) for entry in data]
+        with self.user_write() as cursor:
+            # Delete the current tag mappings for all affected balance entries
+            cursor.executemany(
+                'DELETE FROM tag_mappings WHERE '
+                'object_reference = ?;', [(x.label,) for x in data],
+            )
 
-        cursor.executemany(
-            'UPDATE manually_tracked_balances SET asset=?, amount=?, location=?, category=?'
-            'WHERE label=?;', tuples,
-        )
-        if cursor.rowcount != len(data):
-            msg = 'Tried to edit manually tracked balance entry that did not exist in the DB'
-            raise InputError(msg)
-        insert_tag_mappings(cursor=cursor, data=data, object_reference_keys=['label'])
+            # Update the manually tracked balance entries in the DB
+            tuples = [(
+                entry.asset.identifier,
+                str(entry.amount),
+                entry.location.serialize_for_db(),
+                BalanceType.serialize_for_db(entry.balance_type),
+                entry.label,
+            ) for entry in data]
 
-        self.update_last_write()
+            cursor.executemany(
+                'UPDATE manually_tracked_balances SET asset=?, amount=?, location=?, category=?'
+                'WHERE label=?;', tuples,
+            )
+            if cursor.rowcount != len(data):
+                msg = 'Tried to edit manually tracked balance entry that did not exist in the DB'
+                raise InputError(msg)
+            insert_tag_mappings(cursor=cursor, data=data, object_reference_keys=['label'])
 
     def remove_manually_tracked_balances(self, labels: List[str]) -> None:
         """
@@ -1797,29 +2243,27 @@ class DBHandler:
         - InputError if any of the given manually tracked balance labels
         to delete did not exist
         """
-        cursor = self.conn.cursor()
-        tuples = [(x,) for x in labels]
-        cursor.executemany(
-            'DELETE FROM tag_mappings WHERE '
-            'object_reference = ?;', tuples,
-        )
-        cursor.executemany(
-            'DELETE FROM manually_tracked_balances WHERE label = ?;', tuples,
-        )
-        affected_rows = cursor.rowcount
-        if affected_rows != len(labels):
-            self.conn.rollback()
-            raise InputError(
-                f'Tried to remove {len(labels) - affected_rows} '
-                f'manually tracked balance labels that do not exist',
+        with self.user_write() as cursor:
+            tuples = [(x,) for x in labels]
+            cursor.executemany(
+                'DELETE FROM tag_mappings WHERE '
+                'object_reference = ?;', tuples,
             )
-
-        self.update_last_write()
+            cursor.executemany(
+                'DELETE FROM manually_tracked_balances WHERE label = ?;', tuples,
+            )
+            affected_rows = cursor.rowcount
+            if affected_rows != len(labels):
+                raise InputError(
+                    f'Tried to remove {len(labels) - affected_rows} '
+                    f'manually tracked balance labels that do not exist',
+                )
 
     def remove(self) -> None:
         cursor = self.conn.cursor()
         cursor.execute('DROP TABLE IF EXISTS timed_balances')
         cursor.execute('DROP TABLE IF EXISTS timed_location_data')
+        cursor.execute('DROP TABLE IF EXISTS balance_snapshot_summaries')
         cursor.execute('DROP TABLE IF EXISTS timed_unique_data')
         self.update_last_write()
 
@@ -1867,9 +2311,7 @@ class DBHandler:
             location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
             usd_value=str(data['net_usd']),
         ))
-
-        self.add_multiple_balances(balances)
-        self.add_multiple_location_data(locations)
+        self.add_balance_snapshot(balances, locations)
 
     def add_exchange(
             self,
@@ -2307,11 +2749,9 @@ class DBHandler:
         Also returns how many are the total found for the filter
         """
         movements = self.get_asset_movements(filter_query=filter_query, has_premium=has_premium)
-        cursor = self.conn.cursor()
-        query, bindings = filter_query.prepare(with_pagination=False)
-        query = 'SELECT COUNT(*) from asset_movements ' + query
-        total_found_result = cursor.execute(query, bindings)
-        return movements, total_found_result.fetchone()[0]
+        with self.read_cursor() as cursor:
+            total_found_result = self.count_filtered(cursor, 'asset_movements', filter_query)
+        return movements, total_found_result
 
     def get_asset_movements(
             self,
@@ -2322,14 +2762,14 @@ class DBHandler:
 
         Returned list is ordered according to the passed filter query
         """
-        cursor = self.conn.cursor()
-        query, bindings = filter_query.prepare()
+        select_bindings = []
         if has_premium:
-            query = 'SELECT * from asset_movements ' + query
-            results = cursor.execute(query, bindings)
+            select = 'SELECT * from asset_movements '
         else:
-            query = 'SELECT * FROM (SELECT * from asset_movements ORDER BY time DESC LIMIT ?) ' + query  # noqa: E501
-            results = cursor.execute(query, [FREE_ASSET_MOVEMENTS_LIMIT] + bindings)
+            select = 'SELECT * FROM (SELECT * from asset_movements ORDER BY time DESC LIMIT ?) '
+            select_bindings = [FREE_ASSET_MOVEMENTS_LIMIT]
+        with self.read_cursor() as cursor:
+            results = self.query_filtered_page(cursor, select, filter_query, select_bindings)
 
         asset_movements = []
         for result in results:
@@ -2438,6 +2878,15 @@ class DBHandler:
         )
         cursor.execute('DELETE FROM amm_swaps WHERE address=?;', (address,))
         cursor.execute('DELETE FROM eth2_deposits WHERE from_address=?;', (address,))
+        # drop the log addresses and topics that only the deleted receipts referred to
+        cursor.execute(
+            'DELETE FROM ethtx_addresses WHERE id NOT IN '
+            '(SELECT address_id FROM ethtx_receipt_logs);',
+        )
+        cursor.execute(
+            'DELETE FROM ethtx_topics WHERE id NOT IN '
+            '(SELECT topic_id FROM ethtx_receipt_log_topics);',
+        )
 
         self.update_last_write()
 
@@ -2531,11 +2980,9 @@ class DBHandler:
         """
         trades = self.get_trades(filter_query=filter_query, has_premium=has_premium)
         table_name = 'combined_trades_view' if has_premium else 'trades'
-        cursor = self.conn.cursor()
-        query, bindings = filter_query.prepare(with_pagination=False)
-        query = f'SELECT COUNT(*) from {table_name} ' + query
-        total_found_result = cursor.execute(query, bindings)
-        return trades, total_found_result.fetchone()[0]
+        with self.read_cursor() as cursor:
+            total_found_result = self.count_filtered(cursor, table_name, filter_query)
+        return trades, total_found_result
 
     def get_trades(self, filter_query: TradesFilterQuery, has_premium: bool) -> List[Trade]:
         """Returns a list of trades optionally filtered by various filters.
@@ -2543,14 +2990,14 @@ class DBHandler:
         This will also take into account AMMSwaps and return them as trades via a view.
 
         The returned list is ordered according to the passed filter query"""
-        cursor = self.conn.cursor()
-        query, bindings = filter_query.prepare()
+        select_bindings = []
         if has_premium:
-            query = 'SELECT * from combined_trades_view ' + query
-            results = cursor.execute(query, bindings)
+            select = 'SELECT * from combined_trades_view '
         else:
-            query = 'SELECT * FROM (SELECT * from trades ORDER BY time DESC LIMIT ?) ' + query  # noqa: E501
-            results = cursor.execute(query, [FREE_TRADES_LIMIT] + bindings)
+            select = 'SELECT * FROM (SELECT * from trades ORDER BY time DESC LIMIT ?) '
+            select_bindings = [FREE_TRADES_LIMIT]
+        with self.read_cursor() as cursor:
+            results = self.query_filtered_page(cursor, select, filter_query, select_bindings)
 
         trades = []
         for result in results:
@@ -2706,33 +3153,27 @@ class DBHandler:
         self,
         from_ts: Timestamp,
         include_nfts: bool = True,
+        max_points: Optional[int] = None,
     ) -> Tuple[List[str], List[str]]:
-        """Get all entries of net value data from the DB"""
-        cursor = self.conn.cursor()
-        # Get the total location ("H") entries in ascending time
-        query = cursor.execute(
-            'SELECT time, usd_value FROM timed_location_data '
-            'WHERE location="H" AND time >= ? ORDER BY time ASC;',
-            (from_ts,),
-        )
-        if not include_nfts:
-            nft_cursor = self.conn.cursor()
-            nft_balances = nft_cursor.execute(
-                'SELECT time, SUM(usd_value) FROM timed_balances WHERE time >= ? '
-                'AND currency LIKE ? GROUP BY time',
-                (from_ts, f'{NFT_DIRECTIVE}%'),
-            )
-            nft_values = {time: value for time, value in nft_balances}
+        """Get all entries of net value data from the DB
 
-        data = []
-        times_int = []
-        for entry in query:
-            times_int.append(entry[0])
-            if include_nfts:
-                total = entry[1]
-            else:
-                total = str(FVal(entry[1]) - FVal(nft_values.get(entry[0], 0)))
-            data.append(total)
+        The totals are read from the summaries written along with each balance snapshot.
+        If max_points is given the data is downsampled to at most that many points.
+        """
+        value_column = 'usd_value' if include_nfts else 'usd_value_without_nfts'
+        with self.read_cursor() as cursor:
+            query = cursor.execute(
+                f'SELECT time, {value_column} FROM balance_snapshot_summaries '
+                f'WHERE time >= ? ORDER BY time ASC;',
+                (from_ts,),
+            ).fetchall()
+
+        if max_points is not None:
+            indices = lttb_indices([(x[0], float(x[1])) for x in query], max_points)
+            query = [query[idx] for idx in indices]
+
+        times_int = [entry[0] for entry in query]
+        data = [entry[1] for entry in query]
         return times_int, data
 
     def query_timed_balances(
@@ -2741,10 +3182,17 @@ class DBHandler:
             from_ts: Optional[Timestamp] = None,
             to_ts: Optional[Timestamp] = None,
             balance_type: Optional[BalanceType] = None,
+            max_points: Optional[int] = None,
     ) -> List[SingleDBAssetBalance]:
         """Query all balance entries for an asset within a range of timestamps
 
-        Can optionally filter by balance type
+        Can optionally filter by balance type.
+
+        If the ssf_0graph_multiplier setting is set, gaps between two entries that are
+        longer than that many balance save periods get zero balances at the start and
+        the end of the gap, which draws the same graph as a zero balance at every
+        save period in between. If max_points is given the balances are downsampled
+        to at most that many points.
         """
         if from_ts is None:
             from_ts = Timestamp(0)
@@ -2762,11 +3210,11 @@ class DBHandler:
             bindings.append(balance_type.serialize_for_db())
         querystr += ' ORDER BY time ASC;'
 
-        cursor = self.conn.cursor()
-        results = cursor.execute(querystr, bindings)
-        results = results.fetchall()
+        with self.read_cursor() as cursor:
+            results = cursor.execute(querystr, bindings).fetchall()
         balances = []
-        results_length = len(results)
+        save_period = settings.balance_save_frequency * HOUR_IN_SECONDS
+        max_diff = save_period * settings.ssf_0graph_multiplier
         for idx, result in enumerate(results):
             entry_time = result[0]
             category = BalanceType.deserialize_from_db(result[3])
@@ -2778,79 +3226,60 @@ class DBHandler:
                     category=category,
                 ),
             )
-            if settings.ssf_0graph_multiplier == 0 or idx == results_length - 1:
+            if settings.ssf_0graph_multiplier == 0 or idx == len(results) - 1:
                 continue
 
-            next_result_time = results[idx + 1][0]
-            max_diff = settings.balance_save_frequency * HOUR_IN_SECONDS * settings.ssf_0graph_multiplier  # noqa: E501
-            while next_result_time - entry_time > max_diff:
-                entry_time = entry_time + settings.balance_save_frequency * HOUR_IN_SECONDS
-                if entry_time >= next_result_time:
-                    break
-
+            gap = results[idx + 1][0] - entry_time
+            if gap <= max_diff:
+                continue
+            # A zero balance is due at every save period of the gap until the rest of the
+            # gap is no longer than max_diff. Only the first and the last one are added.
+            zero_periods = -((max_diff - gap) // save_period)
+            for period in sorted({1, zero_periods}):
                 balances.append(
                     SingleDBAssetBalance(
-                        time=entry_time,
+                        time=Timestamp(entry_time + period * save_period),
                         amount='0',
                         usd_value='0',
                         category=category,
                     ),
                 )
 
+        if max_points is not None:
+            indices = lttb_indices([(x.time, float(x.usd_value)) for x in balances], max_points)
+            balances = [balances[idx] for idx in indices]
+
         return balances
 
     def query_owned_assets(self) -> List[Asset]:
         """Query the DB for a list of all assets ever owned
 
-        The assets are taken from:
+        The assets are taken from the owned_assets table, which the DB triggers keep
+        current with the assets of:
         - Balance snapshots
         - Trades the user made
         - Manual balances
+        - All other history tables of TABLES_WITH_ASSETS
         """
-        # TODO: Perhaps also add amm swaps here
-        # but think on the performance. This is a synchronous api call so if
-        # it starts taking too much time the calling logic needs to change
-        cursor = self.conn.cursor()
-
-        results = set()
-        for table_entry in TABLES_WITH_ASSETS:
-            table_name = table_entry[0]
-            columns = table_entry[1:]
-            columns_str = ", ".join(columns)
-            bindings: Union[Tuple, Tuple[str]] = ()
-            condition = ''
-            if table_name in ('manually_tracked_balances', 'timed_balances'):
-                bindings = (BalanceType.LIABILITY.serialize_for_db(),)
-                condition = ' WHERE category!=?'
-
+        cursor = self.conn.cursor()
+        results = []
+        for (asset_id,) in cursor.execute('SELECT identifier FROM owned_assets;'):
             try:
-                query = cursor.execute(
-                    f'SELECT DISTINCT {columns_str} FROM {table_name} {condition};',
-                    bindings,
+                results.append(Asset(asset_id))
+            except UnknownAsset:
+                self.msg_aggregator.add_warning(
+                    f'Unknown/unsupported asset {asset_id} found in the database. '
+                    f'If you believe this should be supported open an issue in github',
+                )
+                continue
+            except DeserializationError:
+                self.msg_aggregator.add_error(
+                    f'Asset with non-string type {type(asset_id)} found in the '
+                    f'database. Skipping it.',
                 )
-            except sqlcipher.OperationalError as e:    # pylint: disable=no-member
-                log.error(f'Could not fetch assets from table {table_name}. {str(e)}')
                 continue
 
-            for result in query:
-                for _, asset_id in enumerate(result):
-                    try:
-                        if asset_id is not None:
-                            results.add(Asset(asset_id))
-                    except UnknownAsset:
-                        self.msg_aggregator.add_warning(
-                            f'Unknown/unsupported asset {asset_id} found in the database. '
-                            f'If you believe this should be supported open an issue in github',
-                        )
-                        continue
-                    except DeserializationError:
-                        self.msg_aggregator.add_error(
-                            f'Asset with non-string type {type(asset_id)} found in the '
-                            f'database. Skipping it.',
-                        )
-                        continue
-
-        return list(results)
+        return results
 
     def update_owned_assets_in_globaldb(self) -> None:
         """Makes sure all owned assets of the user are in the Global DB"""
@@ -2936,12 +3365,11 @@ class DBHandler:
         Returns a list of `LocationData` all at the latest timestamp.
         Essentially this returns the distribution of netvalue across all locations
         """
-        cursor = self.conn.cursor()
-        results = cursor.execute(
-            'SELECT time, location, usd_value FROM timed_location_data WHERE '
-            'time=(SELECT MAX(time) FROM timed_location_data) AND usd_value!=0;',
-        )
-        results = results.fetchall()
+        with self.read_cursor() as cursor:
+            results = cursor.execute(
+                'SELECT time, location, usd_value FROM timed_location_data WHERE '
+                'time=(SELECT MAX(time) FROM timed_location_data) AND usd_value!=0;',
+            ).fetchall()
 
         locations = []
         for result in results:
@@ -2965,14 +3393,13 @@ class DBHandler:
 
         The list is sorted by usd value going from higher to lower
         """
-        cursor = self.conn.cursor()
-        results = cursor.execute(
-            'SELECT time, currency, amount, usd_value, category FROM timed_balances WHERE '
-            'time=(SELECT MAX(time) from timed_balances) AND category = ? ORDER BY '
-            'CAST(usd_value AS REAL) DESC;',
-            (BalanceType.ASSET.serialize_for_db(),),  # pylint: disable=no-member
-        )
-        results = results.fetchall()
+        with self.read_cursor() as cursor:
+            results = cursor.execute(
+                'SELECT time, currency, amount, usd_value, category FROM timed_balances WHERE '
+                'time=(SELECT MAX(time) from timed_balances) AND category = ? ORDER BY '
+                'CAST(usd_value AS REAL) DESC;',
+                (BalanceType.ASSET.serialize_for_db(),),  # pylint: disable=no-member
+            ).fetchall()
         asset_balances = []
         for result in results:
             asset_balances.append(
@@ -3097,18 +3524,17 @@ class DBHandler:
         Raises:
         - TagConstraintError: If the tag name to delete does not exist in the DB
         """
-        cursor = self.conn.cursor()
-        # Delete the tag mappings for all affected accounts
-        cursor.execute(
-            'DELETE FROM tag_mappings WHERE '
-            'tag_name = ?;', (name,),
-        )
-        cursor.execute('DELETE from tags WHERE name = ?;', (name,))
-        if cursor.rowcount < 1:
-            raise TagConstraintError(
-                f'Tried to delete tag with name "{name}" which does not exist',
+        with self.user_write() as cursor:
+            # Delete the tag mappings for all affected accounts
+            cursor.execute(
+                'DELETE FROM tag_mappings WHERE '
+                'tag_name = ?;', (name,),
             )
-        self.update_last_write()
+            cursor.execute('DELETE from tags WHERE name = ?;', (name,))
+            if cursor.rowcount < 1:
+                raise TagConstraintError(
+                    f'Tried to delete tag with name "{name}" which does not exist',
+                )
 
     def ensure_tags_exist(
             self,
@@ -3434,10 +3860,7 @@ class DBHandler:
         version = self.get_version()
         new_db_filename = f'{ts_now()}_rotkehlchen_db_v{version}.backup'
         new_db_path = self.user_data_dir / new_db_filename
-        shutil.copyfile(
-            self.user_data_dir / 'rotkehlchen.db',
-            new_db_path,
-        )
+        self.backup_to(new_db_path)
         return new_db_path
 
     def get_associated_locations(self) -> Set[Location]:
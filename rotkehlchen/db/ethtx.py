@@ -1,5 +1,5 @@
 import logging
-from copy import deepcopy
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from rotkehlchen.chain.ethereum.structures import EthereumTxReceipt, EthereumTxReceiptLog
@@ -77,10 +77,12 @@ class DBEthTx():
         - pysqlcipher3.dbapi2.OperationalError if the SQL query fails due to invalid
         filtering arguments.
         """
-        cursor = self.db.conn.cursor()
-        query, bindings = filter_.prepare()
-        query = 'SELECT * FROM ethereum_transactions ' + query
-        results = cursor.execute(query, bindings)
+        with self.db.read_cursor() as cursor:
+            results = self.db.query_filtered_page(
+                cursor=cursor,
+                select='SELECT * FROM ethereum_transactions ',
+                filter_query=filter_,
+            )
 
         ethereum_transactions = []
         for result in results:
@@ -108,12 +110,12 @@ class DBEthTx():
             ethereum_transactions.append(tx)
 
         if filter_.pagination is not None:
-            no_pagination_filter = deepcopy(filter_)
-            no_pagination_filter.pagination = None
-            query, bindings = no_pagination_filter.prepare()
-            query = 'SELECT COUNT(*) FROM ethereum_transactions ' + query
-            results = cursor.execute(query, bindings).fetchone()
-            total_filter_count = results[0]
+            with self.db.read_cursor() as cursor:
+                total_filter_count = self.db.count_filtered(
+                    cursor=cursor,
+                    table='ethereum_transactions',
+                    filter_query=filter_,
+                )
         else:
             total_filter_count = len(ethereum_transactions)
 
@@ -127,7 +129,10 @@ class DBEthTx():
             ('ethtxs\\_%', '\\'),
         )
         cursor.execute('DELETE FROM ethereum_transactions;')
-        self.db.conn.commit()
+        # the receipt logs are gone with the transactions so the dictionaries can go too
+        cursor.execute('DELETE FROM ethtx_topics;')
+        cursor.execute('DELETE FROM ethtx_addresses;')
+        self.db.commit()
         self.db.update_last_write()
 
     def add_receipt_data(self, data: Dict[str, Any]) -> None:
@@ -144,17 +149,10 @@ class DBEthTx():
         tx_hash_b = hexstring_to_bytes(data['transactionHash'])
         # some nodes miss the type field for older non EIP1559 transactions. So assume legacy (0)
         tx_type = hexstr_to_int(data.get('type', '0x0'))
-        cursor = self.db.conn.cursor()
         status = data.get('status', 1)  # status may be missing for older txs. Assume 1.
         if status is None:
             status = 1
         contract_address = deserialize_ethereum_address(data['contractAddress']) if data['contractAddress'] else None  # noqa: E501
-        cursor.execute(
-            'INSERT INTO ethtx_receipts (tx_hash, contract_address, status, type) '
-            'VALUES(?, ?, ?, ?) ',
-            (tx_hash_b, contract_address, status, tx_type),
-        )
-
         log_tuples = []
         topic_tuples = []
         for log_entry in data['logs']:
@@ -175,22 +173,33 @@ class DBEthTx():
                     idx,
                 ))
 
-        if len(log_tuples) != 0:
-            cursor.executemany(
-                'INSERT INTO ethtx_receipt_logs (tx_hash, log_index, data, address, removed) '
-                'VALUES(? ,? ,? ,? ,?)',
-                log_tuples,
+        with self.db.user_write() as cursor:
+            cursor.execute(
+                'INSERT INTO ethtx_receipts (tx_hash, contract_address, status, type) '
+                'VALUES(?, ?, ?, ?) ',
+                (tx_hash_b, contract_address, status, tx_type),
             )
-
-            if len(topic_tuples) != 0:
+            if len(log_tuples) != 0:
                 cursor.executemany(
-                    'INSERT INTO ethtx_receipt_log_topics (tx_hash, log_index, topic, topic_index) '  # noqa: E501
-                    'VALUES(? ,? ,?, ?)',
-                    topic_tuples,
+                    'INSERT OR IGNORE INTO ethtx_addresses(address) VALUES(?)',
+                    [(x[3],) for x in log_tuples],
+                )
+                cursor.executemany(
+                    'INSERT INTO ethtx_receipt_logs (tx_hash, log_index, data, address_id, removed) '  # noqa: E501
+                    'VALUES(?, ?, ?, (SELECT id FROM ethtx_addresses WHERE address=?), ?)',
+                    log_tuples,
                 )
 
-        self.db.conn.commit()
-        self.db.update_last_write()
+                if len(topic_tuples) != 0:
+                    cursor.executemany(
+                        'INSERT OR IGNORE INTO ethtx_topics(topic) VALUES(?)',
+                        [(x[2],) for x in topic_tuples],
+                    )
+                    cursor.executemany(
+                        'INSERT INTO ethtx_receipt_log_topics (tx_hash, log_index, topic_id, topic_index) '  # noqa: E501
+                        'VALUES(?, ?, (SELECT id FROM ethtx_topics WHERE topic=?), ?)',
+                        topic_tuples,
+                    )
 
     def get_receipt(self, tx_hash: bytes) -> Optional[EthereumTxReceipt]:
         cursor = self.db.conn.cursor()
@@ -206,24 +215,29 @@ class DBEthTx():
             type=result[3],
         )
 
-        results = cursor.execute('SELECT * from ethtx_receipt_logs WHERE tx_hash=?', (tx_hash,)).fetchall()  # noqa: E501
-        # we do a fetchall since in each loop iteration another query of the cursor happens
+        topics = cursor.execute(
+            'SELECT log_index, topic FROM ethtx_receipt_log_topics '
+            'INNER JOIN ethtx_topics ON ethtx_receipt_log_topics.topic_id=ethtx_topics.id '
+            'WHERE tx_hash=? ORDER BY log_index ASC, topic_index ASC',
+            (tx_hash,),
+        ).fetchall()
+        log_topics = defaultdict(list)
+        for log_index, topic in topics:
+            log_topics[log_index].append(topic)
+
+        results = cursor.execute(
+            'SELECT log_index, data, address, removed FROM ethtx_receipt_logs '
+            'INNER JOIN ethtx_addresses ON ethtx_receipt_logs.address_id=ethtx_addresses.id '
+            'WHERE tx_hash=? ORDER BY log_index ASC',
+            (tx_hash,),
+        )
         for result in results:
-            log_index = result[1]
-            tx_receipt_log = EthereumTxReceiptLog(
-                log_index=log_index,
-                data=result[2],
-                address=result[3],
-                removed=bool(result[4]),  # works since value is either 0 or 1
-            )
-            topic_results = cursor.execute(
-                'SELECT topic from ethtx_receipt_log_topics WHERE tx_hash=? AND log_index=? '
-                'ORDER BY topic_index ASC',
-                (tx_hash, log_index),
-            )
-            for topic_result in topic_results:
-                tx_receipt_log.topics.append(topic_result[0])
-
-            tx_receipt.logs.append(tx_receipt_log)
+            tx_receipt.logs.append(EthereumTxReceiptLog(
+                log_index=result[0],
+                data=result[1],
+                address=result[2],
+                removed=bool(result[3]),  # works since value is either 0 or 1
+                topics=log_topics.get(result[0], []),
+            ))
 
         return tx_receipt
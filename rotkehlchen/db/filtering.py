@@ -1,4 +1,5 @@
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, List, NamedTuple, Optional, Tuple, Union, cast
 
@@ -24,28 +25,77 @@ from rotkehlchen.utils.misc import hexstring_to_bytes, ts_now
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+FILTER_CACHE_SIZE = 64
+
 
 class DBFilterOrder(NamedTuple):
     attribute: str
     ascending: bool
+    # Attributes that the entries are ordered by after the main one. Together with it
+    # they identify each entry, so that the order of entries with equal attribute
+    # values is deterministic and pages can be seeked to.
+    tiebreakers: Tuple[str, ...] = ()
+
+    def attributes(self) -> Tuple[str, ...]:
+        """Returns all the attributes the entries are ordered by, in order"""
+        return (self.attribute, *(x for x in self.tiebreakers if x != self.attribute))
 
     def prepare(self) -> str:
-        if self.attribute in ('amount', 'fee', 'rate'):
-            order_by = f'CAST({self.attribute} AS REAL)'
-        else:
-            order_by = self.attribute
+        direction = 'ASC' if self.ascending else 'DESC'
+        order_by = []
+        for attribute in self.attributes():
+            if attribute in ('amount', 'fee', 'rate'):
+                order_by.append(f'CAST({attribute} AS REAL) {direction}')
+            else:
+                order_by.append(f'{attribute} {direction}')
 
-        return f'ORDER BY {order_by} {"ASC" if self.ascending else "DESC"}'
+        return f'ORDER BY {", ".join(order_by)}'
 
 
 class DBFilterPagination(NamedTuple):
     limit: int
     offset: int
+    # The values of the order attributes of the last entry before the page. If given,
+    # the page is found by seeking past that entry instead of skipping over all of the
+    # entries before it with the offset.
+    seek: Optional[Tuple[Any, ...]] = None
 
     def prepare(self) -> str:
+        if self.seek is not None:
+            return f'LIMIT {self.limit}'
         return f'LIMIT {self.limit} OFFSET {self.offset}'
 
 
+class DBFilterCache():
+    """Remembers the total count and the page boundaries of recently queried filters
+
+    Each value is stored along with the generation of the DB it was computed at and
+    is only returned for the same generation. Any write to the DB changes the
+    generation so no explicit invalidation is needed.
+    """
+
+    def __init__(self, size: int = FILTER_CACHE_SIZE) -> None:
+        self.size = size
+        self.entries: 'OrderedDict[Tuple[str, str], Tuple[Tuple[int, ...], Any]]' = OrderedDict()
+
+    def get(self, key: Tuple[str, str], generation: Tuple[int, ...]) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != generation:
+            return None
+
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Tuple[str, str], generation: Tuple[int, ...], value: Any) -> None:
+        self.entries[key] = (generation, value)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
 @dataclass(init=True, repr=True, eq=True, order=False, unsafe_hash=False, frozen=False)
 class DBFilter():
     and_op: bool
@@ -173,10 +223,36 @@ class DBFilterQuery():
     order_by: Optional[DBFilterOrder] = None
     pagination: Optional[DBFilterPagination] = None
 
+    def seek_attributes(self) -> Optional[Tuple[str, ...]]:
+        """Returns the attributes the entries are ordered by if the query is ordered by
+        the timestamp and then by attributes that identify each entry, since then the
+        pagination can seek to an entry. Otherwise returns None."""
+        timestamp_filter = getattr(self, 'timestamp_filter', None)
+        if timestamp_filter is None or self.order_by is None:
+            return None
+        if self.order_by.attribute != timestamp_filter.timestamp_attribute:
+            return None
+        attributes = self.order_by.attributes()
+        if len(attributes) == 1:
+            return None
+        return attributes
+
     def prepare(self, with_pagination: bool = True) -> Tuple[str, List[Any]]:
         query_parts = []
         bindings = []
         filterstrings = []
+        pagination = self.pagination if with_pagination else None
+        seek_filter, seek_bindings = None, []
+        seek = pagination.seek if pagination is not None else None
+        if pagination is not None and seek is not None:
+            seek_attributes = self.seek_attributes()
+            if seek_attributes is None or self.order_by is None:
+                pagination = pagination._replace(seek=None)
+            else:
+                operator = '>' if self.order_by.ascending else '<'
+                placeholders = ', '.join(['?'] * len(seek_attributes))
+                seek_filter = f'({", ".join(seek_attributes)}) {operator} ({placeholders})'
+                seek_bindings = list(seek)
 
         for fil in self.filters:
             filters, single_bindings = fil.prepare()
@@ -190,14 +266,20 @@ class DBFilterQuery():
         if len(filterstrings) != 0:
             operator = ' AND ' if self.and_op else ' OR '
             where_query = 'WHERE ' + operator.join(filterstrings)
+            if seek_filter is not None:
+                where_query = f'WHERE ({operator.join(filterstrings)}) AND {seek_filter}'
             query_parts.append(where_query)
+        elif seek_filter is not None:
+            query_parts.append(f'WHERE {seek_filter}')
+
+        bindings.extend(seek_bindings)
 
         if self.order_by is not None:
             orderby_query = self.order_by.prepare()
             query_parts.append(orderby_query)
 
-        if with_pagination and self.pagination is not None:
-            pagination_query = self.pagination.prepare()
+        if pagination is not None:
+            pagination_query = pagination.prepare()
             query_parts.append(pagination_query)
 
         return ' '.join(query_parts), bindings
@@ -210,6 +292,7 @@ class DBFilterQuery():
             offset: Optional[int],
             order_by_attribute: Optional[str] = None,
             order_ascending: bool = True,
+            order_tiebreakers: Tuple[str, ...] = (),
     ) -> 'DBFilterQuery':
         if limit is None or offset is None:
             pagination = None
@@ -222,6 +305,7 @@ class DBFilterQuery():
             order_by = DBFilterOrder(
                 attribute=order_by_attribute,
                 ascending=order_ascending,
+                tiebreakers=order_tiebreakers,
             )
 
         return cls(
@@ -313,6 +397,7 @@ class ETHTransactionsFilterQuery(DBFilterQuery, FilterWithTimestamp):
             offset=offset,
             order_by_attribute=order_by_attribute,
             order_ascending=order_ascending,
+            order_tiebreakers=('tx_hash',),
         )
         filter_query = cast('ETHTransactionsFilterQuery', filter_query)
         filters: List[DBFilter] = []
@@ -431,6 +516,8 @@ class TradesFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLocation):
             offset=offset,
             order_by_attribute=order_by_attribute,
             order_ascending=order_ascending,
+            # the two trades of some AMM swaps in combined_trades_view share their id
+            order_tiebreakers=('id', 'link', 'quote_asset'),
         )
         filter_query = cast('TradesFilterQuery', filter_query)
         filters: List[DBFilter] = []
@@ -477,6 +564,7 @@ class AssetMovementsFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLo
             offset=offset,
             order_by_attribute=order_by_attribute,
             order_ascending=order_ascending,
+            order_tiebreakers=('id',),
         )
         filter_query = cast('AssetMovementsFilterQuery', filter_query)
         filters: List[DBFilter] = []
@@ -521,6 +609,7 @@ class LedgerActionsFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLoc
             offset=offset,
             order_by_attribute=order_by_attribute,
             order_ascending=order_ascending,
+            order_tiebreakers=('identifier',),
         )
         filter_query = cast('LedgerActionsFilterQuery', filter_query)
         filters: List[DBFilter] = []
@@ -563,6 +652,7 @@ class Eth2DailyStatsFilterQuery(DBFilterQuery, FilterWithTimestamp):
             offset=offset,
             order_by_attribute=order_by_attribute,
             order_ascending=order_ascending,
+            order_tiebreakers=('validator_index',),
         )
         filter_query = cast('Eth2DailyStatsFilterQuery', filter_query)
         filters: List[DBFilter] = []
@@ -627,6 +717,7 @@ class ReportDataFilterQuery(DBFilterQuery, FilterWithTimestamp):
             offset=offset,
             order_by_attribute=order_by_attribute,
             order_ascending=order_ascending,
+            order_tiebreakers=('identifier',),
         )
         filter_query = cast('ReportDataFilterQuery', filter_query)
         filters: List[DBFilter] = []
@@ -684,6 +775,7 @@ class HistoryEventFilterQuery(DBFilterQuery, FilterWithTimestamp, FilterWithLoca
             offset=offset,
             order_by_attribute=order_by_attribute,
             order_ascending=order_ascending,
+            order_tiebreakers=('identifier',),
         )
         filter_query = cast('HistoryEventFilterQuery', filter_query)
         filters: List[DBFilter] = []
@@ -6,6 +6,7 @@ from pysqlcipher3 import dbapi2 as sqlcipher
 from rotkehlchen.accounting.structures import HistoryBaseEntry
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.constants.limits import FREE_HISTORY_EVENTS_LIMIT
+from rotkehlchen.constants.misc import ZERO
 from rotkehlchen.constants.timing import KRAKEN_TS_MULTIPLIER
 from rotkehlchen.db.filtering import HistoryEventFilterQuery
 from rotkehlchen.errors import DeserializationError, UnknownAsset
@@ -73,15 +74,14 @@ class DBHistoryEvents():
         """
         Get history events using the provided query filter
         """
-        query, bindings = filter_query.prepare()
-        cursor = self.db.conn.cursor()
-
+        select_bindings = []
         if has_premium:
-            query = 'SELECT * from history_events ' + query
-            results = cursor.execute(query, bindings)
+            select = 'SELECT * from history_events '
         else:
-            query = 'SELECT * FROM (SELECT * from history_events ORDER BY timestamp DESC LIMIT ?) ' + query  # noqa: E501
-            results = cursor.execute(query, [FREE_HISTORY_EVENTS_LIMIT] + bindings)
+            select = 'SELECT * FROM (SELECT * from history_events ORDER BY timestamp DESC LIMIT ?) '  # noqa: E501
+            select_bindings = [FREE_HISTORY_EVENTS_LIMIT]
+        with self.db.read_cursor() as cursor:
+            results = self.db.query_filtered_page(cursor, select, filter_query, select_bindings)
 
         output = []
         for entry in results:
@@ -108,11 +108,9 @@ class DBHistoryEvents():
             filter_query=filter_query,
             has_premium=has_premium,
         )
-        cursor = self.db.conn.cursor()
-        query, bindings = filter_query.prepare(with_pagination=False)
-        query = 'SELECT COUNT(*) from history_events ' + query
-        total_found_result = cursor.execute(query, bindings)
-        return events, total_found_result.fetchone()[0]
+        with self.db.read_cursor() as cursor:
+            total_found_result = self.db.count_filtered(cursor, 'history_events', filter_query)
+        return events, total_found_result
 
     def rows_missing_prices_in_base_entries(
         self,
@@ -177,55 +175,41 @@ class DBHistoryEvents():
     def get_history_events_count(self, query_filter: HistoryEventFilterQuery) -> int:
         """Returns how many of certain base entry events are in the database"""
         cursor = self.db.conn.cursor()
-        query, bindings = query_filter.prepare(with_pagination=False)
-        query = 'SELECT COUNT(*) from history_events ' + query
-        result = cursor.execute(query, bindings)
-        return result.fetchone()[0]
+        return self.db.count_filtered(cursor, 'history_events', query_filter)
 
     def get_value_stats(
         self,
         query_filter: HistoryEventFilterQuery,
     ) -> Tuple[FVal, List[Tuple[Asset, FVal, FVal]]]:
         """Returns the sum of the USD value at the time of acquisition and the amount received
-        by asset"""
-        cursor = self.db.conn.cursor()
-        usd_value = FVal(0)
-        query_filters, bindings = query_filter.prepare(with_pagination=False)
-        try:
-            query = 'SELECT SUM(CAST(usd_value AS REAL)) FROM history_events ' + query_filters
-            result = cursor.execute(query, bindings)
-            usd_value = deserialize_fval(
-                value=result.fetchone()[0],
-                name='usd value in history events stats',
-                location='get_value_stats',
-            )
-        except (DeserializationError, sqlcipher.DatabaseError) as e:  # pylint: disable=no-member)
-            log.error(f'Didnt get correct valid usd_value for history_events query. {str(e)}')
+        by asset
 
+        The sums are exact decimal sums computed in a single pass over the events
+        """
+        usd_value = ZERO
+        query_filters, bindings = query_filter.prepare(with_pagination=False)
         query = (
-            'SELECT asset, SUM(CAST(amount AS REAL)), SUM(CAST(usd_value AS REAL)) ' +
+            'SELECT asset, DECIMAL_SUM(amount), DECIMAL_SUM(usd_value) ' +
             'FROM history_events ' +
             query_filters +
             ' GROUP BY asset;'
         )
-        result = cursor.execute(query, bindings)
-        assets_amounts = []
+        assets_amounts: List[Tuple[Asset, FVal, FVal]] = []
+        with self.db.read_cursor() as cursor:
+            try:
+                result = cursor.execute(query, bindings).fetchall()
+            except sqlcipher.DatabaseError as e:  # pylint: disable=no-member
+                log.error(f'Failed to sum the values of the history events. {str(e)}')
+                return usd_value, assets_amounts
+
         for row in result:
+            # The totals are strings of the DECIMAL_SUM aggregate so they are always valid
+            amount, sum_of_usd_values = FVal(row[1]), FVal(row[2])
+            usd_value += sum_of_usd_values
             try:
                 asset = Asset(row[0])
-                amount = deserialize_fval(
-                    value=row[1],
-                    name='total amount in history events stats',
-                    location='get_value_stats',
-                )
-                sum_of_usd_values = deserialize_fval(
-                    value=row[2],
-                    name='total usd value in history events stats',
-                    location='get_value_stats',
-                )
-                assets_amounts.append((asset, amount, sum_of_usd_values))
             except UnknownAsset as e:
                 log.debug(f'Found unknown asset {row[0]} in staking event. {str(e)}')
-            except DeserializationError as e:
-                log.debug(f'Failed to deserialize amount {row[1]}. {str(e)}')
+                continue
+            assets_amounts.append((asset, amount, sum_of_usd_values))
         return usd_value, assets_amounts
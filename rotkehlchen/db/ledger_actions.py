@@ -12,10 +12,14 @@ from rotkehlchen.errors import DeserializationError, UnknownAsset
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.typing import Location, Timestamp
 from rotkehlchen.user_messages import MessagesAggregator
+from rotkehlchen.utils.misc import get_chunks
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
+# Keeps the number of bound parameters of a query below SQLite's limit
+LEDGER_ACTIONS_QUERY_CHUNK_LENGTH = 500
+
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
 
@@ -62,10 +66,7 @@ class DBLedgerActions():
         """
         actions = self.get_ledger_actions(filter_query=filter_query, has_premium=has_premium)
         cursor = self.db.conn.cursor()
-        query, bindings = filter_query.prepare(with_pagination=False)
-        query = 'SELECT COUNT(*) from ledger_actions ' + query
-        total_found_result = cursor.execute(query, bindings)
-        return actions, total_found_result.fetchone()[0]
+        return actions, self.db.count_filtered(cursor, 'ledger_actions', filter_query)
 
     def get_ledger_actions(
             self,
@@ -77,19 +78,23 @@ class DBLedgerActions():
         Returned list is ordered according to the passed filter query
         """
         cursor = self.db.conn.cursor()
-        query_filter, bindings = filter_query.prepare()
+        select_bindings = []
         if has_premium:
-            query = 'SELECT * from ledger_actions ' + query_filter
-            results = cursor.execute(query, bindings)
+            select = 'SELECT * from ledger_actions '
         else:
-            query = 'SELECT * FROM (SELECT * from ledger_actions ORDER BY timestamp DESC LIMIT ?) ' + query_filter  # noqa: E501
-            results = cursor.execute(query, [FREE_LEDGER_ACTIONS_LIMIT] + bindings)
-
-        original_query = 'SELECT identifier from ledger_actions ' + query_filter
-        gitcoin_query = f'SELECT * from ledger_actions_gitcoin_data WHERE parent_id IN ({original_query});'  # noqa: E501
-        cursor2 = self.db.conn.cursor()
-        gitcoin_results = cursor2.execute(gitcoin_query, bindings)
-        gitcoin_map = {x[0]: x for x in gitcoin_results}
+            select = 'SELECT * FROM (SELECT * from ledger_actions ORDER BY timestamp DESC LIMIT ?) '  # noqa: E501
+            select_bindings = [FREE_LEDGER_ACTIONS_LIMIT]
+        results = self.db.query_filtered_page(cursor, select, filter_query, select_bindings)
+
+        gitcoin_map = {}
+        identifiers = [x[0] for x in results]
+        for chunk in get_chunks(identifiers, n=LEDGER_ACTIONS_QUERY_CHUNK_LENGTH):
+            gitcoin_results = cursor.execute(
+                f'SELECT * from ledger_actions_gitcoin_data WHERE parent_id IN '
+                f'({",".join(["?"] * len(chunk))});',
+                chunk,
+            )
+            gitcoin_map.update({x[0]: x for x in gitcoin_results})
 
         actions = []
         for result in results:
@@ -175,34 +180,33 @@ class DBLedgerActions():
 
         May raise:
         - sqlcipher.IntegrityError if there is a conflict at addition in  _add_gitcoin_extra_data.
-         If this error is raised connection needs to be rolled back by the caller.
+         If this error is raised the addition of the action is rolled back.
         """
-        cursor = self.db.conn.cursor()
         query = """
         INSERT INTO ledger_actions(
             timestamp, type, location, amount, asset, rate, rate_asset, link, notes
         )
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);"""
-        cursor.execute(query, action.serialize_for_db())
-        identifier = cursor.lastrowid
-        action.identifier = identifier
-        _add_gitcoin_extra_data(cursor, [action])
-        self.db.conn.commit()
+        with self.db.user_write() as cursor:
+            cursor.execute(query, action.serialize_for_db())
+            identifier = cursor.lastrowid
+            action.identifier = identifier
+            _add_gitcoin_extra_data(cursor, [action])
         return identifier
 
     def add_ledger_actions(self, actions: List[LedgerAction]) -> None:
         """Adds multiple ledger action to the DB
 
-        Is slow due to not using executemany since the ledger actions table
-        utilized an auto generated primary key.
+        Does not use executemany since the ledger actions table utilizes an auto
+        generated primary key, but all actions are added in a single transaction.
         """
-        for action in actions:
-            try:
-                self.add_ledger_action(action)
-            except sqlcipher.IntegrityError:  # pylint: disable=no-member
-                self.db.msg_aggregator.add_warning('Did not add ledger action to DB due to it already existing')  # noqa: E501
-                log.warning(f'Did not add ledger action {action} to the DB due to it already existing')  # noqa: E501
-                self.db.conn.rollback()  # undo the addition and rollack to last commit
+        with self.db.user_write():
+            for action in actions:
+                try:
+                    self.add_ledger_action(action)
+                except sqlcipher.IntegrityError:  # pylint: disable=no-member
+                    self.db.msg_aggregator.add_warning('Did not add ledger action to DB due to it already existing')  # noqa: E501
+                    log.warning(f'Did not add ledger action {action} to the DB due to it already existing')  # noqa: E501
 
     def remove_ledger_action(self, identifier: int) -> Optional[str]:
         """Removes a ledger action from the DB by identifier
@@ -219,7 +223,7 @@ class DBLedgerActions():
                 f'Tried to delete ledger action with identifier {identifier} but '
                 f'it was not found in the DB'
             )
-        self.db.conn.commit()
+        self.db.commit()
         return error_msg
 
     def edit_ledger_action(self, action: LedgerAction) -> Optional[str]:
@@ -241,7 +245,7 @@ class DBLedgerActions():
                 f'Tried to edit ledger action with identifier {action.identifier} '
                 f'but it was not found in the DB'
             )
-        self.db.conn.commit()
+        self.db.commit()
         return error_msg
 
     def delete_gitcoin_ledger_actions(self, grant_id: Optional[int]) -> None:
@@ -268,4 +272,4 @@ class DBLedgerActions():
         cursor.execute(query1str, bindings1)
         cursor.execute(query2str, bindings2)
         cursor.execute(query3str, bindings1)
-        self.db.conn.commit()
+        self.db.commit()
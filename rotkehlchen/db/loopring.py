@@ -17,7 +17,7 @@ class DBLoopring():
             'INSERT INTO multisettings(name, value) VALUES(?, ?)',
             (f'loopring_{address}_account_id', str(account_id)),
         )
-        self.db.conn.commit()
+        self.db.commit()
         self.db.update_last_write()
 
     def remove_accountid_mapping(self, address: ChecksumEthAddress) -> None:
@@ -26,7 +26,7 @@ class DBLoopring():
             'DELETE FROM multisettings WHERE name=?;',
             (f'loopring_{address}_account_id',),
         )
-        self.db.conn.commit()
+        self.db.commit()
         self.db.update_last_write()
 
     def get_accountid_mapping(self, address: ChecksumEthAddress) -> Optional[int]:
@@ -27,7 +27,7 @@ class QueriedAddresses():
             raise InputError(
                 f'Address {address} is already in the queried addresses for {module}',
             ) from e
-        self.db.conn.commit()
+        self.db.commit()
         self.db.update_last_write()
 
     def remove_queried_address_for_module(
@@ -46,7 +46,7 @@ class QueriedAddresses():
         )
         if cursor.rowcount != 1:
             raise InputError(f'Address {address} is not in the queried addresses for {module}')
-        self.db.conn.commit()
+        self.db.commit()
         self.db.update_last_write()
 
     def get_queried_addresses_for_module(
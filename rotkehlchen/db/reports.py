@@ -1,5 +1,4 @@
 import logging
-from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from pysqlcipher3 import dbapi2 as sqlcipher
@@ -218,7 +217,7 @@ class DBAccountingReports():
             raise InputError(
                 f'Could not delete PnL report {report_id} from the DB. Report was not found',
             )
-        self.db.conn.commit()
+        self.db.commit()
         self.db.update_last_write()
 
     def add_report_data(self, report_id: int, time: Timestamp, event: NamedJson) -> None:
@@ -263,14 +262,15 @@ class DBAccountingReports():
                 f'Tried to get PnL events from non existing report with id {report_id}',
             )
 
-        query, bindings = filter_.prepare()
-        query = 'SELECT event_type, data FROM pnl_events ' + query
-        results = cursor.execute(query, bindings)
-
+        results = self.db.query_filtered_page(
+            cursor=cursor,
+            select='SELECT event_type, data, timestamp, identifier FROM pnl_events ',
+            filter_query=filter_,
+        )
         records = []
         for result in results:
             try:
-                record = NamedJson.deserialize_from_db(result).data
+                record = NamedJson.deserialize_from_db((result[0], result[1])).data
             except DeserializationError as e:
                 self.db.msg_aggregator.add_error(
                     f'Error deserializing AccountingEvent from the DB. Skipping it.'
@@ -281,12 +281,7 @@ class DBAccountingReports():
             records.append(record)
 
         if filter_.pagination is not None:
-            no_pagination_filter = deepcopy(filter_)
-            no_pagination_filter.pagination = None
-            query, bindings = no_pagination_filter.prepare()
-            query = 'SELECT COUNT(*) FROM pnl_events ' + query
-            results = cursor.execute(query, bindings).fetchone()
-            total_filter_count = results[0]
+            total_filter_count = self.db.count_filtered(cursor, 'pnl_events', filter_)
         else:
             total_filter_count = len(records)
 
@@ -1,3 +1,5 @@
+from typing import List
+
 # Custom enum table for trade types
 DB_CREATE_TRADE_TYPE = """
 CREATE TABLE IF NOT EXISTS trade_type (
@@ -193,6 +195,17 @@ CREATE TABLE IF NOT EXISTS timed_location_data (
 );
 """
 
+# The totals of each saved balance snapshot so that the net value statistics don't
+# need to sum up all the timed balances. The per location totals of the snapshot
+# are kept in timed_location_data.
+DB_CREATE_BALANCE_SNAPSHOT_SUMMARIES = """
+CREATE TABLE IF NOT EXISTS balance_snapshot_summaries (
+    time INTEGER NOT NULL PRIMARY KEY,
+    usd_value TEXT NOT NULL,
+    usd_value_without_nfts TEXT NOT NULL
+);
+"""
+
 DB_CREATE_USER_CREDENTIALS = """
 CREATE TABLE IF NOT EXISTS user_credentials (
     name TEXT NOT NULL,
@@ -476,14 +489,32 @@ CREATE TABLE IF NOT EXISTS ethtx_receipts (
 );
 """  # noqa: E501
 
+# The log addresses and topics repeat a lot between receipts (token contracts, the
+# Transfer event signature, the user's own address) so each distinct one is stored
+# once in these dictionary tables and the log tables refer to it by id.
+DB_CREATE_ETHTX_ADDRESSES = """
+CREATE TABLE IF NOT EXISTS ethtx_addresses (
+    id INTEGER NOT NULL PRIMARY KEY,
+    address TEXT NOT NULL UNIQUE
+);
+"""
+
+DB_CREATE_ETHTX_TOPICS = """
+CREATE TABLE IF NOT EXISTS ethtx_topics (
+    id INTEGER NOT NULL PRIMARY KEY,
+    topic BLOB NOT NULL UNIQUE
+);
+"""
+
 DB_CREATE_ETHTX_RECEIPT_LOGS = """
 CREATE TABLE IF NOT EXISTS ethtx_receipt_logs (
     tx_hash BLOB NOT NULL,
     log_index INTEGER NOT NULL,
     data BLOB NOT NULL,
-    address TEXT NOT NULL,
+    address_id INTEGER NOT NULL,
     removed INTEGER NOT NULL CHECK (removed IN (0, 1)),
     FOREIGN KEY(tx_hash) REFERENCES ethtx_receipts(tx_hash) ON DELETE CASCADE ON UPDATE CASCADE,
+    FOREIGN KEY(address_id) REFERENCES ethtx_addresses(id),
     PRIMARY KEY(tx_hash, log_index)
 );
 """
@@ -492,9 +523,10 @@ DB_CREATE_ETHTX_RECEIPT_LOG_TOPICS = """
 CREATE TABLE IF NOT EXISTS ethtx_receipt_log_topics (
     tx_hash BLOB NOT NULL,
     log_index INTEGER NOT NULL,
-    topic BLOB NOT NULL,
+    topic_id INTEGER NOT NULL,
     topic_index INTEGER NOT NULL,
     FOREIGN KEY(tx_hash, log_index) REFERENCES ethtx_receipt_logs(tx_hash, log_index) ON DELETE CASCADE ON UPDATE CASCADE,
+    FOREIGN KEY(topic_id) REFERENCES ethtx_topics(id),
     PRIMARY KEY(tx_hash, log_index, topic_index)
 );
 """  # noqa: E501
@@ -778,6 +810,117 @@ CREATE VIEW IF NOT EXISTS combined_trades_view AS
 ;
 """  # noqa: E501
 
+# How many times each asset is referenced by the tables of TABLES_WITH_ASSETS. Kept
+# current by the triggers of DB_SCRIPT_CREATE_OWNED_ASSETS_TRIGGERS so that the owned
+# assets can be read without scanning all of these tables.
+DB_CREATE_OWNED_ASSETS = """
+CREATE TABLE IF NOT EXISTS owned_assets (
+    identifier TEXT NOT NULL PRIMARY KEY,
+    ref_count INTEGER NOT NULL
+);
+"""
+
+# Indexes for the columns the history queries filter and order by. Checked with
+# EXPLAIN QUERY PLAN against the query shapes built in db/filtering.py. They are
+# not part of DB_SCRIPT_CREATE_TABLES since that also runs on DBs that are not yet
+# upgraded to the latest schema. Existing DBs get them through the DB upgrade.
+DB_SCRIPT_CREATE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_trades_time ON trades(time, id);
+CREATE INDEX IF NOT EXISTS idx_trades_location_time ON trades(location, time, id);
+CREATE INDEX IF NOT EXISTS idx_trades_base_asset ON trades(base_asset);
+CREATE INDEX IF NOT EXISTS idx_trades_quote_asset ON trades(quote_asset);
+CREATE INDEX IF NOT EXISTS idx_asset_movements_time ON asset_movements(time, id);
+CREATE INDEX IF NOT EXISTS idx_asset_movements_location_time ON asset_movements(location, time, id);
+CREATE INDEX IF NOT EXISTS idx_asset_movements_asset ON asset_movements(asset);
+CREATE INDEX IF NOT EXISTS idx_ledger_actions_timestamp ON ledger_actions(timestamp);
+CREATE INDEX IF NOT EXISTS idx_ledger_actions_location_timestamp ON ledger_actions(location, timestamp);
+CREATE INDEX IF NOT EXISTS idx_ledger_actions_asset ON ledger_actions(asset);
+CREATE INDEX IF NOT EXISTS idx_history_events_timestamp ON history_events(timestamp);
+CREATE INDEX IF NOT EXISTS idx_history_events_location_timestamp ON history_events(location, timestamp);
+CREATE INDEX IF NOT EXISTS idx_history_events_asset ON history_events(asset);
+CREATE INDEX IF NOT EXISTS idx_timed_balances_currency_time ON timed_balances(currency, time);
+CREATE INDEX IF NOT EXISTS idx_ethereum_transactions_timestamp ON ethereum_transactions(timestamp, tx_hash);
+CREATE INDEX IF NOT EXISTS idx_ethereum_transactions_from_address ON ethereum_transactions(from_address);
+CREATE INDEX IF NOT EXISTS idx_ethereum_transactions_to_address ON ethereum_transactions(to_address);
+"""  # noqa: E501
+
+# Tuples that contain first the name of a table and then the columns that
+# reference assets ids. This is used to query all assets that a user owns.
+TABLES_WITH_ASSETS = (
+    ('aave_events', 'asset1', 'asset2'),
+    ('yearn_vaults_events', 'from_asset', 'to_asset'),
+    ('manually_tracked_balances', 'asset'),
+    ('trades', 'base_asset', 'quote_asset', 'fee_currency'),
+    ('margin_positions', 'pl_currency', 'fee_currency'),
+    ('asset_movements', 'asset', 'fee_asset'),
+    ('ledger_actions', 'asset', 'rate_asset'),
+    ('amm_swaps', 'token0_identifier', 'token1_identifier'),
+    ('amm_events', 'token0_identifier', 'token1_identifier'),
+    ('adex_events', 'token'),
+    ('balancer_events', 'pool_address_token'),
+    ('timed_balances', 'currency'),
+)
+# The balances of these tables count only if they are not liabilities ('B')
+TABLES_WITH_BALANCE_CATEGORY = ('manually_tracked_balances', 'timed_balances')
+
+
+def _owned_assets_triggers() -> str:
+    """Creates the triggers that keep the reference counts of owned_assets current on
+    every insert, delete and update of the asset columns of TABLES_WITH_ASSETS"""
+    triggers: List[str] = []
+    for table, *columns in TABLES_WITH_ASSETS:
+        new_condition, old_condition, updated_columns = '', '', columns
+        if table in TABLES_WITH_BALANCE_CATEGORY:
+            new_condition = " WHEN NEW.category != 'B'"
+            old_condition = " WHEN OLD.category != 'B'"
+            updated_columns = columns + ['category']
+
+        add = ''.join(
+            f'    INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.{x}, 0);\n'  # noqa: E501
+            f'    UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.{x};\n'  # noqa: E501
+            for x in columns
+        )
+        remove = ''.join(
+            f'    UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.{x};\n'  # noqa: E501
+            f'    DELETE FROM owned_assets WHERE identifier = OLD.{x} AND ref_count <= 0;\n'
+            for x in columns
+        )
+        update_of = ', '.join(updated_columns)
+        triggers.extend((
+            f'CREATE TRIGGER IF NOT EXISTS owned_assets_{table}_insert '
+            f'AFTER INSERT ON {table}{new_condition}\nBEGIN\n{add}END;\n',
+            f'CREATE TRIGGER IF NOT EXISTS owned_assets_{table}_delete '
+            f'AFTER DELETE ON {table}{old_condition}\nBEGIN\n{remove}END;\n',
+            f'CREATE TRIGGER IF NOT EXISTS owned_assets_{table}_update_old '
+            f'AFTER UPDATE OF {update_of} ON {table}{old_condition}\nBEGIN\n{remove}END;\n',
+            f'CREATE TRIGGER IF NOT EXISTS owned_assets_{table}_update_new '
+            f'AFTER UPDATE OF {update_of} ON {table}{new_condition}\nBEGIN\n{add}END;\n',
+        ))
+
+    return ''.join(triggers)
+
+
+def _owned_assets_population() -> str:
+    """Counts the references to each asset in TABLES_WITH_ASSETS from scratch"""
+    selects: List[str] = []
+    for table, *columns in TABLES_WITH_ASSETS:
+        condition = " WHERE category != 'B'" if table in TABLES_WITH_BALANCE_CATEGORY else ''
+        selects.extend(f'    SELECT {x} AS identifier FROM {table}{condition}' for x in columns)
+
+    union = '\n    UNION ALL\n'.join(selects)
+    return (
+        'DELETE FROM owned_assets;\n'
+        'INSERT INTO owned_assets(identifier, ref_count)\n'
+        f'SELECT identifier, COUNT(*) FROM (\n{union}\n) WHERE identifier IS NOT NULL '
+        'GROUP BY identifier;\n'
+    )
+
+
+# Like the indexes these are not part of DB_SCRIPT_CREATE_TABLES. Existing DBs get the
+# triggers and have the owned_assets table populated through the DB upgrade.
+DB_SCRIPT_CREATE_OWNED_ASSETS_TRIGGERS = _owned_assets_triggers()
+DB_SCRIPT_POPULATE_OWNED_ASSETS = _owned_assets_population()
+
 DB_SCRIPT_CREATE_TABLES = f"""
 PRAGMA foreign_keys=off;
 BEGIN TRANSACTION;
@@ -788,6 +931,7 @@ BEGIN TRANSACTION;
 {DB_CREATE_ASSETS}
 {DB_CREATE_TIMED_BALANCES}
 {DB_CREATE_TIMED_LOCATION_DATA}
+{DB_CREATE_BALANCE_SNAPSHOT_SUMMARIES}
 {DB_CREATE_USER_CREDENTIALS}
 {DB_CREATE_USER_CREDENTIALS_MAPPINGS}
 {DB_CREATE_EXTERNAL_SERVICE_CREDENTIALS}
@@ -798,6 +942,8 @@ BEGIN TRANSACTION;
 {DB_CREATE_TRADES}
 {DB_CREATE_ETHEREUM_TRANSACTIONS}
 {DB_CREATE_ETHTX_RECEIPTS}
+{DB_CREATE_ETHTX_ADDRESSES}
+{DB_CREATE_ETHTX_TOPICS}
 {DB_CREATE_ETHTX_RECEIPT_LOGS}
 {DB_CREATE_ETHTX_RECEIPT_LOG_TOPICS}
 {DB_CREATE_MARGIN}
@@ -826,6 +972,7 @@ BEGIN TRANSACTION;
 {DB_CREATE_GITCOIN_TX_TYPE}
 {DB_CREATE_GITCOIN_GRANT_METADATA}
 {DB_CREATE_NFTS}
+{DB_CREATE_OWNED_ASSETS}
 {DB_CREATE_COMBINED_TRADES_VIEW}
 COMMIT;
 PRAGMA foreign_keys=on;
@@ -55,12 +55,17 @@ CREATE TABLE IF NOT EXISTS pnl_events (
 );
 """
 
+DB_CREATE_PNL_EVENTS_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_pnl_events_report_id_timestamp ON pnl_events(report_id, timestamp);
+"""
+
 DB_SCRIPT_CREATE_TRANSIENT_TABLES = f"""
 PRAGMA foreign_keys=off;
 BEGIN TRANSACTION;
 {DB_CREATE_PNL_REPORT}
 {DB_CREATE_ACCOUNTING_EVENT_TYPE}
 {DB_CREATE_PNL_EVENTS}
+{DB_CREATE_PNL_EVENTS_INDEXES}
 COMMIT;
 PRAGMA foreign_keys=on;
 """
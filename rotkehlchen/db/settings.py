@@ -3,6 +3,7 @@ from typing import Any, Dict, List, NamedTuple, Optional, Union
 
 from rotkehlchen.accounting.ledger_actions import LedgerActionType
 from rotkehlchen.assets.asset import Asset
+from rotkehlchen.chain.ethereum.typing import EthereumCallType, NodeName
 from rotkehlchen.constants.assets import A_USD
 from rotkehlchen.constants.timing import YEAR_IN_SECONDS
 from rotkehlchen.db.utils import str_to_bool
@@ -45,8 +46,18 @@ DEFAULT_PNL_CSV_WITH_FORMULAS = True
 DEFAULT_PNL_CSV_HAVE_SUMMARY = False
 DEFAULT_SSF_0GRAPH_MULTIPLIER = 0
 DEFAULT_LAST_DATA_MIGRATION = 0
-
-JSON_KEYS = ('current_price_oracles', 'historical_price_oracles', 'taxable_ledger_actions')
+DEFAULT_PINNED_ETHEREUM_NODES: List[NodeName] = []
+DEFAULT_EXCLUDED_ETHEREUM_NODES: List[NodeName] = []
+DEFAULT_HEDGED_ETHEREUM_CALLS: List[EthereumCallType] = []
+
+JSON_KEYS = (
+    'current_price_oracles',
+    'historical_price_oracles',
+    'taxable_ledger_actions',
+    'pinned_ethereum_nodes',
+    'excluded_ethereum_nodes',
+    'hedged_ethereum_calls',
+)
 BOOLEAN_KEYS = (
     'have_premium',
     'include_crypto2crypto',
@@ -108,6 +119,9 @@ class DBSettings(NamedTuple):
     pnl_csv_have_summary: bool = DEFAULT_PNL_CSV_HAVE_SUMMARY
     ssf_0graph_multiplier: int = DEFAULT_SSF_0GRAPH_MULTIPLIER
     last_data_migration: int = DEFAULT_LAST_DATA_MIGRATION
+    pinned_ethereum_nodes: List[NodeName] = DEFAULT_PINNED_ETHEREUM_NODES
+    excluded_ethereum_nodes: List[NodeName] = DEFAULT_EXCLUDED_ETHEREUM_NODES
+    hedged_ethereum_calls: List[EthereumCallType] = DEFAULT_HEDGED_ETHEREUM_CALLS
 
 
 class ModifiableDBSettings(NamedTuple):
@@ -135,6 +149,9 @@ class ModifiableDBSettings(NamedTuple):
     pnl_csv_with_formulas: Optional[bool] = None
     pnl_csv_have_summary: Optional[bool] = None
     ssf_0graph_multiplier: Optional[int] = None
+    pinned_ethereum_nodes: Optional[List[NodeName]] = None
+    excluded_ethereum_nodes: Optional[List[NodeName]] = None
+    hedged_ethereum_calls: Optional[List[EthereumCallType]] = None
 
     def serialize(self) -> Dict[str, Any]:
         settings_dict = {}
@@ -216,6 +233,12 @@ def db_settings_from_dict(
         elif key == 'taxable_ledger_actions':
             values = json.loads(value)
             specified_args[key] = [LedgerActionType.deserialize(x) for x in values]
+        elif key in ('pinned_ethereum_nodes', 'excluded_ethereum_nodes'):
+            values = json.loads(value)
+            specified_args[key] = [NodeName.deserialize(x) for x in values]
+        elif key == 'hedged_ethereum_calls':
+            values = json.loads(value)
+            specified_args[key] = [EthereumCallType.deserialize(x) for x in values]
         else:
             msg_aggregator.add_warning(
                 f'Unknown DB setting {key} given. Ignoring it. Should not '
@@ -1,12 +1,15 @@
 import logging
 import os
 import shutil
+from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any, Callable, Dict, NamedTuple, Optional
 
+import gevent
 from eth_utils.address import to_checksum_address
 from pysqlcipher3 import dbapi2 as sqlcipher
 
+from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.db.asset_rename import rename_assets_in_db
 from rotkehlchen.db.settings import ROTKEHLCHEN_DB_VERSION
 from rotkehlchen.db.upgrades.v5_v6 import upgrade_v5_to_v6
@@ -40,6 +43,7 @@ from rotkehlchen.utils.misc import ts_now
 
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.user_messages import MessagesAggregator
 
 logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
@@ -49,6 +53,8 @@ class UpgradeRecord(NamedTuple):
     from_version: int
     function: Callable
     kwargs: Optional[Dict[str, Any]] = None
+    # If the function takes a progress_handler to report its steps
+    reports_progress: bool = False
 
 
 def _checksum_eth_accounts_v1_to_v2(db: 'DBHandler') -> None:
@@ -185,10 +191,12 @@ UPGRADES_LIST = [
     UpgradeRecord(
         from_version=24,
         function=upgrade_v24_to_v25,
+        reports_progress=True,
     ),
     UpgradeRecord(
         from_version=25,
         function=upgrade_v25_to_v26,
+        reports_progress=True,
     ),
     UpgradeRecord(
         from_version=26,
@@ -209,21 +217,83 @@ UPGRADES_LIST = [
     UpgradeRecord(
         from_version=30,
         function=upgrade_v30_to_v31,
+        reports_progress=True,
     ),
 ]
 
 
+class DBUpgradeProgressHandler():
+    """Reports the progress of the DB upgrades to the frontend over the websocket
+
+    Each upgrade is reported when it starts. The upgrades that take long also set how
+    many steps they have and report each step they reach.
+    """
+
+    def __init__(
+            self,
+            msg_aggregator: 'MessagesAggregator',
+            start_version: int,
+            target_version: int,
+    ) -> None:
+        self.msg_aggregator = msg_aggregator
+        self.start_version = start_version
+        self.target_version = target_version
+        self.current_version = start_version
+        self.total_steps = 0
+        self.current_step = 0
+
+    def new_round(self, version: int) -> None:
+        """Starts reporting the progress of the upgrade to the given version"""
+        self.current_version = version
+        self.total_steps = 0
+        self.current_step = 0
+        self._notify()
+
+    def set_total_steps(self, steps: int) -> None:
+        self.total_steps = steps
+
+    def new_step(self) -> None:
+        self.current_step += 1
+        self._notify()
+
+    def _notify(self) -> None:
+        # Not sent via add_message since with no frontend listening it would be kept as
+        # an error for the frontend to query
+        notifier = self.msg_aggregator.rotki_notifier
+        if notifier is None:
+            return
+
+        notifier.broadcast(
+            message_type=WSMessageType.DB_UPGRADE_STATUS,
+            to_send_data={
+                'start_version': self.start_version,
+                'target_version': self.target_version,
+                'current_upgrade': {
+                    'to_version': self.current_version,
+                    'total_steps': self.total_steps,
+                    'current_step': self.current_step,
+                },
+            },
+        )
+        # The upgrades don't switch greenlets so let the message be sent before going on
+        gevent.sleep(0)
+
+
 class DBUpgradeManager():
     """Separate class to manage DB upgrades/migrations"""
 
     def __init__(self, db: 'DBHandler'):
         self.db = db
+        self.progress_handler: Optional[DBUpgradeProgressHandler] = None
 
     def run_upgrades(self) -> bool:
         """Run all required database upgrades
 
         Returns true for fresh database and false otherwise.
 
+        A single backup of the DB is taken before the first upgrade and restored if any
+        of them fails, so the DB is either fully upgraded or left as it was.
+
         May raise:
         - DBUpgradeError if the user uses a newer version than the one we
         upgrade to or if there is a problem during upgrade.
@@ -251,9 +321,10 @@ class DBUpgradeManager():
             result = cursor.execute('SELECT COUNT(*) FROM sqlite_master WHERE type="table" AND name="eth2_validators"')  # noqa: E501
             if result.fetchone()[0] == 0:  # it's wrong and at least v30
                 self.db.set_version(30)
+                our_version = 30
 
-        for upgrade in UPGRADES_LIST:
-            self._perform_single_upgrade(upgrade)
+        if our_version < ROTKEHLCHEN_DB_VERSION:
+            self._run_upgrades_pipeline(start_version=our_version)
 
         # Finally make sure to always have latest version in the DB
         cursor = self.db.conn.cursor()
@@ -264,54 +335,83 @@ class DBUpgradeManager():
         self.db.conn.commit()
         return False
 
-    def _perform_single_upgrade(self, upgrade: UpgradeRecord) -> None:
-        """
-        This is the wrapper function that performs each DB upgrade
-
-        The logic is:
-            1. Check version, if not at from_version get out.
-            2. If at from_version make a DB backup before performing the upgrade
-            3. Perform the upgrade action
-            4. If something went wrong during upgrade restore backup and quit
-            5. If all went well set version and delete the backup
+    def _run_upgrades_pipeline(self, start_version: int) -> None:
+        """Runs all the upgrades from start_version on, restoring the DB if any fails
 
+        May raise:
+        - DBUpgradeError if there is a problem during upgrade.
         """
-        current_version = self.db.get_version()
-        if current_version != upgrade.from_version:
-            return
-        to_version = upgrade.from_version + 1
-
+        self.progress_handler = DBUpgradeProgressHandler(
+            msg_aggregator=self.db.msg_aggregator,
+            start_version=start_version,
+            target_version=ROTKEHLCHEN_DB_VERSION,
+        )
         # First make a backup of the DB
         with TemporaryDirectory() as tmpdirname:
-            tmp_db_filename = f'{ts_now()}_rotkehlchen_db_v{upgrade.from_version}.backup'
+            tmp_db_filename = f'{ts_now()}_rotkehlchen_db_v{start_version}.backup'
             tmp_db_path = os.path.join(tmpdirname, tmp_db_filename)
-            shutil.copyfile(
-                os.path.join(self.db.user_data_dir, 'rotkehlchen.db'),
-                tmp_db_path,
-            )
+            try:
+                self.db.backup_to(Path(tmp_db_path))
+            except OSError as e:
+                raise DBUpgradeError(
+                    f'Could not back up the DB before upgrading it: {str(e)}',
+                ) from e
 
             try:
-                kwargs = upgrade.kwargs if upgrade.kwargs is not None else {}
-                upgrade.function(db=self.db, **kwargs)
+                for upgrade in UPGRADES_LIST:
+                    self._perform_single_upgrade(upgrade)
             except BaseException as e:  # lgtm[py/catch-base-exception]
                 # Problem .. restore DB backup and bail out
-                error_message = (
-                    f'Failed at database upgrade from version {upgrade.from_version} to '
-                    f'{to_version}: {str(e)}'
+                error_message = str(e) if isinstance(e, DBUpgradeError) else (
+                    f'Failed at database upgrade from version {start_version}: {str(e)}'
                 )
                 log.error(error_message)
-                shutil.copyfile(
-                    tmp_db_path,
-                    os.path.join(self.db.user_data_dir, 'rotkehlchen.db'),
-                )
+                # The upgrades may have committed some of their changes already so
+                # all of the DB is replaced with the backup
+                self.db.conn.rollback()
+                try:
+                    self.db.restore_from(Path(tmp_db_path))
+                except OSError as restore_error:
+                    log.error(f'Failed to restore the DB after the upgrade failure: {str(restore_error)}')  # noqa: E501
+                    shutil.copyfile(
+                        tmp_db_path,
+                        os.path.join(self.db.user_data_dir, tmp_db_filename),
+                    )
+                    error_message += (
+                        f'. The DB could not be restored either. A backup of it from '
+                        f'before the upgrade is at {tmp_db_filename} in the user directory'
+                    )
                 raise DBUpgradeError(error_message) from e
 
             # for some upgrades even for success keep the backup of the previous db
-            if upgrade.from_version >= 24:
+            if start_version >= 24:
                 shutil.copyfile(
                     tmp_db_path,
                     os.path.join(self.db.user_data_dir, tmp_db_filename),
                 )
 
-        # Upgrade success all is good
+    def _perform_single_upgrade(self, upgrade: UpgradeRecord) -> None:
+        """Performs the upgrade if the DB is at its from_version and sets the new version
+
+        May raise:
+        - DBUpgradeError if the upgrade fails
+        """
+        current_version = self.db.get_version()
+        if current_version != upgrade.from_version:
+            return
+        to_version = upgrade.from_version + 1
+
+        assert self.progress_handler is not None, 'should be set by the pipeline'
+        self.progress_handler.new_round(version=to_version)
+        kwargs = upgrade.kwargs if upgrade.kwargs is not None else {}
+        if upgrade.reports_progress:
+            kwargs = {**kwargs, 'progress_handler': self.progress_handler}
+        try:
+            upgrade.function(db=self.db, **kwargs)
+        except BaseException as e:  # lgtm[py/catch-base-exception]
+            raise DBUpgradeError(
+                f'Failed at database upgrade from version {upgrade.from_version} to '
+                f'{to_version}: {str(e)}',
+            ) from e
+
         self.db.set_version(to_version)
@@ -1,7 +1,9 @@
+import hashlib
 import json
 import shutil
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type
 
 from rotkehlchen.chain.ethereum.interfaces.ammswap import UNISWAP_TRADES_PREFIX
 from rotkehlchen.chain.ethereum.modules.adex.utils import ADEX_EVENTS_PREFIX
@@ -12,14 +14,15 @@ from rotkehlchen.chain.ethereum.modules.balancer.typing import (
 from rotkehlchen.chain.ethereum.modules.uniswap import UNISWAP_EVENTS_PREFIX
 from rotkehlchen.constants.ethereum import YEARN_VAULTS_PREFIX
 from rotkehlchen.constants.resolver import ETHEREUM_DIRECTIVE
-from rotkehlchen.exchanges.data_structures import hash_id
 from rotkehlchen.typing import AssetMovementCategory, Location, TradeType
 from rotkehlchen.user_messages import MessagesAggregator
+from rotkehlchen.utils.mixins.dbenum import DBEnumMixIn
 
 if TYPE_CHECKING:
     from sqlite3 import Cursor
 
     from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.db.upgrade_manager import DBUpgradeProgressHandler
 
 
 def pair_get_asset_ids(pair: str) -> Tuple[str, str]:
@@ -38,6 +41,18 @@ def pair_get_asset_ids(pair: str) -> Tuple[str, str]:
     return assets[0], assets[1]
 
 
+def hash_id(hashable: str) -> str:
+    """The hash_id of the exchange data structures, done with hashlib which is
+    a lot faster for the many rows hashed here"""
+    return hashlib.sha3_256(hashable.encode()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def db_enum_str(enum_class: Type[DBEnumMixIn], value: str) -> str:
+    """The string of a DB enum value as it goes into the identifiers"""
+    return str(enum_class.deserialize_from_db(value))
+
+
 class V24V25UpgradeHelper():
 
     def __init__(self, msg_aggregator: MessagesAggregator) -> None:
@@ -47,6 +62,7 @@ class V24V25UpgradeHelper():
         assets_data_dir = root_dir / 'data'
         with open(assets_data_dir / 'all_assets.json', 'r') as f:
             self.assets = json.loads(f.read())
+        self.new_asset_ids: Dict[str, str] = {}
 
     def __del__(self) -> None:
         del self.assets
@@ -69,59 +85,67 @@ class V24V25UpgradeHelper():
         return None
 
     def get_new_asset_identifier_if_existing(self, identifier: str) -> str:
-        new_id = self.get_new_asset_identifier(identifier)
-        return new_id if new_id else identifier
+        """Looks up each identifier once, so it's also only warned once about"""
+        new_id = self.new_asset_ids.get(identifier)
+        if new_id is None:
+            new_id = self.get_new_asset_identifier(identifier) or identifier
+            self.new_asset_ids[identifier] = new_id
 
-    def update_multisettings(self, cursor: 'Cursor') -> None:
+        return new_id
+
+    def create_asset_id_mappings(self, cursor: 'Cursor') -> None:
+        """Maps the asset ids that change to their new ids in a temporary table
+
+        With it the tables that only need their asset ids changed are upgraded
+        with a single query each.
+        """
         query = cursor.execute(
-            'SELECT name, value FROM multisettings;',
+            'SELECT value FROM multisettings WHERE name="ignored_asset" '
+            'UNION SELECT currency FROM timed_balances '
+            'UNION SELECT asset FROM manually_tracked_balances '
+            'UNION SELECT asset FROM ledger_actions;',
         )
-        old_tuples = query.fetchall()
-        cursor.execute('DELETE from multisettings;')
-        new_tuples = []
-        for entry in old_tuples:
-            value = entry[1]
-            if entry[0] == 'ignored_asset':
-                value = self.get_new_asset_identifier_if_existing(entry[1])
-            new_tuples.append((entry[0], value))
-
+        old_ids = [x[0] for x in query if x[0] is not None]
+        cursor.execute(
+            'CREATE TEMP TABLE v25_asset_ids ('
+            'old_id TEXT NOT NULL PRIMARY KEY, new_id TEXT NOT NULL);',
+        )
+        mappings = [(x, self.get_new_asset_identifier_if_existing(x)) for x in old_ids]
         cursor.executemany(
-            'INSERT INTO multisettings(name, value) VALUES(?, ?);',
-            new_tuples,
+            'INSERT INTO temp.v25_asset_ids(old_id, new_id) VALUES(?, ?);',
+            [x for x in mappings if x[0] != x[1]],
         )
 
-    def update_timed_balances(self, cursor: 'Cursor') -> None:
-        query = cursor.execute(
-            'SELECT category, time, currency, amount, usd_value FROM timed_balances;',
+    @staticmethod
+    def update_asset_id_column(
+            cursor: 'Cursor',
+            table_name: str,
+            column: str,
+            condition: str = '',
+    ) -> None:
+        """Changes the asset ids of a column to their new ids in the temporary mappings"""
+        cursor.execute(
+            f'UPDATE {table_name} SET {column}=(SELECT new_id FROM temp.v25_asset_ids '
+            f'WHERE old_id={column}) WHERE {condition}{column} IN '
+            f'(SELECT old_id FROM temp.v25_asset_ids);',
         )
-        old_tuples = query.fetchall()
-        cursor.execute('DELETE from timed_balances;')
-        new_tuples = []
-        for entry in old_tuples:
-            new_id = self.get_new_asset_identifier_if_existing(entry[2])
-            new_tuples.append((entry[0], entry[1], new_id, entry[3], entry[4]))
 
-        cursor.executemany(
-            'INSERT INTO timed_balances(category, time, currency, amount, usd_value) '
-            'VALUES(?, ?, ?, ?, ?);',
-            new_tuples,
+    def update_multisettings(self, cursor: 'Cursor') -> None:
+        self.update_asset_id_column(
+            cursor=cursor,
+            table_name='multisettings',
+            column='value',
+            condition='name="ignored_asset" AND ',
         )
 
-    def update_manually_tracked_balances(self, cursor: 'Cursor') -> None:
-        query = cursor.execute(
-            'SELECT asset, label, amount, location FROM manually_tracked_balances;',
-        )
-        old_tuples = query.fetchall()
-        cursor.execute('DELETE from manually_tracked_balances;')
-        new_tuples = []
-        for entry in old_tuples:
-            new_id = self.get_new_asset_identifier_if_existing(entry[0])
-            new_tuples.append((new_id, entry[1], entry[2], entry[3]))
+    def update_timed_balances(self, cursor: 'Cursor') -> None:
+        self.update_asset_id_column(cursor=cursor, table_name='timed_balances', column='currency')
 
-        cursor.executemany(
-            'INSERT INTO manually_tracked_balances(asset, label, amount, location) '
-            'VALUES(?, ?, ?, ?);',
-            new_tuples,
+    def update_manually_tracked_balances(self, cursor: 'Cursor') -> None:
+        self.update_asset_id_column(
+            cursor=cursor,
+            table_name='manually_tracked_balances',
+            column='asset',
         )
 
     def update_margin_positions(self, cursor: 'Cursor') -> None:
@@ -144,7 +168,7 @@ class V24V25UpgradeHelper():
             # formulate the new DB identifier primary key. Copy the identifier() functionality
             open_time_str = 'None' if entry[2] == 0 else str(entry[2])
             new_id_string = (
-                str(Location.deserialize_from_db(entry[1])) +
+                db_enum_str(Location, entry[1]) +
                 open_time_str +
                 str(entry[3]) +
                 new_pl_currency +
@@ -192,8 +216,8 @@ class V24V25UpgradeHelper():
             new_fee_asset = self.get_new_asset_identifier_if_existing(entry[8])
             # formulate the new DB identifier primary key. Copy the identifier() functionality
             new_id_string = (
-                str(Location.deserialize_from_db(entry[1])) +
-                str(AssetMovementCategory.deserialize_from_db(entry[2])) +
+                db_enum_str(Location, entry[1]) +
+                db_enum_str(AssetMovementCategory, entry[2]) +
                 str(entry[5]) +
                 new_asset +
                 new_fee_asset +
@@ -222,43 +246,15 @@ class V24V25UpgradeHelper():
             new_tuples,
         )
 
-    def update_ledger_actions(self, cursor: 'Cursor') -> None:
+    @staticmethod
+    def update_ledger_actions(cursor: 'Cursor') -> None:
         """Upgrades the ledger_actions table
 
         Upgrades it to have an optional rate and asset
         and to also upgrade old asset to the new identifier schema for eth tokens
         """
-        # Get old data and transform to the new schema
-        query = cursor.execute(
-            'SELECT identifier, '
-            '       timestamp, '
-            '       type, '
-            '       location, '
-            '       amount, '
-            '       asset, '
-            '       link, '
-            '       notes from ledger_actions; ',
-        )
-        new_tuples = []
-        for entry in query:
-            asset_id = self.get_new_asset_identifier_if_existing(entry[5])
-            link = None if entry[6] == '' else entry[6]
-            notes = None if entry[7] == '' else entry[7]
-            new_tuples.append((
-                entry[0],  # identifier
-                entry[1],  # timestamp
-                entry[2],  # type
-                entry[3],  # location
-                entry[4],  # amount
-                asset_id,
-                None,      # rate
-                None,      # rate asset
-                link,
-                notes,
-            ))
-
-        # Upgrade the table
-        cursor.execute('DROP TABLE IF EXISTS ledger_actions;')
+        cursor.execute('CREATE TEMP TABLE ledger_actions_old AS SELECT * FROM ledger_actions;')
+        cursor.execute('DROP TABLE ledger_actions;')
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS ledger_actions (
         identifier INTEGER NOT NULL PRIMARY KEY,
@@ -273,9 +269,8 @@ class V24V25UpgradeHelper():
         notes TEXT
         );
         """)
-
-        # Insert the new data
-        executestr = """
+        # Move the data to the new schema
+        cursor.execute("""
         INSERT INTO ledger_actions(
               identifier,
               timestamp,
@@ -287,9 +282,11 @@ class V24V25UpgradeHelper():
               rate_asset,
               link,
               notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        cursor.executemany(executestr, new_tuples)
+            SELECT identifier, timestamp, type, location, amount, COALESCE(new_id, asset),
+            NULL, NULL, NULLIF(link, ''), NULLIF(notes, '')
+            FROM temp.ledger_actions_old LEFT JOIN temp.v25_asset_ids ON asset=old_id
+        """)
+        cursor.execute('DROP TABLE temp.ledger_actions_old;')
 
     def update_trades(self, cursor: 'Cursor') -> None:
         """Upgrades the trades table to use base/quote asset instead of a pair
@@ -325,12 +322,9 @@ class V24V25UpgradeHelper():
                 )
                 continue
 
-            new_id = self.get_new_asset_identifier(base)
-            new_base = new_id if new_id else base
-            new_id = self.get_new_asset_identifier(quote)
-            new_quote = new_id if new_id else quote
-            new_id = self.get_new_asset_identifier(entry[8])
-            new_fee_currency = new_id if new_id else entry[8]
+            new_base = self.get_new_asset_identifier_if_existing(base)
+            new_quote = self.get_new_asset_identifier_if_existing(quote)
+            new_fee_currency = self.get_new_asset_identifier_if_existing(entry[8])
             timestamp = entry[1]
             amount = entry[5]
             rate = entry[6]
@@ -339,9 +333,9 @@ class V24V25UpgradeHelper():
             notes = None if entry[10] == '' else entry[10]
             # Copy the identifier() functionality. This identifier does not sound like a good idea
             new_trade_id_string = (
-                str(Location.deserialize_from_db(entry[2])) +
+                db_enum_str(Location, entry[2]) +
                 str(timestamp) +
-                str(TradeType.deserialize_from_db(entry[4])) +
+                db_enum_str(TradeType, entry[4]) +
                 new_base +
                 new_quote +
                 amount +
@@ -409,7 +403,10 @@ def delete_icons_cache(icons_directory: Path) -> None:
             entry.unlink()
 
 
-def upgrade_v24_to_v25(db: 'DBHandler') -> None:
+def upgrade_v24_to_v25(
+        db: 'DBHandler',
+        progress_handler: 'DBUpgradeProgressHandler',
+) -> None:
     """Upgrades the DB from v24 to v25.
 
     - Deletes data from all tables that may contain assset ids or trade pairs
@@ -444,6 +441,7 @@ def upgrade_v24_to_v25(db: 'DBHandler') -> None:
 
     -> Remember to also clear relevant used_query_ranges
     """
+    progress_handler.set_total_steps(8)
     helper = V24V25UpgradeHelper(db.msg_aggregator)
     cursor = db.conn.cursor()
     # Firstly let's clear tables we can easily repopulate with new data
@@ -488,17 +486,28 @@ def upgrade_v24_to_v25(db: 'DBHandler') -> None:
     cursor.execute('DELETE from asset_movements where location IN ("G", "K");')
     cursor.execute('DELETE from used_query_ranges where name LIKE "coinbase%";')
 
+    progress_handler.new_step()
+
     # Update tables that need updating
+    helper.create_asset_id_mappings(cursor)
     helper.update_multisettings(cursor)
-    helper.update_timed_balances(cursor)
     helper.update_manually_tracked_balances(cursor)
+    progress_handler.new_step()
+    helper.update_timed_balances(cursor)
+    progress_handler.new_step()
     helper.update_margin_positions(cursor)
+    progress_handler.new_step()
     helper.update_asset_movements(cursor)
+    progress_handler.new_step()
     helper.update_ledger_actions(cursor)
+    cursor.execute('DROP TABLE temp.v25_asset_ids;')
+    progress_handler.new_step()
     helper.update_trades(cursor)
+    progress_handler.new_step()
 
     delete_icons_cache(db.user_data_dir.parent / 'icons')
     shutil.rmtree(db.user_data_dir.parent / 'price_history', ignore_errors=True)
+    progress_handler.new_step()
 
     del helper
     db.conn.commit()
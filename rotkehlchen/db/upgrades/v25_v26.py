@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Set
+from typing import TYPE_CHECKING, List
 
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.user_messages import MessagesAggregator
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from sqlite3 import Connection, Cursor
 
     from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.db.upgrade_manager import DBUpgradeProgressHandler
 
 
 class V25V26UpgradeHelper():
@@ -132,261 +133,198 @@ class V25V26UpgradeHelper():
         cursor.execute('DELETE FROM trades WHERE location = "S";')
         cursor.execute('DELETE FROM asset_movements WHERE location = "S";')
 
-    def _process_asset_identifiers(
+    def _add_unknown_assets(
             self,
             cursor: 'Cursor',
-            asset_ids: Set[str],
             table_name: str,
+            columns: List[str],
     ) -> None:
-        """Processes the given asset ids of an entry and determines if the entry can be used.
+        """Adds the asset ids of the table that are not in the global DB to the user DB assets
 
-        If an asset can't be found in the global db False is returned and warning logged.
+        So that the entries of the table are not deleted. A warning is logged for each
+        such asset the first time it is found.
         """
-        asset_ids = asset_ids - {None}  # remove empty identifiers
-        if asset_ids.issubset(self.all_asset_ids):
-            return
-
-        for asset_id in asset_ids:
-            if asset_id not in self.all_asset_ids:
-                # Add it to the user DB assets, even though it's not in the global DB
-                # assets, so the entry is not deleted
-                cursor.execute(
-                    'INSERT OR IGNORE INTO assets(identifier) VALUES(?);',
-                    (asset_id,),
-                )
-                self.all_asset_ids.add(asset_id)
-                self.msg_aggregator.add_warning(
-                    f'During v25 -> v26 DB upgrade found {table_name} entry of unknown asset '
-                    f'{asset_id}. The entry is going to be transferred into the newDB '
-                    f'but will need to be fixed using the replace functionality.',
-                )
-                return
-
-    def upgrade_timed_balances(self, cursor: 'Cursor') -> None:
+        asset_ids = ' UNION '.join(f'SELECT {x} AS asset_id FROM {table_name}' for x in columns)
         query = cursor.execute(
-            'SELECT category, time, currency, amount, usd_value FROM timed_balances;',
+            f'SELECT DISTINCT asset_id FROM ({asset_ids}) WHERE asset_id IS NOT NULL AND '
+            f'asset_id NOT IN (SELECT identifier FROM assets);',
         )
-        old_tuples = query.fetchall()
-        cursor.execute('DROP TABLE IF EXISTS timed_balances;')
-        new_tuples = []
-        for entry in old_tuples:
-            self._process_asset_identifiers(
-                cursor=cursor,
-                asset_ids={entry[2]},
-                table_name='timed_balances',
-            )
-            new_tuples.append(entry)
-
-        # create the new table and insert all values into it
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS timed_balances (
-            category CHAR(1) NOT NULL DEFAULT('A') REFERENCES balance_category(category),
-            time INTEGER,
-            currency TEXT,
-            amount TEXT,
-            usd_value TEXT,
-            FOREIGN KEY(currency) REFERENCES assets(identifier) ON UPDATE CASCADE,
-            PRIMARY KEY (time, currency, category)
-        );
-        """)
+        unknown_ids = [x[0] for x in query]
         cursor.executemany(
-            'INSERT INTO timed_balances(category, time, currency, amount, usd_value) '
-            'VALUES(?, ?, ?, ?, ?);',
-            new_tuples,
-        )
-
-    def upgrade_manually_tracked_balances(self, cursor: 'Cursor') -> None:
-        query = cursor.execute(
-            'SELECT asset, label, amount, location FROM manually_tracked_balances;',
+            'INSERT OR IGNORE INTO assets(identifier) VALUES(?);',
+            [(x,) for x in unknown_ids],
         )
-        old_tuples = query.fetchall()
-        cursor.execute('DROP TABLE IF EXISTS manually_tracked_balances;')
-        new_tuples = []
-        for entry in old_tuples:
-            self._process_asset_identifiers(
-                cursor=cursor,
-                asset_ids={entry[0]},
-                table_name='manually_tracked_balances',
+        for asset_id in unknown_ids:
+            self.msg_aggregator.add_warning(
+                f'During v25 -> v26 DB upgrade found {table_name} entry of unknown asset '
+                f'{asset_id}. The entry is going to be transferred into the newDB '
+                f'but will need to be fixed using the replace functionality.',
             )
-            new_tuples.append(entry)
 
-        # create the new table and insert all values into it
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS manually_tracked_balances (
-            asset TEXT NOT NULL,
-            label TEXT NOT NULL PRIMARY KEY,
-            amount TEXT,
-            location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
-            FOREIGN KEY(asset) REFERENCES assets(identifier) ON UPDATE CASCADE
-        );
-        """)
-        cursor.executemany(
-            'INSERT INTO manually_tracked_balances(asset, label, amount, location) '
-            'VALUES(?, ?, ?, ?);',
-            new_tuples,
+    def _upgrade_table(
+            self,
+            cursor: 'Cursor',
+            table_name: str,
+            asset_columns: List[str],
+            create_table: str,
+            columns: str,
+    ) -> None:
+        """Recreates the table with the given statement and moves all of its rows to it"""
+        self._add_unknown_assets(cursor=cursor, table_name=table_name, columns=asset_columns)
+        cursor.execute(f'CREATE TEMP TABLE {table_name}_old AS SELECT * FROM {table_name};')
+        cursor.execute(f'DROP TABLE {table_name};')
+        cursor.execute(create_table)
+        cursor.execute(
+            f'INSERT INTO {table_name}({columns}) SELECT {columns} FROM temp.{table_name}_old;',
         )
+        cursor.execute(f'DROP TABLE temp.{table_name}_old;')
 
-    def upgrade_margin_positions(self, cursor: 'Cursor') -> None:
-        query = cursor.execute(
-            'SELECT id, location, open_time, close_time, profit_loss, pl_currency, fee, fee_currency, link, notes FROM margin_positions;',  # noqa: E501
+    def upgrade_timed_balances(self, cursor: 'Cursor') -> None:
+        self._upgrade_table(
+            cursor=cursor,
+            table_name='timed_balances',
+            asset_columns=['currency'],
+            create_table="""
+            CREATE TABLE IF NOT EXISTS timed_balances (
+                category CHAR(1) NOT NULL DEFAULT('A') REFERENCES balance_category(category),
+                time INTEGER,
+                currency TEXT,
+                amount TEXT,
+                usd_value TEXT,
+                FOREIGN KEY(currency) REFERENCES assets(identifier) ON UPDATE CASCADE,
+                PRIMARY KEY (time, currency, category)
+            );
+            """,
+            columns='category, time, currency, amount, usd_value',
         )
-        old_tuples = query.fetchall()
-        cursor.execute('DROP TABLE IF EXISTS margin_positions;')
-        new_tuples = []
-        for entry in old_tuples:
-            self._process_asset_identifiers(
-                cursor=cursor,
-                asset_ids={entry[5], entry[7]},
-                table_name='margin_positions',
-            )
-            new_tuples.append(entry)
 
-        # create the new table and insert all values into it
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS margin_positions (
-            id TEXT PRIMARY KEY,
-            location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
-            open_time INTEGER,
-            close_time INTEGER,
-            profit_loss TEXT,
-            pl_currency TEXT NOT NULL,
-            fee TEXT,
-            fee_currency TEXT,
-            link TEXT,
-            notes TEXT,
-            FOREIGN KEY(pl_currency) REFERENCES assets(identifier) ON UPDATE CASCADE,
-            FOREIGN KEY(fee_currency) REFERENCES assets(identifier) ON UPDATE CASCADE
-        );
-        """)
-        cursor.executemany(
-            'INSERT INTO margin_positions('
-            'id, location, open_time, close_time, profit_loss, pl_currency, fee, '
-            'fee_currency, link, notes'
-            ') VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?);',
-            new_tuples,
+    def upgrade_manually_tracked_balances(self, cursor: 'Cursor') -> None:
+        self._upgrade_table(
+            cursor=cursor,
+            table_name='manually_tracked_balances',
+            asset_columns=['asset'],
+            create_table="""
+            CREATE TABLE IF NOT EXISTS manually_tracked_balances (
+                asset TEXT NOT NULL,
+                label TEXT NOT NULL PRIMARY KEY,
+                amount TEXT,
+                location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
+                FOREIGN KEY(asset) REFERENCES assets(identifier) ON UPDATE CASCADE
+            );
+            """,
+            columns='asset, label, amount, location',
         )
 
-    def upgrade_asset_movements(self, cursor: 'Cursor') -> None:
-        query = cursor.execute(
-            'SELECT id, location, category, address, transaction_id, time, asset, amount, fee_asset, fee, link FROM asset_movements;',  # noqa: E501
+    def upgrade_margin_positions(self, cursor: 'Cursor') -> None:
+        self._upgrade_table(
+            cursor=cursor,
+            table_name='margin_positions',
+            asset_columns=['pl_currency', 'fee_currency'],
+            create_table="""
+            CREATE TABLE IF NOT EXISTS margin_positions (
+                id TEXT PRIMARY KEY,
+                location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
+                open_time INTEGER,
+                close_time INTEGER,
+                profit_loss TEXT,
+                pl_currency TEXT NOT NULL,
+                fee TEXT,
+                fee_currency TEXT,
+                link TEXT,
+                notes TEXT,
+                FOREIGN KEY(pl_currency) REFERENCES assets(identifier) ON UPDATE CASCADE,
+                FOREIGN KEY(fee_currency) REFERENCES assets(identifier) ON UPDATE CASCADE
+            );
+            """,
+            columns=(
+                'id, location, open_time, close_time, profit_loss, '
+                'pl_currency, fee, fee_currency, link, notes'
+            ),
         )
-        old_tuples = query.fetchall()
-        cursor.execute('DROP TABLE IF EXISTS asset_movements;')
-        new_tuples = []
-        for entry in old_tuples:
-            self._process_asset_identifiers(
-                cursor=cursor,
-                asset_ids={entry[6], entry[8]},
-                table_name='asset_movements',
-            )
-            new_tuples.append(entry)
 
-        # create the new table and insert all values into it
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS asset_movements (
-            id TEXT PRIMARY KEY,
-            location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
-            category CHAR(1) NOT NULL DEFAULT('A') REFERENCES asset_movement_category(category),
-            address TEXT,
-            transaction_id TEXT,
-            time INTEGER,
-            asset TEXT NOT NULL,
-            amount TEXT,
-            fee_asset TEXT,
-            fee TEXT,
-            link TEXT,
-            FOREIGN KEY(asset) REFERENCES assets(identifier) ON UPDATE CASCADE,
-            FOREIGN KEY(fee_asset) REFERENCES assets(identifier) ON UPDATE CASCADE
-        );
-        """)
-        cursor.executemany(
-            'INSERT INTO asset_movements('
-            'id, location, category, address, transaction_id, time, '
-            'asset, amount, fee_asset, fee, link'
-            ') VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);',
-            new_tuples,
+    def upgrade_asset_movements(self, cursor: 'Cursor') -> None:
+        self._upgrade_table(
+            cursor=cursor,
+            table_name='asset_movements',
+            asset_columns=['asset', 'fee_asset'],
+            create_table="""
+            CREATE TABLE IF NOT EXISTS asset_movements (
+                id TEXT PRIMARY KEY,
+                location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
+                category CHAR(1) NOT NULL DEFAULT('A') REFERENCES asset_movement_category(category),
+                address TEXT,
+                transaction_id TEXT,
+                time INTEGER,
+                asset TEXT NOT NULL,
+                amount TEXT,
+                fee_asset TEXT,
+                fee TEXT,
+                link TEXT,
+                FOREIGN KEY(asset) REFERENCES assets(identifier) ON UPDATE CASCADE,
+                FOREIGN KEY(fee_asset) REFERENCES assets(identifier) ON UPDATE CASCADE
+            );
+            """,  # noqa: E501
+            columns=(
+                'id, location, category, address, transaction_id, '
+                'time, asset, amount, fee_asset, fee, link'
+            ),
         )
 
     def upgrade_ledger_actions(self, cursor: 'Cursor') -> None:
-        query = cursor.execute(
-            'SELECT identifier, timestamp, type, location, amount, asset, rate, rate_asset, link, notes FROM ledger_actions;',  # noqa: E501
-        )
-        old_tuples = query.fetchall()
-        cursor.execute('DROP TABLE IF EXISTS ledger_actions;')
-        new_tuples = []
-        for entry in old_tuples:
-            self._process_asset_identifiers(
-                cursor=cursor,
-                asset_ids={entry[5], entry[7]},
-                table_name='ledger_actions',
-            )
-            new_tuples.append(entry)
-
-        # create the new table and insert all values into it
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS ledger_actions (
-            identifier INTEGER NOT NULL PRIMARY KEY,
-            timestamp INTEGER NOT NULL,
-            type CHAR(1) NOT NULL DEFAULT('A') REFERENCES ledger_action_type(type),
-            location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
-            amount TEXT NOT NULL,
-            asset TEXT NOT NULL,
-            rate TEXT,
-            rate_asset TEXT,
-            link TEXT,
-            notes TEXT,
-            FOREIGN KEY(asset) REFERENCES assets(identifier) ON UPDATE CASCADE,
-            FOREIGN KEY(rate_asset) REFERENCES assets(identifier) ON UPDATE CASCADE
-        );
-        """)
-        cursor.executemany(
-            'INSERT INTO ledger_actions('
-            'identifier, timestamp, type, location, amount, asset, rate, rate_asset, link, notes'
-            ') VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?);',
-            new_tuples,
+        self._upgrade_table(
+            cursor=cursor,
+            table_name='ledger_actions',
+            asset_columns=['asset', 'rate_asset'],
+            create_table="""
+            CREATE TABLE IF NOT EXISTS ledger_actions (
+                identifier INTEGER NOT NULL PRIMARY KEY,
+                timestamp INTEGER NOT NULL,
+                type CHAR(1) NOT NULL DEFAULT('A') REFERENCES ledger_action_type(type),
+                location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
+                amount TEXT NOT NULL,
+                asset TEXT NOT NULL,
+                rate TEXT,
+                rate_asset TEXT,
+                link TEXT,
+                notes TEXT,
+                FOREIGN KEY(asset) REFERENCES assets(identifier) ON UPDATE CASCADE,
+                FOREIGN KEY(rate_asset) REFERENCES assets(identifier) ON UPDATE CASCADE
+            );
+            """,
+            columns=(
+                'identifier, timestamp, type, location, amount, '
+                'asset, rate, rate_asset, link, notes'
+            ),
         )
 
     def upgrade_trades(self, cursor: 'Cursor') -> None:
-        query = cursor.execute(
-            'SELECT id, time, location, base_asset, quote_asset, type, amount, rate, fee, fee_currency, link, notes FROM trades;',  # noqa: E501
-        )
-        old_tuples = query.fetchall()
-        cursor.execute('DROP TABLE IF EXISTS trades;')
-        new_tuples = []
-        for entry in old_tuples:
-            self._process_asset_identifiers(
-                cursor=cursor,
-                asset_ids={entry[3], entry[4], entry[9]},
-                table_name='trades',
-            )
-            new_tuples.append(entry)
-
-        # create the new table and insert all values into it
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS trades (
-            id TEXT PRIMARY KEY NOT NULL,
-            time INTEGER NOT NULL,
-            location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
-            base_asset TEXT NOT NULL,
-            quote_asset TEXT NOT NULL,
-            type CHAR(1) NOT NULL DEFAULT ('A') REFERENCES trade_type(type),
-            amount TEXT NOT NULL,
-            rate TEXT NOT NULL,
-            fee TEXT,
-            fee_currency TEXT,
-            link TEXT,
-            notes TEXT,
-            FOREIGN KEY(base_asset) REFERENCES assets(identifier) ON UPDATE CASCADE,
-            FOREIGN KEY(quote_asset) REFERENCES assets(identifier) ON UPDATE CASCADE,
-            FOREIGN KEY(fee_currency) REFERENCES assets(identifier) ON UPDATE CASCADE
-        );
-        """)
-        cursor.executemany(
-            'INSERT INTO trades('
-            'id, time, location, base_asset, quote_asset, type, '
-            'amount, rate, fee, fee_currency, link, notes'
-            ') VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);',
-            new_tuples,
+        self._upgrade_table(
+            cursor=cursor,
+            table_name='trades',
+            asset_columns=['base_asset', 'quote_asset', 'fee_currency'],
+            create_table="""
+            CREATE TABLE IF NOT EXISTS trades (
+                id TEXT PRIMARY KEY NOT NULL,
+                time INTEGER NOT NULL,
+                location CHAR(1) NOT NULL DEFAULT('A') REFERENCES location(location),
+                base_asset TEXT NOT NULL,
+                quote_asset TEXT NOT NULL,
+                type CHAR(1) NOT NULL DEFAULT ('A') REFERENCES trade_type(type),
+                amount TEXT NOT NULL,
+                rate TEXT NOT NULL,
+                fee TEXT,
+                fee_currency TEXT,
+                link TEXT,
+                notes TEXT,
+                FOREIGN KEY(base_asset) REFERENCES assets(identifier) ON UPDATE CASCADE,
+                FOREIGN KEY(quote_asset) REFERENCES assets(identifier) ON UPDATE CASCADE,
+                FOREIGN KEY(fee_currency) REFERENCES assets(identifier) ON UPDATE CASCADE
+            );
+            """,
+            columns=(
+                'id, time, location, base_asset, quote_asset, type, '
+                'amount, rate, fee, fee_currency, link, notes'
+            ),
         )
 
     def introduce_assets_table(self, cursor: 'Cursor') -> None:
@@ -492,15 +430,28 @@ class V25V26UpgradeHelper():
         """)
         cursor.execute('DELETE FROM ethereum_accounts_details;')
 
-        self.upgrade_timed_balances(cursor)
-        self.upgrade_manually_tracked_balances(cursor)
-        self.upgrade_margin_positions(cursor)
-        self.upgrade_asset_movements(cursor)
-        self.upgrade_ledger_actions(cursor)
-        self.upgrade_trades(cursor)
-
-
-def upgrade_v25_to_v26(db: 'DBHandler') -> None:
+    def upgrade_asset_tables(
+            self,
+            cursor: 'Cursor',
+            progress_handler: 'DBUpgradeProgressHandler',
+    ) -> None:
+        """Upgrades the tables with asset ids that are kept to refer to the assets table"""
+        for upgrade_table in (
+                self.upgrade_timed_balances,
+                self.upgrade_manually_tracked_balances,
+                self.upgrade_margin_positions,
+                self.upgrade_asset_movements,
+                self.upgrade_ledger_actions,
+                self.upgrade_trades,
+        ):
+            upgrade_table(cursor)
+            progress_handler.new_step()
+
+
+def upgrade_v25_to_v26(
+        db: 'DBHandler',
+        progress_handler: 'DBUpgradeProgressHandler',
+) -> None:
     """Upgrades the DB from v25 to v26
 
     - Upgrades the user_credentials table to have a name and location
@@ -514,6 +465,7 @@ def upgrade_v25_to_v26(db: 'DBHandler') -> None:
     - Delete the unused anonymized logs setting from the DB
     - Introduce assets table and foreign key relationships for assets
     """
+    progress_handler.set_total_steps(8)
     helper = V25V26UpgradeHelper(db.msg_aggregator)
     helper.create_tables(db.conn)
     cursor = db.conn.cursor()
@@ -521,6 +473,9 @@ def upgrade_v25_to_v26(db: 'DBHandler') -> None:
     helper.migrate_kraken_account_type(cursor)
     helper.purge_binanceus(cursor)
     cursor.execute('DELETE from settings WHERE name="anonymized_logs";')
+    progress_handler.new_step()
     helper.introduce_assets_table(cursor)
+    progress_handler.new_step()
+    helper.upgrade_asset_tables(cursor=cursor, progress_handler=progress_handler)
     del helper
     db.conn.commit()
@@ -1,10 +1,493 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
+
+from rotkehlchen.constants.misc import NFT_DIRECTIVE, ZERO
+from rotkehlchen.fval import FVal
 
 if TYPE_CHECKING:
     from rotkehlchen.db.dbhandler import DBHandler
+    from rotkehlchen.db.upgrade_manager import DBUpgradeProgressHandler
+
+
+def _add_balance_snapshot_summaries(db: 'DBHandler') -> None:
+    """Summarize the already saved balance snapshots from their total location entries"""
+    cursor = db.conn.cursor()
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS balance_snapshot_summaries (
+    time INTEGER NOT NULL PRIMARY KEY,
+    usd_value TEXT NOT NULL,
+    usd_value_without_nfts TEXT NOT NULL
+    );""")
+    nft_values: Dict[int, FVal] = {}
+    query = cursor.execute(
+        'SELECT time, usd_value FROM timed_balances WHERE currency LIKE ?;',
+        (f'{NFT_DIRECTIVE}%',),
+    )
+    for time, usd_value in query:
+        nft_values[time] = nft_values.get(time, ZERO) + FVal(usd_value)
+
+    summaries = []
+    query = cursor.execute('SELECT time, usd_value FROM timed_location_data WHERE location="H";')
+    for time, usd_value in query:
+        nfts_usd_value = nft_values.get(time)
+        if nfts_usd_value is None:
+            summaries.append((time, usd_value, usd_value))
+        else:
+            summaries.append((time, usd_value, str(FVal(usd_value) - nfts_usd_value)))
+    cursor.executemany(
+        'INSERT OR IGNORE INTO balance_snapshot_summaries(time, usd_value, usd_value_without_nfts) '  # noqa: E501
+        'VALUES(?, ?, ?);',
+        summaries,
+    )
+
+
+def _upgrade_ethtx_receipt_logs(db: 'DBHandler') -> None:
+    """Move the addresses and topics of the receipt logs to the dictionary tables"""
+    cursor = db.conn.cursor()
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS ethtx_addresses (
+    id INTEGER NOT NULL PRIMARY KEY,
+    address TEXT NOT NULL UNIQUE
+    );""")
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS ethtx_topics (
+    id INTEGER NOT NULL PRIMARY KEY,
+    topic BLOB NOT NULL UNIQUE
+    );""")
+    cursor.execute(
+        'INSERT OR IGNORE INTO ethtx_addresses(address) '
+        'SELECT DISTINCT address FROM ethtx_receipt_logs;',
+    )
+    cursor.execute(
+        'INSERT OR IGNORE INTO ethtx_topics(topic) '
+        'SELECT DISTINCT topic FROM ethtx_receipt_log_topics;',
+    )
+    cursor.execute('ALTER TABLE ethtx_receipt_log_topics RENAME TO ethtx_receipt_log_topics_old;')  # noqa: E501
+    cursor.execute('ALTER TABLE ethtx_receipt_logs RENAME TO ethtx_receipt_logs_old;')
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS ethtx_receipt_logs (
+    tx_hash BLOB NOT NULL,
+    log_index INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    address_id INTEGER NOT NULL,
+    removed INTEGER NOT NULL CHECK (removed IN (0, 1)),
+    FOREIGN KEY(tx_hash) REFERENCES ethtx_receipts(tx_hash) ON DELETE CASCADE ON UPDATE CASCADE,
+    FOREIGN KEY(address_id) REFERENCES ethtx_addresses(id),
+    PRIMARY KEY(tx_hash, log_index)
+    );""")  # noqa: E501
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS ethtx_receipt_log_topics (
+    tx_hash BLOB NOT NULL,
+    log_index INTEGER NOT NULL,
+    topic_id INTEGER NOT NULL,
+    topic_index INTEGER NOT NULL,
+    FOREIGN KEY(tx_hash, log_index) REFERENCES ethtx_receipt_logs(tx_hash, log_index) ON DELETE CASCADE ON UPDATE CASCADE,
+    FOREIGN KEY(topic_id) REFERENCES ethtx_topics(id),
+    PRIMARY KEY(tx_hash, log_index, topic_index)
+    );""")  # noqa: E501
+    cursor.execute(
+        'INSERT INTO ethtx_receipt_logs(tx_hash, log_index, data, address_id, removed) '
+        'SELECT tx_hash, log_index, data, ethtx_addresses.id, removed '
+        'FROM ethtx_receipt_logs_old INNER JOIN ethtx_addresses '
+        'ON ethtx_receipt_logs_old.address=ethtx_addresses.address;',
+    )
+    cursor.execute(
+        'INSERT INTO ethtx_receipt_log_topics(tx_hash, log_index, topic_id, topic_index) '
+        'SELECT tx_hash, log_index, ethtx_topics.id, topic_index '
+        'FROM ethtx_receipt_log_topics_old INNER JOIN ethtx_topics '
+        'ON ethtx_receipt_log_topics_old.topic=ethtx_topics.topic;',
+    )
+    cursor.execute('DROP TABLE ethtx_receipt_log_topics_old;')
+    cursor.execute('DROP TABLE ethtx_receipt_logs_old;')
+
+
+def _add_owned_assets(db: 'DBHandler') -> None:
+    """Add the owned assets table along with the triggers that keep it current and
+    count the assets of the already saved history"""
+    cursor = db.conn.cursor()
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS owned_assets (
+    identifier TEXT NOT NULL PRIMARY KEY,
+    ref_count INTEGER NOT NULL
+    );""")
+    cursor.executescript("""
+    CREATE TRIGGER IF NOT EXISTS owned_assets_aave_events_insert AFTER INSERT ON aave_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset1, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset1;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset2, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset2;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_aave_events_delete AFTER DELETE ON aave_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset1;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset1 AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset2;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset2 AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_aave_events_update_old AFTER UPDATE OF asset1, asset2 ON aave_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset1;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset1 AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset2;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset2 AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_aave_events_update_new AFTER UPDATE OF asset1, asset2 ON aave_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset1, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset1;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset2, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset2;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_yearn_vaults_events_insert AFTER INSERT ON yearn_vaults_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.from_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.from_asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.to_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.to_asset;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_yearn_vaults_events_delete AFTER DELETE ON yearn_vaults_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.from_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.from_asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.to_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.to_asset AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_yearn_vaults_events_update_old AFTER UPDATE OF from_asset, to_asset ON yearn_vaults_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.from_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.from_asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.to_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.to_asset AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_yearn_vaults_events_update_new AFTER UPDATE OF from_asset, to_asset ON yearn_vaults_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.from_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.from_asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.to_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.to_asset;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_manually_tracked_balances_insert AFTER INSERT ON manually_tracked_balances WHEN NEW.category != 'B'
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_manually_tracked_balances_delete AFTER DELETE ON manually_tracked_balances WHEN OLD.category != 'B'
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_manually_tracked_balances_update_old AFTER UPDATE OF asset, category ON manually_tracked_balances WHEN OLD.category != 'B'
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_manually_tracked_balances_update_new AFTER UPDATE OF asset, category ON manually_tracked_balances WHEN NEW.category != 'B'
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_trades_insert AFTER INSERT ON trades
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.base_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.base_asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.quote_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.quote_asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.fee_currency, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.fee_currency;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_trades_delete AFTER DELETE ON trades
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.base_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.base_asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.quote_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.quote_asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.fee_currency;
+        DELETE FROM owned_assets WHERE identifier = OLD.fee_currency AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_trades_update_old AFTER UPDATE OF base_asset, quote_asset, fee_currency ON trades
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.base_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.base_asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.quote_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.quote_asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.fee_currency;
+        DELETE FROM owned_assets WHERE identifier = OLD.fee_currency AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_trades_update_new AFTER UPDATE OF base_asset, quote_asset, fee_currency ON trades
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.base_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.base_asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.quote_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.quote_asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.fee_currency, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.fee_currency;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_margin_positions_insert AFTER INSERT ON margin_positions
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.pl_currency, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.pl_currency;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.fee_currency, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.fee_currency;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_margin_positions_delete AFTER DELETE ON margin_positions
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.pl_currency;
+        DELETE FROM owned_assets WHERE identifier = OLD.pl_currency AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.fee_currency;
+        DELETE FROM owned_assets WHERE identifier = OLD.fee_currency AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_margin_positions_update_old AFTER UPDATE OF pl_currency, fee_currency ON margin_positions
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.pl_currency;
+        DELETE FROM owned_assets WHERE identifier = OLD.pl_currency AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.fee_currency;
+        DELETE FROM owned_assets WHERE identifier = OLD.fee_currency AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_margin_positions_update_new AFTER UPDATE OF pl_currency, fee_currency ON margin_positions
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.pl_currency, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.pl_currency;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.fee_currency, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.fee_currency;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_asset_movements_insert AFTER INSERT ON asset_movements
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.fee_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.fee_asset;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_asset_movements_delete AFTER DELETE ON asset_movements
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.fee_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.fee_asset AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_asset_movements_update_old AFTER UPDATE OF asset, fee_asset ON asset_movements
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.fee_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.fee_asset AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_asset_movements_update_new AFTER UPDATE OF asset, fee_asset ON asset_movements
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.fee_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.fee_asset;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_ledger_actions_insert AFTER INSERT ON ledger_actions
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.rate_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.rate_asset;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_ledger_actions_delete AFTER DELETE ON ledger_actions
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.rate_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.rate_asset AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_ledger_actions_update_old AFTER UPDATE OF asset, rate_asset ON ledger_actions
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.asset AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.rate_asset;
+        DELETE FROM owned_assets WHERE identifier = OLD.rate_asset AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_ledger_actions_update_new AFTER UPDATE OF asset, rate_asset ON ledger_actions
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.asset;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.rate_asset, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.rate_asset;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_amm_swaps_insert AFTER INSERT ON amm_swaps
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token0_identifier, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token0_identifier;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token1_identifier, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token1_identifier;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_amm_swaps_delete AFTER DELETE ON amm_swaps
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token0_identifier;
+        DELETE FROM owned_assets WHERE identifier = OLD.token0_identifier AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token1_identifier;
+        DELETE FROM owned_assets WHERE identifier = OLD.token1_identifier AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_amm_swaps_update_old AFTER UPDATE OF token0_identifier, token1_identifier ON amm_swaps
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token0_identifier;
+        DELETE FROM owned_assets WHERE identifier = OLD.token0_identifier AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token1_identifier;
+        DELETE FROM owned_assets WHERE identifier = OLD.token1_identifier AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_amm_swaps_update_new AFTER UPDATE OF token0_identifier, token1_identifier ON amm_swaps
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token0_identifier, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token0_identifier;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token1_identifier, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token1_identifier;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_amm_events_insert AFTER INSERT ON amm_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token0_identifier, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token0_identifier;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token1_identifier, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token1_identifier;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_amm_events_delete AFTER DELETE ON amm_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token0_identifier;
+        DELETE FROM owned_assets WHERE identifier = OLD.token0_identifier AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token1_identifier;
+        DELETE FROM owned_assets WHERE identifier = OLD.token1_identifier AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_amm_events_update_old AFTER UPDATE OF token0_identifier, token1_identifier ON amm_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token0_identifier;
+        DELETE FROM owned_assets WHERE identifier = OLD.token0_identifier AND ref_count <= 0;
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token1_identifier;
+        DELETE FROM owned_assets WHERE identifier = OLD.token1_identifier AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_amm_events_update_new AFTER UPDATE OF token0_identifier, token1_identifier ON amm_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token0_identifier, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token0_identifier;
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token1_identifier, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token1_identifier;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_adex_events_insert AFTER INSERT ON adex_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_adex_events_delete AFTER DELETE ON adex_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token;
+        DELETE FROM owned_assets WHERE identifier = OLD.token AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_adex_events_update_old AFTER UPDATE OF token ON adex_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.token;
+        DELETE FROM owned_assets WHERE identifier = OLD.token AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_adex_events_update_new AFTER UPDATE OF token ON adex_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.token, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.token;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_balancer_events_insert AFTER INSERT ON balancer_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.pool_address_token, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.pool_address_token;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_balancer_events_delete AFTER DELETE ON balancer_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.pool_address_token;
+        DELETE FROM owned_assets WHERE identifier = OLD.pool_address_token AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_balancer_events_update_old AFTER UPDATE OF pool_address_token ON balancer_events
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.pool_address_token;
+        DELETE FROM owned_assets WHERE identifier = OLD.pool_address_token AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_balancer_events_update_new AFTER UPDATE OF pool_address_token ON balancer_events
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.pool_address_token, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.pool_address_token;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_timed_balances_insert AFTER INSERT ON timed_balances WHEN NEW.category != 'B'
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.currency, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.currency;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_timed_balances_delete AFTER DELETE ON timed_balances WHEN OLD.category != 'B'
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.currency;
+        DELETE FROM owned_assets WHERE identifier = OLD.currency AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_timed_balances_update_old AFTER UPDATE OF currency, category ON timed_balances WHEN OLD.category != 'B'
+    BEGIN
+        UPDATE owned_assets SET ref_count = ref_count - 1 WHERE identifier = OLD.currency;
+        DELETE FROM owned_assets WHERE identifier = OLD.currency AND ref_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS owned_assets_timed_balances_update_new AFTER UPDATE OF currency, category ON timed_balances WHEN NEW.category != 'B'
+    BEGIN
+        INSERT OR IGNORE INTO owned_assets(identifier, ref_count) VALUES(NEW.currency, 0);
+        UPDATE owned_assets SET ref_count = ref_count + 1 WHERE identifier = NEW.currency;
+    END;
+    """)  # noqa: E501
+    cursor.execute("""
+    INSERT INTO owned_assets(identifier, ref_count)
+    SELECT identifier, COUNT(*) FROM (
+        SELECT asset1 AS identifier FROM aave_events
+        UNION ALL
+        SELECT asset2 AS identifier FROM aave_events
+        UNION ALL
+        SELECT from_asset AS identifier FROM yearn_vaults_events
+        UNION ALL
+        SELECT to_asset AS identifier FROM yearn_vaults_events
+        UNION ALL
+        SELECT asset AS identifier FROM manually_tracked_balances WHERE category != 'B'
+        UNION ALL
+        SELECT base_asset AS identifier FROM trades
+        UNION ALL
+        SELECT quote_asset AS identifier FROM trades
+        UNION ALL
+        SELECT fee_currency AS identifier FROM trades
+        UNION ALL
+        SELECT pl_currency AS identifier FROM margin_positions
+        UNION ALL
+        SELECT fee_currency AS identifier FROM margin_positions
+        UNION ALL
+        SELECT asset AS identifier FROM asset_movements
+        UNION ALL
+        SELECT fee_asset AS identifier FROM asset_movements
+        UNION ALL
+        SELECT asset AS identifier FROM ledger_actions
+        UNION ALL
+        SELECT rate_asset AS identifier FROM ledger_actions
+        UNION ALL
+        SELECT token0_identifier AS identifier FROM amm_swaps
+        UNION ALL
+        SELECT token1_identifier AS identifier FROM amm_swaps
+        UNION ALL
+        SELECT token0_identifier AS identifier FROM amm_events
+        UNION ALL
+        SELECT token1_identifier AS identifier FROM amm_events
+        UNION ALL
+        SELECT token AS identifier FROM adex_events
+        UNION ALL
+        SELECT pool_address_token AS identifier FROM balancer_events
+        UNION ALL
+        SELECT currency AS identifier FROM timed_balances WHERE category != 'B'
+    ) WHERE identifier IS NOT NULL GROUP BY identifier;
+    """)
+
+
+def _enable_incremental_vacuum(db: 'DBHandler') -> None:
+    """Switch the DB to incremental auto vacuum
+
+    An existing DB only switches once it is rebuilt by a VACUUM, which can not run
+    inside a transaction, so this has to come after the rest of the upgrade is committed.
+    """
+    if db.conn.execute('PRAGMA auto_vacuum;').fetchone()[0] == 2:
+        return
+
+    db.conn.execute('PRAGMA auto_vacuum=INCREMENTAL;')
+    db.conn.execute('VACUUM;')
 
 
-def upgrade_v30_to_v31(db: 'DBHandler') -> None:
+def upgrade_v30_to_v31(
+        db: 'DBHandler',
+        progress_handler: 'DBUpgradeProgressHandler',
+) -> None:
     """Upgrades the DB from v30 to v31
 
     - Add the new eth2 validator table and upgrade the old ones to have foreign key relationships.
@@ -12,7 +495,13 @@ def upgrade_v30_to_v31(db: 'DBHandler') -> None:
     is the one specified by the backend.
     - Delete all kraken trades and their used query ranges since we can now also fetch app trades
     and insta trades which are only visible through the kraken ledger query.
+    - Add indexes for the columns the history queries filter and order by.
+    - Add the owned_assets table along with the triggers that maintain it and populate it.
+    - Add the balance_snapshot_summaries table and fill it in for the saved snapshots.
+    - Store the addresses and topics of the receipt logs once in dictionary tables.
+    - Rebuild the DB with incremental auto vacuum so that free pages can be given back.
     """
+    progress_handler.set_total_steps(7)
     cursor = db.conn.cursor()
     # Should exist -- but we are being extremely pedantic here
     ignored_actions_exists = cursor.execute(
@@ -33,6 +522,7 @@ def upgrade_v30_to_v31(db: 'DBHandler') -> None:
     # Delete kraken trades so they can be requeried
     cursor.execute('DELETE FROM trades WHERE location="B";')
     cursor.execute('DELETE FROM used_query_ranges WHERE name LIKE "kraken_trades_%";')
+    progress_handler.new_step()
 
     # Add all new tables
     cursor.execute('DROP TABLE IF EXISTS eth2_deposits;')
@@ -188,4 +678,33 @@ CREATE VIEW IF NOT EXISTS combined_trades_view AS
     type TEXT NOT NULL,
     subtype TEXT
     );""")
+    progress_handler.new_step()
+    # Add the indexes used by the history queries
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_time ON trades(time, id);')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_location_time ON trades(location, time, id);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_base_asset ON trades(base_asset);')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_quote_asset ON trades(quote_asset);')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_asset_movements_time ON asset_movements(time, id);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_asset_movements_location_time ON asset_movements(location, time, id);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_asset_movements_asset ON asset_movements(asset);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ledger_actions_timestamp ON ledger_actions(timestamp);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ledger_actions_location_timestamp ON ledger_actions(location, timestamp);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ledger_actions_asset ON ledger_actions(asset);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_events_timestamp ON history_events(timestamp);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_events_location_timestamp ON history_events(location, timestamp);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_history_events_asset ON history_events(asset);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_timed_balances_currency_time ON timed_balances(currency, time);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ethereum_transactions_timestamp ON ethereum_transactions(timestamp, tx_hash);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ethereum_transactions_from_address ON ethereum_transactions(from_address);')  # noqa: E501
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_ethereum_transactions_to_address ON ethereum_transactions(to_address);')  # noqa: E501
+    progress_handler.new_step()
+    # Add the owned assets table and count the assets of the existing history
+    _add_owned_assets(db)
+    progress_handler.new_step()
+    _add_balance_snapshot_summaries(db)
+    progress_handler.new_step()
+    _upgrade_ethtx_receipt_logs(db)
+    progress_handler.new_step()
     db.conn.commit()
+    _enable_incremental_vacuum(db)
+    progress_handler.new_step()
@@ -8,6 +8,8 @@ from rotkehlchen.accounting.structures import BalanceType
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.chain.substrate.typing import KusamaAddress, PolkadotAddress
 from rotkehlchen.chain.substrate.utils import is_valid_kusama_address, is_valid_polkadot_address
+from rotkehlchen.constants.misc import ZERO
+from rotkehlchen.fval import FVal
 from rotkehlchen.typing import (
     BlockchainAccountData,
     BTCAddress,
@@ -67,6 +69,12 @@ class LocationData(NamedTuple):
     usd_value: str
 
 
+class BalanceSnapshotSummary(NamedTuple):
+    time: Timestamp
+    usd_value: str
+    usd_value_without_nfts: str
+
+
 class Tag(NamedTuple):
     name: str
     description: Optional[str]
@@ -77,6 +85,25 @@ class Tag(NamedTuple):
         return self._asdict()  # pylint: disable=no-member
 
 
+class DecimalSum():
+    """SQLite aggregate that sums a column of decimal strings exactly
+
+    Registered as DECIMAL_SUM on the DB connections so that sums of amounts and
+    values avoid the float rounding of SUM(CAST(x AS REAL)).
+    """
+
+    def __init__(self) -> None:
+        self.total = ZERO
+
+    def step(self, value: Optional[str]) -> None:
+        if value is not None:
+            self.total += FVal(value)
+
+    def finalize(self) -> str:
+        # drop the trailing zeros the addition keeps without switching to exponent form
+        return f'{self.total.num.normalize():f}'
+
+
 def str_to_bool(s: str) -> bool:
     return s == 'True'
 
@@ -1,10 +1,23 @@
 from datetime import datetime
-from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
+)
 
 from rotkehlchen.assets.asset import Asset
 from rotkehlchen.assets.converters import asset_from_binance
 from rotkehlchen.crypto import sha3
-from rotkehlchen.errors import UnknownAsset
+from rotkehlchen.errors import InputError, UnknownAsset
 from rotkehlchen.fval import FVal
 from rotkehlchen.history.deserialization import deserialize_price
 from rotkehlchen.serialization.deserialize import (
@@ -32,6 +45,103 @@ def hash_id(hashable: str) -> TradeID:
     return TradeID(id_bytes.hex())
 
 
+T = TypeVar('T')
+V = TypeVar('V', bound='DBRowView')
+
+
+class DBRowField(Generic[T]):
+    """A field of a DBRowView deserialized from its DB column the first time it's accessed
+
+    The deserialized value is kept in the slot of the view named after the field with
+    an underscore prefix.
+    """
+
+    def __init__(self, column: str, deserialize: Callable[[Any], T]) -> None:
+        self.column = column
+        self.deserialize = deserialize
+        self.name = ''
+        self.slot: Any = None
+
+    def __set_name__(self, owner: Type['DBRowView'], name: str) -> None:
+        self.name = name
+        self.slot = owner.__dict__[f'_{name}']
+
+    @overload
+    def __get__(self, obj: None, objtype: Any) -> 'DBRowField[T]':
+        ...
+
+    @overload
+    def __get__(self, obj: 'DBRowView', objtype: Any) -> T:
+        ...
+
+    def __get__(self, obj: Optional['DBRowView'], objtype: Any = None) -> Any:
+        """May raise:
+        - AttributeError if the column of the field was not queried
+        - DeserializationError or UnknownAsset if the column's value is not valid
+        """
+        if obj is None:
+            return self
+
+        try:
+            return self.slot.__get__(obj, objtype)
+        except AttributeError:  # not accessed yet
+            pass
+
+        index = obj.column_indices.get(self.column)
+        if index is None:
+            raise AttributeError(
+                f'{self.name} of {type(obj).__name__} was not queried from the DB',
+            )
+        value = self.deserialize(obj.entry[index])
+        self.slot.__set__(obj, value)
+        return value
+
+
+class DBRowView():
+    """A view of a DB row that deserializes each field only when it's first accessed
+
+    For the queries whose consumers need only a few fields of each entry. The row may
+    contain only some of the columns, in which case accessing the other fields raises
+    an AttributeError. Subclasses define their fields as DBRowField class attributes
+    and a slot named as each field with an underscore prefix.
+    """
+    __slots__ = ('entry', 'column_indices')
+
+    def __init__(self, entry: Sequence[Any], column_indices: Dict[str, int]) -> None:
+        self.entry = entry
+        # Shared by all of the rows of a query
+        self.column_indices = column_indices
+
+    @classmethod
+    def columns_of(cls, fields: Optional[Sequence[str]]) -> List[str]:
+        """Returns the DB columns of the given fields or of all of the fields if None
+
+        May raise:
+        - InputError if any of the given fields is not a field of the view
+        """
+        if fields is None:
+            fields = [x for x, y in vars(cls).items() if isinstance(y, DBRowField)]
+
+        columns = []
+        for field in fields:
+            descriptor = vars(cls).get(field)
+            if not isinstance(descriptor, DBRowField):
+                raise InputError(f'{field} is not a field of {cls.__name__}')
+            columns.append(descriptor.column)
+
+        return columns
+
+    @classmethod
+    def from_rows(
+            cls: Type[V],
+            rows: List[Sequence[Any]],
+            columns: Sequence[str],
+    ) -> List[V]:
+        """Creates the views of the rows of a query that selected the given columns"""
+        column_indices = {column: idx for idx, column in enumerate(columns)}
+        return [cls(row, column_indices) for row in rows]
+
+
 AssetMovementDBTuple = Tuple[
     str,  # id
     str,  # location
@@ -112,6 +222,53 @@ class AssetMovement(NamedTuple):
         )
 
 
+class AssetMovementView(DBRowView):
+    """A lazily deserialized view of an asset movement DB row. Check DBRowView"""
+    __slots__ = (
+        '_identifier',
+        '_location',
+        '_category',
+        '_address',
+        '_transaction_id',
+        '_timestamp',
+        '_asset',
+        '_amount',
+        '_fee_asset',
+        '_fee',
+        '_link',
+    )
+    identifier = DBRowField('id', str)
+    location = DBRowField('location', Location.deserialize_from_db)
+    category = DBRowField('category', AssetMovementCategory.deserialize_from_db)
+    address = DBRowField('address', lambda x: x)
+    transaction_id = DBRowField('transaction_id', lambda x: x)
+    timestamp = DBRowField('time', deserialize_timestamp)
+    asset = DBRowField('asset', Asset)
+    amount = DBRowField('amount', deserialize_asset_amount)
+    fee_asset = DBRowField('fee_asset', Asset)
+    fee = DBRowField('fee', deserialize_fee)
+    link = DBRowField('link', lambda x: x)
+
+    def to_asset_movement(self) -> AssetMovement:
+        """May raise:
+            - AttributeError if not all of the fields were queried
+            - DeserializationError
+            - UnknownAsset
+        """
+        return AssetMovement(
+            location=self.location,
+            category=self.category,
+            address=self.address,
+            transaction_id=self.transaction_id,
+            timestamp=self.timestamp,
+            asset=self.asset,
+            amount=self.amount,
+            fee_asset=self.fee_asset,
+            fee=self.fee,
+            link=self.link,
+        )
+
+
 TradeDBTuple = Tuple[
     str,  # id
     int,  # time
@@ -226,6 +383,56 @@ class Trade(NamedTuple):
         )
 
 
+class TradeView(DBRowView):
+    """A lazily deserialized view of a trade DB row. Check DBRowView"""
+    __slots__ = (
+        '_identifier',
+        '_timestamp',
+        '_location',
+        '_base_asset',
+        '_quote_asset',
+        '_trade_type',
+        '_amount',
+        '_rate',
+        '_fee',
+        '_fee_currency',
+        '_link',
+        '_notes',
+    )
+    identifier = DBRowField('id', TradeID)
+    timestamp = DBRowField('time', deserialize_timestamp)
+    location = DBRowField('location', Location.deserialize_from_db)
+    base_asset = DBRowField('base_asset', Asset)
+    quote_asset = DBRowField('quote_asset', Asset)
+    trade_type = DBRowField('type', TradeType.deserialize_from_db)
+    amount = DBRowField('amount', deserialize_asset_amount)
+    rate = DBRowField('rate', deserialize_price)
+    fee = DBRowField('fee', lambda x: deserialize_optional(x, deserialize_fee))
+    fee_currency = DBRowField('fee_currency', lambda x: deserialize_optional(x, Asset))
+    link = DBRowField('link', lambda x: x)
+    notes = DBRowField('notes', lambda x: x)
+
+    def to_trade(self) -> Trade:
+        """May raise:
+            - AttributeError if not all of the fields were queried
+            - DeserializationError
+            - UnknownAsset
+        """
+        return Trade(
+            timestamp=self.timestamp,
+            location=self.location,
+            base_asset=self.base_asset,
+            quote_asset=self.quote_asset,
+            trade_type=self.trade_type,
+            amount=self.amount,
+            rate=self.rate,
+            fee=self.fee,
+            fee_currency=self.fee_currency,
+            link=self.link,
+            notes=self.notes,
+        )
+
+
 MarginPositionDBTuple = Tuple[
     str,  # id
     str,  # location
@@ -6,6 +6,7 @@ import requests
 from rotkehlchen.accounting.ledger_actions import LedgerAction
 from rotkehlchen.accounting.structures import Balance
 from rotkehlchen.assets.asset import Asset
+from rotkehlchen.assets.converters import load_exchange_symbols
 from rotkehlchen.db.filtering import (
     AssetMovementsFilterQuery,
     LedgerActionsFilterQuery,
@@ -61,6 +62,7 @@ class ExchangeInterface(CacheableMixIn, LockableQueryMixIn):
         self.first_connection_made = False
         self.session = requests.session()
         self.session.headers.update({'User-Agent': 'rotkehlchen'})
+        load_exchange_symbols(location)
         log.info(f'Initialized {str(location)} exchange {name}')
 
     def location_id(self) -> Tuple[str, Location]:
@@ -282,17 +284,18 @@ class ExchangeInterface(CacheableMixIn, LockableQueryMixIn):
                 end_ts=query_end_ts,
             )
 
-            # make sure to add them to the DB
-            if new_trades != []:
-                self.db.add_trades(new_trades)
-
-            # and also set the used queried timestamp range for the exchange
-            ranges.update_used_query_range(
-                location_string=location_string,
-                start_ts=queried_range[0],
-                end_ts=queried_range[1],
-                ranges_to_query=[queried_range],
-            )
+            with self.db.user_write():
+                # make sure to add them to the DB
+                if new_trades != []:
+                    self.db.add_trades(new_trades)
+
+                # and also set the used queried timestamp range for the exchange
+                ranges.update_used_query_range(
+                    location_string=location_string,
+                    start_ts=queried_range[0],
+                    end_ts=queried_range[1],
+                    ranges_to_query=[queried_range],
+                )
             # finally append them to the already returned DB trades
             trades.extend(new_trades)
 
@@ -329,16 +332,17 @@ class ExchangeInterface(CacheableMixIn, LockableQueryMixIn):
                 end_ts=query_end_ts,
             ))
 
-        # make sure to add them to the DB
-        if new_positions != []:
-            self.db.add_margin_positions(new_positions)
-        # and also set the last queried timestamp for the exchange
-        ranges.update_used_query_range(
-            location_string=location_string,
-            start_ts=start_ts,
-            end_ts=end_ts,
-            ranges_to_query=ranges_to_query,
-        )
+        with self.db.user_write():
+            # make sure to add them to the DB
+            if new_positions != []:
+                self.db.add_margin_positions(new_positions)
+            # and also set the last queried timestamp for the exchange
+            ranges.update_used_query_range(
+                location_string=location_string,
+                start_ts=start_ts,
+                end_ts=end_ts,
+                ranges_to_query=ranges_to_query,
+            )
         # finally append them to the already returned DB margin positions
         margin_positions.extend(new_positions)
 
@@ -387,14 +391,15 @@ class ExchangeInterface(CacheableMixIn, LockableQueryMixIn):
                 end_ts=query_end_ts,
             ))
 
-        if new_movements != []:
-            self.db.add_asset_movements(new_movements)
-        ranges.update_used_query_range(
-            location_string=location_string,
-            start_ts=start_ts,
-            end_ts=end_ts,
-            ranges_to_query=ranges_to_query,
-        )
+        with self.db.user_write():
+            if new_movements != []:
+                self.db.add_asset_movements(new_movements)
+            ranges.update_used_query_range(
+                location_string=location_string,
+                start_ts=start_ts,
+                end_ts=end_ts,
+                ranges_to_query=ranges_to_query,
+            )
         asset_movements.extend(new_movements)
 
         return asset_movements
@@ -436,14 +441,15 @@ class ExchangeInterface(CacheableMixIn, LockableQueryMixIn):
                 end_ts=query_end_ts,
             ))
 
-        if new_ledger_actions != []:
-            db.add_ledger_actions(new_ledger_actions)
-        ranges.update_used_query_range(
-            location_string=location_string,
-            start_ts=start_ts,
-            end_ts=end_ts,
-            ranges_to_query=ranges_to_query,
-        )
+        with self.db.user_write():
+            if new_ledger_actions != []:
+                db.add_ledger_actions(new_ledger_actions)
+            ranges.update_used_query_range(
+                location_string=location_string,
+                start_ts=start_ts,
+                end_ts=end_ts,
+                ranges_to_query=ranges_to_query,
+            )
         ledger_actions.extend(new_ledger_actions)
 
         return ledger_actions
@@ -316,14 +316,18 @@ class Etherscan(ExternalServiceWithApiKey):
             self,
             to_address: ChecksumEthAddress,
             input_data: str,
+            block_identifier: Union[int, Literal['latest']] = 'latest',
     ) -> str:
-        """Performs an eth_call on the given address and the given input data.
+        """Performs an eth_call on the given address and the given input data
+        at the state of the given block.
 
         May raise:
         - RemoteError if there are any problems with reaching Etherscan or if
         an unexpected response is returned
         """
         options = {'to': to_address, 'data': input_data}
+        if isinstance(block_identifier, int):  # etherscan's default tag is latest
+            options['tag'] = hex(block_identifier)
         result = self._query(
             module='proxy',
             action='eth_call',
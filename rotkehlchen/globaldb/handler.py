@@ -1,23 +1,41 @@
 import logging
 import shutil
 import sqlite3
+from collections import defaultdict
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 
 from typing_extensions import Literal
 
 from rotkehlchen.assets.asset import Asset, EthereumToken, UnderlyingToken
 from rotkehlchen.assets.typing import AssetData, AssetType
 from rotkehlchen.chain.ethereum.typing import string_to_ethereum_address
-from rotkehlchen.constants.assets import CONSTANT_ASSETS
+from rotkehlchen.constants import assets as constant_assets
 from rotkehlchen.constants.misc import NFT_DIRECTIVE
-from rotkehlchen.constants.resolver import ethaddress_to_identifier
+from rotkehlchen.constants.resolver import (
+    ETHEREUM_DIRECTIVE,
+    ETHEREUM_DIRECTIVE_LENGTH,
+    ethaddress_to_identifier,
+)
 from rotkehlchen.errors import DeserializationError, InputError, UnknownAsset
 from rotkehlchen.globaldb.upgrades.v1_v2 import upgrade_ethereum_asset_ids
 from rotkehlchen.history.typing import HistoricalPrice, HistoricalPriceOracle
 from rotkehlchen.logging import RotkehlchenLogsAdapter
 from rotkehlchen.typing import ChecksumEthAddress, Location, Timestamp
-from rotkehlchen.utils.misc import ts_now
+from rotkehlchen.utils.misc import get_chunks, ts_now
 
 from .schema import DB_SCRIPT_CREATE_TABLES
 
@@ -29,6 +47,14 @@ logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
 GLOBAL_DB_VERSION = 2
+# Keeps the number of bound parameters of a query below SQLite's limit
+ETHEREUM_TOKENS_QUERY_CHUNK_LENGTH = 500
+# How many contract call results are kept before the least recently used are evicted
+CONTRACT_CALL_RESULTS_MAX_ENTRIES = 100000
+# How many of the least recently used contract call results are evicted at once
+CONTRACT_CALL_RESULTS_EVICT_ENTRIES = 10000
+# The last use of a contract call result is only saved if it is older than this
+CONTRACT_CALL_RESULTS_LAST_USED_SECS = 3600
 
 
 def _get_setting_value(cursor: sqlite3.Cursor, name: str, default_value: int) -> int:
@@ -76,11 +102,29 @@ def _initialize_global_db_directory(data_dir: Path) -> sqlite3.Connection:
     return initialize_globaldb(dbname)
 
 
+def _refresh_assets_caches(
+        identifier: Optional[str] = None,
+        old_symbol: Optional[str] = None,
+) -> None:
+    """Refresh the caches derived from the assets after either a single or all assets
+    changed in the DB. For a single asset old_symbol is its symbol before the change."""
+    if identifier is None:
+        GlobalDBHandler.clear_assets_caches()
+    else:
+        GlobalDBHandler.refresh_asset_caches(identifier, old_symbol)
+    # TODO: figure out a way to move this out. Moved in here due to cyclic imports
+    from rotkehlchen.assets.resolver import AssetResolver  # isort:skip  # noqa: E501  # pylint: disable=import-outside-toplevel
+    AssetResolver().refresh_cache(identifier)
+
+
 class GlobalDBHandler():
     """A singleton class controlling the global DB"""
     __instance: Optional['GlobalDBHandler'] = None
     _data_directory: Optional[Path] = None
     _conn: sqlite3.Connection
+    _exchange_symbols: Dict[Location, Dict[str, str]]
+    _ethereum_tokens: Dict[ChecksumEthAddress, Optional[EthereumToken]]
+    _contract_call_results_count: Optional[int]
 
     def __new__(
             cls,
@@ -99,7 +143,14 @@ class GlobalDBHandler():
         GlobalDBHandler.__instance = object.__new__(cls)
         GlobalDBHandler.__instance._data_directory = data_dir
         GlobalDBHandler.__instance._conn = _initialize_global_db_directory(data_dir)
+        GlobalDBHandler.__instance._exchange_symbols = {}
+        GlobalDBHandler.__instance._ethereum_tokens = {}
+        GlobalDBHandler.__instance._contract_call_results_count = None
         _reload_constant_assets(GlobalDBHandler.__instance)
+        constant_assets.CONSTANT_ASSETS_RELOADER = partial(
+            _reload_constant_assets,
+            GlobalDBHandler.__instance,
+        )
         return GlobalDBHandler.__instance
 
     @staticmethod
@@ -194,6 +245,7 @@ class GlobalDBHandler():
             GlobalDBHandler().add_common_asset_details(asset_data)
 
         connection.commit()  # success
+        _refresh_assets_caches(asset_id)
 
     @overload
     @staticmethod
@@ -274,6 +326,63 @@ class GlobalDBHandler():
 
         return result
 
+    @staticmethod
+    def get_resolvable_assets_data(
+            specific_ids: Optional[List[str]] = None,
+    ) -> List[AssetData]:
+        """Return the data of all assets, or of the given ids, that can be resolved
+
+        Uses a single query joining the assets with both details tables. Follows the
+        same rules as get_asset_data() with form_with_incomplete_data=False, so assets
+        with an unknown type, missing details or tokens with missing basic data are
+        not included.
+        """
+        cursor = GlobalDBHandler()._conn.cursor()
+        specific_ids_query = ''
+        bindings: Tuple[str, ...] = (AssetType.ETHEREUM_TOKEN.serialize_for_db(),)  # pylint: disable=no-member  # noqa: E501
+        if specific_ids is not None:
+            specific_ids_query = f'WHERE A.identifier IN ({",".join("?" * len(specific_ids))})'
+            bindings += tuple(specific_ids)
+        query = cursor.execute(
+            f'SELECT A.identifier, A.type, A.name, A.symbol, A.started, A.swapped_for, '
+            f'A.coingecko, A.cryptocompare, A.details_reference, B.address, B.decimals, '
+            f'B.protocol, C.asset_id, C.forked FROM assets AS A LEFT OUTER JOIN '
+            f'ethereum_tokens AS B ON A.type=? AND B.address=A.details_reference '
+            f'LEFT OUTER JOIN common_asset_details AS C ON C.asset_id=A.details_reference '
+            f'{specific_ids_query};',
+            bindings,
+        )
+        result = []
+        for entry in query:
+            try:
+                asset_type = AssetType.deserialize_from_db(entry[1])
+            except DeserializationError as e:
+                log.debug(f'Failed to read asset {entry[0]} from the DB due to {str(e)}. Skipping')  # noqa: E501
+                continue
+
+            if asset_type == AssetType.ETHEREUM_TOKEN:
+                if entry[9] is None or entry[2] is None or entry[3] is None or entry[10] is None:
+                    continue  # missing token details or basic data
+            elif entry[12] is None:
+                continue  # missing common asset details
+
+            result.append(AssetData(
+                identifier=entry[0],
+                name=entry[2],
+                symbol=entry[3],
+                asset_type=asset_type,
+                started=entry[4],
+                forked=entry[13],
+                swapped_for=entry[5],
+                ethereum_address=entry[9],
+                decimals=entry[10],
+                coingecko=entry[6],
+                cryptocompare=entry[7],
+                protocol=entry[11],
+            ))
+
+        return result
+
     @staticmethod
     def get_asset_data(
             identifier: str,
@@ -375,17 +484,8 @@ class GlobalDBHandler():
             address: ChecksumEthAddress,
     ) -> Optional[List[UnderlyingToken]]:
         """Fetch underlying tokens for a token address if they exist"""
-        cursor = GlobalDBHandler()._conn.cursor()
-        query = cursor.execute(
-            'SELECT address, weight from underlying_tokens_list WHERE parent_token_entry=?;',
-            (address,),
-        )
-        results = query.fetchall()
-        underlying_tokens = None
-        if len(results) != 0:
-            underlying_tokens = [UnderlyingToken.deserialize_from_db(x) for x in results]
-
-        return underlying_tokens
+        token = GlobalDBHandler.get_ethereum_tokens_by_addresses([address]).get(address)
+        return token.underlying_tokens if token is not None else None
 
     @staticmethod
     def _add_underlying_tokens(
@@ -482,32 +582,63 @@ class GlobalDBHandler():
 
         If no token for the given address can be found None is returned.
         """
-        cursor = GlobalDBHandler()._conn.cursor()
-        query = cursor.execute(
-            'SELECT A.identifier, B.address, B.decimals, A.name, A.symbol, A.started, '
-            'A.swapped_for, A.coingecko, A.cryptocompare, B.protocol '
-            'FROM ethereum_tokens AS B LEFT OUTER JOIN '
-            'assets AS A ON B.address = A.details_reference WHERE address=?;',
-            (address,),
-        )
-        results = query.fetchall()
-        if len(results) == 0:
-            return None
+        return GlobalDBHandler.get_ethereum_tokens_by_addresses([address]).get(address)
 
-        token_data = results[0]
-        underlying_tokens = GlobalDBHandler().fetch_underlying_tokens(address)
-
-        try:
-            return EthereumToken.deserialize_from_db(
-                entry=token_data,
-                underlying_tokens=underlying_tokens,
-            )
-        except UnknownAsset as e:
-            log.error(
-                f'Found unknown swapped_for asset {str(e)} in '
-                f'the DB when deserializing an EthereumToken',
+    @staticmethod
+    def get_ethereum_tokens_by_addresses(
+            addresses: List[ChecksumEthAddress],
+    ) -> Dict[ChecksumEthAddress, EthereumToken]:
+        """Gets all details for the ethereum tokens of the given addresses
+
+        Tokens are kept in an in-memory map by address. The ones not in the map are
+        queried along with their underlying tokens in a single joined query.
+        Addresses for which no token can be found are not in the returned mapping.
+        """
+        globaldb = GlobalDBHandler()
+        tokens = globaldb._ethereum_tokens
+        missing_addresses = list({x for x in addresses if x not in tokens})
+        cursor = globaldb._conn.cursor()
+        for chunk in get_chunks(missing_addresses, n=ETHEREUM_TOKENS_QUERY_CHUNK_LENGTH):
+            query = cursor.execute(
+                'SELECT A.identifier, B.address, B.decimals, A.name, A.symbol, A.started, '
+                'A.swapped_for, A.coingecko, A.cryptocompare, B.protocol, U.address, U.weight '
+                'FROM ethereum_tokens AS B LEFT OUTER JOIN '
+                'assets AS A ON B.address = A.details_reference LEFT OUTER JOIN '
+                'underlying_tokens_list AS U ON U.parent_token_entry = B.address '
+                f'WHERE B.address IN ({",".join("?" * len(chunk))}) ORDER BY U.rowid;',
+                chunk,
             )
-            return None
+            token_entries = {}
+            underlying_tokens: Dict[str, List[UnderlyingToken]] = defaultdict(list)
+            for entry in query:
+                token_entries[entry[1]] = entry[:10]
+                if entry[10] is not None:
+                    underlying_tokens[entry[1]].append(
+                        UnderlyingToken.deserialize_from_db((entry[10], entry[11])),
+                    )
+
+            for address in chunk:
+                token: Optional[EthereumToken] = None
+                token_data = token_entries.get(address)
+                if token_data is not None:
+                    try:
+                        token = EthereumToken.deserialize_from_db(
+                            entry=token_data,
+                            underlying_tokens=underlying_tokens.get(address),
+                        )
+                    except UnknownAsset as e:
+                        log.error(
+                            f'Found unknown swapped_for asset {str(e)} in '
+                            f'the DB when deserializing an EthereumToken',
+                        )
+                tokens[address] = token
+
+        result = {}
+        for address in addresses:
+            token = tokens[address]
+            if token is not None:
+                result[address] = token
+        return result
 
     @staticmethod
     def get_ethereum_tokens(
@@ -522,12 +653,7 @@ class GlobalDBHandler():
         - Protocol for which to return tokens
         """
         cursor = GlobalDBHandler()._conn.cursor()
-        querystr = (
-            'SELECT A.identifier, B.address, B.decimals, A.name, A.symbol, A.started, '
-            'A.swapped_for, A.coingecko, A.cryptocompare, B.protocol '
-            'FROM ethereum_tokens as B LEFT OUTER JOIN '
-            'assets AS A on B.address = A.details_reference '
-        )
+        querystr = 'SELECT B.address FROM ethereum_tokens as B '
         if exceptions is not None or protocol is not None or except_protocols is not None:
             bindings_list: List[Union[str, ChecksumEthAddress]] = []
             querystr_additions = []
@@ -550,20 +676,8 @@ class GlobalDBHandler():
             querystr += ';'
             bindings = ()
 
-        query = cursor.execute(querystr, bindings)
-        tokens = []
-        for entry in query:
-            underlying_tokens = GlobalDBHandler().fetch_underlying_tokens(entry[1])
-            try:
-                token = EthereumToken.deserialize_from_db(entry, underlying_tokens)  # noqa: E501
-                tokens.append(token)
-            except UnknownAsset as e:
-                log.error(
-                    f'Found unknown swapped_for asset {str(e)} in '
-                    f'the DB when deserializing an EthereumToken',
-                )
-
-        return tokens
+        addresses = [entry[0] for entry in cursor.execute(querystr, bindings)]
+        return list(GlobalDBHandler.get_ethereum_tokens_by_addresses(addresses).values())
 
     @staticmethod
     def add_ethereum_token_data(entry: EthereumToken) -> None:
@@ -611,6 +725,7 @@ class GlobalDBHandler():
         """
         connection = GlobalDBHandler()._conn
         cursor = connection.cursor()
+        old_symbol = _get_asset_symbol(cursor, ethaddress_to_identifier(entry.ethereum_address))
         try:
             cursor.execute(
                 'UPDATE assets SET name=?, symbol=?, started=?, swapped_for=?, '
@@ -661,6 +776,7 @@ class GlobalDBHandler():
             )
 
         connection.commit()
+        _refresh_assets_caches(rotki_id, old_symbol)
         return rotki_id
 
     @staticmethod
@@ -673,6 +789,7 @@ class GlobalDBHandler():
         """
         connection = GlobalDBHandler()._conn
         cursor = connection.cursor()
+        old_symbol = _get_asset_symbol(cursor, ethaddress_to_identifier(address))
         try:
             cursor.execute(
                 'DELETE FROM ethereum_tokens WHERE address=?;',
@@ -733,6 +850,7 @@ class GlobalDBHandler():
             )
 
         connection.commit()
+        _refresh_assets_caches(rotki_id, old_symbol)
         return rotki_id
 
     @staticmethod
@@ -753,6 +871,7 @@ class GlobalDBHandler():
         forked = forked_asset.identifier if forked_asset else None
         swapped_for_asset = data.get('swapped_for', None)
         swapped_for = swapped_for_asset.identifier if swapped_for_asset else None
+        old_symbol = _get_asset_symbol(cursor, identifier)
         try:
             cursor.execute(
                 'UPDATE assets SET type=?, name=?, symbol=?, started=?, swapped_for=?, '
@@ -792,6 +911,7 @@ class GlobalDBHandler():
             ) from e
 
         connection.commit()
+        _refresh_assets_caches(identifier, old_symbol)
 
     @staticmethod
     def add_common_asset_details(data: Dict[str, Any]) -> None:
@@ -830,6 +950,7 @@ class GlobalDBHandler():
         """
         connection = GlobalDBHandler()._conn
         cursor = connection.cursor()
+        old_symbol = _get_asset_symbol(cursor, identifier)
         try:
             cursor.execute(
                 'DELETE FROM assets WHERE identifier=?;',
@@ -859,6 +980,7 @@ class GlobalDBHandler():
             )
 
         connection.commit()
+        _refresh_assets_caches(identifier, old_symbol)
 
     @staticmethod
     def add_user_owned_assets(assets: List['Asset']) -> None:
@@ -1290,7 +1412,7 @@ class GlobalDBHandler():
 
         connection.commit()
         cursor.execute(detach_database)
-
+        _refresh_assets_caches()
         return True, ''
 
     @staticmethod
@@ -1347,6 +1469,7 @@ class GlobalDBHandler():
 
         connection.commit()
         cursor.execute(detach_database)
+        _refresh_assets_caches()
         return True, ''
 
     def save_binance_pairs(
@@ -1380,13 +1503,320 @@ class GlobalDBHandler():
                 log.debug(f'Failed to deserialize binance pair {pair}. {str(e)}')
         return pairs
 
+    @staticmethod
+    def get_exchange_symbols(location: Location, to_world: Dict[str, str]) -> Dict[str, str]:
+        """Returns the exchange symbol to asset identifier translation table of a location
 
-def _reload_constant_assets(globaldb: GlobalDBHandler) -> None:
-    """Reloads the details of the constant declared assets after reading from the DB"""
-    identifiers = [x.identifier for x in CONSTANT_ASSETS]
+        The table is kept both in memory and in the DB. If it's not there it's built from
+        the given exchange to world symbols mapping and the assets in the DB. Symbols that
+        don't map to exactly one known asset are not part of the table.
+        """
+        globaldb = GlobalDBHandler()
+        symbols = globaldb._exchange_symbols.get(location)
+        if symbols is not None:
+            return symbols
+
+        serialized_location = location.serialize_for_db()
+        cursor = globaldb._conn.cursor()
+        cursor.execute(
+            'SELECT exchange_symbol, asset_id FROM exchange_symbols WHERE location=?',
+            (serialized_location,),
+        )
+        symbols = dict(cursor)
+        if len(symbols) == 0:
+            symbols = _build_exchange_symbols(cursor, to_world)
+            cursor.executemany(
+                'INSERT OR REPLACE INTO exchange_symbols(location, exchange_symbol, asset_id) '
+                'VALUES(?, ?, ?)',
+                [(serialized_location, symbol, asset_id) for symbol, asset_id in symbols.items()],
+            )
+            globaldb._conn.commit()
+            log.debug(f'Built the {str(location)} symbols table with {len(symbols)} entries')
+
+        globaldb._exchange_symbols[location] = symbols
+        return symbols
+
+    @staticmethod
+    def search_assets(text: str, limit: int, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Searches for assets with a word in their identifier, name, symbol or token
+        address starting with each of the words of the given text
+
+        Results come first if their symbol is the text, then if they are owned by the user
+        and then if their symbol or name starts with the text. The rest is ordered by
+        relevance. Returns the serialized data of the requested page of results and the
+        number of all assets that matched.
+        """
+        match_query = ' '.join(
+            '"' + word.replace('"', '""') + '"*'
+            for word in text.split() if any(x.isalnum() for x in word)
+        )
+        if match_query == '':
+            return [], 0
+
+        connection = GlobalDBHandler()._conn
+        _fill_assets_search(connection)
+        cursor = connection.cursor()
+        entries_found = cursor.execute(
+            'SELECT COUNT(*) FROM assets_search WHERE assets_search MATCH ?;', (match_query,),
+        ).fetchone()[0]
+        if entries_found == 0:
+            return [], 0
+
+        prefix = text.strip().replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        cursor.execute(
+            'SELECT S.identifier FROM assets_search AS S LEFT OUTER JOIN user_owned_assets AS U '
+            'ON U.asset_id=S.identifier WHERE assets_search MATCH ? ORDER BY '
+            '(S.symbol=? COLLATE NOCASE) DESC, U.asset_id IS NOT NULL DESC, '
+            "(S.symbol LIKE ? ESCAPE '\\' OR S.name LIKE ? ESCAPE '\\') DESC, S.rank "
+            'LIMIT ? OFFSET ?;',
+            (match_query, text.strip(), prefix, prefix, limit, offset),
+        )
+        identifiers = [entry[0] for entry in cursor]
+        # type ignore is due to: https://github.com/python/mypy/issues/7781
+        assets_data = GlobalDBHandler().get_all_asset_data(mapping=False, specific_ids=identifiers)  # type: ignore  # noqa: E501
+        assets = {x.identifier: x for x in assets_data}
+        entries = [
+            {'identifier': x, **assets[x].serialize()}
+            for x in identifiers if x in assets
+        ]
+        return entries, entries_found
+
+    @staticmethod
+    def get_contract_call_result(
+            chain: str,
+            contract_address: ChecksumEthAddress,
+            input_hash: bytes,
+            block_number: int,
+    ) -> Optional[bytes]:
+        """Returns the saved result of a contract call at the given block, if any,
+        and marks it as recently used. To not write to the DB on every hit the last use
+        is only updated if it is older than CONTRACT_CALL_RESULTS_LAST_USED_SECS."""
+        connection = GlobalDBHandler()._conn
+        key = (chain, contract_address, input_hash, block_number)
+        result = connection.execute(
+            'SELECT result, last_used FROM contract_call_results WHERE chain=? AND '
+            'contract_address=? AND input_hash=? AND block_number=?',
+            key,
+        ).fetchone()
+        if result is None:
+            return None
+
+        now = ts_now()
+        if now - result[1] >= CONTRACT_CALL_RESULTS_LAST_USED_SECS:
+            connection.execute(
+                'UPDATE contract_call_results SET last_used=? WHERE chain=? AND '
+                'contract_address=? AND input_hash=? AND block_number=?',
+                (now, *key),
+            )
+            connection.commit()
+        return result[0]
+
+    @staticmethod
+    def add_contract_call_result(
+            chain: str,
+            contract_address: ChecksumEthAddress,
+            input_hash: bytes,
+            block_number: int,
+            result: bytes,
+    ) -> None:
+        """Saves the result of a contract call at the given block. If there are more than
+        CONTRACT_CALL_RESULTS_MAX_ENTRIES saved results the least recently used are deleted
+        so that CONTRACT_CALL_RESULTS_EVICT_ENTRIES can be added before evicting again"""
+        globaldb = GlobalDBHandler()
+        connection = globaldb._conn
+        if globaldb._contract_call_results_count is None:
+            globaldb._contract_call_results_count = connection.execute(
+                'SELECT COUNT(*) FROM contract_call_results',
+            ).fetchone()[0]
+
+        cursor = connection.execute(
+            'INSERT OR IGNORE INTO contract_call_results(chain, contract_address, '
+            'input_hash, block_number, result, last_used) VALUES(?, ?, ?, ?, ?, ?)',
+            (chain, contract_address, input_hash, block_number, result, ts_now()),
+        )
+        globaldb._contract_call_results_count += cursor.rowcount
+        if globaldb._contract_call_results_count > CONTRACT_CALL_RESULTS_MAX_ENTRIES:
+            cursor = connection.execute(
+                'DELETE FROM contract_call_results WHERE rowid IN (SELECT rowid FROM '
+                'contract_call_results ORDER BY last_used ASC LIMIT ?)',
+                (
+                    globaldb._contract_call_results_count -
+                    CONTRACT_CALL_RESULTS_MAX_ENTRIES +
+                    CONTRACT_CALL_RESULTS_EVICT_ENTRIES,
+                ),
+            )
+            globaldb._contract_call_results_count -= cursor.rowcount
+        connection.commit()
+
+    @staticmethod
+    def refresh_asset_caches(identifier: str, old_symbol: Optional[str]) -> None:
+        """Updates the caches derived from the assets after a single asset was added,
+        edited or deleted. old_symbol is the symbol the asset had before the change."""
+        globaldb = GlobalDBHandler()
+        if identifier.startswith(ETHEREUM_DIRECTIVE):
+            # also drops the entry saying that no token exists at the address
+            address = identifier[ETHEREUM_DIRECTIVE_LENGTH:]
+            globaldb._ethereum_tokens.pop(string_to_ethereum_address(address), None)
+        _update_exchange_symbols(globaldb, identifier, old_symbol)
+        cursor = globaldb._conn.cursor()
+        # if the search index is not built yet it's built from all assets when needed
+        if cursor.execute('SELECT 1 FROM assets_search LIMIT 1;').fetchone() is not None:
+            cursor.execute('DELETE FROM assets_search WHERE identifier=?;', (identifier,))
+            _index_assets_for_search(cursor, identifier)
+        globaldb._conn.commit()
+
+    @staticmethod
+    def clear_assets_caches() -> None:
+        """Clears the ethereum tokens map, the symbol translation tables of all exchanges
+        and the assets search index. Should be called when the assets change in the DB.
+        The caches are filled again the next time they are needed."""
+        globaldb = GlobalDBHandler()
+        globaldb._ethereum_tokens = {}
+        globaldb._exchange_symbols = {}
+        globaldb._conn.execute('DELETE FROM exchange_symbols;')
+        globaldb._conn.execute('DELETE FROM assets_search;')
+        globaldb._conn.commit()
+
+
+def _fill_assets_search(connection: sqlite3.Connection) -> None:
+    """Indexes all assets for searching if the search index is empty"""
+    cursor = connection.cursor()
+    if cursor.execute('SELECT 1 FROM assets_search LIMIT 1;').fetchone() is not None:
+        return
+
+    _index_assets_for_search(cursor)
+    connection.commit()
+    log.debug(f'Built the assets search index with {cursor.rowcount} entries')
+
+
+def _index_assets_for_search(cursor: sqlite3.Cursor, identifier: Optional[str] = None) -> None:
+    """Adds either all assets or the asset with the given identifier to the search index"""
+    querystr = (
+        'INSERT INTO assets_search(identifier, name, symbol, address) '
+        'SELECT A.identifier, A.name, A.symbol, B.address FROM assets AS A '
+        'LEFT OUTER JOIN ethereum_tokens AS B ON A.type=? AND B.address=A.details_reference'
+    )
+    bindings: Tuple[str, ...] = (AssetType.ETHEREUM_TOKEN.serialize_for_db(),)  # pylint: disable=no-member  # noqa: E501
+    if identifier is not None:
+        querystr += ' WHERE A.identifier=?'
+        bindings += (identifier,)
+    cursor.execute(querystr + ';', bindings)
+
+
+def _get_asset_symbol(cursor: sqlite3.Cursor, identifier: str) -> Optional[str]:
+    result = cursor.execute('SELECT symbol FROM assets WHERE identifier=?;', (identifier,))
+    entry = result.fetchone()
+    return None if entry is None else entry[0]
+
+
+def _update_exchange_symbols(
+        globaldb: GlobalDBHandler,
+        identifier: str,
+        old_symbol: Optional[str],
+) -> None:
+    """Updates the rows of the exchange symbol translation tables that a change of
+    a single asset can affect. Those are the symbols that map to the asset's identifier
+    or to its old or new symbol. Does not commit."""
+    # TODO: figure out a way to move this out. Moved in here due to cyclic imports
+    from rotkehlchen.assets.converters import EXCHANGE_TO_WORLD  # isort:skip  # noqa: E501  # pylint: disable=import-outside-toplevel
+    cursor = globaldb._conn.cursor()
+    keys = {x.lower() for x in (identifier, old_symbol, _get_asset_symbol(cursor, identifier)) if x is not None}  # noqa: E501
+    # resolve each world symbol as _build_exchange_symbols() does for all of them
+    resolved: Dict[str, Optional[str]] = {}
+    candidates: Set[str] = set()
+    asset_ids = {identifier}
+    for key in keys:
+        entries = cursor.execute(
+            'SELECT identifier, symbol FROM assets WHERE identifier=? COLLATE NOCASE OR '
+            'symbol=? COLLATE NOCASE;',
+            (key, key),
+        ).fetchall()
+        with_identifier = [x for x, _ in entries if x.lower() == key]
+        with_symbol = [x for x, symbol in entries if symbol is not None and symbol.lower() == key]
+        if len(with_identifier) != 0:
+            resolved[key] = with_identifier[-1]
+        else:
+            resolved[key] = with_symbol[0] if len(with_symbol) == 1 else None
+        for asset_id, symbol in entries:
+            asset_ids.add(asset_id)
+            candidates.update(x for x in (asset_id, symbol) if x is not None and x.lower() == key)
+
+    serialized_locations = {
+        x[0] for x in cursor.execute('SELECT DISTINCT location FROM exchange_symbols;')
+    }
+    serialized_locations.update(x.serialize_for_db() for x in globaldb._exchange_symbols)
+    for serialized_location in serialized_locations:
+        location = Location.deserialize_from_db(serialized_location)
+        to_world = EXCHANGE_TO_WORLD.get(location, {})
+        # rows that map to a world symbol of the changed keys point to one of these assets
+        cursor.execute(
+            f'SELECT exchange_symbol FROM exchange_symbols WHERE location=? AND asset_id IN '
+            f'({",".join("?" * len(asset_ids))});',
+            (serialized_location, *asset_ids),
+        )
+        exchange_symbols = {x[0] for x in cursor}.union(candidates, to_world)
+        symbols = globaldb._exchange_symbols.get(location)
+        for exchange_symbol in exchange_symbols:
+            key = to_world.get(exchange_symbol, exchange_symbol).lower()
+            if key not in keys:
+                continue
+            asset_id = resolved[key]
+            if asset_id is None:
+                cursor.execute(
+                    'DELETE FROM exchange_symbols WHERE location=? AND exchange_symbol=?;',
+                    (serialized_location, exchange_symbol),
+                )
+                if symbols is not None:
+                    symbols.pop(exchange_symbol, None)
+            else:
+                cursor.execute(
+                    'INSERT OR REPLACE INTO exchange_symbols(location, exchange_symbol, asset_id) '
+                    'VALUES(?, ?, ?);',
+                    (serialized_location, exchange_symbol, asset_id),
+                )
+                if symbols is not None:
+                    symbols[exchange_symbol] = asset_id
+
+
+def _build_exchange_symbols(cursor: sqlite3.Cursor, to_world: Dict[str, str]) -> Dict[str, str]:
+    """Maps the symbols an exchange may use to asset identifiers the same way that
+    symbol_to_asset_or_token() would. An identifier match takes precedence over a symbol
+    match and symbols shared by multiple assets are ambiguous. Both are case insensitive."""
+    identifiers: Dict[str, str] = {}
+    symbols: Dict[str, Optional[str]] = {}
+    candidates = set(to_world)
+    for identifier, symbol in cursor.execute('SELECT identifier, symbol FROM assets;'):
+        identifiers[identifier.lower()] = identifier
+        candidates.add(identifier)
+        if symbol is not None:
+            key = symbol.lower()
+            symbols[key] = None if key in symbols else identifier
+            candidates.add(symbol)
+
+    exchange_symbols = {}
+    for exchange_symbol in candidates:
+        key = to_world.get(exchange_symbol, exchange_symbol).lower()
+        asset_id = identifiers.get(key) or symbols.get(key)
+        if asset_id is not None:
+            exchange_symbols[exchange_symbol] = asset_id
+
+    return exchange_symbols
+
+
+def _reload_constant_assets(
+        globaldb: GlobalDBHandler,
+        assets: Optional[List[Asset]] = None,
+) -> None:
+    """Reloads the details of the constant declared assets after reading from the DB
+
+    If no assets are given then all constant assets created so far are reloaded
+    """
+    if assets is None:
+        assets = constant_assets.CONSTANT_ASSETS
+    identifiers = [x.identifier for x in assets]
     db_data = globaldb.get_all_asset_data(mapping=True, serialized=False, specific_ids=identifiers)  # type: ignore  # noqa: E501
 
-    for entry in CONSTANT_ASSETS:
+    for entry in assets:
         db_entry = db_data.get(entry.identifier)
         if db_entry is None:
             log.critical(
@@ -1404,11 +1834,11 @@ def _reload_constant_assets(globaldb: GlobalDBHandler) -> None:
                     f'Skipping reloading this asset from DB. Did user mess with the DB?',
                 )
                 continue
-            swapped_for = Asset(db_entry.swapped_for) if db_entry.swapped_for else None
             object.__setattr__(entry, 'name', db_entry.name)
             object.__setattr__(entry, 'symbol', db_entry.symbol)
             object.__setattr__(entry, 'started', db_entry.started)
-            object.__setattr__(entry, 'swapped_for', swapped_for)
+            # related assets are resolved lazily from their identifier
+            object.__setattr__(entry, '_swapped_for', db_entry.swapped_for)
             object.__setattr__(entry, 'cryptocompare', db_entry.cryptocompare)
             object.__setattr__(entry, 'coingecko', db_entry.coingecko)
             object.__setattr__(entry, 'ethereum_address', db_entry.ethereum_address)
@@ -1424,13 +1854,11 @@ def _reload_constant_assets(globaldb: GlobalDBHandler) -> None:
                     f'Skipping reloading this asset from DB. Did user mess with the DB?',
                 )
                 continue
-            swapped_for = Asset(db_entry.swapped_for) if db_entry.swapped_for else None
-            forked = Asset(db_entry.forked) if db_entry.forked else None
             object.__setattr__(entry, 'name', db_entry.name)
             object.__setattr__(entry, 'symbol', db_entry.symbol)
             object.__setattr__(entry, 'asset_type', db_entry.asset_type)
             object.__setattr__(entry, 'started', db_entry.started)
-            object.__setattr__(entry, 'forked', forked)
-            object.__setattr__(entry, 'swapped_for', swapped_for)
+            object.__setattr__(entry, '_forked', db_entry.forked)
+            object.__setattr__(entry, '_swapped_for', db_entry.swapped_for)
             object.__setattr__(entry, 'cryptocompare', db_entry.cryptocompare)
             object.__setattr__(entry, 'coingecko', db_entry.coingecko)
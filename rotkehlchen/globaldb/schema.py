@@ -162,6 +162,46 @@ CREATE TABLE IF NOT EXISTS binance_pairs (
 );
 """
 
+# Translation of each exchange's symbols to asset identifiers. Built from the exchange's
+# symbol mappings and the assets table and deleted whenever the assets change.
+DB_CREATE_EXCHANGE_SYMBOLS = """
+CREATE TABLE IF NOT EXISTS exchange_symbols (
+    location CHAR(1) NOT NULL,
+    exchange_symbol TEXT NOT NULL,
+    asset_id TEXT NOT NULL,
+    PRIMARY KEY(location, exchange_symbol)
+);
+"""
+
+# Full text index over the assets used by the asset search. Like the exchange symbols
+# it's derived from the assets table, emptied when the assets change and rebuilt lazily.
+# Prefix indices make the search fast for the first few characters typed.
+DB_CREATE_ASSETS_SEARCH = """
+CREATE VIRTUAL TABLE IF NOT EXISTS assets_search USING fts5(
+    identifier,
+    name,
+    symbol,
+    address,
+    prefix='1 2 3'
+);
+"""
+
+# Results of eth_calls made at a given block. They can't change so they are kept
+# across runs. last_used orders the entries for evicting the least recently used.
+DB_CREATE_CONTRACT_CALL_RESULTS = """
+CREATE TABLE IF NOT EXISTS contract_call_results (
+    chain TEXT NOT NULL,
+    contract_address TEXT NOT NULL,
+    input_hash BLOB NOT NULL,
+    block_number INTEGER NOT NULL,
+    result BLOB NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY(chain, contract_address, input_hash, block_number)
+);
+CREATE INDEX IF NOT EXISTS idx_contract_call_results_last_used
+    ON contract_call_results(last_used);
+"""
+
 DB_SCRIPT_CREATE_TABLES = f"""
 PRAGMA foreign_keys=off;
 BEGIN TRANSACTION;
@@ -175,6 +215,9 @@ BEGIN TRANSACTION;
 {DB_CREATE_PRICE_HISTORY_SOURCE_TYPES}
 {DB_CREATE_PRICE_HISTORY}
 {DB_CREATE_BINANCE_PARIS}
+{DB_CREATE_EXCHANGE_SYMBOLS}
+{DB_CREATE_ASSETS_SEARCH}
+{DB_CREATE_CONTRACT_CALL_RESULTS}
 COMMIT;
 PRAGMA foreign_keys=on;
 """
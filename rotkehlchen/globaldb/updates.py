@@ -26,6 +26,33 @@ logger = logging.getLogger(__name__)
 log = RotkehlchenLogsAdapter(logger)
 
 ASSETS_VERSION_KEY = 'assets_version'
+# The key column of each table the entries of an assets update can be staged for
+STAGED_TABLE_KEYS = {
+    'assets': 'identifier',
+    'ethereum_tokens': 'address',
+    'common_asset_details': 'asset_id',
+}
+
+
+def split_statements(statements: str) -> List[str]:
+    """Splits the given text in its SQL statements.
+
+    A `;` only ends a statement if sqlite considers the statement complete, so a `;`
+    inside a quoted value does not split it.
+    """
+    result = []
+    statement = ''
+    for part in statements.split(';'):
+        statement += part + ';'
+        if sqlite3.complete_statement(statement):
+            if statement[:-1].strip() != '':
+                result.append(statement)
+            statement = ''
+
+    # an incomplete statement is kept for its error to show when it's executed
+    if statement[:-1].strip() != '':
+        result.append(statement[:-1])
+    return result
 
 
 def executeall(cursor: sqlite3.Cursor, statements: str) -> None:
@@ -34,9 +61,7 @@ def executeall(cursor: sqlite3.Cursor, statements: str) -> None:
 
     TODO: Is there a better way? Couldn't find one
     """
-    for statement in statements.split(';'):
-        if statement == '':
-            continue
+    for statement in split_statements(statements):
         cursor.execute(statement)
 
 
@@ -91,6 +116,93 @@ def _force_remote(cursor: sqlite3.Cursor, local_asset: Asset, full_insert: str)
     AssetResolver().clean_memory_cache(local_asset.identifier.lower())
 
 
+def _create_staging_tables(cursor: sqlite3.Cursor) -> None:
+    """Creates the temporary tables the entries of an assets update are inserted in
+    before being merged into the DB. They have no constraints so staging never fails
+    due to the data already in the DB.
+
+    Rows with is_update set are copies of existing rows that update entries were
+    applied to and that replace the existing rows at the merge."""
+    cursor.execute("""
+    CREATE TEMP TABLE IF NOT EXISTS staged_assets (
+        identifier TEXT COLLATE NOCASE,
+        type CHAR(1),
+        name TEXT,
+        symbol TEXT,
+        started INTEGER,
+        swapped_for TEXT,
+        coingecko TEXT,
+        cryptocompare TEXT,
+        details_reference TEXT,
+        is_update INTEGER NOT NULL DEFAULT 0
+    );""")
+    cursor.execute("""
+    CREATE TEMP TABLE IF NOT EXISTS staged_ethereum_tokens (
+        address VARCHAR[42],
+        decimals INTEGER,
+        protocol TEXT,
+        is_update INTEGER NOT NULL DEFAULT 0
+    );""")
+    cursor.execute("""
+    CREATE TEMP TABLE IF NOT EXISTS staged_common_asset_details (
+        asset_id TEXT COLLATE NOCASE,
+        forked STRING,
+        is_update INTEGER NOT NULL DEFAULT 0
+    );""")
+
+
+def _clear_staging_tables(cursor: sqlite3.Cursor) -> None:
+    cursor.execute('DELETE FROM temp.staged_assets;')
+    cursor.execute('DELETE FROM temp.staged_ethereum_tokens;')
+    cursor.execute('DELETE FROM temp.staged_common_asset_details;')
+
+
+def _unstage(cursor: sqlite3.Cursor, asset_data: AssetData) -> None:
+    """Removes the staged rows of an update entry"""
+    cursor.execute(
+        'DELETE FROM temp.staged_ethereum_tokens WHERE address IN '
+        '(SELECT details_reference FROM temp.staged_assets WHERE identifier=?) OR address=?;',
+        (asset_data.identifier, asset_data.ethereum_address),
+    )
+    cursor.execute(
+        'DELETE FROM temp.staged_common_asset_details WHERE asset_id=?;',
+        (asset_data.identifier,),
+    )
+    cursor.execute('DELETE FROM temp.staged_assets WHERE identifier=?;', (asset_data.identifier,))
+
+
+def _stage_existing_rows(cursor: sqlite3.Cursor, identifier: str) -> Optional[str]:
+    """Copies the rows of an existing asset in the staging tables for its update entry
+    to be applied to them. Returns the ethereum address of the asset if it has one."""
+    cursor.execute(
+        'INSERT INTO temp.staged_assets(identifier, type, name, symbol, started, swapped_for, '
+        'coingecko, cryptocompare, details_reference, is_update) SELECT identifier, type, '
+        'name, symbol, started, swapped_for, coingecko, cryptocompare, details_reference, 1 '
+        'FROM assets WHERE identifier=?;',
+        (identifier,),
+    )
+    cursor.execute(
+        'INSERT INTO temp.staged_common_asset_details(asset_id, forked, is_update) '
+        'SELECT asset_id, forked, 1 FROM common_asset_details WHERE asset_id=?;',
+        (identifier,),
+    )
+    cursor.execute(
+        'SELECT E.address FROM ethereum_tokens AS E INNER JOIN assets AS A '
+        'ON A.details_reference=E.address WHERE A.identifier=?;',
+        (identifier,),
+    )
+    result = cursor.fetchone()
+    if result is None:
+        return None
+
+    cursor.execute(
+        'INSERT INTO temp.staged_ethereum_tokens(address, decimals, protocol, is_update) '
+        'SELECT address, decimals, protocol, 1 FROM ethereum_tokens WHERE address=?;',
+        (result[0],),
+    )
+    return result[0]
+
+
 class ParsedAssetData(NamedTuple):
     identifier: str
     asset_type: AssetType
@@ -113,6 +225,8 @@ class AssetsUpdater():
         self.ethereum_tokens_re = re.compile(r'.*INSERT +INTO +ethereum_tokens\( *address *, *decimals *, *protocol *\) +VALUES\((.*?),(.*?),(.*?)\).*')  # noqa: E501
         self.common_asset_details_re = re.compile(r'.*INSERT +INTO +common_asset_details\( *asset_id *, *forked *\) +VALUES\((.*?),(.*?)\).*')  # noqa: E501
         self.string_re = re.compile(r'.*"(.*?)".*')
+        self.staged_insert_re = re.compile(r'^\s*INSERT +INTO +(assets|ethereum_tokens|common_asset_details) *\(')  # noqa: E501
+        self.staged_update_re = re.compile(r'^\s*UPDATE +(assets|ethereum_tokens|common_asset_details) +SET +(.*) +WHERE +(identifier|address|asset_id) *= *"([^"]*)" *;?\s*$', re.DOTALL)  # noqa: E501
         self.branch = 'master'
         if not getattr(sys, 'frozen', False):
             # not packaged -- must be in develop mode
@@ -280,6 +394,265 @@ class AssetsUpdater():
             protocol=protocol,
         )
 
+    def _apply_single_entry(
+            self,
+            cursor: sqlite3.Cursor,
+            version: int,
+            action: str,
+            full_insert: str,
+            remote_asset_data: AssetData,
+            conflicts: Optional[Dict[Asset, Literal['remote', 'local']]],
+    ) -> None:
+        """Applies the action of a single update entry and handles it failing"""
+        local_asset: Optional[Asset] = None
+        try:
+            local_asset = Asset(remote_asset_data.identifier)
+        except UnknownAsset:
+            pass
+
+        try:
+            executeall(cursor, action)
+            if local_asset is not None:
+                AssetResolver().clean_memory_cache(local_asset.identifier.lower())
+        except sqlite3.Error:  # https://docs.python.org/3/library/sqlite3.html#exceptions
+            if local_asset is None:
+                try:  # if asset is not known then simply do an insertion
+                    executeall(cursor, full_insert)
+                except sqlite3.Error as e:
+                    self._add_failed_entry_warning(remote_asset_data, version, str(e))
+                return  # fail or succeed continue to next entry
+
+            # otherwise asset is known, so it's a conflict
+            self._handle_conflict(cursor, version, local_asset, remote_asset_data, full_insert, conflicts)  # noqa: E501
+
+    def _add_failed_entry_warning(
+            self,
+            remote_asset_data: AssetData,
+            version: int,
+            error: str,
+    ) -> None:
+        self.msg_aggregator.add_warning(
+            f'Failed to add asset {remote_asset_data.identifier} in the '
+            f'DB during the v{version} assets update. Skipping entry. '
+            f'Error: {error}',
+        )
+
+    def _handle_conflict(
+            self,
+            cursor: sqlite3.Cursor,
+            version: int,
+            local_asset: Asset,
+            remote_asset_data: AssetData,
+            full_insert: str,
+            conflicts: Optional[Dict[Asset, Literal['remote', 'local']]],
+    ) -> None:
+        """Resolves the conflict of a known asset with the given resolutions if possible,
+        otherwise marks it for the user to resolve"""
+        resolution = conflicts.get(local_asset) if conflicts else None
+        if resolution == 'local':
+            # do nothing, keep local
+            return
+        if resolution == 'remote':
+            try:
+                _force_remote(cursor, local_asset, full_insert)
+            except sqlite3.Error as e:
+                self.msg_aggregator.add_warning(
+                    f'Failed to resolve conflict for {remote_asset_data.identifier} in '
+                    f'the DB during the v{version} assets update. Skipping entry. '
+                    f'Error: {str(e)}',
+                )
+            return  # fail or succeed continue to next entry
+
+        # else can't resolve. Mark it for the user to resolve.
+        local_data = AssetResolver().get_asset_data(local_asset.identifier, False)
+        self.conflicts.append((local_data, remote_asset_data))
+
+    def _stage_entry(
+            self,
+            cursor: sqlite3.Cursor,
+            action: str,
+            full_insert: str,
+            remote_asset_data: AssetData,
+    ) -> bool:
+        """Stages an entry that only adds an asset or only updates an existing one.
+
+        The rows of an entry that adds an asset are inserted in the staging tables. For an
+        entry that updates an asset by its key, the asset's rows are copied in the staging
+        tables and the updates are applied to the copies.
+
+        Returns False if the entry can't be staged and needs to be applied on its own.
+        May raise an sqlite3 error if staging fails, in which case nothing is staged.
+        """
+        statements = split_statements(action)
+        cursor.execute('SAVEPOINT stage_entry;')
+        try:
+            if action == full_insert:
+                staged = self._stage_inserts(cursor, statements)
+            else:
+                staged = self._stage_updates(cursor, statements, remote_asset_data)
+        except sqlite3.Error:
+            cursor.execute('ROLLBACK TO SAVEPOINT stage_entry;')
+            cursor.execute('RELEASE SAVEPOINT stage_entry;')
+            raise
+
+        if staged is False:
+            cursor.execute('ROLLBACK TO SAVEPOINT stage_entry;')
+        cursor.execute('RELEASE SAVEPOINT stage_entry;')
+        return staged
+
+    def _stage_inserts(self, cursor: sqlite3.Cursor, statements: List[str]) -> bool:
+        if not all(self.staged_insert_re.match(x) for x in statements):
+            return False
+
+        for statement in statements:
+            cursor.execute(self.staged_insert_re.sub(r'INSERT INTO temp.staged_\1(', statement, count=1))  # noqa: E501
+        return True
+
+    def _stage_updates(
+            self,
+            cursor: sqlite3.Cursor,
+            statements: List[str],
+            remote_asset_data: AssetData,
+    ) -> bool:
+        """Applies the updates of an entry to the staged copies of the asset's rows.
+
+        Only updates of the asset's own rows by their key that do not change the key
+        can be staged.
+        """
+        matches = [self.staged_update_re.match(x) for x in statements]
+        if len(matches) == 0 or any(x is None for x in matches):
+            return False
+
+        address = _stage_existing_rows(cursor, remote_asset_data.identifier)
+        for match in matches:
+            table, assignments, key, value = match.groups()  # type: ignore  # checked above
+            if key != STAGED_TABLE_KEYS[table] or re.search(rf'(^|[\s,]){key} *=', assignments):  # noqa: E501
+                return False
+            entry_key = address if table == 'ethereum_tokens' else remote_asset_data.identifier
+            if entry_key is None or value.lower() != entry_key.lower():
+                return False
+
+            cursor.execute(
+                f'UPDATE temp.staged_{table} SET {assignments} WHERE {key}=? AND is_update=1;',
+                (entry_key,),
+            )
+            if cursor.rowcount != 1:
+                return False
+
+        return True
+
+    def _apply_staged_entries(
+            self,
+            cursor: sqlite3.Cursor,
+            version: int,
+            staged: Dict[str, Tuple[AssetData, str, str]],
+            conflicts: Optional[Dict[Asset, Literal['remote', 'local']]],
+    ) -> None:
+        """Merges the staged entries into the DB with set based statements.
+
+        A single join finds the entries that would fail the merge: added assets that
+        already exist, added tokens whose address already exists and assets swapped for
+        or forked from assets that exist neither in the DB nor in the staged entries.
+        They are taken out of the staging tables to be handled on their own. If the merge
+        of the rest still fails they are all applied one by one so that only the failing
+        entries are skipped.
+        """
+        if len(staged) == 0:
+            return
+
+        unstaged = []
+        cursor.execute(
+            'SELECT S.identifier, S.is_update=0 AND A.identifier IS NOT NULL '
+            'FROM temp.staged_assets AS S '
+            'LEFT OUTER JOIN assets AS A ON A.identifier=S.identifier '
+            'LEFT OUTER JOIN ethereum_tokens AS E ON E.address=S.details_reference '
+            'LEFT OUTER JOIN temp.staged_common_asset_details AS C ON C.asset_id=S.identifier '
+            'WHERE (S.is_update=0 AND (A.identifier IS NOT NULL OR E.address IS NOT NULL)) OR '
+            '(S.swapped_for IS NOT NULL AND S.swapped_for COLLATE NOCASE NOT IN '
+            '(SELECT identifier FROM assets UNION SELECT identifier FROM temp.staged_assets)) OR '
+            '(C.forked IS NOT NULL AND C.forked COLLATE NOCASE NOT IN '
+            '(SELECT identifier FROM assets UNION SELECT identifier FROM temp.staged_assets)) '
+            'ORDER BY S.rowid;',
+        )
+        for identifier, asset_exists in cursor.fetchall():
+            remote_asset_data, action, full_insert = staged.pop(identifier.lower())
+            unstaged.append((remote_asset_data, action, full_insert, bool(asset_exists)))
+            _unstage(cursor, remote_asset_data)
+
+        cursor.execute('SAVEPOINT staged_assets_update;')
+        try:
+            cursor.execute(
+                'INSERT INTO ethereum_tokens(address, decimals, protocol) '
+                'SELECT address, decimals, protocol FROM temp.staged_ethereum_tokens '
+                'WHERE is_update=0;',
+            )
+            cursor.execute(
+                'INSERT INTO assets(identifier, type, name, symbol, started, swapped_for, '
+                'coingecko, cryptocompare, details_reference) SELECT identifier, type, name, '
+                'symbol, started, swapped_for, coingecko, cryptocompare, details_reference '
+                'FROM temp.staged_assets WHERE is_update=0;',
+            )
+            cursor.execute(
+                'INSERT INTO common_asset_details(asset_id, forked) '
+                'SELECT asset_id, forked FROM temp.staged_common_asset_details '
+                'WHERE is_update=0;',
+            )
+            cursor.execute(
+                'UPDATE ethereum_tokens SET (decimals, protocol) = (SELECT S.decimals, '
+                'S.protocol FROM temp.staged_ethereum_tokens AS S WHERE S.is_update=1 AND '
+                'S.address=ethereum_tokens.address) WHERE address IN (SELECT address FROM '
+                'temp.staged_ethereum_tokens WHERE is_update=1);',
+            )
+            cursor.execute(
+                'UPDATE assets SET (type, name, symbol, started, swapped_for, coingecko, '
+                'cryptocompare, details_reference) = (SELECT S.type, S.name, S.symbol, '
+                'S.started, S.swapped_for, S.coingecko, S.cryptocompare, S.details_reference '
+                'FROM temp.staged_assets AS S WHERE S.is_update=1 AND '
+                'S.identifier=assets.identifier) WHERE identifier IN (SELECT identifier FROM '
+                'temp.staged_assets WHERE is_update=1);',
+            )
+            cursor.execute(
+                'UPDATE common_asset_details SET forked = (SELECT S.forked FROM '
+                'temp.staged_common_asset_details AS S WHERE S.is_update=1 AND '
+                'S.asset_id=common_asset_details.asset_id) WHERE asset_id IN (SELECT asset_id '
+                'FROM temp.staged_common_asset_details WHERE is_update=1);',
+            )
+        except sqlite3.Error as e:
+            log.debug(
+                f'Could not merge {len(staged)} entries of the v{version} assets update '
+                f'at once due to {str(e)}. Applying them one by one',
+            )
+            cursor.execute('ROLLBACK TO SAVEPOINT staged_assets_update;')
+            for remote_asset_data, action, full_insert in staged.values():
+                self._apply_single_entry(cursor, version, action, full_insert, remote_asset_data, conflicts)  # noqa: E501
+        else:
+            for remote_asset_data, action, full_insert in staged.values():
+                if action != full_insert:
+                    AssetResolver().clean_memory_cache(remote_asset_data.identifier.lower())
+        cursor.execute('RELEASE SAVEPOINT staged_assets_update;')
+        _clear_staging_tables(cursor)
+
+        for remote_asset_data, action, full_insert, asset_exists in unstaged:
+            if action != full_insert:
+                self._apply_single_entry(cursor, version, action, full_insert, remote_asset_data, conflicts)  # noqa: E501
+                continue
+
+            try:
+                local_asset = Asset(remote_asset_data.identifier)
+            except UnknownAsset:
+                # The asset exists only in the updated DB or its token address is taken
+                # so like the insertion of any unknown asset this fails
+                try:
+                    executeall(cursor, full_insert)
+                except sqlite3.Error as e:
+                    self._add_failed_entry_warning(remote_asset_data, version, str(e))
+                continue
+
+            if asset_exists:
+                self._handle_conflict(cursor, version, local_asset, remote_asset_data, full_insert, conflicts)  # noqa: E501
+            else:
+                self._apply_single_entry(cursor, version, full_insert, full_insert, remote_asset_data, conflicts)  # noqa: E501
+
     def _apply_single_version_update(
             self,
             cursor: sqlite3.Cursor,
@@ -287,6 +660,14 @@ class AssetsUpdater():
             text: str,
             conflicts: Optional[Dict[Asset, Literal['remote', 'local']]],
     ) -> None:
+        """Applies the entries of an update version.
+
+        Consecutive entries that only add assets or only update existing ones are staged
+        and merged into the DB all at once. Any other entry is applied on its own after
+        merging the ones staged before it so the order of the entries is kept.
+        """
+        _create_staging_tables(cursor)
+        staged: Dict[str, Tuple[AssetData, str, str]] = {}
         lines = text.splitlines()
         for action, full_insert in zip(*[iter(lines)] * 2):
             if full_insert == '*':
@@ -301,47 +682,19 @@ class AssetsUpdater():
                 )
                 continue
 
-            local_asset: Optional[Asset] = None
-            try:
-                local_asset = Asset(remote_asset_data.identifier)
-            except UnknownAsset:
-                pass
+            if remote_asset_data.identifier.lower() not in staged:
+                try:
+                    if self._stage_entry(cursor, action, full_insert, remote_asset_data):
+                        staged[remote_asset_data.identifier.lower()] = (remote_asset_data, action, full_insert)  # noqa: E501
+                        continue
+                except sqlite3.Error as e:
+                    log.debug(f'Could not stage assets update entry {action} due to {str(e)}')
 
-            try:
-                executeall(cursor, action)
-                if local_asset is not None:
-                    AssetResolver().clean_memory_cache(local_asset.identifier.lower())
-            except sqlite3.Error:  # https://docs.python.org/3/library/sqlite3.html#exceptions
-                if local_asset is None:
-                    try:  # if asset is not known then simply do an insertion
-                        executeall(cursor, full_insert)
-                    except sqlite3.Error as e:
-                        self.msg_aggregator.add_warning(
-                            f'Failed to add asset {remote_asset_data.identifier} in the '
-                            f'DB during the v{version} assets update. Skipping entry. '
-                            f'Error: {str(e)}',
-                        )
-                    continue  # fail or succeed continue to next entry
-
-                # otherwise asset is known, so it's a conflict. Check if we can resolve
-                resolution = conflicts.get(local_asset) if conflicts else None
-                if resolution == 'local':
-                    # do nothing, keep local
-                    continue
-                if resolution == 'remote':
-                    try:
-                        _force_remote(cursor, local_asset, full_insert)
-                    except sqlite3.Error as e:
-                        self.msg_aggregator.add_warning(
-                            f'Failed to resolve conflict for {remote_asset_data.identifier} in '
-                            f'the DB during the v{version} assets update. Skipping entry. '
-                            f'Error: {str(e)}',
-                        )
-                    continue  # fail or succeed continue to next entry
-
-                # else can't resolve. Mark it for the user to resolve.
-                local_data = AssetResolver().get_asset_data(local_asset.identifier, False)
-                self.conflicts.append((local_data, remote_asset_data))
+            self._apply_staged_entries(cursor, version, staged, conflicts)
+            staged = {}
+            self._apply_single_entry(cursor, version, action, full_insert, remote_asset_data, conflicts)  # noqa: E501
+
+        self._apply_staged_entries(cursor, version, staged, conflicts)
 
         # special case upgrade that should be temporary, until we make non-asset specific
         # update lines possible in our update mechanism:
@@ -406,6 +759,7 @@ class AssetsUpdater():
             connection.close()
             connection = GlobalDBHandler()._conn
             _replace_assets_from_db(connection, tempdbpath)
+            GlobalDBHandler.clear_assets_caches()
             return None
 
     def _perform_update(
@@ -408,9 +408,7 @@ class Inquirer():
             if token is not None:
                 if token.protocol is not None:
                     is_known_protocol = token.protocol in KnownProtocolsAssets
-                underlying_tokens = GlobalDBHandler().get_ethereum_token(  # type: ignore
-                    token.ethereum_address,
-                ).underlying_tokens
+                underlying_tokens = token.underlying_tokens
         except UnknownAsset:
             pass
 
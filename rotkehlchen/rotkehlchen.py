@@ -16,6 +16,7 @@ from rotkehlchen.accounting.structures import Balance, BalanceType
 from rotkehlchen.api.websockets.notifier import RotkiNotifier
 from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.assets.asset import Asset
+from rotkehlchen.assets.resolver import AssetResolver
 from rotkehlchen.balances.manual import (
     account_for_manually_tracked_asset_balances,
     get_manually_tracked_balances,
@@ -180,6 +181,8 @@ class Rotkehlchen():
             initial_settings=initial_settings,
         )
 
+        # Load all assets at once since login resolves thousands of them one by one
+        AssetResolver().warm_up()
         # unlock or create the DB
         self.password = password
         self.user_directory = self.data.unlock(user, password, create_new, initial_settings)
@@ -280,6 +283,11 @@ class Rotkehlchen():
             msg_aggregator=self.msg_aggregator,
         )
 
+        ethereum_manager.set_node_preferences(
+            pinned_nodes=settings.pinned_ethereum_nodes,
+            excluded_nodes=settings.excluded_ethereum_nodes,
+        )
+        ethereum_manager.hedged_calls = settings.hedged_ethereum_calls
         Inquirer().inject_ethereum(ethereum_manager)
         Inquirer().set_oracles_order(settings.current_price_oracles)
 
@@ -805,6 +813,24 @@ class Rotkehlchen():
         if settings.active_modules is not None:
             self.chain_manager.process_new_modules_list(settings.active_modules)
 
+        if settings.pinned_ethereum_nodes is not None or settings.excluded_ethereum_nodes is not None:  # noqa: E501
+            db_settings = self.data.db.get_settings()
+            self.chain_manager.ethereum.set_node_preferences(
+                pinned_nodes=(
+                    settings.pinned_ethereum_nodes
+                    if settings.pinned_ethereum_nodes is not None
+                    else db_settings.pinned_ethereum_nodes
+                ),
+                excluded_nodes=(
+                    settings.excluded_ethereum_nodes
+                    if settings.excluded_ethereum_nodes is not None
+                    else db_settings.excluded_ethereum_nodes
+                ),
+            )
+
+        if settings.hedged_ethereum_calls is not None:
+            self.chain_manager.ethereum.hedged_calls = settings.hedged_ethereum_calls
+
         self.data.db.set_settings(settings)
         return True, ''
 
@@ -57,7 +57,7 @@ from rotkehlchen.chain.ethereum.modules.yearn.vaults import (
 )
 from rotkehlchen.chain.ethereum.structures import AaveEvent
 from rotkehlchen.chain.ethereum.trades import AMMTrade
-from rotkehlchen.chain.ethereum.typing import Eth2Deposit
+from rotkehlchen.chain.ethereum.typing import Eth2Deposit, EthereumCallType, NodeName
 from rotkehlchen.db.settings import DBSettings
 from rotkehlchen.db.utils import DBAssetBalance, LocationData, SingleDBAssetBalance
 from rotkehlchen.exchanges.data_structures import Trade
@@ -187,6 +187,8 @@ def _process_entry(entry: Any) -> Union[str, List[Any], Dict[str, Any], Any]:
             TroveOperation,
             LiquityStakeEventType,
             BalanceType,
+            NodeName,
+            EthereumCallType,
     )):
         return str(entry)
 
@@ -2,7 +2,7 @@ import copy
 import logging
 import random
 from collections import defaultdict
-from typing import DefaultDict, List, NamedTuple, Set, Tuple
+from typing import Any, DefaultDict, Dict, List, NamedTuple, Set, Tuple
 
 import gevent
 
@@ -38,6 +38,9 @@ CRYPTOCOMPARE_HISTOHOUR_FREQUENCY = 240  # at least 4 mins apart
 XPUB_DERIVATION_FREQUENCY = 3600  # every hour
 ETH_TX_QUERY_FREQUENCY = 3600  # every hour
 EXCHANGE_QUERY_FREQUENCY = 3600  # every hour
+DB_WAL_CHECKPOINT_FREQUENCY = 1800  # every half hour
+DB_VACUUM_FREQUENCY = 600  # at least 10 mins apart
+DB_VACUUM_MAX_PAGES = 2048  # 8MB with the default page size
 
 
 def noop_exchange_succes_cb(trades, margin, asset_movements, ledger_actions, exchange_specific_data) -> None:  # type: ignore # noqa: E501
@@ -95,6 +98,8 @@ class TaskManager():
             self._maybe_schedule_exchange_history_query,
             self._maybe_schedule_ethereum_txreceipts,
             self._maybe_query_missing_prices,
+            self._maybe_checkpoint_database,
+            self._maybe_vacuum_database,
         ]
         self.schedule_lock = gevent.lock.Semaphore()
 
@@ -230,10 +235,23 @@ class TaskManager():
 
     def _run_ethereum_txreceipts_query(self, hash_results: List[Tuple]) -> None:
         dbethtx = DBEthTx(self.database)
-        for entry in hash_results:
-            tx_hash = '0x' + entry[0].hex()
-            tx_receipt_data = self.chain_manager.ethereum.get_transaction_receipt(tx_hash=tx_hash)
-            dbethtx.add_receipt_data(tx_receipt_data)
+        ethereum = self.chain_manager.ethereum
+        tx_hashes = ['0x' + entry[0].hex() for entry in hash_results]
+        receipts_data: List[Dict[str, Any]] = []
+        try:
+            try:
+                receipts_data = ethereum.get_transaction_receipts(tx_hashes=tx_hashes)
+            except RemoteError as e:
+                log.warning(
+                    f'Failed to query {len(tx_hashes)} transaction receipts together due '
+                    f'to {str(e)}. Querying them one by one',
+                )
+                for tx_hash in tx_hashes:
+                    receipts_data.append(ethereum.get_transaction_receipt(tx_hash=tx_hash))
+        finally:  # the receipts queried so far are saved in one go even if a query failed
+            with self.database.user_write():
+                for tx_receipt_data in receipts_data:
+                    dbethtx.add_receipt_data(tx_receipt_data)
 
     def _maybe_schedule_ethereum_txreceipts(self) -> None:
         """Schedules the ethereum transaction receipts query task"""
@@ -302,6 +320,33 @@ class TaskManager():
                 entries_missing_prices=entries,
             )
 
+    def _maybe_checkpoint_database(self) -> None:
+        """Truncates the write-ahead log of the DB so that it does not keep growing
+
+        SQLite checkpoints the log after commits but never shrinks the file itself
+        """
+        if ts_now() - self.database.last_wal_checkpoint_ts < DB_WAL_CHECKPOINT_FREQUENCY:
+            return
+
+        log.debug('Checkpointing the DB write-ahead log')
+        self.database.checkpoint_wal()
+
+    def _maybe_vacuum_database(self) -> None:
+        """Gives some of the free pages of the DB back to the filesystem
+
+        Deleted data leaves free pages in the DB file which only get reused by later
+        writes. They are given back in small steps and only while no other task runs,
+        since everything else waits for the vacuum to finish.
+        """
+        if ts_now() - self.database.last_vacuum_ts < DB_VACUUM_FREQUENCY:
+            return
+
+        if len(self.greenlet_manager.greenlets) != 0 or len(self.api_task_greenlets) != 0:
+            return
+
+        freed_pages = self.database.incremental_vacuum(max_pages=DB_VACUUM_MAX_PAGES)
+        log.debug(f'Incremental DB vacuum freed {freed_pages} pages')
+
     def get_base_entries_missing_prices(
         self,
         query_filter: HistoryEventFilterQuery,
@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 import pytest
 import requests
+from eth_utils import to_checksum_address
 
 from rotkehlchen.assets.asset import Asset, EthereumToken
 from rotkehlchen.assets.typing import AssetType
@@ -788,3 +789,122 @@ def test_update_no_user_loggedin(rotkehlchen_api_server):
         contained_in_msg='No user is currently logged in',
         status_code=HTTPStatus.CONFLICT,
     )
+
+
+@pytest.mark.parametrize('use_clean_caching_directory', [True])
+def test_update_many_new_assets(rotkehlchen_api_server, globaldb):
+    """Test that an update adding many assets is merged correctly in bulk
+
+    - Assets can be swapped for assets added later in the same update
+    - An entry whose token address is already taken is skipped with a warning
+    - Other entries in between keep their order
+    - An entry violating a foreign key is skipped with a warning and the new assets
+    around it are still added
+    """
+    rotki = rotkehlchen_api_server.rest_api.rotkehlchen
+    token_insert = 'INSERT INTO ethereum_tokens(address, decimals, protocol) VALUES("{address}", 18, NULL);INSERT INTO assets(identifier,type, name, symbol,started, swapped_for, coingecko, cryptocompare, details_reference) VALUES("_ceth_{address}", "C", "{name}", "{symbol}", 123, {swapped_for}, NULL, NULL, "{address}");\n*\n'  # noqa: E501
+    addresses = [to_checksum_address(f'0x{i:040x}') for i in range(1, 301)]
+    # the first token is swapped for a token which is added after it and the 250th for
+    # a token that does not exist
+    swapped_for = {0: f'"_ceth_{addresses[120]}"', 250: '"_ceth_0x000000000000000000000000000000000000dEaD"'}  # noqa: E501
+    entries = [
+        token_insert.format(address=address, name=f'token {i}', symbol=f'TKN{i}', swapped_for=swapped_for.get(i, 'NULL'))  # noqa: E501
+        for i, address in enumerate(addresses[:-1])
+    ]
+    # an asset with a different identifier for an existing token address
+    entries.insert(100, 'INSERT INTO ethereum_tokens(address, decimals, protocol) VALUES("0x6B175474E89094C44Da98b954EedeAC495271d0F", 18, NULL);INSERT INTO assets(identifier,type, name, symbol,started, swapped_for, coingecko, cryptocompare, details_reference) VALUES("DAI2", "C", "Dai 2", "DAI2", 123, NULL, NULL, NULL, "0x6B175474E89094C44Da98b954EedeAC495271d0F");\n*\n')  # noqa: E501
+    entries.insert(200, f'UPDATE assets SET name="renamed token" WHERE identifier="_ceth_{addresses[150]}";\nINSERT INTO ethereum_tokens(address, decimals, protocol) VALUES("{addresses[150]}", 18, NULL);INSERT INTO assets(identifier,type,name,symbol,started, swapped_for, coingecko, cryptocompare, details_reference) VALUES("_ceth_{addresses[150]}", "C", "renamed token", "TKN150", 123, NULL, NULL, NULL, "{addresses[150]}");\n')  # noqa: E501
+    entries.append(token_insert.format(address=addresses[-1], name='last token', symbol='LAST', swapped_for='NULL'))  # noqa: E501
+    update_patch = mock_asset_updates(
+        original_requests_get=requests.get,
+        latest=999999991,
+        updates={"999999991": {
+            "changes": len(entries),
+            "min_schema_version": GLOBAL_DB_VERSION,
+            "max_schema_version": GLOBAL_DB_VERSION,
+        }},
+        sql_actions={"999999991": ''.join(entries)},
+    )
+    globaldb.add_setting_value(ASSETS_VERSION_KEY, 999999990)
+    start_assets_num = len(globaldb.get_all_asset_data(mapping=False))
+    with update_patch:
+        response = requests.post(
+            api_url_for(
+                rotkehlchen_api_server,
+                'assetupdatesresource',
+            ),
+            json={'async_query': False},
+        )
+        assert assert_proper_response_with_result(response) is True
+
+    errors = rotki.msg_aggregator.consume_errors()
+    warnings = rotki.msg_aggregator.consume_warnings()
+    assert len(errors) == 0, f'Found errors: {errors}'
+    assert len(warnings) == 2
+    assert 'Failed to add asset DAI2' in warnings[0]
+    assert f'Failed to add asset _ceth_{addresses[250]}' in warnings[1]
+    assert globaldb.get_setting_value(ASSETS_VERSION_KEY, None) == 999999991
+    assert len(globaldb.get_all_asset_data(mapping=False)) == start_assets_num + 299
+    first_token = EthereumToken(addresses[0])
+    assert first_token.name == 'token 0'
+    assert first_token.decimals == 18
+    assert first_token.swapped_for == EthereumToken(addresses[120])
+    assert EthereumToken(addresses[251]).name == 'token 251'
+    assert EthereumToken(addresses[-1]).name == 'last token'
+    assert EthereumToken(addresses[150]).name == 'renamed token'
+    assert EthereumToken('0x6B175474E89094C44Da98b954EedeAC495271d0F').symbol == 'DAI'
+
+
+def test_update_many_existing_assets(rotkehlchen_api_server, globaldb):
+    """Test that an update changing many existing assets is merged correctly in bulk
+
+    - A ; inside a quoted value does not split the statement
+    - Updates of the ethereum token details are applied
+    - An asset can be swapped for an asset added in the same update
+    """
+    rotki = rotkehlchen_api_server.rest_api.rotkehlchen
+    dai_address = '0x6B175474E89094C44Da98b954EedeAC495271d0F'
+    update_1 = f"""UPDATE assets SET name="Euro; the currency" WHERE identifier="EUR";
+INSERT INTO assets(identifier,type,name,symbol,started, swapped_for, coingecko, cryptocompare, details_reference) VALUES("EUR", "A","Euro; the currency","EUR",NULL, NULL,NULL,NULL, "EUR");INSERT INTO common_asset_details(asset_id, forked) VALUES("EUR", NULL);
+UPDATE assets SET name="US Dollar" WHERE identifier="USD";
+INSERT INTO assets(identifier,type,name,symbol,started, swapped_for, coingecko, cryptocompare, details_reference) VALUES("USD", "A","US Dollar","USD",NULL, NULL,NULL,NULL, "USD");INSERT INTO common_asset_details(asset_id, forked) VALUES("USD", NULL);
+INSERT INTO assets(identifier,type,name,symbol,started, swapped_for, coingecko, cryptocompare, details_reference) VALUES("121-ada-FADS-as", "F","A name","SYMBOL",NULL, NULL,"", "", "121-ada-FADS-as");INSERT INTO common_asset_details(asset_id, forked) VALUES("121-ada-FADS-as", "BTC");
+*
+UPDATE ethereum_tokens SET decimals=17, protocol="makerdao" WHERE address="{dai_address}";UPDATE assets SET swapped_for="121-ada-FADS-as" WHERE identifier="_ceth_{dai_address}";
+INSERT INTO ethereum_tokens(address, decimals, protocol) VALUES("{dai_address}", 17, "makerdao");INSERT INTO assets(identifier,type, name, symbol,started, swapped_for, coingecko, cryptocompare, details_reference) VALUES("_ceth_{dai_address}", "C", "Multi Collateral Dai", "DAI", 1573672677, "121-ada-FADS-as", "dai", NULL, "{dai_address}");
+    """  # noqa: E501
+    update_patch = mock_asset_updates(
+        original_requests_get=requests.get,
+        latest=999999991,
+        updates={"999999991": {
+            "changes": 4,
+            "min_schema_version": GLOBAL_DB_VERSION,
+            "max_schema_version": GLOBAL_DB_VERSION,
+        }},
+        sql_actions={"999999991": update_1},
+    )
+    globaldb.add_setting_value(ASSETS_VERSION_KEY, 999999990)
+    start_assets_num = len(globaldb.get_all_asset_data(mapping=False))
+    with update_patch:
+        response = requests.post(
+            api_url_for(
+                rotkehlchen_api_server,
+                'assetupdatesresource',
+            ),
+            json={'async_query': False},
+        )
+        assert assert_proper_response_with_result(response) is True
+
+    errors = rotki.msg_aggregator.consume_errors()
+    warnings = rotki.msg_aggregator.consume_warnings()
+    assert len(errors) == 0, f'Found errors: {errors}'
+    assert len(warnings) == 0, f'Found warnings: {warnings}'
+    assert globaldb.get_setting_value(ASSETS_VERSION_KEY, None) == 999999991
+    assert len(globaldb.get_all_asset_data(mapping=False)) == start_assets_num + 1
+    assert Asset('EUR').name == 'Euro; the currency'
+    assert Asset('USD').name == 'US Dollar'
+    dai = EthereumToken(dai_address)
+    assert dai.name == 'Multi Collateral Dai'
+    assert dai.decimals == 17
+    assert dai.protocol == 'makerdao'
+    assert dai.swapped_for == Asset('121-ada-FADS-as')
@@ -824,3 +824,119 @@ def test_replace_asset_edge_cases(rotkehlchen_api_server, globaldb):
         contained_in_msg='Tried to initialize an asset out of a non-string identifier',
         status_code=HTTPStatus.BAD_REQUEST,
     )
+
+
+@pytest.mark.parametrize('use_clean_caching_directory', [True])
+@pytest.mark.parametrize('start_with_logged_in_user', [True])
+def test_search_assets(rotkehlchen_api_server, globaldb):
+    """Test that the assets search endpoint ranks, paginates and sees new assets"""
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': 'dai', 'limit': 100},
+    )
+    result = assert_proper_response_with_result(response)
+    all_entries = result['entries']
+    assert result['entries_found'] == len(all_entries) > 2
+    dai_identifier = strethaddress_to_identifier('0x6B175474E89094C44Da98b954EedeAC495271d0F')
+    assert all_entries[0]['identifier'] == dai_identifier
+    assert all_entries[0]['symbol'] == 'DAI'
+
+    # owned assets come right after the exact symbol matches
+    sai_identifier = strethaddress_to_identifier('0x89d24A6b4CcB1B6fAA2625fE562bDD9a23260359')
+    assert all_entries[1]['identifier'] != sai_identifier
+    globaldb.add_user_owned_assets([Asset(sai_identifier)])
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': 'dai', 'limit': 2, 'offset': 0},
+    )
+    result = assert_proper_response_with_result(response)
+    assert result['entries_found'] == len(all_entries)
+    assert [x['identifier'] for x in result['entries']] == [dai_identifier, sai_identifier]
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': 'dai', 'limit': 2, 'offset': len(all_entries) - 1},
+    )
+    result = assert_proper_response_with_result(response)
+    assert len(result['entries']) == 1
+
+    # tokens can be found by the start of their address
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': '0x6b1754'},
+    )
+    result = assert_proper_response_with_result(response)
+    assert result['entries_found'] == 1
+    assert result['entries'][0]['identifier'] == dai_identifier
+
+    # newly added assets can be found by the start of each word of their name
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': 'fooba tok'},
+    )
+    assert assert_proper_response_with_result(response) == {'entries': [], 'entries_found': 0}
+    identifier = 'FOOBARID'
+    globaldb.add_asset(
+        asset_id=identifier,
+        asset_type=AssetType.OWN_CHAIN,
+        data={'name': 'foobar token', 'symbol': 'FOOBAR'},
+    )
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': 'fooba tok'},
+    )
+    result = assert_proper_response_with_result(response)
+    assert result['entries_found'] == 1
+    assert result['entries'][0]['identifier'] == identifier
+    assert result['entries'][0]['name'] == 'foobar token'
+
+    # the index entry of a single asset is updated when the asset is edited or deleted
+    globaldb.edit_custom_asset({
+        'identifier': identifier,
+        'asset_type': AssetType.OWN_CHAIN,
+        'name': 'bazbar token',
+        'symbol': 'BAZBAR',
+    })
+    cursor = globaldb._conn.cursor()
+    assert cursor.execute('SELECT COUNT(*) FROM assets_search').fetchone()[0] == cursor.execute(
+        'SELECT COUNT(*) FROM assets',
+    ).fetchone()[0]
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': 'bazba'},
+    )
+    result = assert_proper_response_with_result(response)
+    assert result['entries_found'] == 1
+    assert result['entries'][0]['identifier'] == identifier
+    assert result['entries'][0]['name'] == 'bazbar token'
+    globaldb.delete_custom_asset(identifier)
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': 'bazba'},
+    )
+    assert assert_proper_response_with_result(response) == {'entries': [], 'entries_found': 0}
+
+    # text without any words matches nothing
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': '" *'},
+    )
+    assert assert_proper_response_with_result(response) == {'entries': [], 'entries_found': 0}
+
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': ''},
+    )
+    assert_error_response(
+        response=response,
+        contained_in_msg='Shorter than minimum length 1',
+        status_code=HTTPStatus.BAD_REQUEST,
+    )
+    response = requests.get(
+        api_url_for(rotkehlchen_api_server, 'assetssearchresource'),
+        json={'value': 'dai', 'limit': 0},
+    )
+    assert_error_response(
+        response=response,
+        contained_in_msg='The asset search limit should be between 1 and 100',
+        status_code=HTTPStatus.BAD_REQUEST,
+    )
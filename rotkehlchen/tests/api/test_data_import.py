@@ -3,10 +3,12 @@ import shutil
 from http import HTTPStatus
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
 import requests
 
+from rotkehlchen.errors import DeserializationError
 from rotkehlchen.tests.utils.api import (
     api_url_for,
     assert_error_response,
@@ -124,6 +126,36 @@ def test_data_import_blockfi_transactions(rotkehlchen_api_server):
     assert_blockfi_transactions_import_results(rotki)
 
 
+@pytest.mark.parametrize('number_of_eth_accounts', [0])
+def test_data_import_failing_row_is_rolled_back(rotkehlchen_api_server):
+    """Test that a row failing after some of its writes leaves none of them in the DB,
+    while the import of the other rows goes on"""
+    rotki = rotkehlchen_api_server.rest_api.rotkehlchen
+    importer = rotki.data_importer
+    consume_entry = importer._consume_blockfi_entry
+    consumed_rows = 0
+
+    def consume_and_fail(csv_row, **kwargs):
+        nonlocal consumed_rows
+        consume_entry(csv_row, **kwargs)
+        consumed_rows += 1
+        raise DeserializationError('failed after writing')
+
+    dir_path = Path(__file__).resolve().parent.parent
+    filepath = dir_path / 'data' / 'blockfi-transactions.csv'
+    with patch.object(importer, '_consume_blockfi_entry', side_effect=consume_and_fail):
+        success, _ = importer.import_blockfi_transactions_csv(filepath)
+
+    assert success is True
+    assert consumed_rows != 0
+    cursor = rotki.data.db.conn.cursor()
+    assert cursor.execute('SELECT COUNT(*) FROM asset_movements').fetchone()[0] == 0
+    assert cursor.execute('SELECT COUNT(*) FROM ledger_actions').fetchone()[0] == 0
+    warnings = rotki.msg_aggregator.consume_warnings()
+    assert len(warnings) >= consumed_rows
+    assert all('failed after writing' in x for x in warnings[-consumed_rows:])
+
+
 @pytest.mark.parametrize('number_of_eth_accounts', [0])
 def test_data_import_blockfi_trades(rotkehlchen_api_server):
     """Test that the data import endpoint works successfully for blockfi trades"""
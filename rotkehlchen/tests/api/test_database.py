@@ -159,3 +159,38 @@ def test_delete_download_backup_errors(rotkehlchen_api_server, data_dir, usernam
     )
     assert undeletable_file.exists()
     assert filepath.exists()
+
+
+@pytest.mark.parametrize('start_with_logged_in_user', [True, False])
+def test_query_and_vacuum_db_health(rotkehlchen_api_server, start_with_logged_in_user):
+    """Test that the DB statistics can be queried and the free pages given back"""
+    response = requests.get(api_url_for(rotkehlchen_api_server, 'databasehealthresource'))
+    if not start_with_logged_in_user:
+        assert_error_response(
+            response=response,
+            contained_in_msg='No user is currently logged in',
+            status_code=HTTPStatus.CONFLICT,
+        )
+        return
+
+    db = rotkehlchen_api_server.rest_api.rotkehlchen.data.db
+    db.conn.executemany(
+        'INSERT INTO timed_location_data(time, location, usd_value) VALUES(?, "A", ?)',
+        [(idx, 'a' * 1000) for idx in range(1000)],
+    )
+    db.conn.commit()
+    db.conn.execute('DELETE FROM timed_location_data WHERE time >= 500;')
+    db.conn.commit()
+    response = requests.get(api_url_for(rotkehlchen_api_server, 'databasehealthresource'))
+    result = assert_proper_response_with_result(response)
+    assert result['auto_vacuum'] == 'incremental'
+    assert result['freelist_count'] > 0
+    assert {'name': 'timed_location_data', 'rows': 500} in [
+        {'name': x['name'], 'rows': x['rows']} for x in result['tables']
+    ]
+    assert 'idx_history_events_asset' in [x['name'] for x in result['indexes']]
+
+    response = requests.put(api_url_for(rotkehlchen_api_server, 'databasehealthresource'))
+    after_vacuum = assert_proper_response_with_result(response)
+    assert after_vacuum['freelist_count'] == 0
+    assert after_vacuum['page_count'] == result['page_count'] - result['freelist_count']
@@ -5,6 +5,7 @@ from unittest.mock import patch
 import pytest
 import requests
 
+from rotkehlchen.chain.ethereum.typing import NodeName
 from rotkehlchen.db.settings import ROTKEHLCHEN_DB_VERSION, DBSettings
 from rotkehlchen.tests.utils.api import (
     api_url_for,
@@ -96,6 +97,12 @@ def test_set_settings(rotkehlchen_api_server):
             value = ['coingecko', 'cryptocompare']
         elif setting == 'taxable_ledger_actions':
             value = ['income']
+        elif setting == 'pinned_ethereum_nodes':
+            value = ['etherscan']
+        elif setting == 'excluded_ethereum_nodes':
+            value = ['cloudflare-eth', '1inch']
+        elif setting == 'hedged_ethereum_calls':
+            value = ['eth balances', 'token balances']
         else:
             raise AssertionError(f'Unexpected settting {setting} encountered')
 
@@ -438,6 +445,82 @@ def test_set_settings_errors(rotkehlchen_api_server):
         status_code=HTTPStatus.BAD_REQUEST,
     )
 
+    # unknown ethereum node
+    data = {
+        'settings': {'pinned_ethereum_nodes': ['etherscan', 'foo']},
+    }
+    response = requests.put(api_url_for(rotkehlchen_api_server, "settingsresource"), json=data)
+    assert_error_response(
+        response=response,
+        contained_in_msg='Invalid ethereum node: foo',
+        status_code=HTTPStatus.BAD_REQUEST,
+    )
+
+    # node both pinned and excluded
+    data = {
+        'settings': {
+            'pinned_ethereum_nodes': ['etherscan', 'mycrypto'],
+            'excluded_ethereum_nodes': ['mycrypto'],
+        },
+    }
+    response = requests.put(api_url_for(rotkehlchen_api_server, "settingsresource"), json=data)
+    assert_error_response(
+        response=response,
+        contained_in_msg='Ethereum nodes mycrypto can not be both pinned and excluded',
+        status_code=HTTPStatus.BAD_REQUEST,
+    )
+
+
+def test_pin_and_exclude_ethereum_nodes(rotkehlchen_api_server):
+    """Test that pinned and excluded ethereum nodes are used by the ethereum manager
+    and shown in the nodes health"""
+    ethereum = rotkehlchen_api_server.rest_api.rotkehlchen.chain_manager.ethereum
+    response = requests.put(
+        api_url_for(rotkehlchen_api_server, "settingsresource"),
+        json={'settings': {
+            'pinned_ethereum_nodes': ['etherscan'],
+            'excluded_ethereum_nodes': ['1inch', 'cloudflare-eth'],
+        }},
+    )
+    assert_proper_response(response)
+    assert ethereum.pinned_nodes == [NodeName.ETHERSCAN]
+    assert ethereum.excluded_nodes == [NodeName.ONEINCH, NodeName.CLOUDFLARE_ETH]
+    call_order = ethereum.default_call_order()
+    assert call_order[0] == NodeName.ETHERSCAN
+    assert NodeName.ONEINCH not in call_order and NodeName.CLOUDFLARE_ETH not in call_order
+
+    # changing only the excluded nodes keeps the pinned ones
+    response = requests.put(
+        api_url_for(rotkehlchen_api_server, "settingsresource"),
+        json={'settings': {'excluded_ethereum_nodes': ['myetherwallet']}},
+    )
+    assert_proper_response(response)
+    assert ethereum.pinned_nodes == [NodeName.ETHERSCAN]
+    assert ethereum.excluded_nodes == [NodeName.MYETHERWALLET]
+
+    response = requests.get(api_url_for(rotkehlchen_api_server, "ethereumnodesresource"))
+    result = assert_proper_response_with_result(response)
+    assert result['contract_call_cache_hits'] == ethereum.contract_call_cache_hits
+    assert result['contract_call_cache_misses'] == ethereum.contract_call_cache_misses
+    nodes = {x['name']: x for x in result['nodes']}
+    assert set(nodes.keys()) == {str(x) for x in NodeName}
+    assert nodes['etherscan'] == {
+        'name': 'etherscan',
+        'connected': True,
+        'pinned': True,
+        'excluded': False,
+        'state': 'closed',
+        'latency': None,
+        'error_rate': 0,
+        'queries': 0,
+        'failures': 0,
+        'hedges': 0,
+        'hedges_won': 0,
+        'cancelled': 0,
+    }
+    assert nodes['myetherwallet']['excluded'] is True
+    assert nodes['own node']['connected'] is False
+
 
 def assert_queried_addresses_match(
         result: Dict[ModuleName, List[ChecksumEthAddress]],
@@ -213,6 +213,20 @@ def test_query_statistics_asset_balance_errors(rotkehlchen_api_server, rest_api_
         status_code=HTTPStatus.BAD_REQUEST,
     )
 
+    # Check that asking for fewer than 3 points is an error
+    response = requests.get(
+        api_url_for(
+            rotkehlchen_api_server,
+            "statisticsassetbalanceresource",
+            asset="BTC",
+        ), json={'from_timestamp': 0, 'to_timestamp': start_time, 'max_points': 2},
+    )
+    assert_error_response(
+        response=response,
+        contained_in_msg='The maximum number of points must be at least 3',
+        status_code=HTTPStatus.BAD_REQUEST,
+    )
+
 
 @pytest.mark.parametrize('number_of_eth_accounts', [2])
 @pytest.mark.parametrize('btc_accounts', [[UNIT_BTC_ADDRESS1, UNIT_BTC_ADDRESS2]])
@@ -2,9 +2,12 @@ import logging
 import os
 import time
 from copy import deepcopy
+from pathlib import Path
 from unittest.mock import patch
 
+import gevent
 import pytest
+from pysqlcipher3 import dbapi2 as sqlcipher
 
 from rotkehlchen.accounting.ledger_actions import LedgerActionType
 from rotkehlchen.accounting.structures import ActionType, BalanceType
@@ -14,8 +17,14 @@ from rotkehlchen.constants import YEAR_IN_SECONDS
 from rotkehlchen.constants.assets import A_1INCH, A_BTC, A_DAI, A_ETH, A_USD
 from rotkehlchen.data_handler import DataHandler
 from rotkehlchen.db.dbhandler import DBHandler, detect_sqlcipher_version
-from rotkehlchen.db.filtering import AssetMovementsFilterQuery, TradesFilterQuery
+from rotkehlchen.db.filtering import (
+    AssetMovementsFilterQuery,
+    HistoryEventFilterQuery,
+    TradesFilterQuery,
+)
+from rotkehlchen.db.history_events import DBHistoryEvents
 from rotkehlchen.db.queried_addresses import QueriedAddresses
+from rotkehlchen.db.schema import DB_SCRIPT_POPULATE_OWNED_ASSETS
 from rotkehlchen.db.settings import (
     DEFAULT_ACCOUNT_FOR_ASSETS_MOVEMENTS,
     DEFAULT_ACTIVE_MODULES,
@@ -25,11 +34,14 @@ from rotkehlchen.db.settings import (
     DEFAULT_CURRENT_PRICE_ORACLES,
     DEFAULT_DATE_DISPLAY_FORMAT,
     DEFAULT_DISPLAY_DATE_IN_LOCALTIME,
+    DEFAULT_EXCLUDED_ETHEREUM_NODES,
+    DEFAULT_HEDGED_ETHEREUM_CALLS,
     DEFAULT_HISTORICAL_PRICE_ORACLES,
     DEFAULT_INCLUDE_CRYPTO2CRYPTO,
     DEFAULT_INCLUDE_GAS_COSTS,
     DEFAULT_LAST_DATA_MIGRATION,
     DEFAULT_MAIN_CURRENCY,
+    DEFAULT_PINNED_ETHEREUM_NODES,
     DEFAULT_PNL_CSV_HAVE_SUMMARY,
     DEFAULT_PNL_CSV_WITH_FORMULAS,
     DEFAULT_SSF_0GRAPH_MULTIPLIER,
@@ -41,7 +53,12 @@ from rotkehlchen.db.settings import (
 )
 from rotkehlchen.db.utils import BlockchainAccounts, DBAssetBalance, LocationData
 from rotkehlchen.errors import AuthenticationError, InputError
-from rotkehlchen.exchanges.data_structures import AssetMovement, MarginPosition, Trade
+from rotkehlchen.exchanges.data_structures import (
+    AssetMovement,
+    AssetMovementView,
+    MarginPosition,
+    Trade,
+)
 from rotkehlchen.fval import FVal
 from rotkehlchen.premium.premium import PremiumCredentials
 from rotkehlchen.serialization.deserialize import deserialize_asset_movement_category
@@ -81,6 +98,7 @@ TABLES_AT_INIT = [
     'yearn_vaults_events',
     'timed_balances',
     'timed_location_data',
+    'balance_snapshot_summaries',
     'asset_movement_category',
     'balance_category',
     'external_service_credentials',
@@ -92,6 +110,8 @@ TABLES_AT_INIT = [
     'trades',
     'ethereum_transactions',
     'ethtx_receipts',
+    'ethtx_addresses',
+    'ethtx_topics',
     'ethtx_receipt_logs',
     'ethtx_receipt_log_topics',
     'manually_tracked_balances',
@@ -121,6 +141,7 @@ TABLES_AT_INIT = [
     'gitcoin_grant_metadata',
     'nfts',
     'history_events',
+    'owned_assets',
 ]
 
 
@@ -347,6 +368,9 @@ def test_writing_fetching_data(data_dir, username):
         'pnl_csv_have_summary': DEFAULT_PNL_CSV_HAVE_SUMMARY,
         'ssf_0graph_multiplier': DEFAULT_SSF_0GRAPH_MULTIPLIER,
         'last_data_migration': DEFAULT_LAST_DATA_MIGRATION,
+        'pinned_ethereum_nodes': DEFAULT_PINNED_ETHEREUM_NODES,
+        'excluded_ethereum_nodes': DEFAULT_EXCLUDED_ETHEREUM_NODES,
+        'hedged_ethereum_calls': DEFAULT_HEDGED_ETHEREUM_CALLS,
     }
     assert len(expected_dict) == len(DBSettings()), 'One or more settings are missing'
 
@@ -558,6 +582,45 @@ def test_query_timed_balances(data_dir, username):
     assert result[0].usd_value == '9.98'
 
 
+def test_query_timed_balances_zero_gaps_and_max_points(data_dir, username):
+    """Test that long gaps get zero balances at their ends and that balances can be
+    downsampled to a maximum number of points"""
+    msg_aggregator = MessagesAggregator()
+    data = DataHandler(data_dir, msg_aggregator)
+    data.unlock(username, '123', create_new=True)
+    data.db.set_settings(ModifiableDBSettings(balance_save_frequency=24, ssf_0graph_multiplier=2))  # noqa: E501
+    day = 24 * 60 * 60
+    start_ts = 1451606400
+    data.db.add_multiple_balances([
+        DBAssetBalance(
+            category=BalanceType.ASSET,
+            time=Timestamp(start_ts + offset * day),
+            asset=A_BTC,
+            amount='1',
+            usd_value='10',
+        ) for offset in (0, 1, 11)
+    ])
+
+    result = data.db.query_timed_balances(A_BTC)
+    assert [(x.time - start_ts) // day for x in result] == [0, 1, 2, 9, 11]
+    assert [x.usd_value for x in result] == ['10', '10', '0', '0', '10']
+
+    data.db.add_multiple_balances([
+        DBAssetBalance(
+            category=BalanceType.ASSET,
+            time=Timestamp(start_ts + offset * day),
+            asset=A_ETH,
+            amount='1',
+            usd_value='100' if offset == 50 else '1',
+        ) for offset in range(100)
+    ])
+    result = data.db.query_timed_balances(A_ETH, max_points=10)
+    assert len(result) == 10
+    assert result[0].time == start_ts
+    assert result[-1].time == start_ts + 99 * day
+    assert start_ts + 50 * day in {x.time for x in result}
+
+
 def test_query_owned_assets(data_dir, username):
     """Test the get_owned_assets with also an unknown asset in the DB"""
     msg_aggregator = MessagesAggregator()
@@ -655,6 +718,29 @@ def test_query_owned_assets(data_dir, username):
     warnings = data.db.msg_aggregator.consume_warnings()
     assert len(warnings) == 0
 
+    # the owned assets follow deletions, replacements and updates of the history
+    cursor = data.db.conn.cursor()
+    cursor.execute('DELETE FROM trades WHERE base_asset=?', (A_SUSHI.identifier,))
+    cursor.execute(
+        'INSERT OR REPLACE INTO timed_balances(category, time, currency, amount, usd_value) '
+        'VALUES(?, ?, ?, ?, ?)',
+        (BalanceType.ASSET.serialize_for_db(), 1489326500, A_XMR.identifier, '3', '50'),
+    )
+    cursor.execute(
+        'UPDATE timed_balances SET category=? WHERE currency=?',
+        (BalanceType.LIABILITY.serialize_for_db(), A_XMR.identifier),
+    )
+    cursor.execute(
+        'UPDATE trades SET quote_asset=? WHERE base_asset=?',
+        (A_DAI.identifier, A_SDC.identifier),
+    )
+    data.db.conn.commit()
+    assert set(data.db.query_owned_assets()) == {A_USD, A_ETH, A_BTC, A_SDC, A_DAI}
+    # and match the counts of a population from scratch
+    ref_counts = cursor.execute('SELECT * FROM owned_assets ORDER BY identifier').fetchall()
+    cursor.executescript(DB_SCRIPT_POPULATE_OWNED_ASSETS)
+    assert cursor.execute('SELECT * FROM owned_assets ORDER BY identifier').fetchall() == ref_counts  # noqa: E501
+
 
 def test_get_latest_location_value_distribution(data_dir, username):
     msg_aggregator = MessagesAggregator()
@@ -754,6 +840,35 @@ def test_get_netvalue_without_nfts(data_dir, username):
     assert values[3] == '4500'
 
 
+def test_save_balances_data_summary(data_dir, username):
+    """Test that saving a balance snapshot also saves its totals with and without NFTs"""
+    msg_aggregator = MessagesAggregator()
+    data = DataHandler(data_dir, msg_aggregator)
+    data.unlock(username, '123', create_new=True)
+    data.db.add_asset_identifiers(['_nft_pickle'])
+    data.db.save_balances_data(
+        data={
+            'assets': {
+                A_ETH: {'amount': FVal('2'), 'usd_value': FVal('5000.5')},
+                Asset('_nft_pickle'): {'amount': FVal('1'), 'usd_value': FVal('1000')},
+            },
+            'liabilities': {A_DAI: {'amount': FVal('500'), 'usd_value': FVal('500')}},
+            'location': {'blockchain': {'usd_value': FVal('5500.5')}},
+            'net_usd': FVal('5500.5'),
+        },
+        timestamp=Timestamp(1488326400),
+    )
+
+    times, values = data.db.get_netvalue_data(Timestamp(0))
+    assert times == [1488326400]
+    assert values == ['5500.5']
+    times, values = data.db.get_netvalue_data(Timestamp(0), include_nfts=False)
+    assert times == [1488326400]
+    assert values == ['4500.5']
+    locations = data.db.get_latest_location_value_distribution()
+    assert {x.location: x.usd_value for x in locations} == {'H': '5500.5', 'J': '5500.5'}
+
+
 def test_add_trades(data_dir, username, caplog):
     """Test that adding and retrieving trades from the DB works fine.
 
@@ -954,6 +1069,20 @@ def test_add_asset_movements(data_dir, username, caplog):
     )
     assert returned_movements == [movement1, movement2, movement3]
 
+    columns = AssetMovementView.columns_of(None)
+    rows = data.db.conn.execute(
+        f'SELECT {",".join(columns)} FROM asset_movements ORDER BY time, id;',
+    )
+    views = AssetMovementView.from_rows(rows.fetchall(), columns)
+    assert [x.to_asset_movement() for x in views] == returned_movements
+    columns = AssetMovementView.columns_of(['location', 'amount'])
+    rows = data.db.conn.execute(
+        f'SELECT {",".join(columns)} FROM asset_movements WHERE location=?;',
+        (Location.BITTREX.serialize_for_db(),),
+    )
+    views = AssetMovementView.from_rows(rows.fetchall(), columns)
+    assert [(x.location, x.amount) for x in views] == [(Location.BITTREX, FVal('1.0'))]
+
 
 @pytest.mark.parametrize('ethereum_accounts', [[]])
 def test_non_checksummed_eth_account_in_db(database):
@@ -1329,3 +1458,194 @@ def test_fresh_db_adds_version(user_data_dir):
     query = query.fetchall()
     assert len(query) != 0
     assert int(query[0][0]) == ROTKEHLCHEN_DB_VERSION
+
+
+def test_read_connections(database):
+    """Test that the DB uses a write-ahead log and that reads go through the pool
+    of read connections unless the writer has uncommitted changes"""
+    assert database.conn.execute('PRAGMA journal_mode;').fetchone()[0] == 'wal'
+    cursor = database.conn.cursor()
+    cursor.execute('INSERT INTO settings(name, value) VALUES("test_setting", "1")')
+    with database.read_cursor() as read_cursor:  # sees the uncommitted change
+        assert read_cursor.connection == database.conn
+        assert read_cursor.execute('SELECT value FROM settings WHERE name="test_setting"').fetchone() == ('1',)  # noqa: E501
+    database.conn.commit()
+
+    with database.read_cursor() as read_cursor:
+        read_connection = read_cursor.connection
+        assert read_connection != database.conn
+        assert read_cursor.execute('SELECT value FROM settings WHERE name="test_setting"').fetchone() == ('1',)  # noqa: E501
+        with pytest.raises(sqlcipher.OperationalError):  # pylint: disable=no-member
+            read_cursor.execute('DELETE FROM settings')
+    assert database.read_connections == [read_connection]
+    with database.read_cursor() as read_cursor:  # the idle connection is reused
+        assert read_cursor.connection == read_connection
+
+    assert database.checkpoint_wal() is True
+    assert (database.user_data_dir / 'rotkehlchen.db-wal').stat().st_size == 0
+    database.disconnect()
+    assert database.read_connections == []
+    assert not (database.user_data_dir / 'rotkehlchen.db-wal').exists()
+
+
+def test_backup_has_data_still_in_the_wal(database):
+    """Test that a DB backup has the committed data that is only in the write-ahead log
+    when the log can't be checkpointed, and not the writes that are not committed yet"""
+    cursor = database.conn.cursor()
+    cursor.execute('INSERT INTO settings(name, value) VALUES("committed_setting", "1")')
+    database.conn.commit()
+    cursor.execute('INSERT INTO settings(name, value) VALUES("pending_setting", "1")')
+    assert database.checkpoint_wal() is False
+    with database.read_cursor() as read_cursor:
+        assert read_cursor.connection == database.conn
+
+    backup_path = database.create_db_backup()
+    database.conn.rollback()
+    backup = database._open_connection(fullpath=backup_path, password=database.password)
+    settings = {x[0] for x in backup.execute('SELECT name FROM settings')}
+    backup.close()
+    assert 'committed_setting' in settings
+    assert 'pending_setting' not in settings
+
+
+def test_restore_from_backup(database, tmpdir_factory):
+    """Test that restoring a backup replaces all of the DB, also for the other open
+    connections, and keeps the DB in write-ahead log mode with foreign keys on"""
+    database.add_tag(name='public', description='', background_color='ffffff', foreground_color='000000')  # noqa: E501
+    backup_path = Path(tmpdir_factory.mktemp('backup')) / 'rotkehlchen.db'
+    database.backup_to(backup_path)
+
+    database.add_tag(name='private', description='', background_color='ffffff', foreground_color='000000')  # noqa: E501
+    database.conn.execute('CREATE TABLE restore_test (value INTEGER);')
+    database.conn.commit()
+    with database.read_cursor() as cursor:
+        assert cursor.execute('SELECT COUNT(*) FROM tags').fetchone()[0] == 2
+
+    database.restore_from(backup_path)
+    assert list(database.get_tags()) == ['public']
+    with database.read_cursor() as cursor:
+        assert cursor.connection != database.conn
+        assert cursor.execute('SELECT name FROM tags').fetchall() == [('public',)]
+        assert cursor.execute(
+            'SELECT COUNT(*) FROM sqlite_master WHERE name="restore_test"',
+        ).fetchone()[0] == 0
+    assert database.conn.execute('PRAGMA journal_mode;').fetchone()[0] == 'wal'
+    assert database.conn.execute('PRAGMA foreign_keys;').fetchone()[0] == 1
+    assert database.conn.execute('PRAGMA integrity_check;').fetchone()[0] == 'ok'
+    assert database.conn.execute('PRAGMA foreign_key_check;').fetchall() == []
+
+
+def test_user_write(database):
+    """Test that the writes of a user_write() are committed once at its end, that a
+    nested one only rolls back its own writes and that an outer one rolls back all"""
+    database.last_write_ts = Timestamp(0)
+    with database.user_write():
+        database.update_used_query_range('range_a', Timestamp(1), Timestamp(2))
+        with pytest.raises(InputError), database.user_write():
+            database.update_used_query_range('range_b', Timestamp(1), Timestamp(2))
+            raise InputError('failed')
+        database.add_tag(name='public', description='', background_color='ffffff', foreground_color='000000')  # noqa: E501
+        assert database.conn.in_transaction
+        assert database.last_write_ts == 0
+        with database.read_cursor() as cursor:  # uncommitted changes visible to the writer
+            assert cursor.execute('SELECT COUNT(*) FROM tags').fetchone()[0] == 1
+
+    assert not database.conn.in_transaction
+    assert database.last_write_ts != 0
+    with database.read_cursor() as cursor:
+        assert cursor.connection != database.conn
+        assert cursor.execute('SELECT name FROM used_query_ranges').fetchall() == [('range_a',)]  # noqa: E501
+        assert cursor.execute('SELECT COUNT(*) FROM tags').fetchone()[0] == 1
+
+    with pytest.raises(ValueError), database.user_write():
+        database.update_used_query_range('range_c', Timestamp(1), Timestamp(2))
+        database.delete_tag('public')
+        raise ValueError('failed')
+    assert not database.conn.in_transaction
+    assert database.get_used_query_range('range_c') is None
+    assert len(database.get_tags()) == 1
+
+
+def test_user_write_of_other_greenlet_waits(database):
+    """Test that the user_write() of a greenlet does not join the transaction of another
+    greenlet's user_write() that switched greenlets, but waits for it to end"""
+    def write_range(name):
+        with database.user_write():
+            database.update_used_query_range(name, Timestamp(1), Timestamp(2))
+
+    def failing_write():
+        with database.user_write():
+            database.update_used_query_range('range_a', Timestamp(1), Timestamp(2))
+            gevent.sleep(0.01)
+            assert database.get_used_query_range('range_b') is None
+            raise ValueError('failed')
+
+    failing = gevent.spawn(failing_write)
+    gevent.sleep(0)  # let it start its transaction
+    other = gevent.spawn(write_range, 'range_b')
+    gevent.joinall([failing, other])
+    assert isinstance(failing.exception, ValueError)
+    assert other.exception is None
+    assert database.get_used_query_range('range_a') is None
+    assert database.get_used_query_range('range_b') is not None
+    assert database.write_depths == {}
+    assert not database.conn.in_transaction
+
+
+def test_history_events_value_stats(database):
+    """Test that the history events stats are exact decimal sums per asset"""
+    database.conn.executemany(
+        'INSERT INTO history_events(identifier, event_identifier, sequence_index, timestamp, '
+        'location, asset, amount, usd_value, type) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [
+            (1, '1', 0, 1, 'B', 'ETH', '0.1', '0.1', 'staking'),
+            (2, '2', 0, 2, 'B', 'ETH', '0.2', '0.2', 'staking'),
+            (3, '3', 0, 3, 'B', 'BTC', '12345678901234.000000001', '0.3', 'staking'),
+            (4, '4', 0, 4, 'B', 'BTC', '0.000000001', '0.000000001', 'staking'),
+            (5, '5', 0, 5, 'B', 'UNKNOWNASSET', '1', '1', 'staking'),
+        ],
+    )
+    database.conn.commit()
+    usd_value, assets_amounts = DBHistoryEvents(database).get_value_stats(
+        query_filter=HistoryEventFilterQuery.make(order_by_attribute=None),
+    )
+    assert usd_value == FVal('1.600000001')
+    assert sorted(assets_amounts, key=lambda x: x[0].identifier) == [
+        (A_BTC, FVal('12345678901234.000000002'), FVal('0.300000001')),
+        (A_ETH, FVal('0.3'), FVal('0.3')),
+    ]
+
+
+def test_incremental_vacuum_and_health_stats(database):
+    """Test that a fresh DB can give back the pages freed by deletions"""
+    database.conn.executemany(
+        'INSERT INTO timed_location_data(time, location, usd_value) VALUES(?, "A", ?)',
+        [(idx, 'a' * 1000) for idx in range(1000)],
+    )
+    database.conn.commit()
+    stats = database.get_health_stats()
+    assert stats['auto_vacuum'] == 'incremental'
+    assert stats['page_size'] == 4096
+    tables = {x['name']: x['rows'] for x in stats['tables']}
+    assert set(tables) == set(TABLES_AT_INIT)
+    assert tables['timed_location_data'] == 1000
+    indexes = {x['name']: x['table'] for x in stats['indexes']}
+    assert indexes['idx_history_events_asset'] == 'history_events'
+
+    database.conn.execute('DELETE FROM timed_location_data WHERE time >= 500;')
+    database.conn.commit()
+    free_pages = database.get_health_stats()['freelist_count']
+    assert free_pages > 100
+    assert database.incremental_vacuum(max_pages=100) == 100
+    assert database.incremental_vacuum() == free_pages - 100
+    after_vacuum = database.get_health_stats()
+    assert after_vacuum['freelist_count'] == 0
+    assert after_vacuum['page_count'] == stats['page_count'] - free_pages
+    tables = {x['name']: x['rows'] for x in after_vacuum['tables']}
+    assert tables['timed_location_data'] == 500
+
+    # nothing is vacuumed in the middle of a write transaction
+    database.conn.execute('DELETE FROM timed_location_data;')
+    assert database.incremental_vacuum() == 0
+    database.conn.commit()
+    assert database.get_health_stats()['freelist_count'] != 0
@@ -1,15 +1,23 @@
 import pytest
 
+from rotkehlchen.constants.assets import A_BTC, A_ETH
+from rotkehlchen.db.dbhandler import MAIN_DB_NAME
 from rotkehlchen.db.filtering import (
+    AssetMovementsFilterQuery,
     DBETHTransactionAddressFilter,
     DBFilterOrder,
     DBFilterPagination,
     DBFilterQuery,
     DBTimestampFilter,
     ETHTransactionsFilterQuery,
+    HistoryEventFilterQuery,
+    LedgerActionsFilterQuery,
+    TradesFilterQuery,
 )
+from rotkehlchen.exchanges.data_structures import Trade
+from rotkehlchen.fval import FVal
 from rotkehlchen.tests.utils.factories import make_ethereum_address
-from rotkehlchen.typing import Timestamp
+from rotkehlchen.typing import AssetAmount, Fee, Location, Price, Timestamp, TradeType
 
 
 def test_ethereum_transaction_filter():
@@ -22,7 +30,7 @@ def test_ethereum_transaction_filter():
         to_ts=Timestamp(999),
     )
     query, bindings = filter_query.prepare()
-    assert query == 'WHERE (from_address IN (?) OR to_address IN (?)) AND (timestamp >= ? AND timestamp <= ?) ORDER BY timestamp ASC LIMIT 10 OFFSET 10'  # noqa: E501
+    assert query == 'WHERE (from_address IN (?) OR to_address IN (?)) AND (timestamp >= ? AND timestamp <= ?) ORDER BY timestamp ASC, tx_hash ASC LIMIT 10 OFFSET 10'  # noqa: E501
     assert bindings == [
         addresses[0],
         addresses[0],
@@ -74,3 +82,122 @@ def test_filter_arguments(and_op, order_by, pagination):
         time_filter.from_ts,
         time_filter.to_ts,
     ]
+
+
+@pytest.mark.parametrize('table,filter_query,index', [
+    ('trades', TradesFilterQuery.make(from_ts=Timestamp(1), to_ts=Timestamp(999)), 'idx_trades_time'),  # noqa: E501
+    ('trades', TradesFilterQuery.make(location=Location.KRAKEN, from_ts=Timestamp(1)), 'idx_trades_location_time'),  # noqa: E501
+    ('trades', TradesFilterQuery.make(base_asset=A_ETH), 'idx_trades_base_asset'),
+    ('asset_movements', AssetMovementsFilterQuery.make(location=Location.KRAKEN), 'idx_asset_movements_location_time'),  # noqa: E501
+    ('asset_movements', AssetMovementsFilterQuery.make(asset=A_ETH), 'idx_asset_movements_asset'),  # noqa: E501
+    ('ledger_actions', LedgerActionsFilterQuery.make(from_ts=Timestamp(1)), 'idx_ledger_actions_timestamp'),  # noqa: E501
+    ('history_events', HistoryEventFilterQuery.make(location=Location.KRAKEN, to_ts=Timestamp(999)), 'idx_history_events_location_timestamp'),  # noqa: E501
+    ('history_events', HistoryEventFilterQuery.make(asset=A_ETH), 'idx_history_events_asset'),
+    ('ethereum_transactions', ETHTransactionsFilterQuery.make(from_ts=Timestamp(1)), 'idx_ethereum_transactions_timestamp'),  # noqa: E501
+    ('ethereum_transactions', ETHTransactionsFilterQuery.make(addresses=[make_ethereum_address()]), 'idx_ethereum_transactions_from_address'),  # noqa: E501
+])
+def test_filter_queries_use_indexes(database, table, filter_query, index):
+    """Make sure that the filtered history queries search an index instead of scanning"""
+    query, bindings = filter_query.prepare()
+    cursor = database.conn.cursor()
+    plan = cursor.execute(f'EXPLAIN QUERY PLAN SELECT * FROM {table} {query}', bindings)
+    details = [entry[3] for entry in plan]
+    assert any(f'USING INDEX {index} ' in x for x in details), details
+    assert f'SCAN {table}' not in details
+
+
+@pytest.mark.parametrize('seek', [None, (20, 'foo', '', 'BTC')])
+def test_filter_pages_use_indexes(database, seek):
+    """Make sure that the pages ordered by timestamp and their tiebreakers are read
+    in order from the index instead of sorting all of the entries"""
+    filter_query = TradesFilterQuery.make(order_ascending=False, limit=10, offset=50)
+    filter_query.pagination = filter_query.pagination._replace(seek=seek)
+    query, bindings = filter_query.prepare()
+    cursor = database.conn.cursor()
+    plan = cursor.execute(f'EXPLAIN QUERY PLAN SELECT * FROM trades {query}', bindings)
+    details = [entry[3] for entry in plan]
+    assert any('USING INDEX idx_trades_time' in x for x in details), details
+    assert 'USE TEMP B-TREE FOR ORDER BY' not in details
+
+
+def test_filter_pagination_seek():
+    filter_query = TradesFilterQuery.make(limit=10, offset=50, from_ts=Timestamp(1))
+    filter_query.pagination = filter_query.pagination._replace(seek=(20, 'foo', '', 'BTC'))
+    query, bindings = filter_query.prepare()
+    assert query == 'WHERE ((time >= ?)) AND (time, id, link, quote_asset) > (?, ?, ?, ?) ORDER BY time ASC, id ASC, link ASC, quote_asset ASC LIMIT 10'  # noqa: E501
+    assert bindings == [1, 20, 'foo', '', 'BTC']
+
+    filter_query = LedgerActionsFilterQuery.make(order_ascending=False, limit=10, offset=50)
+    filter_query.pagination = filter_query.pagination._replace(seek=(20, 2))
+    query, bindings = filter_query.prepare()
+    assert query == 'WHERE (timestamp, identifier) < (?, ?) ORDER BY timestamp DESC, identifier DESC LIMIT 10'  # noqa: E501
+    assert bindings == [20, 2]
+    query, bindings = filter_query.prepare(with_pagination=False)
+    assert query == 'ORDER BY timestamp DESC, identifier DESC'
+    assert bindings == []
+
+    # seeking needs the entries to be ordered by timestamp, otherwise the offset is used
+    filter_query = TradesFilterQuery.make(order_by_attribute='amount', limit=10, offset=50)
+    filter_query.pagination = filter_query.pagination._replace(seek=(20, 'foo', '', 'BTC'))
+    assert filter_query.prepare() == (
+        'ORDER BY CAST(amount AS REAL) ASC, id ASC, link ASC, quote_asset ASC LIMIT 10 OFFSET 50',  # noqa: E501
+        [],
+    )
+
+
+@pytest.mark.parametrize('ascending', [True, False])
+def test_filtered_pages_and_counts(database, ascending):
+    """Make sure that the pages found by seeking to where the previous page ended are the
+    same as the ones of limit/offset and that the cached counts follow the DB writes"""
+    timestamps = [1, 2, 2, 2, 2, 2, 3, 4, 4, 5, 6, 6, 6]
+    trades = [Trade(
+        timestamp=Timestamp(ts),
+        location=Location.EXTERNAL,
+        base_asset=A_ETH,
+        quote_asset=A_BTC,
+        trade_type=TradeType.BUY,
+        amount=AssetAmount(FVal(idx + 1)),
+        rate=Price(FVal(1)),
+        fee=Fee(FVal('0.1')),
+        fee_currency=A_BTC,
+        link='',
+        notes='',
+    ) for idx, ts in enumerate(timestamps)]
+    database.add_trades(trades)
+    expected = sorted(
+        trades,
+        key=lambda x: (x.timestamp, x.identifier),
+        reverse=not ascending,
+    )
+
+    for limit in (1, 2, 3, 4, 5):
+        pages = []
+        for offset in range(0, len(trades), limit):
+            filter_query = TradesFilterQuery.make(
+                order_ascending=ascending,
+                limit=limit,
+                offset=offset,
+            )
+            page, count = database.get_trades_and_limit_info(filter_query, has_premium=True)
+            assert count == len(trades)
+            pages.extend(page)
+        assert pages == expected
+    # where the pages ended was remembered so all pages after the first were seeked to
+    page_ends = [x for _, x in database.filter_cache.entries.values() if isinstance(x, dict)]
+    assert len(page_ends) == 1 and len(page_ends[0]) != 0
+
+    # a page after a write is not found via an outdated seek and the count is recounted
+    filter_query = TradesFilterQuery.make(order_ascending=ascending, limit=5, offset=5)
+    database.delete_trade(expected[0].identifier)
+    page, count = database.get_trades_and_limit_info(filter_query, has_premium=True)
+    assert count == len(trades) - 1
+    assert page == expected[6:11]
+
+    # and neither after a write of another connection
+    other_conn = database._open_connection(database.user_data_dir / MAIN_DB_NAME, database.password)  # noqa: E501
+    other_conn.execute('DELETE FROM trades WHERE id=?;', (expected[1].identifier,))
+    other_conn.commit()
+    other_conn.close()
+    page, count = database.get_trades_and_limit_info(filter_query, has_premium=True)
+    assert count == len(trades) - 2
+    assert page == expected[7:12]
@@ -3,19 +3,22 @@ import os
 from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from shutil import copyfile
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from pysqlcipher3 import dbapi2 as sqlcipher
 
 from rotkehlchen.accounting.structures import BalanceType
+from rotkehlchen.api.websockets.typedefs import WSMessageType
 from rotkehlchen.assets.asset import Asset, EthereumToken
 from rotkehlchen.assets.typing import AssetType
 from rotkehlchen.data_handler import DataHandler
 from rotkehlchen.db.dbhandler import DBHandler
 from rotkehlchen.db.filtering import AssetMovementsFilterQuery
 from rotkehlchen.db.old_create import OLD_DB_SCRIPT_CREATE_TABLES
+from rotkehlchen.db.schema import TABLES_WITH_ASSETS
 from rotkehlchen.db.settings import ROTKEHLCHEN_DB_VERSION
-from rotkehlchen.db.upgrade_manager import UPGRADES_LIST
+from rotkehlchen.db.upgrade_manager import UPGRADES_LIST, UpgradeRecord
 from rotkehlchen.db.upgrades.v6_v7 import (
     v6_deserialize_location_from_db,
     v6_deserialize_trade_type_from_db,
@@ -27,6 +30,7 @@ from rotkehlchen.db.upgrades.v7_v8 import (
     v7_generate_asset_movement_id,
 )
 from rotkehlchen.db.upgrades.v13_v14 import REMOVED_ASSETS, REMOVED_ETH_TOKENS
+from rotkehlchen.db.upgrades.v29_v30 import upgrade_v29_to_v30
 from rotkehlchen.errors import DBUpgradeError
 from rotkehlchen.tests.utils.database import (
     _init_prepared_db,
@@ -39,9 +43,11 @@ from rotkehlchen.tests.utils.factories import make_ethereum_address
 from rotkehlchen.typing import ChecksumEthAddress
 from rotkehlchen.user_messages import MessagesAggregator
 
-creation_patch = patch(
-    'rotkehlchen.db.dbhandler.DB_SCRIPT_CREATE_TABLES',
-    new=OLD_DB_SCRIPT_CREATE_TABLES,
+creation_patch = patch.multiple(
+    'rotkehlchen.db.dbhandler',
+    DB_SCRIPT_CREATE_TABLES=OLD_DB_SCRIPT_CREATE_TABLES,
+    DB_SCRIPT_CREATE_INDEXES='',
+    DB_SCRIPT_CREATE_OWNED_ASSETS_TRIGGERS='',
 )
 
 
@@ -1748,14 +1754,13 @@ def test_upgrade_db_24_to_25(user_data_dir):  # pylint: disable=unused-argument
     assert not price_history_dir.is_dir()
 
     # Check errors/warnings
+    # The owned assets are only counted from v31 on, so there are no warnings for
+    # the unknown owned assets at this version
+    # There is a single warning for each unknown asset, however many entries it has
     warnings = msg_aggregator.consume_warnings()
-    assert len(warnings) == 11
-    for idx in (0, 1, 3, 5, 7):
-        assert "During v24 -> v25 DB upgrade could not find key '_ceth_0x48Fb253446873234F2fEBbF9BdeAA72d9d387f94'" in warnings[idx]  # noqa: E501
-    for idx in (2, 4, 6):
-        assert "During v24 -> v25 DB upgrade could not find key '_ceth_0xdb89d55d8878680FED2233ea6E1Ae7DF79C7073e'" in warnings[idx]  # noqa: E501
-    assert 'Unknown/unsupported asset _ceth_0x48Fb253446873234F2fEBbF9BdeAA72d9d387f94' in warnings[9]  # noqa: E501
-    assert 'Unknown/unsupported asset _ceth_0xdb89d55d8878680FED2233ea6E1Ae7DF79C7073e' in warnings[10]  # noqa: E501
+    assert len(warnings) == 2
+    assert any("During v24 -> v25 DB upgrade could not find key '_ceth_0x48Fb253446873234F2fEBbF9BdeAA72d9d387f94'" in x for x in warnings)  # noqa: E501
+    assert any("During v24 -> v25 DB upgrade could not find key '_ceth_0xdb89d55d8878680FED2233ea6E1Ae7DF79C7073e'" in x for x in warnings)  # noqa: E501
     errors = msg_aggregator.consume_errors()
     assert len(errors) == 0
     # Finally also make sure that we have updated to the target version
@@ -2080,10 +2085,10 @@ def test_upgrade_db_25_to_26(globaldb, user_data_dir, have_kraken, have_kraken_s
     assert globaldb_assets_num == userdb_assets_num - 1, msg
 
     # Check errors/warnings
+    # No unknown owned asset warning since the owned assets are counted from v31 on
     warnings = msg_aggregator.consume_warnings()
-    assert len(warnings) == 2
+    assert len(warnings) == 1
     assert 'During v25 -> v26 DB upgrade found timed_balances entry of unknown asset _ceth_0xdb89d55d8878680FED2233ea6E1Ae7DF79C7073e' in warnings[0]  # noqa: E501
-    assert 'Unknown/unsupported asset _ceth_0xdb89d55d8878680FED2233ea6E1Ae7DF79C7073e found in the database' in warnings[1]  # noqa: E501
     errors = msg_aggregator.consume_errors()
     assert len(errors) == 0
 
@@ -2331,6 +2336,11 @@ def test_upgrade_db_30_to_31(user_data_dir, db_with_set_version):  # pylint: dis
     - Upgrades the ETH2 tables
     - Deletes ignored ethereum transactions ids
     - Deletes kraken trades and used query ranges
+    - Adds the history query indexes
+    - Adds and populates the owned assets table
+    - Adds and backfills the balance snapshot summaries
+    - Moves the receipt log addresses and topics to dictionary tables
+    - Rebuilds the DB with incremental auto vacuum
     """
     msg_aggregator = MessagesAggregator()
     # Check we have data in the eth2 tables before the DB upgrade
@@ -2358,6 +2368,18 @@ def test_upgrade_db_30_to_31(user_data_dir, db_with_set_version):  # pylint: dis
         ('kraken_trades_kraken1', 0, 1634850532),
         ('kraken_asset_movements_kraken1', 0, 1634850532),
     ]
+    logs_before = cursor.execute(
+        'SELECT tx_hash, log_index, data, address, removed FROM ethtx_receipt_logs '
+        'ORDER BY tx_hash, log_index',
+    ).fetchall()
+    topics_before = cursor.execute(
+        'SELECT tx_hash, log_index, topic, topic_index FROM ethtx_receipt_log_topics '
+        'ORDER BY tx_hash, log_index, topic_index',
+    ).fetchall()
+    assert len(logs_before) == 154
+    assert len(topics_before) == 406
+    # close the DB so its write-ahead log does not outlive the replaced DB file
+    db_v30.disconnect()
 
     if db_with_set_version:
         db_name = 'v30_rotkehlchen.db'
@@ -2391,6 +2413,159 @@ def test_upgrade_db_30_to_31(user_data_dir, db_with_set_version):  # pylint: dis
         ('eth2_deposits_0x45E6CA515E840A4e9E02A3062F99216951825eB2', 1602667372, 1637575118),
         ('kraken_asset_movements_kraken1', 0, 1634850532),
     ]
+    result = cursor.execute(
+        'SELECT name FROM sqlite_master WHERE type="index" AND tbl_name="trades" AND sql IS NOT NULL',  # noqa: E501
+    )
+    assert {x[0] for x in result} == {
+        'idx_trades_time',
+        'idx_trades_location_time',
+        'idx_trades_base_asset',
+        'idx_trades_quote_asset',
+    }
+    result = cursor.execute('SELECT COUNT(*) FROM sqlite_master WHERE type="trigger" AND name LIKE "owned_assets_%"')  # noqa: E501
+    assert result.fetchone()[0] == 4 * len(TABLES_WITH_ASSETS)
+    result = cursor.execute('SELECT * FROM owned_assets ORDER BY identifier;')
+    assert result.fetchall() == [('GNO', 1), ('YFI', 1)]  # of the remaining asset movement
+    result = cursor.execute('SELECT * FROM balance_snapshot_summaries;')
+    assert result.fetchall() == [(1637574520, '0', '0')]
+    # Check that the receipt logs are the same after moving their addresses and topics
+    result = cursor.execute(
+        'SELECT tx_hash, log_index, data, address, removed FROM ethtx_receipt_logs '
+        'INNER JOIN ethtx_addresses ON ethtx_receipt_logs.address_id=ethtx_addresses.id '
+        'ORDER BY tx_hash, log_index',
+    )
+    assert result.fetchall() == logs_before
+    result = cursor.execute(
+        'SELECT tx_hash, log_index, topic, topic_index FROM ethtx_receipt_log_topics '
+        'INNER JOIN ethtx_topics ON ethtx_receipt_log_topics.topic_id=ethtx_topics.id '
+        'ORDER BY tx_hash, log_index, topic_index',
+    )
+    assert result.fetchall() == topics_before
+    assert cursor.execute('SELECT COUNT(*) FROM ethtx_topics').fetchone()[0] < len(topics_before)
+    result = cursor.execute('SELECT name FROM sqlite_master WHERE name LIKE "ethtx_%_old"')
+    assert result.fetchall() == []
+    assert cursor.execute('PRAGMA auto_vacuum;').fetchone()[0] == 2
+
+
+@pytest.mark.parametrize('use_clean_caching_directory', [True])
+def test_upgrades_report_progress(user_data_dir):  # pylint: disable=unused-argument
+    """Test that the progress of the upgrades is sent over the websocket"""
+    msg_aggregator = MessagesAggregator()
+    msg_aggregator.rotki_notifier = MagicMock()
+    _use_prepared_db(user_data_dir, 'v29_rotkehlchen.db')
+    db = _init_db_with_target_version(
+        target_version=31,
+        user_data_dir=user_data_dir,
+        msg_aggregator=msg_aggregator,
+    )
+    assert db.get_version() == 31
+    calls = msg_aggregator.rotki_notifier.broadcast.call_args_list
+    assert all(x[1]['message_type'] == WSMessageType.DB_UPGRADE_STATUS for x in calls)
+    # The v29 DB is still at version 28. The upgrades to v29 and v30 only report that they
+    # started while the one to v31 also reports its steps
+    expected_progress = [(29, 0, 0), (30, 0, 0), (31, 0, 0)]
+    expected_progress += [(31, 7, step) for step in range(1, 8)]
+    assert [x[1]['to_send_data'] for x in calls] == [
+        {
+            'start_version': 28,
+            'target_version': 31,
+            'current_upgrade': {
+                'to_version': to_version,
+                'total_steps': total_steps,
+                'current_step': current_step,
+            },
+        } for to_version, total_steps, current_step in expected_progress
+    ]
+
+
+@pytest.mark.parametrize('use_clean_caching_directory', [True])
+def test_upgrade_with_foreign_key_violation_restores_db(user_data_dir):  # pylint: disable=unused-argument  # noqa: E501
+    """Test that an upgrade adding rows that refer to missing rows fails, since the
+    upgrades run with the foreign keys on, and restores the DB"""
+    def upgrade_with_violation(db: DBHandler) -> None:
+        upgrade_v29_to_v30(db)
+        db.conn.execute(
+            'INSERT INTO timed_balances(category, time, currency, amount, usd_value) '
+            'VALUES("Z", 1, "ETH", "1", "1");',
+        )
+
+    msg_aggregator = MessagesAggregator()
+    _use_prepared_db(user_data_dir, 'v29_rotkehlchen.db')
+    upgrades_list = [x for x in UPGRADES_LIST if x.from_version < 29]
+    upgrades_list.append(UpgradeRecord(from_version=29, function=upgrade_with_violation))
+    with ExitStack() as stack:
+        stack.enter_context(target_patch(target_version=30))
+        stack.enter_context(patch('rotkehlchen.db.upgrade_manager.UPGRADES_LIST', new=upgrades_list))  # noqa: E501
+        with pytest.raises(DBUpgradeError) as e:
+            DBHandler(
+                user_data_dir=user_data_dir,
+                password='123',
+                msg_aggregator=msg_aggregator,
+                initial_settings=None,
+            )
+
+    assert 'FOREIGN KEY constraint failed' in str(e.value)
+    # The DB is left as it was before the upgrades
+    conn = sqlcipher.connect(str(user_data_dir / 'rotkehlchen.db'))  # pylint: disable=no-member
+    conn.executescript('PRAGMA key="123";')
+    assert conn.execute('SELECT value FROM settings WHERE name="version";').fetchone() == ('28',)  # noqa: E501
+    assert conn.execute('SELECT COUNT(*) FROM timed_balances WHERE category="Z";').fetchone() == (0,)  # noqa: E501
+    conn.close()
+
+
+@pytest.mark.parametrize('use_clean_caching_directory', [True])
+def test_upgrade_failing_after_a_commit_restores_db(user_data_dir):  # pylint: disable=unused-argument  # noqa: E501
+    """Test that an upgrade failing after earlier upgrades and itself committed changes
+    to a DB with a write-ahead log restores the DB, which can then be opened and upgraded"""
+    readers = []
+
+    def upgrade_with_commit_and_failure(db: DBHandler) -> None:
+        upgrade_v29_to_v30(db)
+        # a read transaction that is still open keeps the log from being checkpointed
+        reader = sqlcipher.connect(str(user_data_dir / 'rotkehlchen.db'))  # pylint: disable=no-member  # noqa: E501
+        reader.executescript('PRAGMA key="123";')
+        reader.execute('BEGIN;')
+        reader.execute('SELECT COUNT(*) FROM settings;').fetchone()
+        readers.append(reader)
+        db.conn.execute('INSERT INTO settings(name, value) VALUES("half_upgraded", "1");')
+        db.conn.commit()
+        raise ValueError('upgrade failure')
+
+    msg_aggregator = MessagesAggregator()
+    _use_prepared_db(user_data_dir, 'v29_rotkehlchen.db')
+    conn = sqlcipher.connect(str(user_data_dir / 'rotkehlchen.db'))  # pylint: disable=no-member
+    conn.executescript('PRAGMA key="123";')
+    conn.execute('PRAGMA journal_mode=WAL;')
+    conn.close()
+    upgrades_list = [x for x in UPGRADES_LIST if x.from_version < 29]
+    upgrades_list.append(UpgradeRecord(from_version=29, function=upgrade_with_commit_and_failure))  # noqa: E501
+    with ExitStack() as stack:
+        stack.enter_context(target_patch(target_version=30))
+        stack.enter_context(patch('rotkehlchen.db.upgrade_manager.UPGRADES_LIST', new=upgrades_list))  # noqa: E501
+        with pytest.raises(DBUpgradeError) as e:
+            DBHandler(
+                user_data_dir=user_data_dir,
+                password='123',
+                msg_aggregator=msg_aggregator,
+                initial_settings=None,
+            )
+
+    assert 'upgrade failure' in str(e.value)
+    # The DB is left as it was before the upgrades, even though the upgrade to v29 and
+    # part of the one to v30 were committed
+    conn = sqlcipher.connect(str(user_data_dir / 'rotkehlchen.db'))  # pylint: disable=no-member
+    conn.executescript('PRAGMA key="123";')
+    assert conn.execute('PRAGMA integrity_check;').fetchone() == ('ok',)
+    assert conn.execute('SELECT value FROM settings WHERE name="version";').fetchone() == ('28',)  # noqa: E501
+    assert conn.execute('SELECT COUNT(*) FROM settings WHERE name="half_upgraded";').fetchone() == (0,)  # noqa: E501
+    conn.close()
+    readers[0].close()
+    db = _init_db_with_target_version(
+        target_version=30,
+        user_data_dir=user_data_dir,
+        msg_aggregator=msg_aggregator,
+    )
+    assert db.get_version() == 30
 
 
 def test_db_newer_than_software_raises_error(data_dir, username):
@@ -1,3 +1,4 @@
+from rotkehlchen.chain.ethereum.structures import EthereumTxReceipt, EthereumTxReceiptLog
 from rotkehlchen.data_handler import DataHandler
 from rotkehlchen.db.ethtx import DBEthTx
 from rotkehlchen.db.filtering import ETHTransactionsFilterQuery
@@ -10,6 +11,7 @@ from rotkehlchen.tests.utils.constants import (
 )
 from rotkehlchen.typing import EthereumTransaction, Timestamp
 from rotkehlchen.user_messages import MessagesAggregator
+from rotkehlchen.utils.misc import hexstring_to_bytes
 
 
 def test_add_ethereum_transactions(data_dir, username):
@@ -91,3 +93,73 @@ def test_add_ethereum_transactions(data_dir, username):
     assert result == [tx2], 'querying transaction by hash string failed'
     result, _ = dbethtx.get_ethereum_transactions(ETHTransactionsFilterQuery.make(tx_hash=b'dsadsad'))  # noqa: E501
     assert result == []
+
+
+def test_add_and_get_receipts(database):
+    """Test that receipts are stored with their log addresses and topics deduplicated
+    and are read back intact"""
+    dbethtx = DBEthTx(database)
+    transfer_topic = '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+    sender_topic = f'0x{"0" * 24}{ETH_ADDRESS1[2:].lower()}'
+    receipts = []
+    for idx in range(2):
+        tx_hash = bytes([idx]) * 32
+        dbethtx.add_ethereum_transactions([EthereumTransaction(
+            tx_hash=tx_hash,
+            timestamp=Timestamp(1451606400 + idx),
+            block_number=idx,
+            from_address=(ETH_ADDRESS1, ETH_ADDRESS2)[idx],
+            to_address=ETH_ADDRESS3,
+            value=FVal('0'),
+            gas=FVal('5000000'),
+            gas_price=FVal('2000000000'),
+            gas_used=FVal('25000000'),
+            input_data=MOCK_INPUT_DATA,
+            nonce=idx,
+        )])
+        logs = [{
+            'logIndex': log_index,
+            'data': f'0x{log_index:064x}',
+            'address': ETH_ADDRESS3 if log_index == 0 else (ETH_ADDRESS2, ETH_ADDRESS1)[idx],
+            'removed': False,
+            'topics': [transfer_topic, sender_topic, f'0x{idx + log_index:064x}'],
+        } for log_index in range(2)]
+        dbethtx.add_receipt_data({
+            'transactionHash': '0x' + tx_hash.hex(),
+            'contractAddress': None,
+            'status': 1,
+            'logs': logs,
+        })
+        receipts.append(EthereumTxReceipt(
+            tx_hash=tx_hash,
+            contract_address=None,
+            status=True,
+            type=0,
+            logs=[EthereumTxReceiptLog(
+                log_index=x['logIndex'],
+                data=hexstring_to_bytes(x['data']),
+                address=x['address'],
+                removed=False,
+                topics=[hexstring_to_bytes(topic) for topic in x['topics']],
+            ) for x in logs],
+        ))
+
+    assert dbethtx.get_receipt(receipts[0].tx_hash) == receipts[0]
+    assert dbethtx.get_receipt(receipts[1].tx_hash) == receipts[1]
+    cursor = database.conn.cursor()
+    assert cursor.execute('SELECT COUNT(*) FROM ethtx_addresses').fetchone()[0] == 3
+    # transfer and sender topics are shared and the last topics are 0x0, 0x1 and 0x2
+    assert cursor.execute('SELECT COUNT(*) FROM ethtx_topics').fetchone()[0] == 5
+    assert cursor.execute('SELECT COUNT(*) FROM ethtx_receipt_log_topics').fetchone()[0] == 12
+
+    # removing the account of the first transaction drops the addresses and topics
+    # that only its receipt referred to
+    database.delete_data_for_ethereum_address(ETH_ADDRESS1)
+    assert dbethtx.get_receipt(receipts[0].tx_hash) is None
+    assert dbethtx.get_receipt(receipts[1].tx_hash) == receipts[1]
+    assert cursor.execute('SELECT COUNT(*) FROM ethtx_addresses').fetchone()[0] == 2
+    assert cursor.execute('SELECT COUNT(*) FROM ethtx_topics').fetchone()[0] == 4
+
+    dbethtx.purge_ethereum_transaction_data()
+    assert dbethtx.get_receipt(receipts[0].tx_hash) is None
+    assert cursor.execute('SELECT COUNT(*) FROM ethtx_topics').fetchone()[0] == 0
@@ -1,12 +1,15 @@
 from unittest.mock import patch
 
+import pytest
+
 from rotkehlchen.chain.ethereum.trades import AMMSwap
 from rotkehlchen.constants import ZERO
 from rotkehlchen.constants.assets import A_BTC, A_DAI, A_ETH, A_EUR, A_GNO, A_UNI, A_USDC
 from rotkehlchen.data_handler import DataHandler
 from rotkehlchen.db.filtering import TradesFilterQuery
 # from rotkehlchen.db.filtering import TradesFilterQuery
-from rotkehlchen.exchanges.data_structures import Trade
+from rotkehlchen.errors import InputError
+from rotkehlchen.exchanges.data_structures import Trade, TradeView
 from rotkehlchen.fval import FVal
 from rotkehlchen.typing import Location, Price, TradeType
 from rotkehlchen.user_messages import MessagesAggregator
@@ -316,10 +319,11 @@ def test_query_trades_including_ammswaps(data_dir, username):
     assert_trades_equal(returned_trades[1], swap1_trade)
     assert_trades_equal(returned_trades[3], swap2_trade)
     assert_trades_equal(returned_trades[5], swap3_trade)
-    assert_trades_equal(returned_trades[6], swap4_trade2)
-    assert_trades_equal(returned_trades[7], swap4_trade1)
-    assert_trades_equal(returned_trades[8], swap5_trade1)
-    assert_trades_equal(returned_trades[9], swap5_trade2)
+    # the two trades of a swap are ordered by their quote asset
+    assert_trades_equal(returned_trades[6], swap4_trade1)
+    assert_trades_equal(returned_trades[7], swap4_trade2)
+    assert_trades_equal(returned_trades[8], swap5_trade2)
+    assert_trades_equal(returned_trades[9], swap5_trade1)
 
     # Get last 5 trades
     returned_trades = data.db.get_trades(
@@ -328,10 +332,10 @@ def test_query_trades_including_ammswaps(data_dir, username):
     )
     assert len(returned_trades) == 5
     assert_trades_equal(returned_trades[0], swap3_trade)
-    assert_trades_equal(returned_trades[1], swap4_trade2)
-    assert_trades_equal(returned_trades[2], swap4_trade1)
-    assert_trades_equal(returned_trades[3], swap5_trade1)
-    assert_trades_equal(returned_trades[4], swap5_trade2)
+    assert_trades_equal(returned_trades[1], swap4_trade1)
+    assert_trades_equal(returned_trades[2], swap4_trade2)
+    assert_trades_equal(returned_trades[3], swap5_trade2)
+    assert_trades_equal(returned_trades[4], swap5_trade1)
 
     # Get first 5 trades that are in uniswap and that buy USDC
     returned_trades = data.db.get_trades(
@@ -382,3 +386,57 @@ def test_query_trades_including_ammswaps(data_dir, username):
     assert total_found == 2, 'total found for filter should be 2'
     assert len(returned_trades) == 1
     assert_trades_equal(returned_trades[0], trades[1])
+
+
+def test_trade_views(database):
+    """Test that the trade views only deserialize the queried fields"""
+    trades = [
+        Trade(
+            timestamp=1,
+            location=Location.EXTERNAL,
+            base_asset=A_ETH,
+            quote_asset=A_USDC,
+            trade_type=TradeType.BUY,
+            amount=FVal(1),
+            rate=Price(FVal(1.5)),
+            fee=FVal('0.1'),
+            fee_currency=A_USDC,
+            link='',
+            notes='a note',
+        ), Trade(
+            timestamp=2,
+            location=Location.KRAKEN,
+            base_asset=A_BTC,
+            quote_asset=A_EUR,
+            trade_type=TradeType.SELL,
+            amount=FVal(1),
+            rate=Price(FVal(1.5)),
+            fee=None,
+            fee_currency=None,
+            link='',
+            notes=None,
+        ),
+    ]
+    database.add_trades(trades)
+
+    columns = TradeView.columns_of(None)
+    rows = database.conn.execute(f'SELECT {",".join(columns)} FROM trades ORDER BY time;')
+    views = TradeView.from_rows(rows.fetchall(), columns)
+    assert [x.to_trade() for x in views] == trades
+    assert [x.identifier for x in views] == [x.identifier for x in trades]
+
+    columns = TradeView.columns_of(['timestamp', 'base_asset'])
+    rows = database.conn.execute(
+        f'SELECT {",".join(columns)} FROM trades WHERE location=?;',
+        (Location.KRAKEN.serialize_for_db(),),
+    )
+    views = TradeView.from_rows(rows.fetchall(), columns)
+    assert len(views) == 1
+    assert views[0].entry == (2, 'BTC')
+    assert views[0].timestamp == 2
+    assert views[0].base_asset == A_BTC
+    with pytest.raises(AttributeError):
+        views[0].quote_asset  # pylint: disable=pointless-statement
+
+    with pytest.raises(InputError):
+        TradeView.columns_of(['timestamp', 'pair'])
@@ -1,6 +1,6 @@
 import pytest
 
-from rotkehlchen.db.utils import form_query_to_filter_timestamps
+from rotkehlchen.db.utils import DecimalSum, form_query_to_filter_timestamps
 
 
 @pytest.mark.parametrize(
@@ -56,3 +56,17 @@ def test_form_query_to_filter_timestamps(
     )
     assert query_out == expected_query_out
     assert bindings == expected_bindings
+
+
+@pytest.mark.parametrize('values, expected', [
+    (['0.0000538620', '0'], '0.000053862'),
+    (['0.1', '0.2'], '0.3'),
+    (['50', '50'], '100'),
+    (['0.10', '-0.1'], '0'),
+    ([None], '0'),
+])
+def test_decimal_sum(values, expected):
+    decimal_sum = DecimalSum()
+    for value in values:
+        decimal_sum.step(value)
+    assert decimal_sum.finalize() == expected
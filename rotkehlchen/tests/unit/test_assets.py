@@ -7,6 +7,7 @@ from rotkehlchen.assets.asset import Asset, EthereumToken
 from rotkehlchen.assets.resolver import AssetResolver
 from rotkehlchen.assets.typing import AssetType
 from rotkehlchen.assets.utils import get_or_create_ethereum_token, symbol_to_ethereum_token
+from rotkehlchen.constants import assets as constant_assets
 from rotkehlchen.constants.assets import A_DAI, A_USDT
 from rotkehlchen.constants.resolver import ethaddress_to_identifier
 from rotkehlchen.errors import InputError, UnknownAsset
@@ -224,6 +225,73 @@ def test_case_does_not_matter_for_asset_constructor():
     assert a3.identifier == a4.identifier == ethaddress_to_identifier('0xdAC17F958D2ee523a2206206994597C13D831ec7')  # noqa: E501
 
 
+def test_assets_are_interned():
+    """Test that constructing the same asset returns the same instance irrespective of case"""
+    assert Asset('BTC') is Asset('btc')
+    assert Asset('ETH') is not Asset('BTC')
+    token = EthereumToken('0x6B175474E89094C44Da98b954EedeAC495271d0F')
+    assert token is EthereumToken('0x6b175474e89094c44da98b954eedeac495271d0f')
+    # different classes for the same identifier are different instances
+    assert Asset(token.identifier) is not token
+    assert Asset(token.identifier) == token
+
+    # cleaning the cache of an asset should also make it be recreated
+    btc = Asset('BTC')
+    AssetResolver().clean_memory_cache('BTC')
+    assert Asset('BTC') is not btc
+    AssetResolver().clean_memory_cache(token.identifier)
+    assert EthereumToken(token.ethereum_address) is not token
+
+
+def test_related_assets_are_lazily_resolved():
+    """Test that the forked and swapped_for assets are only resolved when accessed"""
+    AssetResolver().clean_memory_cache()
+    bch = Asset('BCH')
+    assert bch._forked == 'BTC'
+    assert bch.forked == Asset('BTC')
+    assert bch._forked is Asset('BTC')
+
+    token = EthereumToken.initialize(
+        address='0x4a220E6096B25EADb88358cb44068A3248254675',
+        swapped_for='BTC',
+    )
+    assert token.swapped_for is Asset('BTC')
+
+    # an unknown related asset is resolved to None
+    token = EthereumToken.initialize(
+        address='0x4a220E6096B25EADb88358cb44068A3248254675',
+        swapped_for='jsakdjsladjsakdj',
+    )
+    assert token.swapped_for is None
+
+
+def test_constant_assets_are_created_lazily(globaldb):
+    """Test that constant assets are created on first access with the details of the DB"""
+    module_dict = vars(constant_assets)
+    original_kfee = module_dict.pop('A_KFEE', None)
+    if original_kfee is not None:
+        constant_assets.CONSTANT_ASSETS.remove(original_kfee)
+    cursor = globaldb._conn.cursor()
+    cursor.execute('UPDATE assets SET name=? WHERE identifier=?', ('Kraken fee credit', 'KFEE'))
+    globaldb._conn.commit()
+
+    try:
+        assert 'A_KFEE' not in module_dict
+        assert 'A_KFEE' in dir(constant_assets)
+        kfee = constant_assets.A_KFEE
+        assert module_dict['A_KFEE'] is kfee
+        assert kfee in constant_assets.CONSTANT_ASSETS
+        assert kfee.name == 'Kraken fee credit'
+        assert kfee.asset_type == AssetType.OWN_CHAIN
+        with pytest.raises(AttributeError):
+            constant_assets.A_NOT_A_CONSTANT_ASSET  # pylint: disable=pointless-statement
+    finally:  # don't leak the modified asset to other tests
+        constant_assets.CONSTANT_ASSETS.remove(module_dict.pop('A_KFEE'))
+        if original_kfee is not None:
+            module_dict['A_KFEE'] = original_kfee
+            constant_assets.CONSTANT_ASSETS.append(original_kfee)
+
+
 def test_coingecko_identifiers_are_reachable():
     """
     Test that all assets have a coingecko entry and that all the identifiers exist in coingecko
@@ -1,14 +1,30 @@
 import os
+import time
+from collections import defaultdict
+from typing import Any, Dict
+from unittest.mock import MagicMock, patch
 
+import gevent
 import pytest
+from gevent.lock import BoundedSemaphore
+from web3 import Web3
 
 from rotkehlchen.chain.ethereum.manager import (
     ETHEREUM_NODES_TO_CONNECT_AT_START,
+    ETHERSCAN_MAX_CONCURRENT_RECEIPT_QUERIES,
     OPEN_NODES,
     OPEN_NODES_WEIGHT_MAP,
     NodeName,
 )
+from rotkehlchen.chain.ethereum.node_health import (
+    CIRCUIT_BREAKER_COOLDOWN,
+    CIRCUIT_BREAKER_FAILURES,
+    HEDGE_MIN_LATENCY_SAMPLES,
+    CircuitState,
+    NodeHealth,
+)
 from rotkehlchen.chain.ethereum.structures import EthereumTxReceipt, EthereumTxReceiptLog
+from rotkehlchen.constants.assets import A_DAI
 from rotkehlchen.constants.ethereum import (
     ATOKEN_ABI,
     ERC20TOKEN_ABI,
@@ -17,6 +33,7 @@ from rotkehlchen.constants.ethereum import (
 )
 from rotkehlchen.constants.misc import ONE, ZERO
 from rotkehlchen.db.ethtx import DBEthTx
+from rotkehlchen.errors import BlockchainQueryError, RemoteError
 from rotkehlchen.fval import FVal
 from rotkehlchen.tests.utils.checks import assert_serialized_dicts_equal
 from rotkehlchen.tests.utils.ethereum import (
@@ -24,8 +41,11 @@ from rotkehlchen.tests.utils.ethereum import (
     ETHEREUM_TEST_PARAMETERS,
     wait_until_all_nodes_connected,
 )
+from rotkehlchen.tests.utils.factories import make_ethereum_address
+from rotkehlchen.tests.utils.mock import MockResponse
 from rotkehlchen.typing import EthereumTransaction
 from rotkehlchen.utils.misc import hexstring_to_bytes
+from rotkehlchen.utils.serialization import rlk_jsondumps
 
 
 @pytest.mark.parametrize(*ETHEREUM_TEST_PARAMETERS)
@@ -302,6 +322,335 @@ def test_nodes_sets():
     assert set(OPEN_NODES_WEIGHT_MAP.keys()) - set({NodeName.ETHERSCAN}) == set(ETHEREUM_NODES_TO_CONNECT_AT_START) - set({NodeName.OWN})  # noqa: E501
 
 
+def test_node_health_circuit_breaker():
+    """Test that a node failing many times in a row is put aside for a growing cooldown"""
+    health = NodeHealth()
+    for _ in range(CIRCUIT_BREAKER_FAILURES - 1):
+        health.record_failure(duration=1, now=100)
+    assert health.state(now=100) == CircuitState.CLOSED
+    health.record_failure(duration=1, now=100)
+    assert health.state(now=100) == CircuitState.OPEN
+    assert health.state(now=100 + CIRCUIT_BREAKER_COOLDOWN) == CircuitState.HALF_OPEN
+
+    # failing while half open opens the circuit for longer
+    now = 100 + CIRCUIT_BREAKER_COOLDOWN
+    health.record_failure(duration=1, now=now)
+    assert health.state(now=now + CIRCUIT_BREAKER_COOLDOWN) == CircuitState.OPEN
+    assert health.state(now=now + 2 * CIRCUIT_BREAKER_COOLDOWN) == CircuitState.HALF_OPEN
+
+    health.record_success(duration=0.5)
+    assert health.state(now=now) == CircuitState.CLOSED
+    assert health.cooldown == CIRCUIT_BREAKER_COOLDOWN
+    assert health.queries == CIRCUIT_BREAKER_FAILURES + 2
+    assert health.failures == CIRCUIT_BREAKER_FAILURES + 1
+    assert 0 < health.error_rate < 1
+    # a slower and failing node weighs less than one not queried yet
+    assert health.weight(0.5) < NodeHealth().weight(0.5)
+
+
+def test_query_skips_broken_and_excluded_nodes(ethereum_manager):
+    """Test that nodes whose circuit is open are queried last and excluded ones never"""
+    web3_to_node = {}
+    for node in (NodeName.MYCRYPTO, NodeName.BLOCKSCOUT):
+        web3 = object()
+        web3_to_node[web3] = node
+        ethereum_manager.web3_mapping[node] = web3
+    queried_nodes = []
+
+    def method(web3):
+        node = web3_to_node.get(web3, NodeName.ETHERSCAN)
+        queried_nodes.append(node)
+        if node == NodeName.MYCRYPTO:
+            raise RemoteError('mycrypto is down')
+        return node
+
+    call_order = [NodeName.MYCRYPTO, NodeName.BLOCKSCOUT, NodeName.ETHERSCAN]
+    for _ in range(CIRCUIT_BREAKER_FAILURES):
+        assert ethereum_manager.query(method, call_order=call_order) == NodeName.BLOCKSCOUT
+    assert queried_nodes == [NodeName.MYCRYPTO, NodeName.BLOCKSCOUT] * CIRCUIT_BREAKER_FAILURES
+
+    queried_nodes.clear()
+    assert ethereum_manager.query(method, call_order=call_order) == NodeName.BLOCKSCOUT
+    assert queried_nodes == [NodeName.BLOCKSCOUT]
+    ethereum_manager.set_node_preferences(
+        pinned_nodes=[NodeName.ETHERSCAN],
+        excluded_nodes=[NodeName.BLOCKSCOUT],
+    )
+    queried_nodes.clear()
+    assert ethereum_manager.query(method, call_order=call_order) == NodeName.ETHERSCAN
+    assert queried_nodes == [NodeName.ETHERSCAN]
+
+    call_order = ethereum_manager.default_call_order()
+    assert call_order[0] == NodeName.ETHERSCAN
+    assert NodeName.BLOCKSCOUT not in call_order
+    nodes = {x['name']: x for x in ethereum_manager.get_nodes_health()}
+    assert nodes['mycrypto']['state'] == 'open'
+    assert nodes['mycrypto']['failures'] == CIRCUIT_BREAKER_FAILURES
+    assert nodes['blockscout']['excluded'] is True
+    assert nodes['blockscout']['queries'] == CIRCUIT_BREAKER_FAILURES + 1
+    assert nodes['etherscan']['pinned'] is True
+    assert nodes['etherscan']['error_rate'] == 0
+
+
+def test_hedged_query(ethereum_manager):
+    """Test that a hedged query is also sent to the next node when the first one takes
+    longer than usual, that the first answer wins and the slower query is cancelled"""
+    web3_to_node = {}
+    for node in (NodeName.MYCRYPTO, NodeName.BLOCKSCOUT, NodeName.AVADO_POOL):
+        web3 = object()
+        web3_to_node[web3] = node
+        ethereum_manager.web3_mapping[node] = web3
+    for _ in range(HEDGE_MIN_LATENCY_SAMPLES):
+        ethereum_manager.nodes_health[NodeName.MYCRYPTO].record_success(0.05)
+    finished_nodes = []
+
+    def method(web3):
+        node = web3_to_node[web3]
+        if node == NodeName.MYCRYPTO:
+            gevent.sleep(5)
+        elif node == NodeName.AVADO_POOL:
+            raise RemoteError('avado pool is down')
+        finished_nodes.append(node)
+        return node
+
+    start = time.monotonic()
+    result = ethereum_manager.query(
+        method,
+        call_order=[NodeName.MYCRYPTO, NodeName.AVADO_POOL, NodeName.BLOCKSCOUT],
+        hedge=True,
+    )
+    assert result == NodeName.BLOCKSCOUT
+    assert time.monotonic() - start < 1
+    gevent.sleep(0.1)  # the slow query has been cancelled and never finishes
+    assert finished_nodes == [NodeName.BLOCKSCOUT]
+
+    # a node that answers in its usual time is not hedged
+    result = ethereum_manager.query(
+        method,
+        call_order=[NodeName.BLOCKSCOUT, NodeName.MYCRYPTO],
+        hedge=True,
+    )
+    assert result == NodeName.BLOCKSCOUT
+    nodes = {x['name']: x for x in ethereum_manager.get_nodes_health()}
+    assert nodes['mycrypto']['cancelled'] == 1
+    assert nodes['mycrypto']['hedges'] == 0
+    assert nodes['avado pool']['hedges'] == 1
+    assert nodes['avado pool']['hedges_won'] == 0
+    assert nodes['blockscout']['hedges'] == 1
+    assert nodes['blockscout']['hedges_won'] == 1
+
+
+def test_query_limits_the_queries_of_each_node(ethereum_manager):
+    """Test that a query with node semaphores holds the semaphore of each node while
+    querying it, also for the nodes after the first one in the call order"""
+    web3_to_node = {}
+    for node in (NodeName.MYCRYPTO, NodeName.BLOCKSCOUT):
+        web3 = object()
+        web3_to_node[web3] = node
+        ethereum_manager.web3_mapping[node] = web3
+    node_semaphores = {NodeName.MYCRYPTO: BoundedSemaphore(1), NodeName.BLOCKSCOUT: BoundedSemaphore(2)}  # noqa: E501
+    running: Dict[NodeName, int] = defaultdict(int)
+    max_running: Dict[NodeName, int] = defaultdict(int)
+
+    def method(web3):
+        node = web3_to_node[web3]
+        running[node] += 1
+        max_running[node] = max(max_running[node], running[node])
+        gevent.sleep(0.01 if node == NodeName.MYCRYPTO else 0.05)
+        running[node] -= 1
+        if node == NodeName.MYCRYPTO:
+            raise RemoteError('mycrypto is down')
+        return node
+
+    greenlets = [gevent.spawn(
+        ethereum_manager.query,
+        method,
+        call_order=[NodeName.MYCRYPTO, NodeName.BLOCKSCOUT],
+        node_semaphores=node_semaphores,
+    ) for _ in range(6)]
+    gevent.joinall(greenlets, raise_error=True)
+    assert all(x.value == NodeName.BLOCKSCOUT for x in greenlets)
+    assert max_running == {NodeName.MYCRYPTO: 1, NodeName.BLOCKSCOUT: 2}
+
+
+def test_contract_calls_at_a_block_are_cached(ethereum_manager, globaldb):
+    """Test that the results of contract calls at a block number are only queried
+    once and kept in the global DB while calls at the latest block always are queried"""
+    web3 = MagicMock()
+    web3.eth.call.side_effect = lambda tx, block_identifier: Web3().codec.encode_abi(
+        ['uint256'],
+        [block_identifier if isinstance(block_identifier, int) else 1],
+    )
+    ethereum_manager.web3_mapping[NodeName.OWN] = web3
+    address = make_ethereum_address()
+
+    def balance_of(block_identifier):
+        return ethereum_manager.call_contract(
+            contract_address=A_DAI.ethereum_address,
+            abi=ERC20TOKEN_ABI,
+            method_name='balanceOf',
+            arguments=[address],
+            call_order=[NodeName.OWN],
+            block_identifier=block_identifier,
+        )
+
+    assert balance_of(12000000) == 12000000
+    assert balance_of(12000000) == 12000000
+    assert web3.eth.call.call_count == 1
+    assert ethereum_manager.contract_call_cache_misses == 1
+    assert ethereum_manager.contract_call_cache_hits == 1
+    assert balance_of(12000001) == 12000001
+    assert web3.eth.call.call_count == 2
+    for _ in range(2):
+        assert balance_of('latest') == 1
+    assert web3.eth.call.call_count == 4
+    assert ethereum_manager.contract_call_cache_misses == 2
+    assert ethereum_manager.contract_call_cache_hits == 1
+
+    # results that can't be decoded are not kept
+    web3.eth.call.side_effect = lambda tx, block_identifier: b''
+    for _ in range(2):
+        with pytest.raises(BlockchainQueryError):
+            balance_of(12000002)
+    assert web3.eth.call.call_count == 6
+    input_data = Web3().eth.contract(abi=ERC20TOKEN_ABI).encodeABI('balanceOf', args=[address])
+    assert globaldb.get_contract_call_result(
+        chain='ETH',
+        contract_address=A_DAI.ethereum_address,
+        input_hash=bytes(Web3.keccak(hexstr=input_data)),
+        block_number=12000002,
+    ) is None
+
+
+def _raw_tx_receipt(idx: int) -> Dict[str, Any]:
+    """A receipt as returned by the JSON-RPC API of a node or the etherscan proxy"""
+    return {
+        'transactionHash': '0x' + idx.to_bytes(32, 'big').hex(),
+        'blockNumber': hex(1000 + idx),
+        'cumulativeGasUsed': '0x5208',
+        'gasUsed': '0x5208',
+        'status': '0x1',
+        'transactionIndex': hex(idx),
+        'contractAddress': None,
+        'type': '0x2',
+        'logs': [{
+            'address': '0x6B175474E89094C44Da98b954EedeAC495271d0F',
+            'data': '0x' + '00' * 32,
+            'logIndex': hex(idx),
+            'removed': False,
+            'topics': ['0x' + '11' * 32],
+        }],
+    }
+
+
+def test_get_transaction_receipts_in_batches(ethereum_manager):
+    """Test that the receipts are queried from a web3 node in JSON-RPC batch requests
+    and from etherscan concurrently, and that they are returned in the given order"""
+    tx_hashes = ['0x' + idx.to_bytes(32, 'big').hex() for idx in range(5)]
+    web3 = MagicMock()
+    web3.provider.endpoint_uri = 'http://localhost:8545'
+    ethereum_manager.web3_mapping[NodeName.OWN] = web3
+    batches = []
+
+    def mock_post(url, json, timeout):  # pylint: disable=unused-argument
+        batches.append([x['params'][0] for x in json])
+        assert all(x['method'] == 'eth_getTransactionReceipt' for x in json)
+        # results may come in any order and the node does not have the last receipt
+        results = [{
+            'jsonrpc': '2.0',
+            'id': x['id'],
+            'result': None if x['params'][0] == tx_hashes[-1] else _raw_tx_receipt(int(x['params'][0], 16)),  # noqa: E501
+        } for x in reversed(json)]
+        return MockResponse(200, rlk_jsondumps(results))
+
+    running = 0
+    max_running = 0
+
+    def mock_etherscan_receipt(tx_hash):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        gevent.sleep(0.01)
+        running -= 1
+        return _raw_tx_receipt(int(tx_hash, 16))
+
+    post_patch = patch('rotkehlchen.chain.ethereum.manager.requests.post', side_effect=mock_post)
+    batch_size_patch = patch('rotkehlchen.chain.ethereum.manager.MAX_RECEIPTS_PER_BATCH_REQUEST', new=2)  # noqa: E501
+    etherscan_patch = patch.object(
+        ethereum_manager.etherscan,
+        'get_transaction_receipt',
+        side_effect=mock_etherscan_receipt,
+    )
+    with post_patch, batch_size_patch, etherscan_patch as etherscan_mock:
+        receipts = ethereum_manager.get_transaction_receipts(
+            tx_hashes=tx_hashes[:-1],
+            call_order=[NodeName.OWN, NodeName.ETHERSCAN],
+        )
+        assert batches == [tx_hashes[:2], tx_hashes[2:4]]
+        assert etherscan_mock.call_count == 0
+        assert [x['transactionHash'] for x in receipts] == tx_hashes[:-1]
+        assert receipts[3]['blockNumber'] == 1003
+        assert receipts[3]['status'] == 1
+        assert receipts[3]['logs'][0]['logIndex'] == 3
+
+        # a node missing a receipt makes all of them be queried from the next node
+        batches.clear()
+        receipts = ethereum_manager.get_transaction_receipts(
+            tx_hashes=tx_hashes,
+            call_order=[NodeName.OWN, NodeName.ETHERSCAN],
+        )
+        assert len(batches) == 3
+        assert etherscan_mock.call_count == len(tx_hashes)
+        assert max_running == ETHERSCAN_MAX_CONCURRENT_RECEIPT_QUERIES
+        assert [x['transactionHash'] for x in receipts] == tx_hashes
+
+
+def test_get_transaction_receipts_without_status(ethereum_manager):
+    """Test that receipts of pre-byzantium transactions, which have no status, are
+    accepted and that a malformed receipt does not count as a failure of the node"""
+    tx_hashes = ['0x' + idx.to_bytes(32, 'big').hex() for idx in range(2)]
+    web3 = MagicMock()
+    web3.provider.endpoint_uri = 'http://localhost:8545'
+    ethereum_manager.web3_mapping[NodeName.OWN] = web3
+    malformed = False
+
+    def mock_post(url, json, timeout):  # pylint: disable=unused-argument
+        results = []
+        for entry in json:
+            receipt = _raw_tx_receipt(int(entry['params'][0], 16))
+            receipt.pop('status')
+            if malformed:
+                receipt['blockNumber'] = 'foo'
+            results.append({'jsonrpc': '2.0', 'id': entry['id'], 'result': receipt})
+        return MockResponse(200, rlk_jsondumps(results))
+
+    post_patch = patch('rotkehlchen.chain.ethereum.manager.requests.post', side_effect=mock_post)
+    etherscan_patch = patch.object(
+        ethereum_manager.etherscan,
+        'get_transaction_receipt',
+        side_effect=lambda tx_hash: _raw_tx_receipt(int(tx_hash, 16)),
+    )
+    with post_patch, etherscan_patch as etherscan_mock:
+        receipts = ethereum_manager.get_transaction_receipts(
+            tx_hashes=tx_hashes,
+            call_order=[NodeName.OWN, NodeName.ETHERSCAN],
+        )
+        assert etherscan_mock.call_count == 0
+        assert [x['status'] for x in receipts] == [1, 1]
+
+        malformed = True
+        receipts = ethereum_manager.get_transaction_receipts(
+            tx_hashes=tx_hashes,
+            call_order=[NodeName.OWN, NodeName.ETHERSCAN],
+        )
+        assert etherscan_mock.call_count == 2
+        assert [x['transactionHash'] for x in receipts] == tx_hashes
+
+    health = ethereum_manager.nodes_health[NodeName.OWN]
+    assert health.queries == 2
+    assert health.failures == 0
+
+
 @pytest.mark.skipif(
     'CI' in os.environ,
     reason='This test is only for us to figure out the speed of the open nodes',
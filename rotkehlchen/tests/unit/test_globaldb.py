@@ -2,10 +2,12 @@ import itertools
 import sqlite3
 from pathlib import Path
 from shutil import copyfile
+from unittest.mock import patch
 
 import pytest
 
 from rotkehlchen.assets.asset import Asset, EthereumToken, UnderlyingToken
+from rotkehlchen.assets.converters import EXCHANGE_TO_WORLD, asset_from_kraken
 from rotkehlchen.assets.resolver import AssetResolver
 from rotkehlchen.assets.typing import AssetData, AssetType
 from rotkehlchen.assets.utils import symbol_to_asset_or_token
@@ -13,9 +15,13 @@ from rotkehlchen.chain.ethereum.typing import string_to_ethereum_address
 from rotkehlchen.constants.assets import A_BAT, A_CRV, A_DAI, A_PICKLE
 from rotkehlchen.constants.misc import NFT_DIRECTIVE
 from rotkehlchen.constants.resolver import ethaddress_to_identifier
-from rotkehlchen.errors import InputError
+from rotkehlchen.errors import InputError, UnknownAsset
 from rotkehlchen.exchanges.data_structures import Trade
-from rotkehlchen.globaldb.handler import GLOBAL_DB_VERSION, GlobalDBHandler
+from rotkehlchen.globaldb.handler import (
+    CONTRACT_CALL_RESULTS_LAST_USED_SECS,
+    GLOBAL_DB_VERSION,
+    GlobalDBHandler,
+)
 from rotkehlchen.history.typing import HistoricalPriceOracle
 from rotkehlchen.serialization.deserialize import deserialize_asset_amount
 from rotkehlchen.tests.fixtures.globaldb import create_globaldb
@@ -679,3 +685,219 @@ def test_add_user_owned_asset_nft(globaldb):
     new_assets = {x[0] for x in result}
     assert new_assets - initial_assets == {A_DAI.identifier, A_PICKLE.identifier, A_CRV.identifier}
     assert all(not x.startswith(NFT_DIRECTIVE) for x in new_assets)
+
+
+@pytest.mark.parametrize('use_clean_caching_directory', [True])
+def test_asset_resolver_warm_up(globaldb):
+    """Test that warming up the resolver gives the same data as resolving one by one"""
+    AssetResolver().clean_memory_cache()
+    AssetResolver().warm_up()
+    cache = AssetResolver().assets_cache
+    assert AssetResolver().get_memory_footprint() > 0
+    assert cache['bidr'] == bidr_asset_data
+    assert cache[selfkey_id.lower()] == selfkey_asset_data
+    assert cache['bch'].forked == 'BTC'
+    for identifier in ('BTC', 'EUR', selfkey_id, A_DAI.identifier):
+        db_data = globaldb.get_asset_data(identifier, form_with_incomplete_data=False)
+        assert cache[identifier.lower()] == db_data
+
+    # adding, editing and deleting an asset incrementally updates the cache
+    globaldb.add_asset(
+        asset_id='MYBONK',
+        asset_type=AssetType.OWN_CHAIN,
+        data={'name': 'Bonk', 'symbol': 'BNK', 'forked': Asset('BTC')},
+    )
+    assert cache['mybonk'].name == 'Bonk'
+    assert cache['mybonk'].forked == 'BTC'
+    assert Asset('MYBONK').name == 'Bonk'
+    globaldb.edit_custom_asset({
+        'identifier': 'MYBONK',
+        'asset_type': AssetType.OWN_CHAIN,
+        'name': 'Bonk 2',
+        'symbol': 'BNK',
+    })
+    assert cache['mybonk'].name == 'Bonk 2'
+    assert cache['mybonk'].forked is None
+    assert Asset('MYBONK').name == 'Bonk 2'
+    globaldb.delete_custom_asset('MYBONK')
+    assert 'mybonk' not in cache
+    assert AssetResolver.warmed_up is True
+
+
+def test_exchange_symbols_table(globaldb):
+    """Test that the exchange symbol translation tables map symbols like the DB
+    and that they are rebuilt after the assets change"""
+    symbols = globaldb.get_exchange_symbols(Location.KRAKEN, EXCHANGE_TO_WORLD[Location.KRAKEN])
+    assert symbols['XXBT'] == 'BTC'
+    assert symbols['XBT'] == 'BTC'
+    assert symbols['SETH'] == 'ETH2'
+    assert symbols['ZEUR'] == 'EUR'
+    assert symbols['PICKLE'] == A_PICKLE.identifier
+    assert asset_from_kraken('XXBT') == Asset('BTC')
+    assert asset_from_kraken('PICKLE') == symbol_to_asset_or_token('PICKLE')
+    cursor = globaldb._conn.cursor()
+    query = 'SELECT COUNT(*) FROM exchange_symbols WHERE location=?'
+    serialized_kraken = Location.KRAKEN.serialize_for_db()
+    assert cursor.execute(query, (serialized_kraken,)).fetchone()[0] == len(symbols)
+
+    binance_symbols = globaldb.get_exchange_symbols(
+        Location.BINANCE,
+        EXCHANGE_TO_WORLD[Location.BINANCE],
+    ).copy()
+
+    # a symbol that now matches a single asset gets into the table after the assets change
+    # without the rest of the table being rebuilt
+    assert 'BNK' not in symbols
+    table_size = len(symbols)
+    globaldb.add_asset(
+        asset_id='MYBONK',
+        asset_type=AssetType.OWN_CHAIN,
+        data={'name': 'Bonk', 'symbol': 'BNK'},
+    )
+    assert cursor.execute(query, (serialized_kraken,)).fetchone()[0] == table_size + 2
+    assert asset_from_kraken('BNK') == Asset('MYBONK')
+    symbols = globaldb.get_exchange_symbols(Location.KRAKEN, EXCHANGE_TO_WORLD[Location.KRAKEN])
+    assert symbols['BNK'] == 'MYBONK'
+    assert symbols['MYBONK'] == 'MYBONK'
+
+    # and a symbol that no longer matches a single asset is removed from it
+    globaldb.add_asset(
+        asset_id='MYBONK2',
+        asset_type=AssetType.OWN_CHAIN,
+        data={'name': 'Bonk 2', 'symbol': 'BNK'},
+    )
+    symbols = globaldb.get_exchange_symbols(Location.KRAKEN, EXCHANGE_TO_WORLD[Location.KRAKEN])
+    assert 'BNK' not in symbols
+    with pytest.raises(UnknownAsset):
+        asset_from_kraken('BNK')
+
+    # until the other asset with the symbol is renamed or deleted
+    globaldb.edit_custom_asset({
+        'identifier': 'MYBONK2',
+        'asset_type': AssetType.OWN_CHAIN,
+        'name': 'Bonk 2',
+        'symbol': 'BNK2',
+    })
+    assert asset_from_kraken('BNK') == Asset('MYBONK')
+    assert asset_from_kraken('BNK2') == Asset('MYBONK2')
+    globaldb.delete_custom_asset('MYBONK2')
+    globaldb.delete_custom_asset('MYBONK')
+    symbols = globaldb.get_exchange_symbols(Location.KRAKEN, EXCHANGE_TO_WORLD[Location.KRAKEN])
+    assert all(x not in symbols for x in ('BNK', 'BNK2', 'MYBONK', 'MYBONK2'))
+    assert cursor.execute(query, (serialized_kraken,)).fetchone()[0] == table_size
+
+    # the tables of the other exchanges are kept, both in memory and in the DB
+    globaldb._exchange_symbols = {}
+    assert globaldb.get_exchange_symbols(
+        Location.BINANCE,
+        EXCHANGE_TO_WORLD[Location.BINANCE],
+    ) == binance_symbols
+
+
+def test_get_ethereum_tokens_by_addresses(globaldb):
+    """Test that ethereum tokens are served from the address map and that it's
+    invalidated when tokens are added, edited or deleted"""
+    token = INITIAL_TOKENS[0]
+    unknown_address = make_ethereum_address()
+    addresses = [token.ethereum_address, A_DAI.ethereum_address, unknown_address]
+    assert globaldb.get_ethereum_tokens_by_addresses(addresses) == {
+        A_DAI.ethereum_address: A_DAI,
+    }
+    dai = globaldb._ethereum_tokens[A_DAI.ethereum_address]
+    assert globaldb._ethereum_tokens[token.ethereum_address] is None
+    globaldb.add_asset(
+        asset_id=token.identifier,
+        asset_type=AssetType.ETHEREUM_TOKEN,
+        data=token,
+    )
+    tokens = globaldb.get_ethereum_tokens_by_addresses(addresses)
+    assert list(tokens.keys()) == addresses[:2]
+    assert tokens[token.ethereum_address] == token
+    assert tokens[token.ethereum_address].underlying_tokens == token.underlying_tokens
+    assert tokens[A_DAI.ethereum_address].underlying_tokens is None
+    # the second time the same instances come from the map
+    assert globaldb.get_ethereum_token(token.ethereum_address) is tokens[token.ethereum_address]
+    assert globaldb.fetch_underlying_tokens(token.ethereum_address) == token.underlying_tokens
+
+    edited_token = EthereumToken.initialize(
+        address=token.ethereum_address,
+        decimals=5,
+        name='Custom 1 edited',
+        symbol='CST1',
+        underlying_tokens=token.underlying_tokens[:2],
+    )
+    globaldb.edit_ethereum_token(edited_token)
+    # only the changed token is dropped from the map
+    assert token.ethereum_address not in globaldb._ethereum_tokens
+    assert globaldb._ethereum_tokens[A_DAI.ethereum_address] is dai
+    assert globaldb._ethereum_tokens[unknown_address] is None
+    db_token = globaldb.get_ethereum_token(token.ethereum_address)
+    assert db_token.decimals == 5
+    assert db_token.name == 'Custom 1 edited'
+    assert db_token.underlying_tokens == token.underlying_tokens[:2]
+
+    globaldb.delete_ethereum_token(token.ethereum_address)
+    assert globaldb.get_ethereum_token(token.ethereum_address) is None
+    assert globaldb.fetch_underlying_tokens(token.ethereum_address) is None
+
+
+def test_contract_call_results_eviction(globaldb):
+    """Test that saved contract call results are evicted least recently used first,
+    only once there are too many of them, and that their last use is saved at most
+    once per CONTRACT_CALL_RESULTS_LAST_USED_SECS"""
+    contract_address = make_ethereum_address()
+    now = 0
+
+    def add(block_number):
+        globaldb.add_contract_call_result(
+            chain='ETH',
+            contract_address=contract_address,
+            input_hash=b'hash',
+            block_number=block_number,
+            result=block_number.to_bytes(32, 'big'),
+        )
+
+    def get(block_number):
+        return globaldb.get_contract_call_result(
+            chain='ETH',
+            contract_address=contract_address,
+            input_hash=b'hash',
+            block_number=block_number,
+        )
+
+    def saved():
+        return dict(globaldb._conn.execute(
+            'SELECT block_number, last_used FROM contract_call_results',
+        ).fetchall())
+
+    ts_patch = patch('rotkehlchen.globaldb.handler.ts_now', side_effect=lambda: now)
+    max_patch = patch('rotkehlchen.globaldb.handler.CONTRACT_CALL_RESULTS_MAX_ENTRIES', new=3)
+    evict_patch = patch('rotkehlchen.globaldb.handler.CONTRACT_CALL_RESULTS_EVICT_ENTRIES', new=1)
+    with ts_patch, max_patch, evict_patch:
+        for block_number in (1, 2, 3):
+            add(block_number)
+        now = 10
+        assert get(2) == (2).to_bytes(32, 'big')
+        now = CONTRACT_CALL_RESULTS_LAST_USED_SECS
+        assert get(1) == (1).to_bytes(32, 'big')
+        assert saved() == {1: now, 2: 0, 3: 0}
+        add(1)  # already saved so it is not counted again
+        assert saved() == {1: now, 2: 0, 3: 0}
+
+        # going over the limit evicts the least recently used and makes room for more
+        add(4)
+        assert saved() == {1: now, 4: now}
+        assert get(2) is None
+        now += 100
+        add(5)
+        assert saved() == {1: now - 100, 4: now - 100, 5: now}
+        now += 100
+        add(6)
+        assert saved() == {5: now - 100, 6: now}
+        assert get(5) == (5).to_bytes(32, 'big')
+        assert globaldb.get_contract_call_result(
+            chain='ETH',
+            contract_address=contract_address,
+            input_hash=b'other hash',
+            block_number=5,
+        ) is None
@@ -3,7 +3,7 @@ import pytest
 from rotkehlchen.assets.typing import AssetData, AssetType
 from rotkehlchen.chain.ethereum.typing import string_to_ethereum_address
 from rotkehlchen.errors import DeserializationError
-from rotkehlchen.globaldb.updates import AssetsUpdater
+from rotkehlchen.globaldb.updates import AssetsUpdater, split_statements
 from rotkehlchen.typing import Timestamp
 
 
@@ -170,3 +170,22 @@ def test_parse_full_insert(assets_updater, text, expected_data, error_msg):
             assets_updater._parse_full_insert(text)
 
         assert error_msg in str(excinfo.value)
+
+
+@pytest.mark.parametrize('text,expected_statements', [
+    ('', []),
+    (
+        'UPDATE assets SET name="A" WHERE identifier="EUR";UPDATE assets SET name="B" WHERE identifier="USD";',  # noqa: E501
+        ['UPDATE assets SET name="A" WHERE identifier="EUR";', 'UPDATE assets SET name="B" WHERE identifier="USD";'],  # noqa: E501
+    ),
+    (
+        'UPDATE assets SET name="A;B" WHERE identifier="EUR";\n',
+        ['UPDATE assets SET name="A;B" WHERE identifier="EUR";'],
+    ),
+    (
+        "UPDATE assets SET name='A;B;C' WHERE identifier=\"EUR\"; UPDATE assets SET name=\"B\" WHERE identifier=\"USD\"",  # noqa: E501
+        ["UPDATE assets SET name='A;B;C' WHERE identifier=\"EUR\";", ' UPDATE assets SET name="B" WHERE identifier="USD";'],  # noqa: E501
+    ),
+])
+def test_split_statements(text, expected_statements):
+    assert split_statements(text) == expected_statements
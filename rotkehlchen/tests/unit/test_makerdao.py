@@ -1,9 +1,12 @@
 from collections import defaultdict
+from unittest.mock import MagicMock
 
 import pytest
 from web3 import Web3
 
 from rotkehlchen.accounting.structures import Balance, BalanceSheet
+from rotkehlchen.chain.ethereum.manager import NodeName
+from rotkehlchen.chain.ethereum.modules.makerdao.constants import RAY
 from rotkehlchen.chain.ethereum.modules.makerdao.vaults import (
     COLLATERAL_TYPE_MAPPING,
     GEMJOIN_MAPPING,
@@ -11,11 +14,12 @@ from rotkehlchen.chain.ethereum.modules.makerdao.vaults import (
     MakerdaoVaults,
 )
 from rotkehlchen.constants.assets import A_BAT, A_DAI, A_ETH
+from rotkehlchen.constants.ethereum import MAKERDAO_VAT
 from rotkehlchen.constants.misc import ZERO
 from rotkehlchen.constants.resolver import ethaddress_to_identifier
 from rotkehlchen.fval import FVal
 from rotkehlchen.premium.premium import Premium
-from rotkehlchen.tests.utils.factories import make_ethereum_address
+from rotkehlchen.tests.utils.factories import ZERO_ETH_ADDRESS, make_ethereum_address
 from rotkehlchen.tests.utils.makerdao import VaultTestData, create_web3_mock
 
 
@@ -149,6 +153,28 @@ def test_get_vault_balance(
     assert vault.get_balance() == expected_result
 
 
+@pytest.mark.parametrize('number_of_eth_accounts', [2])
+def test_collateral_price_at_block(makerdao_vaults, globaldb):  # pylint: disable=unused-argument
+    """Test that the collateral price at a past block is read from the makerdao
+    contracts at that block and that the results are only queried once"""
+    def mock_call(tx, block_identifier):
+        assert block_identifier == 12000000
+        if tx['to'] == MAKERDAO_VAT.address:  # Art, rate, spot, line, dust
+            return Web3().codec.encode_abi(['uint256'] * 5, [1, RAY, 100 * RAY, 1, 1])
+        # pip, mat
+        return Web3().codec.encode_abi(['address', 'uint256'], [ZERO_ETH_ADDRESS, 2 * RAY])
+
+    web3 = MagicMock()
+    web3.eth.call.side_effect = mock_call
+    makerdao_vaults.ethereum.web3_mapping[NodeName.OWN] = web3
+    ilk = b'ETH-A'.ljust(32, b'\0')
+    for _ in range(2):
+        price = makerdao_vaults._get_collateral_price_at_block(ilk=ilk, block_number=12000000)
+        assert price == FVal(200)
+    assert web3.eth.call.call_count == 2
+    assert makerdao_vaults.ethereum.contract_call_cache_hits == 2
+
+
 def test_vault_types():
     assert len(COLLATERAL_TYPE_MAPPING) == len(GEMJOIN_MAPPING)
     assert set(COLLATERAL_TYPE_MAPPING.keys()) == set(GEMJOIN_MAPPING.keys())
@@ -9,7 +9,7 @@ from rotkehlchen.chain.bitcoin.xpub import XpubData
 from rotkehlchen.chain.ethereum.transactions import EthTransactions
 from rotkehlchen.db.ethtx import DBEthTx
 from rotkehlchen.exchanges.manager import ExchangeManager
-from rotkehlchen.tasks.manager import TaskManager
+from rotkehlchen.tasks.manager import DB_VACUUM_MAX_PAGES, TaskManager
 from rotkehlchen.tests.utils.ethereum import setup_ethereum_transactions_test
 from rotkehlchen.typing import Location
 from rotkehlchen.utils.misc import hexstring_to_bytes, ts_now
@@ -195,3 +195,31 @@ def test_maybe_schedule_ethereum_txreceipts(task_manager, ethereum_manager, data
     assert receipt1 == receipts[0]
     receipt2 = txmodule.get_or_query_transaction_receipt(tx_hash_2)
     assert receipt2 == receipts[1]
+
+
+def test_maybe_vacuum_database(task_manager, database, api_task_greenlets):
+    database.conn.executemany(
+        'INSERT INTO timed_location_data(time, location, usd_value) VALUES(?, "A", ?)',
+        [(idx, 'a' * 1000) for idx in range(10000)],
+    )
+    database.conn.commit()
+    database.conn.execute('DELETE FROM timed_location_data;')
+    database.conn.commit()
+    free_pages = database.conn.execute('PRAGMA freelist_count;').fetchone()[0]
+    assert free_pages > DB_VACUUM_MAX_PAGES
+    task_manager.potential_tasks = [task_manager._maybe_vacuum_database]
+    gevent.joinall(task_manager.greenlet_manager.greenlets)  # the tasks started at init
+
+    # nothing is vacuumed while other tasks run
+    api_task_greenlets.append(gevent.spawn(gevent.sleep, 10))
+    task_manager.schedule()
+    assert database.conn.execute('PRAGMA freelist_count;').fetchone()[0] == free_pages
+    api_task_greenlets.pop().kill()
+
+    task_manager.schedule()
+    assert database.last_vacuum_ts != 0
+    remaining = free_pages - DB_VACUUM_MAX_PAGES
+    assert database.conn.execute('PRAGMA freelist_count;').fetchone()[0] == remaining
+    # and the next vacuum waits until DB_VACUUM_FREQUENCY has passed
+    task_manager.schedule()
+    assert database.conn.execute('PRAGMA freelist_count;').fetchone()[0] == remaining
@@ -1,15 +1,28 @@
-from unittest.mock import patch
+import random
+from collections import defaultdict
+from unittest.mock import MagicMock, patch
 
+import gevent
 import pytest
 import requests
 
-from rotkehlchen.chain.ethereum.tokens import EthTokens
+from rotkehlchen.chain.ethereum.tokens import (
+    BALANCES_PER_CALL_RESET_SECS,
+    MAX_BALANCES_PER_CALL,
+    NODE_MAX_CONCURRENT_TOKEN_QUERIES,
+    EthTokens,
+)
+from rotkehlchen.chain.ethereum.typing import NodeName
 from rotkehlchen.chain.ethereum.utils import token_normalized_value
 from rotkehlchen.constants.assets import A_BAT, A_MKR
+from rotkehlchen.errors import RemoteError
 from rotkehlchen.fval import FVal
+from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.tests.utils.blockchain import mock_etherscan_query
 from rotkehlchen.tests.utils.constants import A_GNO
 from rotkehlchen.tests.utils.factories import make_ethereum_address
+from rotkehlchen.typing import Timestamp
+from rotkehlchen.utils.misc import ts_now
 
 
 @pytest.fixture(name='ethtokens')
@@ -71,12 +84,13 @@ def test_detected_tokens_cache(ethtokens, inquirer):  # pylint: disable=unused-a
         # Then in second call autodetect queries should not have been made, and DB cache used
         result2, _ = ethtokens.query_tokens_for_addresses([addr1, addr2], False)
         call_count = etherscan_mock.call_count
-        assert call_count == initial_call_count + 2
+        # the saved tokens of both addresses are queried in one call
+        assert call_count == initial_call_count + 1
 
         # In the third call force re-detection
         result3, _ = ethtokens.query_tokens_for_addresses([addr1, addr2], True)
         call_count = etherscan_mock.call_count
-        assert call_count == initial_call_count + 2 + initial_call_count
+        assert call_count == initial_call_count + 1 + initial_call_count
 
         assert result1 == result2 == result3
         assert len(result1) == len(eth_map)
@@ -110,3 +124,116 @@ def test_ignored_tokens_in_query(ethtokens, inquirer):  # pylint: disable=unused
         assert len(result[addr1]) == 1
         assert result[addr1][A_MKR] == FVal('4E-15')
         assert len(result[addr2]) == 1
+
+
+def test_detection_queries_run_concurrently(ethtokens, inquirer):  # pylint: disable=unused-argument  # noqa: E501
+    """Test that detection queries all addresses and chunks concurrently within the
+    limit of the node and merges their results in the same order every time"""
+    addresses = [make_ethereum_address() for _ in range(5)]
+    running: defaultdict = defaultdict(int)
+    max_running: defaultdict = defaultdict(int)
+
+    def mock_tokens_balance(ethereum, method_name, arguments, call_order, call_type, node_semaphores):  # pylint: disable=unused-argument  # noqa: E501
+        def query_node(web3):
+            node = NodeName.ETHERSCAN if web3 is None else NodeName.OWN
+            running[node] += 1
+            max_running[node] = max(max_running[node], running[node])
+            gevent.sleep(random.random() / 100)
+            running[node] -= 1
+            # Each address has a balance of the first token of each chunk
+            return [
+                [10 ** 18 if idx == 0 else 0 for idx in range(len(arguments[1]))]
+                for _ in arguments[0]
+            ]
+
+        return ethereum.query(query_node, call_order=call_order, node_semaphores=node_semaphores)  # noqa: E501
+
+    eth_scan = MagicMock()
+    eth_scan.call.side_effect = mock_tokens_balance
+    with patch('rotkehlchen.chain.ethereum.tokens.ETH_SCAN', new=eth_scan):
+        result, token_usd_prices = ethtokens.query_tokens_for_addresses(addresses, True)
+        assert max_running[NodeName.ETHERSCAN] == NODE_MAX_CONCURRENT_TOKEN_QUERIES[NodeName.ETHERSCAN]  # noqa: E501
+        # all the addresses fit in each call, so there is one call per chunk of tokens
+        tokens = list(result[addresses[0]].keys())
+        assert len(tokens) == eth_scan.call.call_count
+        assert set(token_usd_prices.keys()) == set(tokens)
+        for address in addresses:
+            assert list(result[address].keys()) == tokens
+            assert all(y == token_normalized_value(10 ** 18, x) for x, y in result[address].items())  # noqa: E501
+            assert ethtokens.db.get_tokens_for_address_if_time(address, ts_now()) == tokens
+
+        result_again, _ = ethtokens.query_tokens_for_addresses(addresses, True)
+        assert list(result_again.keys()) == addresses
+        for address in addresses:
+            assert list(result_again[address].keys()) == tokens
+
+
+def test_balances_queried_in_smaller_calls_after_failure(ethtokens, inquirer):  # pylint: disable=unused-argument  # noqa: E501
+    """Test that if a call for the balances of many accounts fails, the balances are
+    queried again in smaller calls, and that later calls stay within the lowered limit"""
+    addresses = [make_ethereum_address() for _ in range(30)]
+    max_balances = 400
+    calls_balances = []
+
+    def mock_tokens_balance(ethereum, method_name, arguments, call_order, call_type, node_semaphores):  # pylint: disable=unused-argument  # noqa: E501
+        balances_num = len(arguments[0]) * len(arguments[1])
+        calls_balances.append(balances_num)
+        if balances_num > max_balances:
+            raise RemoteError('out of gas')
+        # Every account holds the tokens whose address ends in 0
+        return [
+            [10 ** 18 if token[-1] == '0' else 0 for token in arguments[1]]
+            for _ in arguments[0]
+        ]
+
+    eth_scan = MagicMock()
+    eth_scan.call.side_effect = mock_tokens_balance
+    with patch('rotkehlchen.chain.ethereum.tokens.ETH_SCAN', new=eth_scan):
+        result, _ = ethtokens.query_tokens_for_addresses(addresses, True)
+        assert ethtokens.max_balances_per_call <= max_balances
+        assert list(result.keys()) == addresses
+        tokens = list(result[addresses[0]].keys())
+        assert len(tokens) != 0
+        assert all(x.ethereum_address[-1] == '0' for x in tokens)
+        for address in addresses:
+            assert list(result[address].keys()) == tokens
+
+        calls_balances.clear()
+        result_again, _ = ethtokens.query_tokens_for_addresses(addresses, True)
+        assert result_again == result
+        assert max(calls_balances) <= max_balances
+
+
+def test_saved_tokens_queried_in_groups(ethtokens, inquirer):  # pylint: disable=unused-argument  # noqa: E501
+    """Test that the saved tokens of addresses with different ones are not queried for
+    each other and that a lowered limit of balances per call goes back up after a while"""
+    addresses = [make_ethereum_address() for _ in range(3)]
+    tokens = GlobalDBHandler().get_ethereum_tokens()[:30]
+    ethtokens.db.save_tokens_for_addresses({
+        addresses[0]: tokens[:10],
+        addresses[1]: tokens[:10],
+        addresses[2]: tokens[10:],
+    })
+    calls = []
+
+    def mock_tokens_balance(ethereum, method_name, arguments, call_order, call_type, node_semaphores):  # pylint: disable=unused-argument  # noqa: E501
+        calls.append((arguments[0], set(arguments[1])))
+        return [[10 ** 18] * len(arguments[1]) for _ in arguments[0]]
+
+    eth_scan = MagicMock()
+    eth_scan.call.side_effect = mock_tokens_balance
+    ethtokens.max_balances_per_call = 200
+    ethtokens.max_balances_per_call_ts = ts_now()
+    with patch('rotkehlchen.chain.ethereum.tokens.ETH_SCAN', new=eth_scan):
+        result, _ = ethtokens.query_tokens_for_addresses(addresses, False)
+        assert calls == [
+            (addresses[:2], {x.ethereum_address for x in tokens[:10]}),
+            (addresses[2:], {x.ethereum_address for x in tokens[10:]}),
+        ]
+        assert list(result[addresses[0]].keys()) == tokens[:10]
+        assert list(result[addresses[2]].keys()) == tokens[10:]
+        assert ethtokens.max_balances_per_call == 200
+
+        ethtokens.max_balances_per_call_ts = Timestamp(ts_now() - BALANCES_PER_CALL_RESET_SECS)
+        ethtokens.query_tokens_for_addresses(addresses, False)
+        assert ethtokens.max_balances_per_call == MAX_BALANCES_PER_CALL
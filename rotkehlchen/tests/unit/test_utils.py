@@ -14,6 +14,7 @@ from rotkehlchen.fval import FVal
 from rotkehlchen.serialization.deserialize import deserialize_timestamp_from_date
 from rotkehlchen.serialization.serialize import process_result
 from rotkehlchen.tests.utils.mock import MockResponse
+from rotkehlchen.utils.downsampling import lttb_indices
 from rotkehlchen.utils.misc import (
     combine_dicts,
     combine_stat_dicts,
@@ -365,3 +366,22 @@ def test_jsonloads_list():
     with pytest.raises(JSONDecodeError) as e:
         jsonloads_list('{"foo": 1, "boo": "value"}')
     assert 'Returned json is not a list' in str(e.value)
+
+
+def test_lttb_indices():
+    points = [(x, float(x % 10)) for x in range(100)]
+    assert lttb_indices(points, 100) == list(range(100))
+    assert lttb_indices(points, 500) == list(range(100))
+    assert lttb_indices([], 10) == []
+
+    indices = lttb_indices(points, 12)
+    assert len(indices) == 12
+    assert indices[0] == 0 and indices[-1] == 99
+    assert indices == sorted(set(indices))
+    # The saw tooth keeps its peaks and troughs
+    assert {points[idx][1] for idx in indices[1:-1]} <= {0.0, 9.0}
+
+    # A spike in a flat line is always kept
+    points = [(x, 0.0) for x in range(1000)]
+    points[567] = (567, 100.0)
+    assert 567 in lttb_indices(points, 10)
@@ -329,7 +329,8 @@ def assert_cryptocom_import_results(rotki: Rotkehlchen):
         link='',
         notes=get_cryptocom_note('EUR -> BTC'),
     )]
-    assert expected_trades == trades
+    # trades with the same timestamp are ordered by their identifier
+    assert sorted(expected_trades, key=lambda x: (x.timestamp, x.identifier)) == trades
 
     expected_movements = [AssetMovement(
         location=Location.CRYPTOCOM,
@@ -1014,7 +1015,8 @@ def assert_custom_cointracking(rotki: Rotkehlchen):
         fee=Fee(FVal("0.0001")),
         link='',
     )]
-    assert expected_movements == asset_movements
+    # movements with the same timestamp are ordered by their identifier
+    assert sorted(expected_movements, key=lambda x: (x.timestamp, x.identifier)) == asset_movements  # noqa: E501
 
 
 def assert_bisq_trades_import_results(rotki: Rotkehlchen):
@@ -209,7 +209,8 @@ def assert_db_got_replaced(rotkehlchen_instance: Rotkehlchen, username: str):
     directory = os.path.join(rotkehlchen_instance.data.data_directory, username)
     files = [
         os.path.join(directory, f) for f in os.listdir(directory)
-        if not f.endswith('backup') or f.startswith('rotkehlchen_db')
+        if (not f.endswith('backup') or f.startswith('rotkehlchen_db')) and
+        not f.endswith(('-wal', '-shm'))  # the write-ahead log files of the open DB
     ]
     msg = f'Expected 2 or 3 files in the directory but got {files}'
     assert len(files) in (2, 3), msg  # 3rd file is the dbinfo.json
@@ -9,7 +9,7 @@ from rotkehlchen.assets.asset import Asset, EthereumToken
 from rotkehlchen.balances.manual import ManuallyTrackedBalance
 from rotkehlchen.constants.assets import A_BTC, A_ETH, A_EUR
 from rotkehlchen.constants.misc import ZERO
-from rotkehlchen.db.utils import DBAssetBalance, LocationData
+from rotkehlchen.db.utils import DBAssetBalance
 from rotkehlchen.fval import FVal
 from rotkehlchen.tests.utils.blockchain import (
     mock_beaconchain,
@@ -248,69 +248,23 @@ def add_starting_balances(datahandler) -> List[DBAssetBalance]:
     datahandler.db.add_multiple_balances(balances)
     datahandler.db.conn.commit()
 
-    location_data = [
-        LocationData(
-            time=Timestamp(1451606400),
-            location=Location.KRAKEN.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='100',
-        ),
-        LocationData(
-            time=Timestamp(1451606400),
-            location=Location.BANKS.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='1000',
-        ),
-        LocationData(
-            time=Timestamp(1461606500),
-            location=Location.POLONIEX.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='50',
-        ),
-        LocationData(
-            time=Timestamp(1461606500),
-            location=Location.KRAKEN.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='200',
-        ),
-        LocationData(
-            time=Timestamp(1461606500),
-            location=Location.BANKS.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='50000',
-        ),
-        LocationData(
-            time=Timestamp(1491607800),
-            location=Location.POLONIEX.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='100',
-        ),
-        LocationData(
-            time=Timestamp(1491607800),
-            location=Location.KRAKEN.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='2000',
-        ),
-        LocationData(
-            time=Timestamp(1491607800),
-            location=Location.BANKS.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='10000',
-        ),
-        LocationData(
-            time=Timestamp(1491607800),
-            location=Location.BLOCKCHAIN.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='200000',
-        ),
-        LocationData(
-            time=Timestamp(1451606400),
-            location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='1500',
-        ),
-        LocationData(
-            time=Timestamp(1461606500),
-            location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='4500',
-        ),
-        LocationData(
-            time=Timestamp(1491607800),
-            location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='10700.5',
-        ),
-    ]
-    datahandler.db.add_multiple_location_data(location_data)
+    for time, location_usd_values, net_usd in (
+            (1451606400, {'kraken': '100', 'banks': '1000'}, '1500'),
+            (1461606500, {'poloniex': '50', 'kraken': '200', 'banks': '50000'}, '4500'),
+            (1491607800, {'poloniex': '100', 'kraken': '2000', 'banks': '10000', 'blockchain': '200000'}, '10700.5'),  # noqa: E501
+    ):
+        datahandler.db.save_balances_data(
+            data={
+                'assets': {},
+                'liabilities': {},
+                'location': {
+                    location: {'usd_value': FVal(usd_value)}
+                    for location, usd_value in location_usd_values.items()
+                },
+                'net_usd': FVal(net_usd),
+            },
+            timestamp=Timestamp(time),
+        )
 
     return balances
 
@@ -318,55 +272,23 @@ def add_starting_balances(datahandler) -> List[DBAssetBalance]:
 def add_starting_nfts(datahandler):
     """Adds a time series for an account owning a NFT"""
     datahandler.db.add_asset_identifiers(['_nft_pickle'])
-    balances = [
-        DBAssetBalance(
-            category=BalanceType.ASSET,
-            time=Timestamp(1488326400),
-            asset=Asset('_nft_pickle'),
-            amount='1',
-            usd_value='1000',
-        ), DBAssetBalance(
-            category=BalanceType.ASSET,
-            time=Timestamp(1488426400),
-            asset=Asset('_nft_pickle'),
-            amount='1',
-            usd_value='1000',
-        ), DBAssetBalance(
-            category=BalanceType.ASSET,
-            time=Timestamp(1488526400),
-            asset=Asset('_nft_pickle'),
-            amount='2',
-            usd_value='2000',
-        ), DBAssetBalance(
-            category=BalanceType.ASSET,
-            time=Timestamp(1488626400),
-            asset=Asset('_nft_pickle'),
-            amount='1',
-            usd_value='1000',
-        ),
-    ]
-    datahandler.db.add_multiple_balances(balances)
-    datahandler.db.conn.commit()
-    location_data = [
-        LocationData(
-            time=Timestamp(1488326400),
-            location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='3000',
-        ),
-        LocationData(
-            time=Timestamp(1488426400),
-            location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='4000',
-        ),
-        LocationData(
-            time=Timestamp(1488526400),
-            location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='5000',
-        ),
-        LocationData(
-            time=Timestamp(1488626400),
-            location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
-            usd_value='5500',
-        ),
-    ]
-    datahandler.db.add_multiple_location_data(location_data)
+    for time, nft_amount, nft_usd_value, net_usd in (
+            (1488326400, '1', '1000', '3000'),
+            (1488426400, '1', '1000', '4000'),
+            (1488526400, '2', '2000', '5000'),
+            (1488626400, '1', '1000', '5500'),
+    ):
+        datahandler.db.save_balances_data(
+            data={
+                'assets': {
+                    Asset('_nft_pickle'): {
+                        'amount': FVal(nft_amount),
+                        'usd_value': FVal(nft_usd_value),
+                    },
+                },
+                'liabilities': {},
+                'location': {},
+                'net_usd': FVal(net_usd),
+            },
+            timestamp=Timestamp(time),
+        )
@@ -0,0 +1,45 @@
+from typing import List, Sequence, Tuple
+
+
+def lttb_indices(points: Sequence[Tuple[int, float]], max_points: int) -> List[int]:
+    """Downsamples a time series with the Largest-Triangle-Three-Buckets algorithm
+
+    Takes (time, value) points in ascending time order and returns the indices of at
+    most max_points of them, chosen so that the graph drawn from them keeps the shape
+    of the full series. The first and last points are always kept.
+
+    https://skemman.is/bitstream/1946/15343/3/SS_MSthesis.pdf
+    """
+    length = len(points)
+    if max_points >= length or max_points < 3:
+        return list(range(length))
+
+    indices = [0]
+    # The points between the first and the last are split into max_points - 2 buckets
+    # and the point of each bucket that forms the largest triangle with the point
+    # chosen from the previous bucket and the average of the next bucket is kept
+    bucket_size = (length - 2) / (max_points - 2)
+    chosen_x, chosen_y = points[0]
+    for bucket in range(max_points - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, length)
+        next_points = points[end:next_end]
+        average_x = sum(x for x, _ in next_points) / len(next_points)
+        average_y = sum(y for _, y in next_points) / len(next_points)
+
+        max_area, max_idx = -1.0, start
+        for idx in range(start, end):
+            x, y = points[idx]
+            area = abs(
+                (chosen_x - average_x) * (y - chosen_y) -
+                (chosen_x - x) * (average_y - chosen_y),
+            )
+            if area > max_area:
+                max_area, max_idx = area, idx
+
+        indices.append(max_idx)
+        chosen_x, chosen_y = points[max_idx]
+
+    indices.append(length - 1)
+    return indices
@@ -22,6 +22,9 @@ class DBEnumMixIn(SerializableEnumMixin):
             )
 
         number = ord(value)
-        if number < 65 or number > list(cls)[-1].value + 64:  # type: ignore
-            raise DeserializationError(f'Failed to deserialize {cls.__name__} DB value {value}')
-        return cls(number - 64)
+        if number >= 65:
+            try:  # looking up the value instead of going through all of the members
+                return cls(number - 64)
+            except ValueError:
+                pass
+        raise DeserializationError(f'Failed to deserialize {cls.__name__} DB value {value}')
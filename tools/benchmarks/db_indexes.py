@@ -0,0 +1,212 @@
+"""Benchmark the history queries of the user DB with and without its indexes
+
+Builds a large synthetic DB with the user DB schema and times the query shapes
+created by rotkehlchen/db/filtering.py and by query_timed_balances, first
+without and then with the indexes of DB_SCRIPT_CREATE_INDEXES.
+
+Run from the repository root with:
+    python -m tools.benchmarks.db_indexes --rows 500000
+"""
+import argparse
+import random
+import sqlite3
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, List, Sequence, Tuple
+
+from rotkehlchen.chain.ethereum.typing import string_to_ethereum_address
+from rotkehlchen.constants.timing import KRAKEN_TS_MULTIPLIER
+from rotkehlchen.db.filtering import (
+    AssetMovementsFilterQuery,
+    ETHTransactionsFilterQuery,
+    HistoryEventFilterQuery,
+    LedgerActionsFilterQuery,
+    TradesFilterQuery,
+)
+from rotkehlchen.db.schema import DB_SCRIPT_CREATE_INDEXES, DB_SCRIPT_CREATE_TABLES
+from rotkehlchen.typing import Location, Timestamp
+
+BENCHMARK_ASSETS = ('BTC', 'ETH', 'EUR', 'USD', 'BCH', 'LTC', 'XRP', 'ADA', 'DOT', 'KSM')
+BENCHMARK_LOCATIONS = (Location.KRAKEN, Location.BINANCE, Location.COINBASE, Location.BITTREX)
+START_TS = 1500000000
+ADDRESSES = [string_to_ethereum_address(f'0x{idx:040x}') for idx in range(50)]
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog='db_indexes',
+        description='Benchmark the user DB history queries with and without indexes',
+    )
+    p.add_argument('--rows', type=int, default=500000, help='Number of rows per history table')
+    p.add_argument('--repeat', type=int, default=5, help='Number of times to repeat each query')
+    return p.parse_args()
+
+
+def populate(conn: sqlite3.Connection, rows: int) -> None:
+    rng = random.Random(42)
+    locations = [x.serialize_for_db() for x in BENCHMARK_LOCATIONS]
+    conn.executemany(
+        'INSERT INTO assets(identifier) VALUES(?)',
+        [(x,) for x in BENCHMARK_ASSETS],
+    )
+    conn.executemany(
+        'INSERT INTO trades(id, time, location, base_asset, quote_asset, type, amount, rate) '
+        'VALUES(?, ?, ?, ?, ?, ?, ?, ?)',
+        ((
+            str(idx),
+            START_TS + idx * 60,
+            rng.choice(locations),
+            *rng.sample(BENCHMARK_ASSETS, 2),
+            'A',
+            '1',
+            '1',
+        ) for idx in range(rows)),
+    )
+    conn.executemany(
+        'INSERT INTO asset_movements(id, location, category, time, asset, amount, fee_asset, fee) '
+        'VALUES(?, ?, ?, ?, ?, ?, ?, ?)',
+        ((
+            str(idx),
+            rng.choice(locations),
+            rng.choice(('A', 'B')),
+            START_TS + idx * 60,
+            rng.choice(BENCHMARK_ASSETS),
+            '1',
+            'ETH',
+            '0.01',
+        ) for idx in range(rows)),
+    )
+    conn.executemany(
+        'INSERT INTO ledger_actions(timestamp, type, location, amount, asset) '
+        'VALUES(?, ?, ?, ?, ?)',
+        ((
+            START_TS + idx * 60,
+            'A',
+            rng.choice(locations),
+            '1',
+            rng.choice(BENCHMARK_ASSETS),
+        ) for idx in range(rows)),
+    )
+    conn.executemany(
+        'INSERT INTO history_events(identifier, event_identifier, sequence_index, timestamp, '
+        'location, asset, amount, usd_value, type) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        ((
+            str(idx),
+            str(idx // 3),
+            idx % 3,
+            (START_TS + idx * 60) * KRAKEN_TS_MULTIPLIER,
+            rng.choice(locations),
+            rng.choice(BENCHMARK_ASSETS),
+            '1',
+            '1',
+            'trade',
+        ) for idx in range(rows)),
+    )
+    conn.executemany(
+        'INSERT INTO timed_balances(category, time, currency, amount, usd_value) '
+        'VALUES(?, ?, ?, ?, ?)',
+        ((
+            'A',
+            START_TS + (idx // len(BENCHMARK_ASSETS)) * 3600,
+            BENCHMARK_ASSETS[idx % len(BENCHMARK_ASSETS)],
+            '1',
+            '1',
+        ) for idx in range(rows)),
+    )
+    conn.executemany(
+        'INSERT INTO ethereum_transactions(tx_hash, timestamp, block_number, from_address, '
+        'to_address, value, gas, gas_price, gas_used, input_data, nonce) '
+        'VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        ((
+            idx.to_bytes(32, byteorder='big'),
+            START_TS + idx * 60,
+            idx,
+            rng.choice(ADDRESSES),
+            rng.choice(ADDRESSES),
+            '0',
+            '21000',
+            '1',
+            '21000',
+            b'',
+            idx,
+        ) for idx in range(rows)),
+    )
+    conn.commit()
+
+
+def make_queries(rows: int) -> List[Tuple[str, str, Sequence[Any]]]:
+    """Returns a list of (name, query, bindings) for the benchmarked query shapes"""
+    middle_ts = Timestamp(START_TS + rows * 30)
+    end_ts = Timestamp(START_TS + rows * 30 + 86400 * 7)
+    queries: List[Tuple[str, str, Sequence[Any]]] = []
+    for name, table, filter_query in (
+        ('trades by time', 'trades', TradesFilterQuery.make(from_ts=middle_ts, to_ts=end_ts)),
+        ('trades by location', 'trades', TradesFilterQuery.make(
+            location=Location.KRAKEN,
+            from_ts=middle_ts,
+            to_ts=end_ts,
+        )),
+        ('asset movements by location', 'asset_movements', AssetMovementsFilterQuery.make(
+            location=Location.KRAKEN,
+            from_ts=middle_ts,
+            to_ts=end_ts,
+        )),
+        ('ledger actions by time', 'ledger_actions', LedgerActionsFilterQuery.make(
+            from_ts=middle_ts,
+            to_ts=end_ts,
+        )),
+        ('history events by location', 'history_events', HistoryEventFilterQuery.make(
+            location=Location.KRAKEN,
+            from_ts=middle_ts,
+            to_ts=end_ts,
+        )),
+        ('ethereum transactions by address', 'ethereum_transactions', ETHTransactionsFilterQuery.make(  # noqa: E501
+            addresses=ADDRESSES[:2],
+            from_ts=middle_ts,
+            to_ts=end_ts,
+        )),
+    ):
+        query, bindings = filter_query.prepare()
+        queries.append((name, f'SELECT * FROM {table} {query}', bindings))
+
+    queries.append((
+        'timed balances of an asset',
+        'SELECT time, amount, usd_value, category FROM timed_balances '
+        'WHERE time BETWEEN ? AND ? AND currency=? ORDER BY time ASC;',
+        (START_TS, end_ts, 'ETH'),
+    ))
+    return queries
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        conn = sqlite3.connect(Path(tmpdir) / 'benchmark.db')
+        conn.executescript(DB_SCRIPT_CREATE_TABLES)
+        print(f'Populating the history tables with {args.rows} rows each...')
+        populate(conn, args.rows)
+        queries = make_queries(args.rows)
+        results = {}
+        for indexed in (False, True):
+            if indexed:
+                conn.executescript(DB_SCRIPT_CREATE_INDEXES)
+                conn.execute('ANALYZE;')
+            for name, query, bindings in queries:
+                timings = timeit.repeat(
+                    lambda: conn.execute(query, bindings).fetchall(),  # pylint: disable=cell-var-from-loop  # noqa: E501
+                    number=1,
+                    repeat=args.repeat,
+                )
+                results[(name, indexed)] = min(timings)
+
+        for name, _, _ in queries:
+            without, with_ = results[(name, False)], results[(name, True)]
+            print(
+                f'{name}: best of {args.repeat}: {without * 1000:.1f}ms without '
+                f'indexes, {with_ * 1000:.1f}ms with indexes',
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark paging through the trades of the user DB like the history endpoints do
+
+Times querying every page of a large trades table along with its total count, first
+with the filter cache emptied before each page so that every page skips over all of
+the previous trades via its offset and recounts them, and then with the cache, where
+each page seeks to where the previous one ended and the count is cached.
+
+Run from the repository root with:
+    python -m tools.benchmarks.db_pagination --rows 200000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from rotkehlchen.db.dbhandler import DBHandler
+from rotkehlchen.db.filtering import TradesFilterQuery
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.user_messages import MessagesAggregator
+
+PASSWORD = '123'
+START_TS = 1500000000
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog='db_pagination',
+        description='Benchmark paging through the trades with and without the filter cache',
+    )
+    p.add_argument('--rows', type=int, default=200000, help='Number of trades in the DB')
+    p.add_argument('--page', type=int, default=100, help='Number of trades per page')
+    return p.parse_args()
+
+
+def query_pages(db: DBHandler, rows: int, page: int, use_cache: bool) -> List[float]:
+    timings = []
+    for offset in range(0, rows, page):
+        if not use_cache:
+            db.filter_cache.clear()
+        filter_query = TradesFilterQuery.make(order_ascending=False, limit=page, offset=offset)
+        start = time.monotonic()
+        db.get_trades_and_limit_info(filter_query, has_premium=True)
+        timings.append(time.monotonic() - start)
+
+    return timings
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        GlobalDBHandler(data_dir=Path(tmpdir))
+        user_data_dir = Path(tmpdir) / 'user'
+        user_data_dir.mkdir()
+        db = DBHandler(user_data_dir, PASSWORD, MessagesAggregator(), None)
+        db.conn.executemany(
+            'INSERT INTO trades(id, time, location, base_asset, quote_asset, type, amount, rate) '
+            'VALUES(?, ?, "A", "ETH", "BTC", "A", "1", "1")',
+            # a few trades per timestamp so that pages also end in the middle of them
+            [(str(idx), START_TS + idx // 3) for idx in range(args.rows)],
+        )
+        db.conn.commit()
+        for use_cache in (False, True):
+            timings = query_pages(db, args.rows, args.page, use_cache)
+            print(
+                f'{"With" if use_cache else "Without"} the filter cache: '
+                f'{len(timings)} pages in {sum(timings):.2f}s, '
+                f'first page {timings[0] * 1000:.2f}ms, '
+                f'last page {timings[-1] * 1000:.2f}ms',
+            )
+        del db
+
+
+if __name__ == '__main__':
+    main()
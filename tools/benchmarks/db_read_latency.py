@@ -0,0 +1,91 @@
+"""Benchmark the latency of DB reads while another connection keeps writing
+
+A writer thread keeps adding trades in batches, like the background tasks do,
+while the main thread times the trades query of the API on a read connection.
+This runs once with the rollback journal and once with the write-ahead log.
+
+Run from the repository root with:
+    python -m tools.benchmarks.db_read_latency --seconds 10
+"""
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+from rotkehlchen.db.dbhandler import MAIN_DB_NAME, DBHandler
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.user_messages import MessagesAggregator
+
+PASSWORD = '123'
+READ_QUERY = 'SELECT * FROM trades ORDER BY time DESC LIMIT 100'
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog='db_read_latency',
+        description='Benchmark DB read latency during concurrent writes per journal mode',
+    )
+    p.add_argument('--seconds', type=int, default=10, help='Duration of each run')
+    p.add_argument('--batch', type=int, default=2000, help='Trades written per transaction')
+    return p.parse_args()
+
+
+def write_trades(db: DBHandler, batch: int, stop: threading.Event) -> None:
+    conn = db._open_connection(db.user_data_dir / MAIN_DB_NAME, PASSWORD)  # pylint: disable=protected-access  # noqa: E501
+    idx = conn.execute('SELECT COUNT(*) FROM trades').fetchone()[0]
+    while not stop.is_set():
+        conn.executemany(
+            'INSERT INTO trades(id, time, location, base_asset, quote_asset, type, amount, rate) '
+            'VALUES(?, ?, "A", "ETH", "BTC", "A", "1", "1")',
+            [(str(idx + x), 1500000000 + idx + x) for x in range(batch)],
+        )
+        conn.commit()
+        idx += batch
+    conn.close()
+
+
+def measure_reads(db: DBHandler, batch: int, seconds: int) -> List[float]:
+    stop = threading.Event()
+    writer = threading.Thread(target=write_trades, args=(db, batch, stop))
+    writer.start()
+    conn = db._open_connection(db.user_data_dir / MAIN_DB_NAME, PASSWORD)  # pylint: disable=protected-access  # noqa: E501
+    conn.execute('SELECT COUNT(*) FROM trades').fetchone()  # derive the key before timing
+    timings = []
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        start = time.monotonic()
+        conn.execute(READ_QUERY).fetchall()
+        timings.append(time.monotonic() - start)
+        time.sleep(0.005)
+
+    stop.set()
+    writer.join()
+    conn.close()
+    return timings
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        GlobalDBHandler(data_dir=Path(tmpdir))
+        user_data_dir = Path(tmpdir) / 'user'
+        user_data_dir.mkdir()
+        db = DBHandler(user_data_dir, PASSWORD, MessagesAggregator(), None)
+        for journal_mode in ('DELETE', 'WAL'):
+            db.close_read_connections()
+            db.conn.execute(f'PRAGMA journal_mode={journal_mode};')
+            timings = sorted(measure_reads(db, args.batch, args.seconds))
+            print(
+                f'{journal_mode} journal: {len(timings)} reads, '
+                f'median {statistics.median(timings) * 1000:.2f}ms, '
+                f'p99 {timings[int(len(timings) * 0.99)] * 1000:.2f}ms, '
+                f'max {timings[-1] * 1000:.2f}ms',
+            )
+        del db
+
+
+if __name__ == '__main__':
+    main()
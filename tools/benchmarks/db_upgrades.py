@@ -0,0 +1,146 @@
+"""Benchmark replaying all the user DB upgrades over a large DB
+
+Copies the v24 test fixture, the oldest DB that the upgrades rewriting whole tables
+start from, and fills it with the history of a large account. Then opens it so that
+all the upgrades up to the current version run and reports how long each one took.
+
+Run from the repository root with:
+    python -m tools.benchmarks.db_upgrades --snapshots 1000 --trades 50000
+"""
+import argparse
+import json
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from rotkehlchen.constants.resolver import ETHEREUM_DIRECTIVE
+from rotkehlchen.db import upgrade_manager
+from rotkehlchen.db.dbhandler import MAIN_DB_NAME, DBHandler
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.user_messages import MessagesAggregator
+
+PASSWORD = '123'
+START_TS = 1500000000
+DATA_DIR = Path(__file__).resolve().parents[2] / 'rotkehlchen'
+FIXTURE = DATA_DIR / 'tests' / 'data' / 'v24_rotkehlchen.db'
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog='db_upgrades',
+        description='Benchmark replaying all the user DB upgrades over a large DB',
+    )
+    p.add_argument('--snapshots', type=int, default=1000, help='Number of balance snapshots')
+    p.add_argument('--assets', type=int, default=100, help='Number of assets per snapshot')
+    p.add_argument('--trades', type=int, default=50000, help='Number of trades')
+    p.add_argument('--movements', type=int, default=10000, help='Number of asset movements')
+    p.add_argument('--transactions', type=int, default=50000, help='Number of eth transactions')  # noqa: E501
+    return p.parse_args()
+
+
+def known_v24_asset_ids(count: int) -> List[str]:
+    """Returns ids of assets at v24 that are also in the global DB after the upgrades"""
+    with open(DATA_DIR / 'data' / 'all_assets.json', 'r') as f:
+        assets = json.loads(f.read())
+    cursor = GlobalDBHandler()._conn.cursor()
+    global_ids = {x[0] for x in cursor.execute('SELECT identifier FROM assets;')}
+    ids = []
+    for identifier, data in assets.items():
+        if data['type'] == 'ethereum token':
+            new_id = ETHEREUM_DIRECTIVE + data['ethereum_address']
+        else:
+            new_id = identifier
+        if new_id in global_ids:
+            ids.append(identifier)
+        if len(ids) == count:
+            break
+
+    return ids
+
+
+def fill_v24_db(db_path: Path, args: argparse.Namespace) -> None:
+    from pysqlcipher3 import dbapi2 as sqlcipher  # pylint: disable=import-outside-toplevel
+    rng = random.Random(42)
+    asset_ids = known_v24_asset_ids(args.assets)
+    conn = sqlcipher.connect(str(db_path))  # pylint: disable=no-member
+    conn.execute(f'PRAGMA key="{PASSWORD}";')
+    conn.executemany(
+        'INSERT INTO timed_balances(category, time, currency, amount, usd_value) '
+        'VALUES("A", ?, ?, "1.5", "150.25")',
+        [
+            (START_TS + snapshot * 86400, asset)
+            for snapshot in range(args.snapshots) for asset in asset_ids
+        ],
+    )
+    conn.executemany(
+        'INSERT INTO trades(id, time, location, pair, type, amount, rate, fee, '
+        'fee_currency, link, notes) VALUES(?, ?, "D", ?, "A", "1.1", "0.01", "0.001", ?, ?, "")',
+        [
+            (
+                f'trade{idx}',
+                START_TS + idx * 60,
+                f'{rng.choice(asset_ids)}_{rng.choice(asset_ids)}',
+                rng.choice(asset_ids),
+                f'link{idx}',
+            ) for idx in range(args.trades)
+        ],
+    )
+    conn.executemany(
+        'INSERT INTO asset_movements(id, location, category, address, transaction_id, time, '
+        'asset, amount, fee_asset, fee, link) VALUES(?, "D", "A", "0xaddress", "0xtxid", ?, '
+        '?, "2", ?, "0.1", ?)',
+        [
+            (f'movement{idx}', START_TS + idx * 60, asset, asset, f'link{idx}')
+            for idx, asset in enumerate(rng.choice(asset_ids) for _ in range(args.movements))
+        ],
+    )
+    conn.executemany(
+        'INSERT INTO ethereum_transactions(tx_hash, timestamp, block_number, from_address, '
+        'to_address, value, gas, gas_price, gas_used, input_data, nonce) '
+        'VALUES(?, ?, 1, "0xE5E86c7658EA28B81355db0d41e8a38D59Efae32", '
+        '"0x1271f0c3050b593B43216CEB79146F6ce1E36321", "1", "21000", "1", "21000", x\'\', ?)',
+        [
+            (idx.to_bytes(32, 'big'), START_TS + idx * 60, idx)
+            for idx in range(args.transactions)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def timed(function: Callable, timings: Dict[int, float], from_version: int) -> Callable:
+    def wrapper(**kwargs: Any) -> None:
+        start = time.monotonic()
+        function(**kwargs)
+        timings[from_version] = time.monotonic() - start
+
+    return wrapper
+
+
+def main() -> None:
+    args = parse_args()
+    timings: Dict[int, float] = {}
+    upgrade_manager.UPGRADES_LIST = [
+        x._replace(function=timed(x.function, timings, x.from_version))
+        for x in upgrade_manager.UPGRADES_LIST
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        GlobalDBHandler(data_dir=Path(tmpdir))
+        user_data_dir = Path(tmpdir) / 'user'
+        user_data_dir.mkdir()
+        shutil.copyfile(FIXTURE, user_data_dir / MAIN_DB_NAME)
+        fill_v24_db(user_data_dir / MAIN_DB_NAME, args)
+        start = time.monotonic()
+        db = DBHandler(user_data_dir, PASSWORD, MessagesAggregator(), None)
+        total = time.monotonic() - start
+        for from_version, duration in timings.items():
+            print(f'v{from_version} -> v{from_version + 1}: {duration:.2f}s')
+        print(f'Opening the DB took {total:.2f}s in total')
+        del db
+
+
+if __name__ == '__main__':
+    main()
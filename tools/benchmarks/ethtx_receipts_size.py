@@ -0,0 +1,131 @@
+"""Report the user DB size of transaction receipts before and after the v30->v31 upgrade
+
+Fills a user DB with the receipts of a large synthetic account in the layout of v30,
+where every log row holds its address and every topic row its 32 bytes, and then
+moves the addresses and topics to the dictionary tables as the upgrade does. The
+size of the encrypted DB file is reported after vacuuming each layout.
+
+Run from the repository root with:
+    python -m tools.benchmarks.ethtx_receipts_size --receipts 50000
+"""
+import argparse
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, List, Tuple
+
+from rotkehlchen.db.dbhandler import MAIN_DB_NAME, DBHandler
+from rotkehlchen.db.upgrades.v30_v31 import _upgrade_ethtx_receipt_logs
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.user_messages import MessagesAggregator
+
+PASSWORD = '123'
+TRANSFER_TOPIC = bytes.fromhex('ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef')
+APPROVAL_TOPIC = bytes.fromhex('8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925')
+# The receipt log tables as they were at v30
+V30_RECEIPT_LOG_TABLES = """
+CREATE TABLE ethtx_receipt_logs (
+    tx_hash BLOB NOT NULL,
+    log_index INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    address TEXT NOT NULL,
+    removed INTEGER NOT NULL CHECK (removed IN (0, 1)),
+    FOREIGN KEY(tx_hash) REFERENCES ethtx_receipts(tx_hash) ON DELETE CASCADE ON UPDATE CASCADE,
+    PRIMARY KEY(tx_hash, log_index)
+);
+CREATE TABLE ethtx_receipt_log_topics (
+    tx_hash BLOB NOT NULL,
+    log_index INTEGER NOT NULL,
+    topic BLOB NOT NULL,
+    topic_index INTEGER NOT NULL,
+    FOREIGN KEY(tx_hash, log_index) REFERENCES ethtx_receipt_logs(tx_hash, log_index) ON DELETE CASCADE ON UPDATE CASCADE,
+    PRIMARY KEY(tx_hash, log_index, topic_index)
+);
+"""  # noqa: E501
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog='ethtx_receipts_size',
+        description='Report the DB size of receipt logs with and without dictionary tables',
+    )
+    p.add_argument('--receipts', type=int, default=50000, help='Number of receipts in the DB')
+    p.add_argument('--contracts', type=int, default=300, help='Number of distinct contracts')
+    p.add_argument('--counterparties', type=int, default=2000, help='Number of distinct counterparties')  # noqa: E501
+    return p.parse_args()
+
+
+def address_topic(rng: random.Random) -> bytes:
+    """A random address as it appears in the indexed topics of a Transfer event"""
+    return bytes(12) + rng.getrandbits(160).to_bytes(20, 'big')
+
+
+def make_receipts(
+        args: argparse.Namespace,
+) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+    """Returns the receipt, log and topic rows of a token heavy account in the v30 layout"""
+    rng = random.Random(42)
+    account_topic = address_topic(rng)
+    contracts = [f'0x{rng.getrandbits(160):040x}' for _ in range(args.contracts)]
+    counterparties = [address_topic(rng) for _ in range(args.counterparties)]
+    receipts: List[Tuple[Any, ...]] = []
+    logs: List[Tuple[Any, ...]] = []
+    topics: List[Tuple[Any, ...]] = []
+    for idx in range(args.receipts):
+        tx_hash = idx.to_bytes(32, 'big')
+        receipts.append((tx_hash, None, 1, 2))
+        for log_index in range(rng.randint(1, 4)):
+            data = rng.getrandbits(256).to_bytes(32, 'big')
+            logs.append((tx_hash, log_index, data, rng.choice(contracts), 0))
+            event_topic = TRANSFER_TOPIC if rng.random() < 0.8 else APPROVAL_TOPIC
+            parties = [account_topic, rng.choice(counterparties)]
+            rng.shuffle(parties)
+            for topic_index, topic in enumerate([event_topic, *parties]):
+                topics.append((tx_hash, log_index, topic, topic_index))
+
+    return receipts, logs, topics
+
+
+def db_size(db: DBHandler) -> int:
+    db.conn.execute('VACUUM;')
+    db.conn.execute('PRAGMA wal_checkpoint(TRUNCATE);')
+    return (db.user_data_dir / MAIN_DB_NAME).stat().st_size
+
+
+def main() -> None:
+    args = parse_args()
+    receipts, logs, topics = make_receipts(args)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        GlobalDBHandler(data_dir=Path(tmpdir))
+        user_data_dir = Path(tmpdir) / 'user'
+        user_data_dir.mkdir()
+        db = DBHandler(user_data_dir, PASSWORD, MessagesAggregator(), None)
+        db.conn.executescript(
+            'DROP TABLE ethtx_receipt_log_topics; DROP TABLE ethtx_receipt_logs;' +
+            V30_RECEIPT_LOG_TABLES,
+        )
+        db.conn.executemany(
+            'INSERT INTO ethereum_transactions(tx_hash, timestamp, block_number, from_address, '
+            'to_address, value, gas, gas_price, gas_used, input_data, nonce) '
+            'VALUES(?, 1, 1, "0x0", "0x0", "0", "1", "1", "1", x\'\', 1)',
+            [(x[0],) for x in receipts],
+        )
+        db.conn.executemany('INSERT INTO ethtx_receipts VALUES(?, ?, ?, ?)', receipts)
+        db.conn.executemany('INSERT INTO ethtx_receipt_logs VALUES(?, ?, ?, ?, ?)', logs)
+        db.conn.executemany('INSERT INTO ethtx_receipt_log_topics VALUES(?, ?, ?, ?)', topics)
+        db.conn.commit()
+        size_before = db_size(db)
+
+        _upgrade_ethtx_receipt_logs(db)
+        db.conn.commit()
+        size_after = db_size(db)
+        print(
+            f'{len(receipts)} receipts, {len(logs)} logs, {len(topics)} topics: '
+            f'{size_before / 2**20:.1f}MB before, {size_after / 2**20:.1f}MB after the '
+            f'upgrade ({(1 - size_after / size_before) * 100:.1f}% smaller)',
+        )
+        del db
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark deserializing trades from DB tuples
+
+Compares deserialization with the interned assets against constructing fresh
+asset objects for each row and eagerly resolving their related assets, which
+is what happened before assets were interned.
+
+Run from the repository root with:
+    python -m tools.benchmarks.trade_deserialization --trades 100000
+"""
+import argparse
+import random
+import tempfile
+import timeit
+from pathlib import Path
+from typing import List
+
+from rotkehlchen.assets.asset import InternedAssetMeta
+from rotkehlchen.assets.resolver import AssetResolver
+from rotkehlchen.exchanges.data_structures import Trade, TradeDBTuple
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+
+BENCHMARK_ASSETS = (
+    'BTC', 'ETH', 'EUR', 'USD', 'BCH', 'LTC', 'XRP', 'ADA', 'DOT', 'KSM',
+    '_ceth_0x6B175474E89094C44Da98b954EedeAC495271d0F',  # DAI
+    '_ceth_0xdAC17F958D2ee523a2206206994597C13D831ec7',  # USDT
+    '_ceth_0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48',  # USDC
+    '_ceth_0x514910771AF9Ca656af840dff83E8264EcF986CA',  # LINK
+)
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog='trade_deserialization',
+        description='Benchmark Trade.deserialize_from_db with and without interned assets',
+    )
+    p.add_argument('--trades', type=int, default=100000, help='Number of trades to deserialize')
+    p.add_argument('--repeat', type=int, default=3, help='Number of times to repeat each run')
+    return p.parse_args()
+
+
+def make_trade_tuples(number: int) -> List[TradeDBTuple]:
+    rng = random.Random(42)
+    entries = []
+    for idx in range(number):
+        base, quote = rng.sample(BENCHMARK_ASSETS, 2)
+        entries.append((
+            str(idx),
+            1600000000 + idx,
+            'A',  # kraken
+            base,
+            quote,
+            'A',  # buy
+            str(rng.randint(1, 1000)),
+            '1.5',
+            '0.01',
+            quote,
+            None,
+            None,
+        ))
+    return entries  # type: ignore
+
+
+def deserialize_interned(entries: List[TradeDBTuple]) -> None:
+    for entry in entries:
+        Trade.deserialize_from_db(entry)
+
+
+def deserialize_without_interning(entries: List[TradeDBTuple]) -> None:
+    for entry in entries:
+        InternedAssetMeta.clear_registry()
+        trade = Trade.deserialize_from_db(entry)
+        for asset in (trade.base_asset, trade.quote_asset, trade.fee_currency):
+            if asset is not None:  # emulate eager resolution of related assets
+                asset.forked  # pylint: disable=pointless-statement
+                asset.swapped_for  # pylint: disable=pointless-statement
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        GlobalDBHandler(data_dir=Path(tmpdir))
+        AssetResolver()
+        entries = make_trade_tuples(args.trades)
+        deserialize_interned(entries)  # warm up the resolver memory cache
+        for name, function in (
+            ('without interning', deserialize_without_interning),
+            ('interned', deserialize_interned),
+        ):
+            timings = timeit.repeat(lambda: function(entries), number=1, repeat=args.repeat)  # pylint: disable=cell-var-from-loop  # noqa: E501
+            print(f'{name}: best of {args.repeat}: {min(timings):.3f}s for {args.trades} trades')
+
+
+if __name__ == '__main__':
+    main()
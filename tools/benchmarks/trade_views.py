@@ -0,0 +1,146 @@
+"""Benchmark querying trades as lazily deserialized views against full deserialization
+
+Fills a user DB with the trades of a large account and then times what consumers that
+need only a few fields of each trade cost when using get_trades, which deserializes
+all of them, and when using trade views of all or of only the needed columns.
+
+Run from the repository root with:
+    python -m tools.benchmarks.trade_views --trades 1000000
+"""
+import argparse
+import random
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from rotkehlchen.db.dbhandler import DBHandler
+from rotkehlchen.db.filtering import TradesFilterQuery
+from rotkehlchen.exchanges.data_structures import TradeView
+from rotkehlchen.globaldb.handler import GlobalDBHandler
+from rotkehlchen.user_messages import MessagesAggregator
+
+PASSWORD = '123'
+START_TS = 1500000000
+ASSETS = ['ETH', 'BTC', 'EUR', 'USD', 'BCH', 'XMR', 'LTC', 'DOGE', 'ZEC', 'DASH']
+LOCATIONS = ['A', 'B', 'C', 'D', 'E', 'F', 'G']
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        prog='trade_views',
+        description='Benchmark lazily deserialized trade views against full deserialization',
+    )
+    p.add_argument('--trades', type=int, default=1000000, help='Number of trades in the DB')
+    return p.parse_args()
+
+
+def fill_trades(db: DBHandler, count: int) -> None:
+    rng = random.Random(42)
+    db.conn.executemany(
+        'INSERT INTO trades(id, time, location, base_asset, quote_asset, type, amount, '
+        'rate, fee, fee_currency, link, notes) VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        (
+            (
+                f'trade{idx}',
+                START_TS + idx * 60,
+                rng.choice(LOCATIONS),
+                rng.choice(ASSETS),
+                rng.choice(ASSETS),
+                rng.choice(('A', 'B')),
+                f'{rng.random() * 10:.8f}',
+                f'{rng.random() * 1000:.8f}',
+                '0.001',
+                'ETH',
+                f'link{idx}',
+                None,
+            ) for idx in range(count)
+        ),
+    )
+    db.conn.commit()
+
+
+def query_trade_views(
+        db: DBHandler,
+        filter_query: TradesFilterQuery,
+        fields: Optional[List[str]],
+) -> List[TradeView]:
+    """Like get_trades with premium but only queries the columns of the given fields"""
+    columns = TradeView.columns_of(fields)
+    select = f'SELECT {",".join(columns)} from combined_trades_view '
+    with db.read_cursor() as cursor:
+        results = db.query_filtered_page(cursor, select, filter_query)
+
+    return TradeView.from_rows(results, columns)
+
+
+def per_location_counts(trades: Iterable) -> Counter:
+    return Counter(x.location for x in trades)
+
+
+def assets_first_seen(trades: Iterable) -> int:
+    """An accounting pre-pass that only needs the timestamps and the assets"""
+    first_seen: Dict[Any, int] = {}
+    for trade in trades:
+        for asset in (trade.base_asset, trade.quote_asset):
+            first_seen.setdefault(asset, trade.timestamp)
+    return len(first_seen)
+
+
+def run(
+        name: str,
+        query: Callable[[], List],
+        consumer: Callable[[Iterable], object],
+) -> Tuple[str, float, float]:
+    start = time.monotonic()
+    trades = query()
+    queried = time.monotonic()
+    consumer(trades)
+    return name, queried - start, time.monotonic() - queried
+
+
+def benchmark(user_data_dir: Path, trades: int) -> List[Tuple[str, float, float]]:
+    db = DBHandler(user_data_dir, PASSWORD, MessagesAggregator(), None)
+    fill_trades(db, trades)
+    filter_query = TradesFilterQuery.make()
+
+    def full() -> List:
+        return db.get_trades(filter_query=filter_query, has_premium=True)
+
+    def views(fields: Optional[List[str]]) -> Callable[[], List]:
+        return lambda: query_trade_views(db, filter_query, fields)
+
+    return [
+        run('per location counts, full', full, per_location_counts),
+        run('per location counts, views', views(None), per_location_counts),
+        run('per location counts, projected views', views(['location']), per_location_counts),
+        run('assets first seen, full', full, assets_first_seen),
+        run('assets first seen, views', views(None), assets_first_seen),
+        run(
+            'assets first seen, projected views',
+            views(['timestamp', 'base_asset', 'quote_asset']),
+            assets_first_seen,
+        ),
+    ]
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        GlobalDBHandler(data_dir=Path(tmpdir))
+        user_data_dir = Path(tmpdir) / 'user'
+        user_data_dir.mkdir()
+        # the DB handler is gone when benchmark() returns, before its directory is removed
+        results = benchmark(user_data_dir, args.trades)
+
+    print(f'{args.trades} trades')
+    for name, query_time, consume_time in results:
+        print(
+            f'{name}: {query_time + consume_time:.2f}s '
+            f'({query_time:.2f}s query, {consume_time:.2f}s consume)',
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -44,6 +44,7 @@ class StatisticsFaker():
         cursor = self.db.conn.cursor()
         cursor.execute('DELETE from timed_location_data;')
         cursor.execute('DELETE from timed_balances;')
+        cursor.execute('DELETE from balance_snapshot_summaries;')
         self.db.conn.commit()
 
     @staticmethod
@@ -105,12 +106,6 @@ class StatisticsFaker():
                 location=locations[idx].serialize_for_db(),
                 usd_value=str(value),
             ))
-        # add the location data + total to the DB
-        self.db.add_multiple_location_data(location_data + [LocationData(
-            time=from_ts,
-            location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
-            usd_value=str(total_amount),
-        )])
 
         # Add the first distribution of assets
         assets_data = []
@@ -122,7 +117,12 @@ class StatisticsFaker():
                 amount=str(random.randint(1, 20)),
                 usd_value=str(value),
             ))
-        self.db.add_multiple_balances(assets_data)
+        # add the assets, location data + total and the snapshot's summary to the DB
+        self.db.add_balance_snapshot(assets_data, location_data + [LocationData(
+            time=from_ts,
+            location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
+            usd_value=str(total_amount),
+        )])
 
         while from_ts < to_ts:
             print(f'At timestamp: {from_ts}/{to_ts} wih total net worth: ${total_amount}')
@@ -159,12 +159,6 @@ class StatisticsFaker():
                     location=location_data[idx].location,
                     usd_value=str(action(FVal(location_data[idx].usd_value), value)),
                 ))
-            # add the location data + total to the DB
-            self.db.add_multiple_location_data(new_location_data + [LocationData(
-                time=from_ts,
-                location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
-                usd_value=str(total_amount),
-            )])
 
             for idx, value in enumerate(divide_number_in_parts(add_usd_value, len(assets))):
                 old_amount = FVal(assets_data[idx].amount)
@@ -178,7 +172,12 @@ class StatisticsFaker():
                     amount=str(new_amount),
                     usd_value=str(action(FVal(assets_data[idx].usd_value), value)),
                 ))
-            self.db.add_multiple_balances(new_assets_data)
+            # add the assets, location data + total and the snapshot's summary to the DB
+            self.db.add_balance_snapshot(new_assets_data, new_location_data + [LocationData(
+                time=from_ts,
+                location=Location.TOTAL.serialize_for_db(),  # pylint: disable=no-member
+                usd_value=str(total_amount),
+            )])
 
             location_data = new_location_data
             assets_data = new_assets_data
@@ -1,11 +1,68 @@
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 from rotkehlchen.config import default_data_directory
 from rotkehlchen.constants.resolver import strethaddress_to_identifier
 from rotkehlchen.globaldb.handler import GlobalDBHandler
 from rotkehlchen.utils.misc import timestamp_to_date, ts_now
 
+# Appended to the generated file. Creates each constant asset from the data tables
+# the first time its variable is accessed.
+LAZY_CREATION_CODE = '''
+
+def _create_constant_asset(var_name: str) -> Asset:
+    """May raise KeyError if there is no constant asset with the given variable name"""
+    token_data = _ETHEREUM_TOKENS_DATA.get(var_name)
+    if token_data is not None:
+        address, decimals, name, symbol, started, swapped_for, coingecko, cryptocompare, protocol = token_data  # noqa: E501
+        return EthereumToken.initialize(
+            address=string_to_ethereum_address(address),
+            decimals=decimals,
+            name=name,
+            symbol=symbol,
+            started=Timestamp(started) if started is not None else None,
+            swapped_for=swapped_for,
+            coingecko=coingecko,
+            cryptocompare=cryptocompare,
+            protocol=protocol,
+        )
+
+    identifier, asset_type, name, symbol, started, forked, swapped_for, coingecko, cryptocompare = _ASSETS_DATA[var_name]  # noqa: E501
+    return Asset.initialize(
+        identifier=identifier,
+        asset_type=asset_type,
+        name=name,
+        symbol=symbol,
+        started=Timestamp(started) if started is not None else None,
+        forked=forked,
+        swapped_for=swapped_for,
+        coingecko=coingecko,
+        cryptocompare=cryptocompare,
+    )
+
+
+def __getattr__(name: str) -> Asset:
+    """Creates a constant asset the first time it is accessed and caches it in the module"""
+    try:
+        asset = _create_constant_asset(name)
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    globals()[name] = asset
+    CONSTANT_ASSETS.append(asset)
+    if CONSTANT_ASSETS_RELOADER is not None:
+        CONSTANT_ASSETS_RELOADER([asset])
+    return asset
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _ASSETS_DATA.keys() | _ETHEREUM_TOKENS_DATA.keys())
+'''
+
+
+def _optional_repr(value: Optional[str]) -> str:
+    return repr(value) if value else 'None'
+
 
 class ContextManager():
     """Manages the parsing context of the assets template"""
@@ -13,96 +70,87 @@ class ContextManager():
     def __init__(self) -> None:
         self.id_to_variable: Dict[str, str] = {}
         self.globaldb = GlobalDBHandler(default_data_directory())
+        self.assets_rows: List[str] = []
+        self.tokens_rows: List[str] = []
 
-    def add_asset_initialization(self, var_name: str, identifier: str) -> str:
-        generated_text = ''
-        asset_data = self.globaldb.get_asset_data(identifier=identifier, form_with_incomplete_data=False)  # noqa: E501
-        var_forked = 'None'
-        if asset_data.forked:
-            if asset_data.forked in self.id_to_variable:
-                var_forked = self.id_to_variable[asset_data.forked]
-            else:
-                var_forked = f'{identifier.upper()}_forked'
-                generated_text += self.add_asset_initialization(var_forked, asset_data.forked.identifier)  # noqa: E501
-        var_swappedfor = 'None'
-        if asset_data.swapped_for:
-            if asset_data.swapped_for in self.id_to_variable:
-                var_swappedfor = self.id_to_variable[asset_data.swapped_for]
-            else:
-                var_swappedfor = f'{identifier.upper()}_swappedfor'
-                generated_text += self.add_asset_initialization(var_swappedfor, asset_data.swapped_for.identifier)  # noqa:E501
-
-        name = f'"{asset_data.name}"' if asset_data.name else None
-        symbol = f'\'{asset_data.symbol}\'' if asset_data.symbol else None
-        started = f'Timestamp({asset_data.started})' if asset_data.started else None
-        coingecko = f'\'{asset_data.coingecko}\'' if asset_data.coingecko else None
-        cryptocompare = f'\'{asset_data.cryptocompare}\'' if asset_data.cryptocompare else None
-        generated_text += (
-            f'{var_name} = Asset.initialize(\n'
-            f'    identifier=\'{identifier}\',\n'
-            f'    asset_type=AssetType.{asset_data.asset_type.name},\n'
-            f'    name={name},\n'
-            f'    symbol={symbol},\n'
-            f'    started={started},\n'
-            f'    forked={var_forked},\n'
-            f'    swapped_for={var_swappedfor},\n'
-            f'    coingecko={coingecko},\n'
-            f'    cryptocompare={cryptocompare},\n'
-            f')\n'
-            f'CONSTANT_ASSETS.append({var_name})\n'
-        )
-
+    def _register_variable(self, var_name: str, identifier: str) -> None:
         if identifier in self.id_to_variable:
             raise ValueError(f'Asset with identifier {identifier} and var_name {var_name} is defined twice')  # noqa: E501
         self.id_to_variable[identifier] = var_name
-        return generated_text
 
-    def add_ethtoken_initialization(self, var_name: str, address: str) -> str:
-        generated_text = ''
+    def add_asset_initialization(self, var_name: str, identifier: str) -> None:
+        asset_data = self.globaldb.get_asset_data(identifier=identifier, form_with_incomplete_data=False)  # noqa: E501
+        # related assets are resolved lazily by their identifier so they don't
+        # need to be constant assets themselves
+        row = (
+            f'    {var_name!r}: ('
+            f'{identifier!r}, '
+            f'AssetType.{asset_data.asset_type.name}, '
+            f'{_optional_repr(asset_data.name)}, '
+            f'{_optional_repr(asset_data.symbol)}, '
+            f'{asset_data.started if asset_data.started else None}, '
+            f'{_optional_repr(asset_data.forked)}, '
+            f'{_optional_repr(asset_data.swapped_for)}, '
+            f'{_optional_repr(asset_data.coingecko)}, '
+            f'{_optional_repr(asset_data.cryptocompare)}),'
+        )
+        self._register_variable(var_name, identifier)
+        self.assets_rows.append(row)
+
+    def add_ethtoken_initialization(self, var_name: str, address: str) -> None:
         token = self.globaldb.get_ethereum_token(address=address)
-        var_swappedfor = 'None'
-        if token.swapped_for:
-            if token.swapped_for in self.id_to_variable:
-                var_swappedfor = self.id_to_variable[token.swapped_for]
-            else:
-                var_swappedfor = f'{strethaddress_to_identifier(address).upper()}_swappedfor'
-                generated_text += self.add_asset_initialization(var_swappedfor, token.swapped_for.identifier)  # noqa: E501
-
-        name = f'"{token.name}"' if token.name else None
-        symbol = f'\'{token.symbol}\'' if token.symbol else None
-        started = f'Timestamp({token.started})' if token.started else None
-        coingecko = f'\'{token.coingecko}\'' if token.coingecko else None
-        cryptocompare = f'\'{token.cryptocompare}\'' if token.cryptocompare else None
-        protocol = f'\'{token.protocol}\'' if token.protocol else None
         if token.underlying_tokens is not None:
             raise ValueError(
                 f'Found token {address} with underlying tokens. Not supported '
                 f'at constants asset generation yet. Can implement when needed.',
             )
-        generated_text += (
-            f'{var_name} = EthereumToken.initialize(\n'
-            f'    address=string_to_ethereum_address(\'{address}\'),\n'
-            f'    decimals={token.decimals},\n'
-            f'    name={name},\n'
-            f'    symbol={symbol},\n'
-            f'    started={started},\n'
-            f'    swapped_for={var_swappedfor},\n'
-            f'    coingecko={coingecko},\n'
-            f'    cryptocompare={cryptocompare},\n'
-            f'    protocol={protocol},\n'
-            f')\n'
-            f'CONSTANT_ASSETS.append({var_name})\n'
+        swapped_for = token.swapped_for.identifier if token.swapped_for else None
+        row = (
+            f'    {var_name!r}: ('
+            f'{address!r}, '
+            f'{token.decimals}, '
+            f'{_optional_repr(token.name)}, '
+            f'{_optional_repr(token.symbol)}, '
+            f'{token.started if token.started else None}, '
+            f'{_optional_repr(swapped_for)}, '
+            f'{_optional_repr(token.coingecko)}, '
+            f'{_optional_repr(token.cryptocompare)}, '
+            f'{_optional_repr(token.protocol)}),'
         )
-        identifier = strethaddress_to_identifier(address)
-        if identifier in self.id_to_variable:
-            raise ValueError(f'Token with identifier {identifier} and varname {var_name} is defined twice')  # noqa: E501
-        self.id_to_variable[identifier] = var_name
-        return generated_text
+        self._register_variable(var_name, strethaddress_to_identifier(address))
+        self.tokens_rows.append(row)
+
+    def data_tables_text(self) -> str:
+        return (
+            '\n# variable name -> (identifier, type, name, symbol, started, forked,\n'
+            '# swapped_for, coingecko, cryptocompare)\n'
+            '_ASSETS_DATA: Dict[str, Tuple[Any, ...]] = {\n' +
+            ''.join(f'{row}  # noqa: E501\n' if len(row) > 99 else f'{row}\n' for row in self.assets_rows) +  # noqa: E501
+            '}\n'
+            '# variable name -> (address, decimals, name, symbol, started, swapped_for,\n'
+            '# coingecko, cryptocompare, protocol)\n'
+            '_ETHEREUM_TOKENS_DATA: Dict[str, Tuple[Any, ...]] = {\n' +
+            ''.join(f'{row}  # noqa: E501\n' if len(row) > 99 else f'{row}\n' for row in self.tokens_rows) +  # noqa: E501
+            '}\n'
+        )
+
+
+def _declaration(line: str, var_name: str, asset_class: str) -> str:
+    comment = line.split('#', 1)[1] if '#' in line else None
+    declaration = f'    {var_name}: {asset_class}'
+    if comment is not None:
+        declaration += f'  #{comment}'
+    return declaration + '\n'
 
 
 def main() -> None:
     """Goes through the assets template, reads the built-in assets DB and generates
-    assets.py with initialization of all constant assets"""
+    assets.py with the data of all constant assets.
+
+    The assets are not initialized at import time. Instead the generated module keeps
+    a compact data table and creates each asset on its first access via the module's
+    __getattr__. The variables are declared for type checkers only.
+    """
     root_dir = Path(__file__).resolve().parent.parent.parent
     constants_dir = root_dir / 'rotkehlchen' / 'constants'
     template_file = constants_dir / 'assets.py.template'
@@ -113,6 +161,7 @@ def main() -> None:
         f'# Do not edit manually!\n'
         f'\n'
     )
+    declarations_text = ''
     ctx = ContextManager()
     with open(template_file, 'r') as f:
         for line in f:
@@ -121,18 +170,30 @@ def main() -> None:
                 initial_split = line.split(' = Asset(\'')
                 var_name = initial_split[0]
                 identifier = initial_split[1].split('\'')[0]
-                generated_text += ctx.add_asset_initialization(var_name, identifier)
+                ctx.add_asset_initialization(var_name, identifier)
+                declarations_text += _declaration(line, var_name, 'Asset')
                 continue
 
             if 'EthereumToken(\'' in line:
                 initial_split = line.split(' = EthereumToken(\'')
                 var_name = initial_split[0]
                 identifier = initial_split[1].split('\'')[0]
-                generated_text += ctx.add_ethtoken_initialization(var_name, identifier)
+                ctx.add_ethtoken_initialization(var_name, identifier)
+                declarations_text += _declaration(line, var_name, 'EthereumToken')
                 continue
 
-            # else just copy text
-            generated_text += line + '\n'
+            if len(ctx.id_to_variable) == 0:
+                # before the first asset just copy text
+                generated_text += line + '\n'
+            elif line == '':
+                if not declarations_text.endswith('\n\n'):
+                    declarations_text += '\n'
+            else:  # comments between the assets go along with the declarations
+                declarations_text += f'    {line}\n'
+
+    generated_text += 'if TYPE_CHECKING:\n' + declarations_text.rstrip('\n') + '\n'
+    generated_text += ctx.data_tables_text()
+    generated_text += LAZY_CREATION_CODE
 
     assets_file = constants_dir / 'assets.py'
     with open(assets_file, 'w') as f: